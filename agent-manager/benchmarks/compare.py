@@ -0,0 +1,91 @@
+"""Compare two benchmark result files and flag regressions.
+
+Usage:
+    python -m benchmarks.compare baseline.json current.json --threshold 0.10
+
+Exits with status 1 if any benchmark's median got slower by more than the
+threshold (and by more than --min-delta-ms, to ignore timer noise).
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class Comparison:
+    """Median timing change for one benchmark."""
+
+    name: str
+    baseline_ms: float
+    current_ms: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        """Relative change (0.25 means 25% slower)."""
+        if self.baseline_ms == 0:
+            return 0.0
+        return self.current_ms / self.baseline_ms - 1
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = 0.10,
+    min_delta_ms: float = 0.1,
+) -> list[Comparison]:
+    """
+    Compare benchmark medians present in both result sets.
+
+    Args:
+        baseline: Results from ``benchmarks.run``
+        current: Results from ``benchmarks.run``
+        threshold: Allowed relative slowdown
+        min_delta_ms: Ignore slowdowns smaller than this many milliseconds
+
+    Returns:
+        One Comparison per shared benchmark
+    """
+    comparisons = []
+    for name, base in baseline["benchmarks"].items():
+        cur = current["benchmarks"].get(name)
+        if cur is None:
+            continue
+        base_ms, cur_ms = base["median"], cur["median"]
+        regressed = (
+            cur_ms > base_ms * (1 + threshold)
+            and cur_ms - base_ms > min_delta_ms
+        )
+        comparisons.append(Comparison(name, base_ms, cur_ms, regressed))
+    return comparisons
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--min-delta-ms", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    if baseline["meta"]["spec"] != current["meta"]["spec"]:
+        print("warning: results were generated with different tree specs", file=sys.stderr)
+
+    comparisons = compare(baseline, current, args.threshold, args.min_delta_ms)
+    print(f"{'Benchmark':<22} {'Baseline ms':>12} {'Current ms':>12} {'Change':>8}")
+    for c in comparisons:
+        flag = "  REGRESSION" if c.regressed else ""
+        print(f"{c.name:<22} {c.baseline_ms:>12.3f} {c.current_ms:>12.3f} {c.change:>+8.1%}{flag}")
+
+    if any(c.regressed for c in comparisons):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
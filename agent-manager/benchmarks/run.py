@@ -0,0 +1,200 @@
+"""Run the benchmark suite against a synthetic tree and write JSON results.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --depth 4 --fanout 5 --repeat 10 --only scan_all,parse_string
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from agent_manager.core.parser import FrontmatterParser
+from agent_manager.core.query import ScanFilter, filter_by_text
+from agent_manager.core.scanner import AgentSkillScanner
+from agent_manager.core.symlink_manager import SymlinkManager
+from agent_manager.core.validator import AgentValidator
+
+from benchmarks.tree import GeneratedTree, TreeSpec, generate_tree
+
+
+def summarize(times: list[float]) -> dict:
+    """
+    Summarize timings in milliseconds.
+
+    Args:
+        times: Non-empty list of timings in milliseconds
+
+    Returns:
+        Dict with min, median, mean, p95, p99, max and runs
+    """
+    times = sorted(times)
+    if len(times) > 1:
+        cuts = statistics.quantiles(times, n=100, method="inclusive")
+        p95, p99 = cuts[94], cuts[98]
+    else:
+        p95 = p99 = times[0]
+    return {
+        "min": times[0],
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "p95": p95,
+        "p99": p99,
+        "max": times[-1],
+        "runs": len(times),
+    }
+
+
+def measure(fn: Callable[[], object], repeat: int, warmup: int = 1) -> dict:
+    """
+    Time ``fn`` and summarize the runs in milliseconds.
+
+    Args:
+        fn: Zero-argument callable to time
+        repeat: Number of timed runs
+        warmup: Untimed runs before measuring
+
+    Returns:
+        Summary from ``summarize``
+    """
+    for _ in range(warmup):
+        fn()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return summarize(times)
+
+
+def build_cases(tree: GeneratedTree) -> dict[str, Callable[[], object]]:
+    """Create the benchmark callables for a generated tree."""
+    scanner = AgentSkillScanner()
+    result = asyncio.run(scanner.scan_all([tree.root]))
+    agents, skills = result.agents, result.skills
+
+    parser = FrontmatterParser()
+    texts = [a.source_path.read_text(encoding="utf-8") for a in agents]
+
+    validator = AgentValidator()
+    records = [
+        {**parser.parse_string(text)[0], "prompt": a.prompt}
+        for text, a in zip(texts, agents)
+    ]
+
+    symlink_manager = SymlinkManager(claude_dir=tree.claude_dir)
+    scan_filter = ScanFilter.parse("model=opus,tag=sre")
+
+    return {
+        "scan_all": lambda: asyncio.run(AgentSkillScanner().scan_all([tree.root])),
+        "parse_string": lambda: [parser.parse_string(t) for t in texts],
+        "validate": lambda: [validator.validate(r) for r in records],
+        "link_status_per_item": lambda: (
+            [symlink_manager.get_agent_link_status(a.source_path) for a in agents],
+            [symlink_manager.get_skill_link_status(s.source_dir) for s in skills],
+        ),
+        "link_status_bulk": lambda: symlink_manager.resolve_global_links(agents, skills),
+        "filter_text": lambda: filter_by_text(agents, "review"),
+        "filter_metadata": lambda: [a for a in agents if scan_filter.matches(a.metadata)],
+    }
+
+
+def git_commit() -> str | None:
+    """Get the current commit hash, if run inside a git checkout."""
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def run_metadata(spec: dict) -> dict:
+    """Describe the environment a result set was produced in."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "spec": spec,
+    }
+
+
+def run(spec: TreeSpec, repeat: int, only: list[str] | None = None) -> dict:
+    """
+    Generate a tree, run the selected benchmarks and return the results.
+
+    Args:
+        spec: Tree shape
+        repeat: Timed runs per benchmark
+        only: Benchmark names to run (default: all)
+
+    Returns:
+        Results dict (see ``compare.py`` for the consumer)
+    """
+    with tempfile.TemporaryDirectory(prefix="agent-manager-bench-") as tmpdir:
+        tree = generate_tree(Path(tmpdir), spec)
+        cases = build_cases(tree)
+
+        unknown = set(only or []) - set(cases)
+        if unknown:
+            raise SystemExit(f"Unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+        benchmarks = {}
+        for name, fn in cases.items():
+            if only and name not in only:
+                continue
+            benchmarks[name] = measure(fn, repeat)
+            print(f"  {name:<22} median {benchmarks[name]['median']:9.3f} ms", file=sys.stderr)
+
+        return {
+            "meta": {**run_metadata(spec.to_dict()), "repeat": repeat},
+            "tree": {
+                "agents": tree.agents,
+                "skills": tree.skills,
+                "links": tree.links,
+                "directories": tree.directories,
+            },
+            "benchmarks": benchmarks,
+        }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    defaults = TreeSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", "-o", type=Path, help="Write JSON results here")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--only", help="Comma-separated benchmark names")
+    for name, value in defaults.to_dict().items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+    args = parser.parse_args(argv)
+
+    spec = TreeSpec(**{name: getattr(args, name) for name in defaults.to_dict()})
+    only = args.only.split(",") if args.only else None
+    results = run(spec, args.repeat, only)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
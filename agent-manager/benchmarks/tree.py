@@ -0,0 +1,143 @@
+"""Synthetic directory tree generator for benchmarks."""
+
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Directories the scanner must skip; generated as noise
+NOISE_DIRS = ["node_modules", ".git", ".venv", "__pycache__", "dist", "build"]
+
+MODELS = ["sonnet", "opus", "haiku"]
+COLORS = ["red", "orange", "yellow", "green", "blue", "purple", "pink", "gray"]
+TAGS = ["sre", "review", "python", "rust", "docs", "notes", "infra", "security"]
+WORDS = (
+    "agent review code system prompt reliability latency service deploy "
+    "incident metric alert trace kubernetes database cache queue retry "
+    "timeout budget owner roadmap note vault markdown refactor pattern"
+).split()
+
+
+@dataclass
+class TreeSpec:
+    """Shape of a synthetic scan tree."""
+
+    depth: int = 3
+    fanout: int = 4
+    # Probability that a leaf directory is a project with .claude/
+    project_density: float = 0.5
+    agents_per_project: int = 3
+    skills_per_project: int = 1
+    # Fraction of agents/skills symlinked into the fake ~/.claude
+    symlink_density: float = 0.2
+    # Noise directories (node_modules, .git, ...) per directory
+    noise_dirs: int = 1
+    # Files inside each noise directory
+    noise_files: int = 5
+    prompt_words: int = 300
+    seed: int = 42
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
+
+@dataclass
+class GeneratedTree:
+    """Paths and counts of a generated tree."""
+
+    root: Path
+    claude_dir: Path
+    agents: int = 0
+    skills: int = 0
+    links: int = 0
+    directories: int = 0
+
+
+def agent_markdown(rng: random.Random, name: str, prompt_words: int) -> str:
+    """Build a synthetic agent file."""
+    tags = rng.sample(TAGS, 2)
+    description = " ".join(rng.choices(WORDS, k=20))
+    prompt = " ".join(rng.choices(WORDS, k=prompt_words))
+    return (
+        "---\n"
+        f"name: {name}\n"
+        f"description: {description}\n"
+        f"model: {rng.choice(MODELS)}\n"
+        f"color: {rng.choice(COLORS)}\n"
+        f"tags: [{', '.join(tags)}]\n"
+        "---\n\n"
+        f"{prompt}\n"
+    )
+
+
+def skill_markdown(rng: random.Random, name: str, prompt_words: int) -> str:
+    """Build a synthetic SKILL.md file."""
+    description = " ".join(rng.choices(WORDS, k=15))
+    content = " ".join(rng.choices(WORDS, k=prompt_words))
+    return f"---\nname: {name}\ndescription: {description}\n---\n\n{content}\n"
+
+
+def generate_tree(base: Path, spec: TreeSpec) -> GeneratedTree:
+    """
+    Generate a scan tree under ``base``.
+
+    Layout: ``base/tree`` holds nested directories ``spec.depth`` levels deep
+    with ``spec.fanout`` children each; leaves become projects with
+    ``.claude/agents`` and ``.claude/skills``. ``base/claude`` is a fake
+    ``~/.claude`` holding symlinks to a fraction of the generated items.
+
+    Args:
+        base: Empty directory to generate into
+        spec: Tree shape
+
+    Returns:
+        GeneratedTree with paths and counts
+    """
+    rng = random.Random(spec.seed)
+    tree = GeneratedTree(root=base / "tree", claude_dir=base / "claude")
+    (tree.claude_dir / "agents").mkdir(parents=True)
+    (tree.claude_dir / "skills").mkdir(parents=True)
+
+    def add_noise(directory: Path) -> None:
+        for noise in rng.sample(NOISE_DIRS, min(spec.noise_dirs, len(NOISE_DIRS))):
+            noise_dir = directory / noise
+            noise_dir.mkdir()
+            for i in range(spec.noise_files):
+                (noise_dir / f"file{i}.md").write_text("noise\n")
+
+    def add_project(directory: Path) -> None:
+        agents_dir = directory / ".claude" / "agents"
+        agents_dir.mkdir(parents=True)
+        for _ in range(spec.agents_per_project):
+            tree.agents += 1
+            name = f"agent-{tree.agents}"
+            agent_file = agents_dir / f"{name}.md"
+            agent_file.write_text(agent_markdown(rng, name, spec.prompt_words))
+            if rng.random() < spec.symlink_density:
+                (tree.claude_dir / "agents" / agent_file.name).symlink_to(agent_file)
+                tree.links += 1
+
+        for _ in range(spec.skills_per_project):
+            tree.skills += 1
+            name = f"skill-{tree.skills}"
+            skill_dir = directory / ".claude" / "skills" / name
+            (skill_dir / "scripts").mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(skill_markdown(rng, name, spec.prompt_words))
+            (skill_dir / "scripts" / "run.sh").write_text("#!/bin/sh\n")
+            if rng.random() < spec.symlink_density:
+                (tree.claude_dir / "skills" / name).symlink_to(skill_dir)
+                tree.links += 1
+
+    def build(directory: Path, level: int) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        tree.directories += 1
+        add_noise(directory)
+        if level == spec.depth:
+            if rng.random() < spec.project_density:
+                add_project(directory)
+            return
+        for i in range(spec.fanout):
+            build(directory / f"d{level}-{i}", level + 1)
+
+    build(tree.root, 0)
+    return tree
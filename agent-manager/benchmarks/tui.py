@@ -0,0 +1,238 @@
+"""Headless TUI responsiveness harness built on Textual's Pilot.
+
+Loads AgentManagerApp with N synthetic agents and skills, replays a
+keystroke script (open agents, hold j, type a search, switch screens with
+a/s/d) and records per-action latency percentiles plus mounted widget counts.
+
+Usage:
+    python -m benchmarks.tui --agents 500 --output tui.json
+    python -m benchmarks.compare tui-base.json tui.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import agent_manager.app
+from agent_manager.app import AgentManagerApp
+from agent_manager.models import Agent, AgentMetadata, Skill, SkillMetadata
+
+from benchmarks.run import run_metadata, summarize
+from benchmarks.tree import COLORS, MODELS, TAGS, WORDS
+
+
+def synthetic_catalog(
+    agents: int, skills: int, prompt_words: int = 300, seed: int = 42
+) -> tuple[list[Agent], list[Skill]]:
+    """
+    Build in-memory agents and skills without touching the filesystem.
+
+    Args:
+        agents: Number of agents
+        skills: Number of skills
+        prompt_words: Words per prompt/content body
+        seed: Random seed
+
+    Returns:
+        (agents, skills)
+    """
+    rng = random.Random(seed)
+    repo = Path("/synthetic/repo")
+
+    agent_list = []
+    for i in range(agents):
+        name = f"{rng.choice(WORDS)}-agent-{i}"
+        agent_list.append(Agent(
+            metadata=AgentMetadata(
+                name=name,
+                description=" ".join(rng.choices(WORDS, k=20)),
+                model=rng.choice(MODELS),
+                color=rng.choice(COLORS),
+                tags=rng.sample(TAGS, 2),
+            ),
+            prompt=" ".join(rng.choices(WORDS, k=prompt_words)),
+            source_path=repo / ".claude" / "agents" / f"{name}.md",
+            source_repo=repo,
+        ))
+
+    skill_list = []
+    for i in range(skills):
+        name = f"{rng.choice(WORDS)}-skill-{i}"
+        skill_dir = repo / ".claude" / "skills" / name
+        skill_list.append(Skill(
+            metadata=SkillMetadata(
+                name=name,
+                description=" ".join(rng.choices(WORDS, k=15)),
+            ),
+            content=" ".join(rng.choices(WORDS, k=prompt_words)),
+            source_path=skill_dir / "SKILL.md",
+            source_dir=skill_dir,
+            source_repo=repo,
+        ))
+
+    return agent_list, skill_list
+
+
+class HarnessApp(AgentManagerApp):
+    """AgentManagerApp that loads a fixed catalog instead of scanning."""
+
+    # CSS_PATH is resolved relative to the defining module
+    CSS_PATH = Path(agent_manager.app.__file__).parent / AgentManagerApp.CSS_PATH
+
+    def __init__(self, agents: list[Agent], skills: list[Skill], **kwargs):
+        super().__init__(**kwargs)
+        self._catalog = (agents, skills)
+
+    async def scan_all(self) -> None:
+        self.agents, self.skills = self._catalog
+
+
+def widget_count(app: AgentManagerApp) -> int:
+    """Count widgets mounted under the active screen."""
+    return len(app.screen.walk_children())
+
+
+async def run_script(
+    app: AgentManagerApp,
+    search: str = "review",
+    hold_j: int = 50,
+    switches: int = 5,
+) -> tuple[dict[str, list[float]], dict[str, int]]:
+    """
+    Replay the keystroke script and time each action.
+
+    Args:
+        app: App to drive (not yet running)
+        search: Text typed into the agents search box
+        hold_j: Number of repeated ``j`` presses
+        switches: Rounds of s/d/a screen switches
+
+    Returns:
+        (action name -> latencies in ms, checkpoint -> mounted widget count)
+    """
+    timings: dict[str, list[float]] = defaultdict(list)
+    widgets: dict[str, int] = {}
+
+    async with app.run_test(size=(160, 48)) as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        async def press(action: str, key: str) -> None:
+            start = time.perf_counter()
+            await pilot.press(key)
+            await pilot.pause()
+            timings[action].append((time.perf_counter() - start) * 1000)
+
+        await press("open_agents", "a")
+        widgets["agents"] = widget_count(app)
+
+        for _ in range(hold_j):
+            await press("cursor_down", "j")
+
+        await press("focus_search", "slash")
+        for char in search:
+            await press("search_keystroke", char)
+        widgets["agents_search"] = widget_count(app)
+        for _ in search:
+            await press("search_backspace", "backspace")
+        await press("focus_list", "tab")
+
+        for _ in range(switches):
+            await press("switch_skills", "s")
+            widgets["skills"] = widget_count(app)
+            await press("switch_dashboard", "d")
+            widgets["dashboard"] = widget_count(app)
+            await press("switch_agents", "a")
+
+    return timings, widgets
+
+
+def run(
+    agents: int,
+    skills: int,
+    search: str = "review",
+    hold_j: int = 50,
+    switches: int = 5,
+) -> dict:
+    """
+    Run the harness against a synthetic catalog and return results.
+
+    The result layout matches ``benchmarks.run`` so ``benchmarks.compare``
+    works on it unchanged.
+
+    Args:
+        agents: Number of synthetic agents
+        skills: Number of synthetic skills
+        search: Text typed into the agents search box
+        hold_j: Number of repeated ``j`` presses
+        switches: Rounds of s/d/a screen switches
+
+    Returns:
+        Results dict with per-action latency summaries and widget counts
+    """
+    catalog = synthetic_catalog(agents, skills)
+
+    # Keep the app away from the real ~/.config and ~/.claude
+    with tempfile.TemporaryDirectory(prefix="agent-manager-tui-") as home:
+        previous_home = os.environ.get("HOME")
+        os.environ["HOME"] = home
+        try:
+            app = HarnessApp(*catalog)
+            timings, widgets = asyncio.run(run_script(app, search, hold_j, switches))
+        finally:
+            if previous_home is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = previous_home
+
+    spec = {
+        "agents": agents,
+        "skills": skills,
+        "search": search,
+        "hold_j": hold_j,
+        "switches": switches,
+    }
+    return {
+        "meta": run_metadata(spec),
+        "benchmarks": {action: summarize(times) for action, times in timings.items()},
+        "widgets": widgets,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", "-o", type=Path, help="Write JSON results here")
+    parser.add_argument("--agents", type=int, default=200)
+    parser.add_argument("--skills", type=int, default=50)
+    parser.add_argument("--search", default="review")
+    parser.add_argument("--hold-j", type=int, default=50)
+    parser.add_argument("--switches", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = run(args.agents, args.skills, args.search, args.hold_j, args.switches)
+    for action, summary in results["benchmarks"].items():
+        print(
+            f"  {action:<18} p50 {summary['median']:8.2f} ms  "
+            f"p95 {summary['p95']:8.2f} ms  (n={summary['runs']})",
+            file=sys.stderr,
+        )
+    for checkpoint, count in results["widgets"].items():
+        print(f"  widgets[{checkpoint}] = {count}", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,25 @@
 """Main Textual application for Agent Manager."""
 
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
 from textual.app import ComposeResult, App
 from textual.binding import Binding
 from textual.widgets import Header, Footer
 
 from agent_manager.core import ConfigManager, AgentSkillScanner, SymlinkManager, MCPManager, SessionManager
+from agent_manager.core.agent_usage import USAGE_WINDOWS, AgentUsage
+from agent_manager.core.catalog_store import CatalogStore
+from agent_manager.core.daemon_client import DaemonClient, DaemonError
+from agent_manager.core.mcp_health import HealthChecker
+from agent_manager.core.mcp_tools import ToolCatalog
+from agent_manager.core.scan_stats import ScanStats
+from agent_manager.core.scanner import ScanResult
+from agent_manager.core.search_index import SearchIndex, SearchResult
+from agent_manager.core.similarity import SimilarityIndex
+from agent_manager.core.tokens import TokenCache, default_token_cache_path
 from agent_manager.models import Agent, Skill, AppConfig, MCPServer
 from agent_manager.ui.screens import (
     DashboardScreen,
@@ -16,6 +31,10 @@ from agent_manager.ui.screens import (
 )
 
 
+# Seconds between picking up new session log lines for the usage figures
+USAGE_REFRESH_INTERVAL = 60.0
+
+
 class AgentManagerApp(App):
     """Main TUI application for managing agents and skills."""
 
@@ -49,14 +68,27 @@ class AgentManagerApp(App):
         super().__init__(*args, **kwargs)
         self.config_manager = ConfigManager()
         self.config = self.config_manager.load()
-        self.scanner = AgentSkillScanner()
+        self.scanner = AgentSkillScanner(
+            token_cache=TokenCache(default_token_cache_path()), keep_parsed=True
+        )
         self.symlink_manager = SymlinkManager(
             claude_dir=self.config.claude_dir,
         )
         self.mcp_manager = MCPManager()
-        self.session_manager = SessionManager()
+        self.session_manager = SessionManager(claude_dir=self.config.claude_dir)
         self.agents: list[Agent] = []
         self.skills: list[Skill] = []
+        self.mcp_servers: list[MCPServer] = []
+        # Tools of each MCP server, refreshed in the background when stale
+        self.tool_catalog = ToolCatalog()
+        self.scan_stats: ScanStats | None = None
+        # Prompt/content index, available once the first scan has finished
+        self.search_index: SearchIndex | None = None
+        self._search_lock = threading.Lock()
+        # Near-duplicate index over agent prompts, rebuilt after each scan
+        self.similarity_index: SimilarityIndex | None = None
+        # Subagent use from session logs: window in days -> agent name -> usage
+        self.agent_usage: dict[int, dict[str, AgentUsage]] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the app."""
@@ -66,8 +98,79 @@ class AgentManagerApp(App):
     async def on_mount(self) -> None:
         """Called when app starts."""
         await self.push_screen("dashboard")
+        # Show the last-known catalog right away; the scan below refreshes it
+        if self.config.catalog_db:
+            self._load_from_catalog()
         # Start initial scan in the background
         self.run_worker(self.scan_all(), exclusive=True)
+        self.run_worker(self.refresh_mcp_tools(), group="mcp-tools")
+        self.refresh_usage()
+        self.set_interval(USAGE_REFRESH_INTERVAL, self.refresh_usage)
+
+    def refresh_usage(self) -> None:
+        """Index new session log lines and recompute agent usage in the background."""
+        self.run_worker(self._refresh_usage(), group="usage", exclusive=True)
+
+    async def _refresh_usage(self) -> None:
+        def load() -> dict[int, dict[str, AgentUsage]]:
+            self.session_manager.update_index()
+            return {days: self.session_manager.agent_usage(days) for days in USAGE_WINDOWS}
+
+        try:
+            usage = await asyncio.to_thread(load)
+        except sqlite3.Error as e:
+            self.notify(f"Could not read session index: {e}", severity="warning")
+            return
+        if usage != self.agent_usage:
+            self.agent_usage = usage
+            screen = self.screen
+            if hasattr(screen, "update_usage"):
+                screen.update_usage()
+            elif hasattr(screen, "update_stats"):
+                screen.update_stats()
+
+    def usage_of(self, agent: Agent) -> dict[int, AgentUsage] | None:
+        """
+        Get an agent's subagent use in each rolling window.
+
+        Args:
+            agent: Agent to look up (by name, as session logs record it)
+
+        Returns:
+            Window in days -> usage, for windows it was called in; None until
+            session logs have been read
+        """
+        if not self.agent_usage:
+            return None
+        name = agent.metadata.name
+        return {days: usage[name] for days, usage in self.agent_usage.items() if name in usage}
+
+    async def refresh_mcp_tools(self) -> None:
+        """Load MCP servers and re-list the tools of those whose catalog entry is stale."""
+        def load() -> list[MCPServer]:
+            servers = self.mcp_manager.load_servers()
+            self.tool_catalog.stale(servers)  # reads the catalog off the UI thread
+            return servers
+
+        servers = await asyncio.to_thread(load)
+        # The MCP screen may have loaded (and be showing) its own copy already
+        if not self.mcp_servers:
+            self.mcp_servers = servers
+        stale = self.tool_catalog.stale(self.mcp_servers)
+        if stale:
+            await HealthChecker(catalog=self.tool_catalog).check_all(stale, force=True)
+
+    def missing_tools(self, agent: Agent) -> list[str]:
+        """
+        Find the MCP tools an agent references that no configured server provides.
+
+        Args:
+            agent: Agent to check
+
+        Returns:
+            Tool names, e.g. ``mcp__github__create_issue``
+        """
+        return self.tool_catalog.missing_tools(agent, self.mcp_servers)
 
     async def scan_all(self) -> None:
         """Scan all configured paths for agents and skills."""
@@ -88,20 +191,31 @@ class AgentManagerApp(App):
             return
 
         try:
-            # Run async scan
-            result = await self.scanner.scan_all(enabled_paths)
+            # Prefer the warm catalog from a running daemon
+            catalog = await asyncio.to_thread(self._load_from_daemon)
+            if catalog is not None:
+                self.agents, self.skills = catalog
+                self.scan_stats = None
+                errors = []
+            else:
+                result = await self.scanner.scan_all(enabled_paths)
+                self.agents = result.agents
+                self.skills = result.skills
+                self.scan_stats = result.stats
+                errors = result.errors
 
-            self.agents = result.agents
-            self.skills = result.skills
+                # One listing of each global directory for every item's link status
+                await asyncio.to_thread(
+                    self.symlink_manager.resolve_global_links, self.agents, self.skills
+                )
 
-            # Update symlink status for each agent and skill
-            for agent in self.agents:
-                status = self.symlink_manager.get_agent_link_status(agent.source_path)
-                agent.global_link = status.get("global_target")
+                if self.config.catalog_db:
+                    try:
+                        await asyncio.to_thread(self._save_to_catalog, enabled_paths, result)
+                    except sqlite3.Error as e:
+                        self.notify(f"Could not update catalog: {e}", severity="warning")
 
-            for skill in self.skills:
-                status = self.symlink_manager.get_skill_link_status(skill.source_dir)
-                skill.global_link = status.get("global_target")
+            await asyncio.to_thread(self._count_tokens)
 
             # Update scan path stats
             for scan_path in self.config.scan_paths:
@@ -117,16 +231,13 @@ class AgentManagerApp(App):
             # Save updated config
             self.config_manager.save(self.config)
 
-            # Notify current screen of update
-            screen = self.screen
-            if hasattr(screen, "update_stats"):
-                screen.update_stats()
-            elif hasattr(screen, "_rebuild_list"):
-                screen._rebuild_list()
+            await asyncio.to_thread(self._update_search_index)
+            self.similarity_index = await asyncio.to_thread(self._build_similarity_index)
+            self._refresh_screen()
 
             # Report any errors
-            if result.errors:
-                error_count = len(result.errors)
+            if errors:
+                error_count = len(errors)
                 self.notify(
                     f"Scan complete with {error_count} error(s)",
                     severity="warning",
@@ -141,6 +252,121 @@ class AgentManagerApp(App):
         except Exception as e:
             self.notify(f"Scan failed: {e}", severity="error")
 
+    def _count_tokens(self) -> None:
+        """Estimate tokens for items that came without a count, and persist new counts."""
+        cache = self.scanner.token_cache
+        cache.annotate(self.agents, self.skills)
+        try:
+            cache.save()
+        except OSError:
+            pass
+
+    def _load_from_daemon(self) -> tuple[list[Agent], list[Skill]] | None:
+        """Fetch agents and skills from the daemon, or None if it isn't running."""
+        client = DaemonClient.connect()
+        if client is None:
+            return None
+        try:
+            with client:
+                agents = client.call("list_agents", include_body=True)
+                skills = client.call("list_skills", include_body=True)
+        except (OSError, DaemonError):
+            return None
+        return (
+            [Agent.from_dict(a) for a in agents],
+            [Skill.from_dict(s) for s in skills],
+        )
+
+    def _load_from_catalog(self) -> None:
+        """Load the last-known agents and skills from the catalog database."""
+        try:
+            with CatalogStore() as store:
+                self.agents = store.load_agents()
+                self.skills = store.load_skills()
+        except sqlite3.Error as e:
+            self.notify(f"Could not read catalog: {e}", severity="warning")
+            return
+        self._refresh_screen()
+
+    def _save_to_catalog(self, paths: list[Path], result: ScanResult) -> None:
+        """Upsert a scan into the catalog database (runs in a worker thread)."""
+        roots = {path.resolve(): ([], [], []) for path in paths}
+        for agent in result.agents:
+            if agent.source_repo in roots:
+                roots[agent.source_repo][0].append(agent)
+        for skill in result.skills:
+            if skill.source_repo in roots:
+                roots[skill.source_repo][1].append(skill)
+        for path, message in result.errors:
+            for root, items in roots.items():
+                if Path(path).resolve().is_relative_to(root):
+                    items[2].append((path, message))
+                    break
+
+        with CatalogStore() as store:
+            for info in store.roots():
+                if info.path not in roots:
+                    store.remove_root(info.path)
+            for root, (agents, skills, errors) in roots.items():
+                store.update_root(root, agents, skills, errors)
+
+    def _update_search_index(self) -> None:
+        """Bring the persisted search index up to date (runs in a worker thread)."""
+        index = self.search_index or SearchIndex.load()
+        with self._search_lock:
+            index.update(self.agents, self.skills)
+            index.prune([
+                *(a.source_path for a in self.agents),
+                *(s.source_path for s in self.skills),
+            ])
+        index.save()
+        self.search_index = index
+
+    def _build_similarity_index(self) -> SimilarityIndex:
+        """Index agent prompts for near-duplicate lookups (runs in a worker thread)."""
+        index = SimilarityIndex()
+        for agent in self.agents:
+            index.add(agent, previous=self.similarity_index)
+        return index
+
+    def similar_agents(self, agent: Agent) -> list[tuple[Agent, float]]:
+        """
+        Find the agents whose prompts are closest to ``agent``.
+
+        Args:
+            agent: Agent to look up
+
+        Returns:
+            (agent, similarity) pairs, empty until the first scan has finished
+        """
+        if self.similarity_index is None:
+            return []
+        return self.similarity_index.relatives(agent)
+
+    def search_content(self, query: str, kind: str) -> list[SearchResult] | None:
+        """
+        Rank agents or skills by prompt/content relevance.
+
+        Args:
+            query: Free-text query
+            kind: "agent" or "skill"
+
+        Returns:
+            Results best first, or None while the index is being built
+        """
+        if self.search_index is None:
+            return None
+        with self._search_lock:
+            return self.search_index.search(query, kind=kind, limit=500)
+
+    def _refresh_screen(self) -> None:
+        """Tell the current screen that the catalog changed."""
+        screen = self.screen
+        if hasattr(screen, "update_stats"):
+            screen.update_stats()
+        elif hasattr(screen, "_rebuild_list"):
+            screen._rebuild_list()
+
     def action_goto(self, screen_name: str) -> None:
         """Navigate to a named screen using switch (not push)."""
         try:
@@ -160,6 +386,7 @@ class AgentManagerApp(App):
     def action_refresh(self) -> None:
         """Trigger a refresh scan."""
         self.run_worker(self.scan_all(), exclusive=True)
+        self.refresh_usage()
 
 
 def main():
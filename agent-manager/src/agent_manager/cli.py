@@ -1,15 +1,15 @@
-"""CLI interface for Agent Manager."""
+"""CLI interface for Agent Manager.
 
-import asyncio
-import json
+Only typer is imported at module level. Each command imports what it needs
+so that non-TUI commands never pay for Textual, the UI package or jsonschema.
+"""
+
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import typer
 
-from agent_manager.app import AgentManagerApp
-from agent_manager.core import ConfigManager, AgentSkillScanner, SymlinkManager
-
 app_cli = typer.Typer(
     name="agent-manager",
     help="TUI Manager for Claude Code Agents and Skills",
@@ -27,6 +27,8 @@ def run(
     ),
 ) -> None:
     """Launch the interactive TUI application."""
+    from agent_manager.app import AgentManagerApp
+
     app = AgentManagerApp()
 
     # Add extra scan paths if provided
@@ -49,22 +51,86 @@ def scan(
         "--json",
         help="Output as JSON",
     ),
+    ndjson_output: bool = typer.Option(
+        False,
+        "--ndjson",
+        help="Stream one JSON object per agent/skill/error as it is found",
+    ),
+    fields: Optional[str] = typer.Option(
+        None,
+        "--fields",
+        help="Comma-separated fields to include in JSON output",
+    ),
+    filter_spec: Optional[str] = typer.Option(
+        None,
+        "--filter",
+        help="Only include items matching e.g. 'model=opus,tag=sre'",
+    ),
+    validate: bool = typer.Option(
+        False,
+        "--validate",
+        help="Validate agents against schema.json and report failures as errors",
+    ),
+    show_stats: bool = typer.Option(
+        False,
+        "--stats",
+        help="Show per-root scan metrics",
+    ),
+    profile: Optional[Path] = typer.Option(
+        None,
+        "--profile",
+        help="Write cProfile/pstats output for the scan to this file",
+    ),
 ) -> None:
     """Scan paths for agents/skills without launching TUI."""
-    scanner = AgentSkillScanner()
+    import asyncio
+    import json
+
+    from agent_manager.core.scan_stats import ScanStats
+    from agent_manager.core.scanner import AgentSkillScanner
+
+    field_list, scan_filter = _parse_query(fields, filter_spec)
+    validator = None
+    if validate:
+        from agent_manager.core.validator import AgentValidator
+
+        validator = AgentValidator()
+    scanner = AgentSkillScanner(scan_filter=scan_filter, validator=validator)
     scan_paths = [Path(p).expanduser().resolve() for p in paths]
 
+    if ndjson_output:
+        resolve_links = _link_resolver(field_list)
+        stats = ScanStats()
+        with _profiling(profile):
+            for kind, item in scanner.iter_scan(scan_paths, stats):
+                if kind == "error":
+                    path, message = item
+                    record = {"type": "error", "path": str(path), "message": message}
+                else:
+                    resolve_links(item)
+                    record = {"type": kind, **_project(item, field_list)}
+                _write_ndjson(record)
+        if show_stats:
+            _write_ndjson({"type": "stats", **stats.to_dict()})
+        return
+
     async def do_scan():
         return await scanner.scan_all(scan_paths)
 
-    result = asyncio.run(do_scan())
+    with _profiling(profile):
+        result = asyncio.run(do_scan())
 
     if json_output:
+        resolve_links = _link_resolver(field_list)
+        for item in (*result.agents, *result.skills):
+            resolve_links(item)
         output = {
-            "agents": [a.to_dict() for a in result.agents],
-            "skills": [s.to_dict() for s in result.skills],
+            "agents": [_project(a, field_list) for a in result.agents],
+            "skills": [_project(s, field_list) for s in result.skills],
             "errors": [{"path": str(p), "message": m} for p, m in result.errors],
         }
+        if show_stats:
+            output["stats"] = result.stats.to_dict()
         typer.echo(json.dumps(output, indent=2))
     else:
         # Pretty print
@@ -81,6 +147,132 @@ def scan(
             for path, error in result.errors:
                 typer.echo(f"  ✗ {path}: {error}")
 
+        if show_stats:
+            typer.echo()
+            _print_scan_stats(result.stats)
+
+
+@app_cli.command()
+def scan_refs(
+    repo: Path = typer.Argument(..., help="Git repository to scan"),
+    refs: Optional[list[str]] = typer.Argument(
+        None,
+        help="Branches, tags or commits (default: HEAD)",
+    ),
+    all_refs: bool = typer.Option(
+        False,
+        "--all",
+        help="Scan every local branch and tag",
+    ),
+    fields: Optional[str] = typer.Option(
+        None,
+        "--fields",
+        help="Comma-separated fields to include in JSON output",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON",
+    ),
+) -> None:
+    """Scan git refs for agents/skills without checking them out."""
+    import json
+
+    from agent_manager.core.git_objects import GitError, GitObjectReader
+    from agent_manager.core.scanner import AgentSkillScanner
+
+    field_list, _ = _parse_query(fields, None)
+    repo = repo.expanduser().resolve()
+    if all_refs:
+        try:
+            with GitObjectReader(repo) as reader:
+                refs = reader.list_refs()
+        except GitError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1)
+    results = AgentSkillScanner().scan_refs(repo, refs or ["HEAD"])
+
+    if json_output:
+        typer.echo(json.dumps({
+            ref: {
+                "agents": [_project(a, field_list) for a in result.agents],
+                "skills": [_project(s, field_list) for s in result.skills],
+                "errors": [{"path": str(p), "message": m} for p, m in result.errors],
+            }
+            for ref, result in results.items()
+        }, indent=2))
+        return
+
+    for ref, result in results.items():
+        typer.echo(f"{ref}: {len(result.agents)} agent(s), {len(result.skills)} skill(s)")
+        for agent in result.agents:
+            typer.echo(f"  • {agent.metadata.name} ({agent.metadata.model})")
+        for skill in result.skills:
+            typer.echo(f"  ◆ {skill.metadata.name}")
+        for _, error in result.errors:
+            typer.echo(f"  ✗ {error}")
+
+
+@contextmanager
+def _profiling(output: Path | None) -> Iterator[None]:
+    """Profile the enclosed block with cProfile if an output path is given."""
+    if output is None:
+        yield
+        return
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(output)
+        typer.echo(f"Profile written to {output} (view with: python -m pstats {output})", err=True)
+
+
+def _print_scan_stats(stats) -> None:
+    """Print per-root scan metrics as a table."""
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="Scan Statistics")
+    table.add_column("Root")
+    table.add_column("Dirs", justify="right")
+    table.add_column("Entries", justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Dupes", justify="right")
+    table.add_column("Wall ms", justify="right")
+    table.add_column("Parse ms", justify="right")
+    table.add_column("YAML ms", justify="right")
+    table.add_column("Valid. ms", justify="right")
+    table.add_column("Errors")
+
+    for root in stats.roots.values():
+        errors = ", ".join(f"{k}={v}" for k, v in root.errors_by_type.most_common())
+        table.add_row(
+            str(root.root),
+            str(root.dirs_visited),
+            str(root.entries_seen),
+            str(root.candidate_files),
+            str(root.duplicate_files),
+            f"{root.wall_time * 1000:.1f}",
+            f"{root.parse_time * 1000:.1f}",
+            f"{root.yaml_time * 1000:.1f}",
+            f"{root.validation_time * 1000:.1f}",
+            errors or "-",
+        )
+
+    console = Console()
+    console.print(table)
+
+    slowest = stats.slowest_files(5)
+    if slowest:
+        console.print("Slowest files:")
+        for path, seconds in slowest:
+            console.print(f"  {seconds * 1000:8.2f} ms  {path}", highlight=False)
+
 
 @app_cli.command()
 def link(
@@ -98,9 +290,10 @@ def link(
     ),
 ) -> None:
     """Link an agent or skill without launching TUI."""
+    from agent_manager.core.config_manager import ConfigManager
+
     config_manager = ConfigManager()
     config = config_manager.load()
-    symlink_manager = SymlinkManager(claude_dir=config.claude_dir)
 
     if scope == "global":
         if is_skill:
@@ -110,8 +303,192 @@ def link(
         typer.echo("Please use the TUI to link agents")
         raise typer.Exit(1)
     else:
-        typer.echo("Project linking not yet implemented via CLI")
+        _link_project(config_manager, config, Path(scope).expanduser().resolve(), name, is_skill)
+
+
+def _link_project(config_manager, config, project: Path, name: str, is_skill: bool) -> None:
+    """Assign an agent or skill to a project in the config and link it there."""
+    import asyncio
+
+    from agent_manager.core.assignments import AssignmentReconciler
+    from agent_manager.models import ProjectAssignment
+
+    if not project.is_dir():
+        raise typer.BadParameter(f"Not a directory: {project}", param_hint="--scope")
+    agents, skills = _load_items()
+    assignment = next(
+        (a for a in config.project_assignments if a.project_path.expanduser() == project), None
+    )
+    if assignment is None:
+        assignment = ProjectAssignment(project)
+        config.project_assignments.append(assignment)
+    names = assignment.skill_names if is_skill else assignment.agent_names
+    if name not in names:
+        names.append(name)
+
+    # Only this project, and without pruning links the user made by hand
+    reconciler = AssignmentReconciler(agents, skills, prune=False)
+    plans = reconciler.plan([assignment])
+    if name in plans[0].missing:
+        typer.echo(f"{'Skill' if is_skill else 'Agent'} not found: {name}", err=True)
         raise typer.Exit(1)
+    config_manager.save(config)
+    asyncio.run(reconciler.apply(plans))
+    _print_plans(plans, dry_run=False, json_output=False)
+
+    kind = "skills" if is_skill else "agents"
+    target = plans[0].project / ".claude" / kind / reconciler.source(kind, name).name
+    skipped = any(a.kind == "skip" and a.target == target for a in plans[0].actions)
+    if plans[0].failed or skipped:
+        typer.echo(f"Could not link {name} into {project}; the assignment is saved for sync", err=True)
+        raise typer.Exit(1)
+
+
+def _enabled_scan_paths() -> list[Path]:
+    """Get the enabled scan paths from the config, exiting if there are none."""
+    from agent_manager.core.config_manager import ConfigManager
+
+    config = ConfigManager().load()
+    enabled_paths = [sp.path for sp in config.scan_paths if sp.enabled]
+    if not enabled_paths:
+        typer.echo("No enabled scan paths configured")
+        raise typer.Exit(1)
+    return enabled_paths
+
+
+def _open_catalog():
+    """
+    Open the catalog database if it is enabled and has been populated.
+
+    Roots whose files or item directories changed since they were stored
+    are rescanned first, so added, edited and deleted items are never
+    served stale.
+    """
+    from agent_manager.core.catalog_store import CatalogStore, default_catalog_path
+    from agent_manager.core.config_manager import ConfigManager
+
+    if not ConfigManager().load().catalog_db or not default_catalog_path().exists():
+        return None
+    store = CatalogStore()
+    _update_catalog(store, stale_only=True)
+    return store
+
+
+def _update_catalog(store, stale_only: bool = False) -> list:
+    """
+    Scan the enabled paths into the catalog, dropping roots no longer enabled.
+
+    Args:
+        store: Open CatalogStore
+        stale_only: Only rescan roots ``CatalogStore.stale_roots`` reports
+
+    Returns:
+        (root, IngestResult) for each root scanned
+    """
+    from agent_manager.core.scanner import AgentSkillScanner
+
+    enabled_paths = [p.resolve() for p in _enabled_scan_paths()]
+    for info in store.roots():
+        if info.path not in enabled_paths:
+            store.remove_root(info.path)
+    roots = store.stale_roots(enabled_paths) if stale_only else enabled_paths
+
+    scanner = AgentSkillScanner()
+    resolve_links = _link_resolver(None)
+
+    def with_links(events):
+        for kind, item in events:
+            if kind != "error":
+                resolve_links(item)
+            yield kind, item
+
+    return [(root, store.ingest(root, with_links(scanner.iter_path(root)))) for root in roots]
+
+
+def _catalog_filter(scan_filter, kind: str) -> dict:
+    """Keyword arguments narrowing a catalog load to a filter's literal terms."""
+    if scan_filter is None:
+        return {}
+    keys = {"name": "name", "model": "model", "tag": "tags"} if kind == "agent" else {"name": "name"}
+    return {
+        arg: value for arg, attr in keys.items()
+        if (value := scan_filter.exact(attr)) is not None
+    }
+
+
+def _write_ndjson(record: dict) -> None:
+    """Write one compact JSON line and flush so consumers see it immediately."""
+    import json
+    import sys
+
+    try:
+        sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Consumer went away (e.g. `| head`); stop quietly
+        raise typer.Exit(0)
+
+
+def _parse_query(fields: str | None, filter_spec: str | None):
+    """Parse --fields and --filter, reporting errors as bad parameters."""
+    from agent_manager.core.query import ScanFilter, parse_fields
+    from agent_manager.models.agent import FIELDS as AGENT_FIELDS
+    from agent_manager.models.skill import FIELDS as SKILL_FIELDS
+
+    field_list = parse_fields(fields)
+    if field_list is not None:
+        unknown = [f for f in field_list if f not in AGENT_FIELDS and f not in SKILL_FIELDS]
+        if unknown:
+            valid = ", ".join(dict.fromkeys([*AGENT_FIELDS, *SKILL_FIELDS]))
+            raise typer.BadParameter(
+                f"Unknown field(s) {', '.join(unknown)} (valid: {valid})",
+                param_hint="--fields",
+            )
+
+    try:
+        scan_filter = ScanFilter.parse(filter_spec)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--filter")
+
+    return field_list, scan_filter
+
+
+def _project(item, fields: list[str] | None) -> dict:
+    """Serialize an agent or skill, keeping only the fields it supports."""
+    from agent_manager.models import Agent
+    from agent_manager.models.agent import FIELDS as AGENT_FIELDS
+    from agent_manager.models.skill import FIELDS as SKILL_FIELDS
+
+    if fields is None:
+        return item.to_dict()
+    supported = AGENT_FIELDS if isinstance(item, Agent) else SKILL_FIELDS
+    return item.to_dict([f for f in fields if f in supported])
+
+
+def _link_resolver(fields: list[str] | None):
+    """
+    Return a callable that sets ``global_link`` on an agent or skill.
+
+    The global link directories are listed once, and only if link_status is
+    part of the output.
+    """
+    if fields is not None and "link_status" not in fields:
+        return lambda item: None
+
+    from agent_manager.core.config_manager import ConfigManager
+    from agent_manager.core.symlink_manager import SymlinkManager
+    from agent_manager.models import Agent
+
+    claude_dir = ConfigManager().load().claude_dir
+    index = SymlinkManager(claude_dir=claude_dir).global_link_index()
+
+    def resolve(item) -> None:
+        if isinstance(item, Agent):
+            item.global_link = index.agent_link(item.source_path)
+        else:
+            item.global_link = index.skill_link(item.source_dir)
+
+    return resolve
 
 
 @app_cli.command()
@@ -121,28 +498,81 @@ def list_agents(
         "--json",
         help="Output as JSON",
     ),
+    ndjson_output: bool = typer.Option(
+        False,
+        "--ndjson",
+        help="Stream one JSON object per agent as it is found",
+    ),
+    fields: Optional[str] = typer.Option(
+        None,
+        "--fields",
+        help="Comma-separated fields to include in JSON output",
+    ),
+    filter_spec: Optional[str] = typer.Option(
+        None,
+        "--filter",
+        help="Only include agents matching e.g. 'model=opus,tag=sre'",
+    ),
+    no_daemon: bool = typer.Option(
+        False,
+        "--no-daemon",
+        help="Scan directly even if the daemon is running",
+    ),
+    no_catalog: bool = typer.Option(
+        False,
+        "--no-catalog",
+        help="Scan directly even if the catalog database is enabled",
+    ),
 ) -> None:
     """List all discovered agents."""
-    config_manager = ConfigManager()
-    config = config_manager.load()
-    scanner = AgentSkillScanner()
+    import asyncio
+    import json
 
-    enabled_paths = [sp.path for sp in config.scan_paths if sp.enabled]
-    if not enabled_paths:
-        typer.echo("No enabled scan paths configured")
-        raise typer.Exit(1)
+    from agent_manager.core.daemon_client import DaemonClient
+    from agent_manager.core.scanner import AgentSkillScanner
+    from agent_manager.models import Agent
 
-    async def do_scan():
-        return await scanner.scan_all(enabled_paths)
+    field_list, scan_filter = _parse_query(fields, filter_spec)
+    scanner = AgentSkillScanner(scan_filter=scan_filter)
 
-    result = asyncio.run(do_scan())
+    client = None if no_daemon else DaemonClient.connect()
+    store = None if no_catalog or client is not None else _open_catalog()
+    if client is not None:
+        with client:
+            agents = [Agent.from_dict(d) for d in client.call("list_agents")]
+        if scan_filter:
+            agents = [a for a in agents if scan_filter.matches(a.metadata)]
+    elif store is not None:
+        with store:
+            agents = store.load_agents(**_catalog_filter(scan_filter, "agent"))
+        if scan_filter:
+            agents = [a for a in agents if scan_filter.matches(a.metadata)]
+        # Links may have changed since the catalog stored them
+        resolve_links = _link_resolver(field_list)
+        for item in agents:
+            resolve_links(item)
+    elif ndjson_output:
+        resolve_links = _link_resolver(field_list)
+        for kind, item in scanner.iter_scan(_enabled_scan_paths()):
+            if kind == "agent":
+                resolve_links(item)
+                _write_ndjson(_project(item, field_list))
+        return
+    else:
+        agents = asyncio.run(scanner.scan_all(_enabled_scan_paths())).agents
+        resolve_links = _link_resolver(field_list)
+        for agent in agents:
+            resolve_links(agent)
 
-    if json_output:
-        output = [a.to_dict() for a in result.agents]
+    if ndjson_output:
+        for agent in agents:
+            _write_ndjson(_project(agent, field_list))
+    elif json_output:
+        output = [_project(a, field_list) for a in agents]
         typer.echo(json.dumps(output, indent=2))
     else:
-        typer.echo(f"Found {len(result.agents)} agent(s):\n")
-        for agent in result.agents:
+        typer.echo(f"Found {len(agents)} agent(s):\n")
+        for agent in agents:
             typer.echo(f"  • {agent.metadata.name:<30} {agent.metadata.model}")
             typer.echo(f"    {agent.source_path}")
             typer.echo()
@@ -155,36 +585,711 @@ def list_skills(
         "--json",
         help="Output as JSON",
     ),
+    ndjson_output: bool = typer.Option(
+        False,
+        "--ndjson",
+        help="Stream one JSON object per skill as it is found",
+    ),
+    fields: Optional[str] = typer.Option(
+        None,
+        "--fields",
+        help="Comma-separated fields to include in JSON output",
+    ),
+    filter_spec: Optional[str] = typer.Option(
+        None,
+        "--filter",
+        help="Only include skills matching e.g. 'name=obsidian*'",
+    ),
+    no_daemon: bool = typer.Option(
+        False,
+        "--no-daemon",
+        help="Scan directly even if the daemon is running",
+    ),
+    no_catalog: bool = typer.Option(
+        False,
+        "--no-catalog",
+        help="Scan directly even if the catalog database is enabled",
+    ),
 ) -> None:
     """List all discovered skills."""
-    config_manager = ConfigManager()
-    config = config_manager.load()
-    scanner = AgentSkillScanner()
+    import asyncio
+    import json
 
-    enabled_paths = [sp.path for sp in config.scan_paths if sp.enabled]
-    if not enabled_paths:
-        typer.echo("No enabled scan paths configured")
-        raise typer.Exit(1)
+    from agent_manager.core.daemon_client import DaemonClient
+    from agent_manager.core.scanner import AgentSkillScanner
+    from agent_manager.models import Skill
 
-    async def do_scan():
-        return await scanner.scan_all(enabled_paths)
+    field_list, scan_filter = _parse_query(fields, filter_spec)
+    scanner = AgentSkillScanner(scan_filter=scan_filter)
 
-    result = asyncio.run(do_scan())
+    client = None if no_daemon else DaemonClient.connect()
+    store = None if no_catalog or client is not None else _open_catalog()
+    if client is not None:
+        with client:
+            skills = [Skill.from_dict(d) for d in client.call("list_skills")]
+        if scan_filter:
+            skills = [s for s in skills if scan_filter.matches(s.metadata)]
+    elif store is not None:
+        with store:
+            skills = store.load_skills(**_catalog_filter(scan_filter, "skill"))
+        if scan_filter:
+            skills = [s for s in skills if scan_filter.matches(s.metadata)]
+        # Links may have changed since the catalog stored them
+        resolve_links = _link_resolver(field_list)
+        for item in skills:
+            resolve_links(item)
+    elif ndjson_output:
+        resolve_links = _link_resolver(field_list)
+        for kind, item in scanner.iter_scan(_enabled_scan_paths()):
+            if kind == "skill":
+                resolve_links(item)
+                _write_ndjson(_project(item, field_list))
+        return
+    else:
+        skills = asyncio.run(scanner.scan_all(_enabled_scan_paths())).skills
+        resolve_links = _link_resolver(field_list)
+        for skill in skills:
+            resolve_links(skill)
 
-    if json_output:
-        output = [s.to_dict() for s in result.skills]
+    if ndjson_output:
+        for skill in skills:
+            _write_ndjson(_project(skill, field_list))
+    elif json_output:
+        output = [_project(s, field_list) for s in skills]
         typer.echo(json.dumps(output, indent=2))
     else:
-        typer.echo(f"Found {len(result.skills)} skill(s):\n")
-        for skill in result.skills:
+        typer.echo(f"Found {len(skills)} skill(s):\n")
+        for skill in skills:
             typer.echo(f"  ◆ {skill.metadata.name:<30} ({len(skill.scripts)} scripts)")
             typer.echo(f"    {skill.source_dir}")
             typer.echo()
 
 
+@app_cli.command()
+def search(
+    query: str = typer.Argument(..., help="Words to look for in agent prompts and skill content"),
+    kind: Optional[str] = typer.Option(
+        None,
+        "--kind",
+        help="Only return 'agent' or 'skill' results",
+    ),
+    limit: int = typer.Option(
+        10,
+        "--limit",
+        "-n",
+        help="Maximum number of results",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON",
+    ),
+    no_daemon: bool = typer.Option(
+        False,
+        "--no-daemon",
+        help="Don't ask the daemon even if it is running",
+    ),
+    no_catalog: bool = typer.Option(
+        False,
+        "--no-catalog",
+        help="Don't use the catalog database even if it is enabled",
+    ),
+) -> None:
+    """Full-text search over agent prompts and skill content (BM25-ranked)."""
+    import json
+
+    from agent_manager.core.daemon_client import DaemonClient
+    from agent_manager.core.parser import FrontmatterParser
+    from agent_manager.core.search_index import SearchResult, snippet, tokenize
+
+    if kind not in (None, "agent", "skill"):
+        raise typer.BadParameter("must be 'agent' or 'skill'", param_hint="--kind")
+
+    client = None if no_daemon else DaemonClient.connect()
+    store = None if no_catalog or client is not None else _open_catalog()
+    if client is not None:
+        with client:
+            rows = client.call("full_text_search", query=query, kind=kind, limit=limit)
+        results = [
+            SearchResult(r["kind"], r["name"], Path(r["source_path"]), r["score"]) for r in rows
+        ]
+    elif store is not None:
+        # Any term may match, as in the BM25 index; FTS5 ranks lower-is-better
+        fts_query = " OR ".join(f'"{term}"' for term in tokenize(query))
+        with store:
+            hits = store.search(fts_query, limit=limit, kind=kind) if fts_query else []
+        results = [SearchResult(h.kind, h.name, h.source_path, -h.rank) for h in hits]
+    else:
+        results = _search_index(query, kind, limit)
+
+    # Snippets come from the files themselves; only the hits are read
+    parser = FrontmatterParser()
+    hits = []
+    for result in results:
+        try:
+            text = result.source_path.read_text(encoding="utf-8")
+            _, body = parser.split(text, result.source_path.name)
+        except (OSError, ValueError):
+            body = ""
+        hits.append((result, snippet(body, query)))
+
+    if json_output:
+        output = [
+            {
+                "kind": r.kind,
+                "name": r.name,
+                "source_path": str(r.source_path),
+                "score": round(r.score, 4),
+                "snippet": match.text if match else None,
+            }
+            for r, match in hits
+        ]
+        typer.echo(json.dumps(output, indent=2))
+        return
+
+    if not hits:
+        typer.echo("No matches")
+        return
+    for result, match in hits:
+        typer.echo(f"{result.score:7.2f}  {result.kind:<5}  {typer.style(result.name, bold=True)}")
+        typer.echo(f"         {result.source_path}")
+        if match:
+            parts, last = [], 0
+            for start, end in match.spans:
+                parts.append(match.text[last:start])
+                parts.append(typer.style(match.text[start:end], bold=True))
+                last = end
+            parts.append(match.text[last:])
+            typer.echo(f"         {''.join(parts)}")
+        typer.echo()
+
+
+def _search_index(query: str, kind: str | None, limit: int) -> list:
+    """
+    Search the persisted BM25 index, rescanning only the roots that changed.
+
+    Roots are checked against the file and directory mtimes recorded when
+    they were indexed, so an unchanged catalog is searched without reading
+    any item.
+    """
+    from agent_manager.core.scanner import AgentSkillScanner
+    from agent_manager.core.search_index import SearchIndex
+
+    enabled_paths = [p.resolve() for p in _enabled_scan_paths()]
+    index = SearchIndex.load()
+    try:
+        for root in index.roots():
+            if root not in enabled_paths:
+                index.remove_root(root)
+        scanner = AgentSkillScanner()
+        for root in index.stale_roots(enabled_paths):
+            agents, skills = [], []
+            for event, item in scanner.iter_path(root, estimate_tokens=False):
+                if event == "agent":
+                    agents.append(item)
+                elif event == "skill":
+                    skills.append(item)
+            index.update_root(root, agents, skills)
+        index.save()
+        return index.search(query, kind=kind, limit=limit)
+    finally:
+        index.close()
+
+
+@app_cli.command()
+def duplicates(
+    identical: bool = typer.Option(
+        False,
+        "--identical",
+        help="Also list agents copied verbatim into several places",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON",
+    ),
+) -> None:
+    """Report agents whose copies of the same name have diverged."""
+    import json
+
+    from agent_manager.core.duplicates import divergent_copies, group_duplicates
+
+    agents, _ = _load_items()
+    divergent = divergent_copies(agents)
+    copied = [g for g in group_duplicates(agents) if len(g) > 1] if identical else []
+
+    if json_output:
+        def variant(group):
+            return {
+                "content_hash": group[0].content_hash,
+                "copies": [str(a.source_path) for a in group],
+            }
+
+        output = {
+            "divergent": {name: [variant(g) for g in groups] for name, groups in divergent.items()},
+        }
+        if identical:
+            output["identical"] = [
+                {"name": g[0].metadata.name, **variant(g)} for g in copied
+            ]
+        typer.echo(json.dumps(output, indent=2))
+        return
+
+    if not divergent:
+        typer.echo("No divergent copies found")
+    for name, groups in divergent.items():
+        total = sum(len(g) for g in groups)
+        typer.echo(f"{name}: {len(groups)} variants across {total} copies")
+        for group in groups:
+            digest = (group[0].content_hash or "?")[:8]
+            for i, agent in enumerate(group):
+                prefix = f"  {digest}  ×{len(group):<3}" if i == 0 else " " * 16
+                typer.echo(f"{prefix} {agent.source_path}")
+        typer.echo()
+
+    if identical:
+        typer.echo(f"{len(copied)} agent(s) copied verbatim:")
+        for group in copied:
+            typer.echo(f"  {group[0].metadata.name} ×{len(group)}")
+            for agent in group:
+                typer.echo(f"      {agent.source_path}")
+
+
+@app_cli.command()
+def similar(
+    name: Optional[str] = typer.Argument(
+        None,
+        help="Show the closest relatives of this agent instead of all clusters",
+    ),
+    threshold: float = typer.Option(
+        0.5,
+        "--threshold",
+        "-t",
+        min=0.0,
+        max=1.0,
+        help="Minimum estimated prompt similarity (0-1)",
+    ),
+    show_diff: bool = typer.Option(
+        False,
+        "--diff",
+        help="Show each variant's prompt diff against the cluster base",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON",
+    ),
+) -> None:
+    """Find clusters of agents with near-identical prompts (forks and drift)."""
+    import json
+
+    from agent_manager.core.similarity import SimilarityIndex, diff
+
+    agents, _ = _load_items()
+    index = SimilarityIndex()
+    for agent in agents:
+        index.add(agent)
+
+    if name is not None:
+        matches = [a for a in agents if a.metadata.name == name]
+        if not matches:
+            typer.echo(f"Agent not found: {name}", err=True)
+            raise typer.Exit(1)
+        relatives = index.relatives(matches[0], limit=10, threshold=threshold)
+        if json_output:
+            typer.echo(json.dumps([
+                {"name": a.metadata.name, "path": str(a.source_path), "similarity": round(s, 3)}
+                for a, s in relatives
+            ], indent=2))
+            return
+        if not relatives:
+            typer.echo(f"No agents similar to {name}")
+        for agent, score in relatives:
+            typer.echo(f"{score:5.0%}  {agent.metadata.name:<30} {agent.source_path}")
+            if show_diff:
+                typer.echo(diff(matches[0], agent))
+        return
+
+    clusters = index.clusters(threshold)
+    if json_output:
+        typer.echo(json.dumps([
+            {
+                "base": str(cluster.base.source_path),
+                "variants": [
+                    {
+                        "name": v.agent.metadata.name,
+                        "similarity": round(v.similarity, 3),
+                        "copies": [str(a.source_path) for a in v.copies],
+                    }
+                    for v in cluster.variants
+                ],
+            }
+            for cluster in clusters
+        ], indent=2))
+        return
+
+    if not clusters:
+        typer.echo("No similar agents found")
+    for cluster in clusters:
+        typer.echo(f"{', '.join(cluster.names)}: {len(cluster.variants)} variants")
+        for variant in cluster.variants:
+            copies = f"×{len(variant.copies)}"
+            typer.echo(f"  {variant.similarity:5.0%} {copies:<4} {variant.agent.source_path}")
+        if show_diff:
+            for variant in cluster.variants[1:]:
+                typer.echo(diff(cluster.base, variant.agent))
+        typer.echo()
+
+
+@app_cli.command()
+def pack(
+    output: Path = typer.Argument(..., help="Bundle file to write"),
+    names: Optional[list[str]] = typer.Argument(
+        None,
+        help="Agent or skill names to include",
+    ),
+    all_items: bool = typer.Option(
+        False,
+        "--all",
+        help="Include every discovered agent and skill",
+    ),
+) -> None:
+    """Pack agents and skills into a portable content-addressed bundle."""
+    from agent_manager.core.bundle import pack as pack_bundle
+
+    if not names and not all_items:
+        raise typer.BadParameter("Give agent/skill names or --all", param_hint="NAMES")
+
+    agents, skills = _load_items()
+    if not all_items:
+        wanted = set(names)
+        agents = [a for a in agents if a.metadata.name in wanted]
+        skills = [s for s in skills if s.metadata.name in wanted]
+        missing = wanted - {a.metadata.name for a in agents} - {s.metadata.name for s in skills}
+        if missing:
+            typer.echo(f"Not found: {', '.join(sorted(missing))}", err=True)
+            raise typer.Exit(1)
+
+    # One item per entry name (the first found); two would collide when linked
+    agents = list({a.source_path.name: a for a in reversed(agents)}.values())[::-1]
+    skills = list({s.source_dir.name: s for s in reversed(skills)}.values())[::-1]
+    try:
+        manifest = pack_bundle(output, agents, skills)
+    except OSError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+    objects = len({blob for item in manifest.items for blob in item.files.values()})
+    typer.echo(f"Packed {len(manifest.items)} item(s), {objects} object(s) into {output}")
+
+
+@app_cli.command()
+def unpack(
+    bundle: Path = typer.Argument(..., help="Bundle file to install"),
+    no_link: bool = typer.Option(
+        False,
+        "--no-link",
+        help="Only copy into the store; don't link into ~/.claude",
+    ),
+    list_only: bool = typer.Option(
+        False,
+        "--list",
+        help="List the bundle's contents without installing",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON",
+    ),
+) -> None:
+    """Install a bundle into the shared store and link it globally."""
+    import json
+    import zipfile
+
+    from agent_manager.core.bundle import read_manifest, unpack as unpack_bundle
+    from agent_manager.core.config_manager import ConfigManager
+    from agent_manager.core.symlink_manager import SymlinkManager
+
+    try:
+        if list_only:
+            manifest = read_manifest(bundle)
+            if json_output:
+                typer.echo(json.dumps(manifest.to_dict(), indent=2))
+                return
+            for item in manifest.items:
+                typer.echo(f"{item.hash[:12]}  {item.kind:<5}  {item.name}")
+            return
+
+        config = ConfigManager().load()
+        results = unpack_bundle(
+            bundle,
+            symlink_manager=SymlinkManager(claude_dir=config.claude_dir),
+            link=not no_link,
+        )
+    except (OSError, zipfile.BadZipFile, KeyError, ValueError) as e:
+        typer.echo(f"Error: invalid bundle {bundle}: {e}", err=True)
+        raise typer.Exit(1)
+
+    if json_output:
+        typer.echo(json.dumps([
+            {
+                "kind": r.item.kind,
+                "name": r.item.name,
+                "hash": r.item.hash,
+                "path": str(r.path),
+                "stored": r.stored,
+                "link": r.link.value if r.link else None,
+            }
+            for r in results
+        ], indent=2))
+        return
+
+    for r in results:
+        status = "stored" if r.stored else "cached"
+        link = f", {r.link.value}" if r.link else ""
+        typer.echo(f"  {r.item.kind:<5} {r.item.name} ({status}{link})")
+    stored = sum(r.stored for r in results)
+    typer.echo(f"Installed {len(results)} item(s), {stored} new in the store")
+
+
+def _load_items():
+    """Get every agent and skill with bodies from the daemon, catalog or a scan."""
+    import asyncio
+
+    from agent_manager.core.daemon_client import DaemonClient
+    from agent_manager.core.scanner import AgentSkillScanner
+    from agent_manager.core.tokens import TokenCache, default_token_cache_path
+    from agent_manager.models import Agent, Skill
+
+    client = DaemonClient.connect()
+    if client is not None:
+        with client:
+            agents = client.call("list_agents", include_body=True)
+            skills = client.call("list_skills", include_body=True)
+        return [Agent.from_dict(a) for a in agents], [Skill.from_dict(s) for s in skills]
+
+    store = _open_catalog()
+    if store is not None:
+        with store:
+            return store.load_agents(), store.load_skills()
+
+    scanner = AgentSkillScanner(token_cache=TokenCache(default_token_cache_path()))
+    result = asyncio.run(scanner.scan_all(_enabled_scan_paths()))
+    scanner.token_cache.save()
+    return result.agents, result.skills
+
+
+_SOURCE_OPTION = typer.Option(
+    Path("agents"),
+    "--source",
+    help="Directory holding the agent .md files",
+)
+_DRY_RUN_OPTION = typer.Option(
+    False,
+    "--dry-run",
+    "-n",
+    help="Show what would change without changing anything",
+)
+_JSON_OPTION = typer.Option(
+    False,
+    "--json",
+    help="Output as JSON",
+)
+
+
+@app_cli.command()
+def install(
+    names: Optional[list[str]] = typer.Argument(
+        None,
+        help="Agent names to install, or 'all' (default: all)",
+    ),
+    source: Path = _SOURCE_OPTION,
+    backup: bool = typer.Option(
+        False,
+        "--backup",
+        help="Back up and replace regular files in the way",
+    ),
+    dry_run: bool = _DRY_RUN_OPTION,
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Link agents from a source directory into ~/.claude/agents."""
+    names = _agent_names(names)
+    installer = _installer(source, names)
+    actions = installer.plan_install(names, backup=backup)
+    _run_actions(installer, actions, dry_run, json_output)
+
+
+@app_cli.command()
+def uninstall(
+    names: Optional[list[str]] = typer.Argument(
+        None,
+        help="Agent names to uninstall, or 'all' (default: all from the source)",
+    ),
+    source: Path = _SOURCE_OPTION,
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Don't ask before removing every link",
+    ),
+    dry_run: bool = _DRY_RUN_OPTION,
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Remove the ~/.claude/agents links of agents from a source directory."""
+    names = _agent_names(names)
+    installer = _installer(source, names)
+    actions = installer.plan_uninstall(names)
+    if not names and not (yes or dry_run or json_output):
+        count = sum(a.kind == "unlink" for a in actions)
+        typer.confirm(f"Remove all {count} agent link(s) from {installer.target_dir}?", abort=True)
+    _run_actions(installer, actions, dry_run, json_output)
+
+
+@app_cli.command()
+def status(
+    names: Optional[list[str]] = typer.Argument(
+        None,
+        help="Agent names to check (default: all)",
+    ),
+    source: Path = _SOURCE_OPTION,
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Show which source agents are linked into ~/.claude/agents."""
+    import json
+
+    installer = _installer(source, names)
+    statuses = installer.status(names)
+    if json_output:
+        typer.echo(json.dumps([s.to_dict() for s in statuses], indent=2))
+        return
+
+    symbols = {
+        "installed": typer.style("✓", fg="green"),
+        "not_installed": typer.style("✗", fg="red"),
+    }
+    details = {
+        "installed": "linked",
+        "other_source": "linked to different source",
+        "regular_file": "regular file, not symlink",
+        "not_installed": "not installed",
+    }
+    for s in statuses:
+        state = s.state.value
+        detail = details[state]
+        if s.state.value == "other_source":
+            detail += f": {s.link_target}"
+        typer.echo(f"  {symbols.get(state, typer.style('⚠', fg='yellow'))} {s.name} ({detail})")
+
+
+def _agent_names(names: list[str] | None) -> list[str] | None:
+    """Agent names given to install/uninstall, or None for every agent ("all" or none)."""
+    if not names or any(n.lower() == "all" for n in names):
+        return None
+    return names
+
+
+def _installer(source: Path, names: list[str] | None):
+    """Create an Installer for ~/.claude, rejecting unknown agent names."""
+    from agent_manager.core.config_manager import ConfigManager
+    from agent_manager.core.installer import Installer
+    from agent_manager.core.symlink_manager import SymlinkManager
+
+    source = source.expanduser()
+    if not source.is_dir():
+        raise typer.BadParameter(f"Not a directory: {source}", param_hint="--source")
+    config = ConfigManager().load()
+    installer = Installer(source, SymlinkManager(claude_dir=config.claude_dir))
+    unknown = installer.unknown(names or [])
+    if unknown:
+        typer.echo(f"Agent not found: {', '.join(unknown)}", err=True)
+        raise typer.Exit(1)
+    return installer
+
+
+def _run_actions(installer, actions, dry_run: bool, json_output: bool) -> None:
+    """Apply (unless dry-run) and report installer actions."""
+    import json
+
+    if not dry_run:
+        installer.apply(actions)
+    if json_output:
+        typer.echo(json.dumps([a.to_dict() for a in actions], indent=2))
+        return
+
+    for action in actions:
+        verb = action.kind if dry_run or action.result is None else action.result.value
+        reason = f" ({action.reason})" if action.reason else ""
+        typer.echo(f"  {verb:<9} {action.target.name}{reason}")
+    changed = sum(a.kind != "skip" for a in actions)
+    typer.echo(f"{'Would change' if dry_run else 'Changed'} {changed} of {len(actions)} agent(s)")
+
+
+@app_cli.command()
+def sync(
+    projects: Optional[list[Path]] = typer.Argument(
+        None,
+        help="Only sync these assigned projects (default: all)",
+    ),
+    prune: bool = typer.Option(
+        True,
+        "--prune/--no-prune",
+        help="Remove links to catalog items no longer assigned",
+    ),
+    dry_run: bool = _DRY_RUN_OPTION,
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Link the agents and skills assigned to each project, and nothing else."""
+    import asyncio
+
+    from agent_manager.core.assignments import AssignmentReconciler
+    from agent_manager.core.config_manager import ConfigManager
+
+    assignments = ConfigManager().load().project_assignments
+    if projects:
+        wanted = {p.expanduser().resolve() for p in projects}
+        assignments = [a for a in assignments if a.project_path.expanduser().resolve() in wanted]
+    if not assignments:
+        typer.echo("No project assignments to sync", err=True)
+        raise typer.Exit(1)
+
+    agents, skills = _load_items()
+    reconciler = AssignmentReconciler(agents, skills, prune=prune)
+    plans = asyncio.run(reconciler.sync(assignments, dry_run=dry_run))
+    _print_plans(plans, dry_run, json_output)
+    if any(p.failed for p in plans):
+        raise typer.Exit(1)
+
+
+def _print_plans(plans, dry_run: bool, json_output: bool) -> None:
+    """Report project assignment plans, listing only projects with something to do."""
+    import json
+
+    if json_output:
+        typer.echo(json.dumps([p.to_dict() for p in plans], indent=2))
+        return
+
+    for plan in plans:
+        if plan.missing:
+            typer.echo(f"  ⚠ {plan.project}: not in the catalog: {', '.join(plan.missing)}")
+        if not plan.actions:
+            continue
+        typer.echo(f"{plan.project}")
+        for action in plan.actions:
+            verb = action.kind if dry_run or action.result is None else action.result.value
+            reason = f" ({action.reason})" if action.reason else ""
+            typer.echo(f"  {verb:<9} {action.target.parent.name}/{action.target.name}{reason}")
+    changed = sum(len(p.changes) for p in plans)
+    touched = sum(bool(p.changes) for p in plans)
+    typer.echo(
+        f"{'Would change' if dry_run else 'Changed'} {changed} link(s) "
+        f"in {touched} of {len(plans)} project(s)"
+    )
+
+
 @app_cli.command()
 def config_show() -> None:
     """Show current configuration."""
+    from agent_manager.core.config_manager import ConfigManager
+
     config_manager = ConfigManager()
     config = config_manager.load()
 
@@ -203,6 +1308,816 @@ def config_show() -> None:
         typer.echo("  (none configured)")
 
 
+catalog_cli = typer.Typer(
+    help="SQLite catalog that keeps the last-known scan between runs",
+    no_args_is_help=True,
+)
+app_cli.add_typer(catalog_cli, name="catalog")
+
+
+@catalog_cli.command("update")
+def catalog_update() -> None:
+    """Scan the enabled paths into the catalog database."""
+    from agent_manager.core.catalog_store import CatalogStore
+
+    with CatalogStore() as store:
+        for root, result in _update_catalog(store):
+            typer.echo(
+                f"{root}: {result.written} written, {result.unchanged} unchanged, "
+                f"{result.removed} removed"
+            )
+
+
+@catalog_cli.command("info")
+def catalog_info() -> None:
+    """Show what the catalog database holds."""
+    from datetime import datetime
+
+    from agent_manager.core.catalog_store import CatalogStore, default_catalog_path
+    from agent_manager.core.config_manager import ConfigManager
+
+    path = default_catalog_path()
+    enabled = ConfigManager().load().catalog_db
+    typer.echo(f"Catalog: {path} ({'enabled' if enabled else 'disabled'})")
+    if not path.exists():
+        typer.echo("  (not created yet; run 'agent-manager catalog update')")
+        return
+
+    with CatalogStore() as store:
+        for info in store.roots():
+            scanned = (
+                datetime.fromtimestamp(info.last_scanned).strftime("%Y-%m-%d %H:%M")
+                if info.last_scanned
+                else "never"
+            )
+            typer.echo(f"  {info.path}")
+            typer.echo(
+                f"     {info.agent_count} agents, {info.skill_count} skills, "
+                f"{info.error_count} errors, scanned {scanned}"
+            )
+
+
+@catalog_cli.command("enable")
+def catalog_enable() -> None:
+    """Use the catalog database in the TUI and list commands."""
+    _set_catalog_enabled(True)
+    typer.echo("Catalog enabled")
+
+
+@catalog_cli.command("disable")
+def catalog_disable() -> None:
+    """Stop using the catalog database."""
+    _set_catalog_enabled(False)
+    typer.echo("Catalog disabled")
+
+
+def _set_catalog_enabled(enabled: bool) -> None:
+    """Persist the catalog_db setting."""
+    from agent_manager.core.config_manager import ConfigManager
+
+    config_manager = ConfigManager()
+    config = config_manager.load()
+    config.catalog_db = enabled
+    config_manager.save(config)
+
+
+daemon_cli = typer.Typer(
+    help="Background daemon that keeps the catalog warm in memory",
+    no_args_is_help=True,
+)
+app_cli.add_typer(daemon_cli, name="daemon")
+
+
+@daemon_cli.command("run")
+def daemon_run(
+    poll_interval: float = typer.Option(
+        2.0,
+        "--poll-interval",
+        help="Seconds between filesystem change checks",
+    ),
+) -> None:
+    """Run the daemon in the foreground."""
+    import asyncio
+    import logging
+
+    from agent_manager.core.config_manager import ConfigManager
+    from agent_manager.core.daemon import CatalogDaemon
+    from agent_manager.core.symlink_manager import SymlinkManager
+
+    config = ConfigManager().load()
+    enabled_paths = [sp.path for sp in config.scan_paths if sp.enabled]
+    if not enabled_paths:
+        typer.echo("No enabled scan paths configured")
+        raise typer.Exit(1)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    daemon = CatalogDaemon(
+        enabled_paths,
+        symlink_manager=SymlinkManager(claude_dir=config.claude_dir),
+        poll_interval=poll_interval,
+    )
+    try:
+        asyncio.run(daemon.serve_forever())
+    except RuntimeError as e:
+        typer.echo(str(e))
+        raise typer.Exit(1)
+
+
+@daemon_cli.command("start")
+def daemon_start() -> None:
+    """Start the daemon in the background."""
+    import subprocess
+    import sys
+    import time
+
+    from agent_manager.core.daemon_client import DaemonClient
+
+    client = DaemonClient.connect()
+    if client is not None:
+        client.close()
+        typer.echo("Daemon already running")
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "agent_manager", "daemon", "run"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    # Wait for the initial scan to finish and the socket to come up
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        client = DaemonClient.connect()
+        if client is not None:
+            with client:
+                info = client.call("ping")
+            typer.echo(f"Daemon started ({info['agents']} agents, {info['skills']} skills)")
+            return
+        time.sleep(0.1)
+
+    typer.echo("Daemon did not start; run 'agent-manager daemon run' to see errors")
+    raise typer.Exit(1)
+
+
+@daemon_cli.command("stop")
+def daemon_stop() -> None:
+    """Stop the running daemon."""
+    from agent_manager.core.daemon_client import DaemonClient
+
+    client = DaemonClient.connect()
+    if client is None:
+        typer.echo("Daemon is not running")
+        raise typer.Exit(1)
+
+    with client:
+        client.call("shutdown")
+    typer.echo("Daemon stopped")
+
+
+@daemon_cli.command("status")
+def daemon_status() -> None:
+    """Show whether the daemon is running."""
+    from agent_manager.core.daemon_client import DaemonClient, default_socket_path
+
+    client = DaemonClient.connect()
+    if client is None:
+        typer.echo("Daemon is not running")
+        raise typer.Exit(1)
+
+    with client:
+        info = client.call("ping")
+    typer.echo(f"Daemon running on {default_socket_path()}")
+    typer.echo(f"  {info['agents']} agents, {info['skills']} skills, {info['errors']} errors")
+    for path in info["paths"]:
+        typer.echo(f"  ✓ {path}")
+    if info.get("watch_error"):
+        typer.echo(f"  ⚠ Last rescan failed: {info['watch_error']}")
+
+
+mcp_cli = typer.Typer(
+    help="MCP servers synced into Claude, Cursor, Gemini and Codex configs",
+    no_args_is_help=True,
+)
+app_cli.add_typer(mcp_cli, name="mcp")
+
+
+@mcp_cli.command("list")
+def mcp_list(json_output: bool = _JSON_OPTION) -> None:
+    """List MCP servers and where they are in sync."""
+    import json
+
+    from agent_manager.core.mcp_manager import MCPManager
+    from agent_manager.models.mcp_server import TARGETS
+
+    manager = MCPManager()
+    servers = manager.load_servers()
+    manager.refresh_status(servers)
+    if json_output:
+        typer.echo(json.dumps(
+            [{**s.to_dict(), "synced_to": s.synced_to} for s in servers], indent=2
+        ))
+        return
+
+    if not servers:
+        typer.echo("No MCP servers configured (try 'agent-manager mcp import')")
+        return
+    for server in servers:
+        synced = [TARGETS[t] for t in server.targets if server.synced_to.get(t)]
+        typer.echo(f"  {server.id} [{server.sync_status.value}]")
+        typer.echo(f"     {server.command or server.url} {' '.join(server.args)}".rstrip())
+        if synced:
+            typer.echo(f"     synced: {', '.join(synced)}")
+
+
+@mcp_cli.command("sync")
+def mcp_sync(
+    dry_run: bool = _DRY_RUN_OPTION,
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Write MCP servers into every target config that differs."""
+    import json
+
+    from agent_manager.core.mcp_manager import MCPManager
+
+    manager = MCPManager()
+    diffs = manager.sync(manager.load_servers(), dry_run=dry_run)
+    if json_output:
+        typer.echo(json.dumps([d.to_dict() for d in diffs], indent=2))
+    else:
+        for diff in diffs:
+            if diff.error:
+                typer.echo(f"  ✗ {diff.target}: {diff.error}")
+                continue
+            if not diff.changed:
+                typer.echo(f"  ✓ {diff.target}: in sync")
+                continue
+            changes = ", ".join(
+                f"{label} {', '.join(ids)}"
+                for label, ids in (("+", diff.added), ("~", diff.updated), ("-", diff.removed))
+                if ids
+            )
+            verb = "would write" if dry_run else "wrote"
+            typer.echo(f"  {verb} {diff.path} ({changes})")
+    if any(d.error for d in diffs):
+        raise typer.Exit(1)
+
+
+@mcp_cli.command("check")
+def mcp_check(
+    server_ids: Optional[list[str]] = typer.Argument(
+        None,
+        help="Servers to check (default: all enabled)",
+    ),
+    timeout: float = typer.Option(10.0, "--timeout", help="Seconds allowed per server"),
+    concurrency: int = typer.Option(8, "--concurrency", "-c", help="Servers started at once"),
+    ttl: float = typer.Option(300.0, "--ttl", help="Seconds to reuse a previous result"),
+    force: bool = typer.Option(False, "--force", "-f", help="Ignore cached results"),
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Start MCP servers and check that they answer the initialize handshake."""
+    import asyncio
+    import json
+
+    from agent_manager.core.mcp_health import HealthChecker
+    from agent_manager.core.mcp_manager import MCPManager
+    from agent_manager.core.mcp_tools import ToolCatalog
+    from agent_manager.models.mcp_server import HealthStatus
+
+    servers = MCPManager().load_servers()
+    if server_ids:
+        unknown = set(server_ids) - {s.id for s in servers}
+        if unknown:
+            typer.echo(f"MCP server not found: {', '.join(sorted(unknown))}", err=True)
+            raise typer.Exit(1)
+        servers = [s for s in servers if s.id in server_ids]
+    else:
+        servers = [s for s in servers if s.enabled]
+
+    checker = HealthChecker(
+        ttl=ttl, timeout=timeout, concurrency=concurrency, catalog=ToolCatalog()
+    )
+    results = asyncio.run(checker.check_all(servers, force=force))
+    if json_output:
+        typer.echo(json.dumps(
+            [{"id": s.id, **r.to_dict()} for s, r in zip(servers, results)], indent=2
+        ))
+    else:
+        symbols = {
+            HealthStatus.OK: typer.style("✓", fg="green"),
+            HealthStatus.SKIPPED: typer.style("-", dim=True),
+        }
+        for server, result in zip(servers, results):
+            symbol = symbols.get(result.status, typer.style("✗", fg="red"))
+            if result.status is HealthStatus.OK:
+                detail = f"{result.latency_ms:.0f} ms, {result.tool_count} tools"
+            else:
+                detail = f"{result.status.value}: {result.error}"
+            typer.echo(f"  {symbol} {server.id} ({detail})")
+    if any(r.status in (HealthStatus.FAILED, HealthStatus.TIMEOUT) for r in results):
+        raise typer.Exit(1)
+
+
+@mcp_cli.command("bench")
+def mcp_bench(
+    server_ids: Optional[list[str]] = typer.Argument(
+        None,
+        help="Servers to benchmark (default: all enabled)",
+    ),
+    runs: int = typer.Option(5, "--runs", "-n", help="Warm spawns per server"),
+    cold_runs: int = typer.Option(1, "--cold", help="Cold spawns per server (empty caches)"),
+    budget: float = typer.Option(2000.0, "--budget", help="Warm p95 startup budget in ms"),
+    cold_budget: float = typer.Option(10000.0, "--cold-budget", help="Cold p95 startup budget in ms"),
+    timeout: float = typer.Option(60.0, "--timeout", help="Seconds allowed per spawn"),
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Measure MCP server startup time and peak memory, cold and warm."""
+    import asyncio
+    import json
+
+    from agent_manager.core.mcp_bench import MCPBench
+    from agent_manager.core.mcp_manager import MCPManager
+
+    servers = MCPManager().load_servers()
+    if server_ids:
+        unknown = set(server_ids) - {s.id for s in servers}
+        if unknown:
+            typer.echo(f"MCP server not found: {', '.join(sorted(unknown))}", err=True)
+            raise typer.Exit(1)
+        servers = [s for s in servers if s.id in server_ids]
+    else:
+        servers = [s for s in servers if s.enabled]
+
+    bench = MCPBench(
+        runs=runs, cold_runs=cold_runs, timeout=timeout,
+        budget_ms=budget, cold_budget_ms=cold_budget,
+    )
+    results = asyncio.run(bench.run_all(servers))
+    if json_output:
+        typer.echo(json.dumps([
+            {
+                **r.to_dict(),
+                "cold_summary": r.summary("cold"),
+                "warm_summary": r.summary("warm"),
+                "over_budget": r.over_budget(),
+                "regressions": bench.regressions(r.server_id),
+            }
+            for r in results
+        ], indent=2))
+    else:
+        def fmt(stats) -> str:
+            return f"{stats['p50']:.0f}/{stats['p95']:.0f} ms" if stats else "-"
+
+        typer.echo(f"  {'Server':<20} {'Mode':<5} {'Init p50/p95':>14} {'Tools p50/p95':>14} {'Peak RSS':>12}")
+        for result in results:
+            over = result.over_budget()
+            for mode in ("cold", "warm"):
+                if not getattr(result, mode):
+                    continue
+                summary = result.summary(mode)
+                flags = ""
+                if summary["failures"]:
+                    flags += typer.style(f"  {summary['failures']} failed", fg="red")
+                if mode in over:
+                    flags += typer.style("  OVER BUDGET", fg="red")
+                rss = summary["peak_rss_kb"]
+                rss_text = f"{rss['max'] / 1024:.1f} MiB" if rss else "-"
+                typer.echo(
+                    f"  {result.server_id:<20} {mode:<5} {fmt(summary['init_ms']):>14} "
+                    f"{fmt(summary['tools_ms']):>14} {rss_text:>12}{flags}"
+                )
+            for regression in bench.regressions(result.server_id):
+                typer.echo(typer.style(f"     regression: {regression}", fg="yellow"))
+    if any(r.over_budget() for r in results):
+        raise typer.Exit(1)
+
+
+@mcp_cli.command("tools")
+def mcp_tools(
+    server_ids: Optional[list[str]] = typer.Argument(
+        None,
+        help="Servers to show (default: all)",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Start the servers and list their tools again",
+    ),
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Show the tool catalog of MCP servers."""
+    import asyncio
+    import json
+
+    from agent_manager.core.mcp_health import HealthChecker
+    from agent_manager.core.mcp_manager import MCPManager
+    from agent_manager.core.mcp_tools import ToolCatalog
+
+    servers = MCPManager().load_servers()
+    if server_ids:
+        unknown = set(server_ids) - {s.id for s in servers}
+        if unknown:
+            typer.echo(f"MCP server not found: {', '.join(sorted(unknown))}", err=True)
+            raise typer.Exit(1)
+        servers = [s for s in servers if s.id in server_ids]
+    catalog = ToolCatalog()
+    stale = catalog.stale(servers, max_age=0 if refresh else float("inf"))
+    if stale:
+        asyncio.run(HealthChecker(catalog=catalog).check_all(stale, force=True))
+
+    if json_output:
+        typer.echo(json.dumps({
+            s.id: [t.to_dict() for t in entry.tools] if (entry := catalog.get(s)) else None
+            for s in servers
+        }, indent=2))
+        return
+    for server in servers:
+        entry = catalog.get(server)
+        if entry is None:
+            typer.echo(f"  {server.id}: (not listed)")
+            continue
+        size = sum(t.description_size for t in entry.tools)
+        typer.echo(f"  {server.id}: {len(entry.tools)} tools, {size} description chars")
+        for tool in entry.tools:
+            typer.echo(f"     {tool.name} ({tool.description_size})")
+
+
+@mcp_cli.command("missing")
+def mcp_missing(json_output: bool = _JSON_OPTION) -> None:
+    """List agents that reference MCP tools no configured server provides."""
+    import json
+
+    from agent_manager.core.mcp_manager import MCPManager
+    from agent_manager.core.mcp_tools import ToolCatalog
+
+    servers = MCPManager().load_servers()
+    catalog = ToolCatalog()
+    agents, _ = _load_items()
+    missing = {
+        a.metadata.name: tools
+        for a in agents
+        if (tools := catalog.missing_tools(a, servers))
+    }
+    if json_output:
+        typer.echo(json.dumps(missing, indent=2))
+        return
+    for name, tools in missing.items():
+        typer.echo(f"  {name}: {', '.join(tools)}")
+    typer.echo(f"{len(missing)} agent(s) reference missing MCP tools")
+
+
+@mcp_cli.command("import")
+def mcp_import() -> None:
+    """Adopt servers already present in target configs."""
+    from agent_manager.core.mcp_manager import MCPManager
+
+    manager = MCPManager()
+    servers = manager.load_servers()
+    found = manager.import_servers(servers)
+    if found:
+        manager.save_servers(servers + found)
+    for server in found:
+        typer.echo(f"  + {server.id} (from {', '.join(server.targets)})")
+    typer.echo(f"Imported {len(found)} server(s)")
+
+
+@mcp_cli.command("add")
+def mcp_add(
+    server_id: str = typer.Argument(..., help="Server id (the key in client configs)"),
+    command: Optional[list[str]] = typer.Argument(
+        None,
+        help="Command and arguments (after --), for stdio servers",
+    ),
+    url: Optional[str] = typer.Option(None, "--url", help="URL of a remote server"),
+    transport: str = typer.Option(
+        "http",
+        "--transport",
+        help="Transport of a remote server (http or sse)",
+    ),
+    env: Optional[list[str]] = typer.Option(
+        None,
+        "--env",
+        "-e",
+        help="Environment variable KEY=VALUE (repeatable)",
+    ),
+    target: Optional[list[str]] = typer.Option(
+        None,
+        "--target",
+        "-t",
+        help="Only sync to these targets (repeatable; default: all)",
+    ),
+) -> None:
+    """Add or replace an MCP server (run 'mcp sync' to write it out)."""
+    from agent_manager.core.mcp_manager import MCPManager
+    from agent_manager.models.mcp_server import MCPServer, TARGETS
+
+    if bool(command) == bool(url):
+        raise typer.BadParameter("Give either a command or --url")
+    unknown = [t for t in target or [] if t not in TARGETS]
+    if unknown:
+        raise typer.BadParameter(
+            f"Unknown target {', '.join(unknown)} (choose from {', '.join(TARGETS)})",
+            param_hint="--target",
+        )
+    env_vars = {}
+    for item in env or []:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise typer.BadParameter(f"Expected KEY=VALUE, got {item!r}", param_hint="--env")
+        env_vars[key] = value
+
+    server = MCPServer(
+        id=server_id,
+        command=command[0] if command else "",
+        args=list(command[1:]) if command else [],
+        env=env_vars,
+        transport="stdio" if command else transport,
+        url=url,
+    )
+    if target:
+        server.targets = list(target)
+
+    manager = MCPManager()
+    servers = [s for s in manager.load_servers() if s.id != server_id]
+    manager.save_servers(servers + [server])
+    typer.echo(f"Added {server_id}")
+
+
+@mcp_cli.command("remove")
+def mcp_remove(
+    server_id: str = typer.Argument(..., help="Server id to remove"),
+) -> None:
+    """Remove an MCP server from every target config."""
+    from agent_manager.core.mcp_manager import MCPManager
+
+    manager = MCPManager()
+    servers = manager.load_servers()
+    server = next((s for s in servers if s.id == server_id), None)
+    if server is None:
+        typer.echo(f"MCP server not found: {server_id}", err=True)
+        raise typer.Exit(1)
+
+    # Sync it as disabled first so its entries are taken out of the targets
+    server.enabled = False
+    diffs = manager.sync(servers)
+    manager.save_servers([s for s in servers if s.id != server_id])
+    cleaned = [d.target for d in diffs if d.written]
+    typer.echo(f"Removed {server_id}" + (f" from {', '.join(cleaned)}" if cleaned else ""))
+
+
+sessions_cli = typer.Typer(
+    help="Claude Code session logs (~/.claude/projects)",
+    no_args_is_help=True,
+)
+app_cli.add_typer(sessions_cli, name="sessions")
+
+
+@sessions_cli.command("index")
+def sessions_index() -> None:
+    """Index the log lines written since the last run."""
+    from agent_manager.core.session_manager import SessionManager
+
+    manager = SessionManager()
+    stats = manager.update_index()
+    typer.echo(
+        f"Indexed {stats.lines} new line(s) ({stats.bytes / 1024 / 1024:.1f} MiB) "
+        f"in {stats.updated} of {stats.files} log(s) in {stats.seconds:.2f}s"
+    )
+    if stats.removed:
+        typer.echo(f"Removed {stats.removed} deleted session(s)")
+
+
+@sessions_cli.command("list")
+def sessions_list(
+    query: str = typer.Option("", "--query", "-q", help="Filter by project, title or session id"),
+    limit: int = typer.Option(50, "--limit", "-n", help="Sessions to show"),
+    offset: int = typer.Option(0, "--offset", help="Sessions to skip"),
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """List sessions, most recently active first."""
+    import json
+
+    from agent_manager.core.session_manager import SessionManager
+    from agent_manager.models.session import format_tokens
+
+    manager = SessionManager()
+    manager.update_index()
+    sessions = manager.list_sessions(offset, limit, query)
+    if json_output:
+        typer.echo(json.dumps([s.to_dict() for s in sessions], indent=2))
+        return
+
+    if not sessions:
+        typer.echo(f"No sessions found in {manager.projects_dir}")
+        return
+    for session in sessions:
+        when = session.last_activity.strftime("%Y-%m-%d %H:%M") if session.last_activity else "-"
+        typer.echo(
+            f"  {session.session_id[:8]}  {when}  {format_tokens(session.total_tokens):>7}  "
+            f"{session.display_name}"
+        )
+        typer.echo(typer.style(f"     {session.project}", dim=True))
+    total = manager.count(query)
+    if offset + len(sessions) < total:
+        typer.echo(f"\n{offset + len(sessions)} of {total} shown (use --offset for more)")
+
+
+@sessions_cli.command("show")
+def sessions_show(
+    session_id: str = typer.Argument(..., help="Session id or a unique prefix of it"),
+    lines: int = typer.Option(20, "--lines", "-n", help="Log entries to print from the end"),
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Show a session's totals and its last log entries."""
+    import json
+
+    from agent_manager.core.session_manager import SessionManager
+
+    manager = SessionManager()
+    manager.update_index()
+    session = manager.get(session_id)
+    if session is None:
+        typer.echo(f"Session not found (or prefix not unique): {session_id}", err=True)
+        raise typer.Exit(1)
+    entries = manager.read_lines(session, -lines, lines)
+    if json_output:
+        typer.echo(json.dumps({**session.to_dict(), "entries": entries}, indent=2))
+        return
+
+    typer.echo(f"{session.display_name}")
+    typer.echo(f"  Session:  {session.session_id}")
+    typer.echo(f"  Project:  {session.project}")
+    typer.echo(f"  Messages: {session.message_count} ({session.line_count} lines)")
+    typer.echo(
+        f"  Tokens:   {session.input_tokens} in, {session.output_tokens} out, "
+        f"{session.cache_read_tokens} cache read, {session.cache_creation_tokens} cache write"
+    )
+    if session.agents:
+        typer.echo(f"  Agents:   {', '.join(session.agents)}")
+    for entry in entries:
+        typer.echo(json.dumps(entry)[:200])
+
+
+@app_cli.command()
+def usage(
+    days: int = typer.Option(30, "--days", "-d", help="Window in days, today included"),
+    unused: bool = typer.Option(
+        False,
+        "--unused",
+        help="Also list catalog agents that were not called",
+    ),
+    json_output: bool = _JSON_OPTION,
+    csv_output: bool = typer.Option(False, "--csv", help="Output as CSV"),
+) -> None:
+    """Show how often each agent was called as a subagent, from session logs."""
+    import csv
+    import json
+    import sys
+
+    from agent_manager.core.agent_usage import AgentUsage, LATENCY_BUCKETS_MS, format_latency
+    from agent_manager.core.session_manager import SessionManager
+    from agent_manager.models.session import format_tokens
+
+    manager = SessionManager()
+    manager.update_index()
+    usage_by_agent = manager.agent_usage(days)
+    rows = sorted(usage_by_agent.values(), key=lambda u: (-u.calls, u.agent))
+    if unused:
+        agents, _ = _load_items()
+        names = sorted({a.metadata.name for a in agents} - set(usage_by_agent))
+        rows.extend(AgentUsage(name) for name in names)
+
+    if json_output:
+        typer.echo(json.dumps({"days": days, "agents": [u.to_dict() for u in rows]}, indent=2))
+        return
+    if csv_output:
+        writer = csv.writer(sys.stdout)
+        writer.writerow([
+            "agent", "calls", "finished", "tokens", "mean_ms", "p50_ms", "p95_ms", "last_used",
+            *(f"latency_lt_{ms}ms" for ms in LATENCY_BUCKETS_MS), f"latency_ge_{LATENCY_BUCKETS_MS[-1]}ms",
+        ])
+        for u in rows:
+            d = u.to_dict()
+            writer.writerow([
+                u.agent, u.calls, u.finished, u.tokens, d["mean_ms"], d["p50_ms"], d["p95_ms"],
+                d["last_used"], *u.latency,
+            ])
+        return
+
+    if not rows:
+        typer.echo(f"No subagent calls in the last {days} day(s)")
+        return
+    typer.echo(f"  {'Calls':>6} {'Tokens':>8} {'Mean':>7} {'p50':>7} {'p95':>7}  Agent")
+    for u in rows:
+        mean = f"{u.mean_ms / 1000:.1f}s" if u.mean_ms is not None else "-"
+        line = (
+            f"  {u.calls:>6} {format_tokens(u.tokens):>8} {mean:>7} "
+            f"{format_latency(u.percentile_ms(0.5)):>7} {format_latency(u.percentile_ms(0.95)):>7}  {u.agent}"
+        )
+        typer.echo(typer.style(line, dim=True) if not u.calls else line)
+
+
+@app_cli.command()
+def stats(json_output: bool = _JSON_OPTION) -> None:
+    """Show the estimated context cost of linked agents and skills per project."""
+    import json
+
+    from agent_manager.core.config_manager import ConfigManager
+    from agent_manager.core.symlink_manager import SymlinkManager
+    from agent_manager.core.tokens import (
+        TokenCache,
+        context_costs,
+        default_token_cache_path,
+        format_token_estimate,
+    )
+
+    config = ConfigManager().load()
+    agents, skills = _load_items()
+    SymlinkManager(claude_dir=config.claude_dir).resolve_global_links(agents, skills)
+    cache = TokenCache(default_token_cache_path())
+    cache.annotate(agents, skills)
+    cache.save()
+    assigned = [a.project_path for a in config.project_assignments]
+    costs = context_costs(agents, skills, assigned)
+    catalog = sum(a.tokens for a in agents) + sum(s.tokens for s in skills)
+
+    if json_output:
+        everywhere, *projects = costs
+        typer.echo(json.dumps({
+            "agents": len(agents),
+            "skills": len(skills),
+            "catalog_tokens": catalog,
+            "global": everywhere.to_dict(),
+            "projects": [c.to_dict() for c in projects],
+        }, indent=2))
+        return
+
+    typer.echo(
+        f"{len(agents)} agent(s) and {len(skills)} skill(s), "
+        f"{format_token_estimate(catalog)} tokens in total (estimated)\n"
+    )
+    typer.echo(f"  {'Agents':>13} {'Skills':>13} {'Global':>8} {'Total':>8}  Project")
+    for cost in costs:
+        agent_col = f"{len(cost.agents)} / {format_token_estimate(cost.agent_tokens)}"
+        skill_col = f"{len(cost.skills)} / {format_token_estimate(cost.skill_tokens)}"
+        if cost.project is None:
+            typer.echo(f"  {agent_col:>13} {skill_col:>13} {'':>8} {'':>8}  (global, every project)")
+            continue
+        inherited = cost.total_tokens - cost.agent_tokens - cost.skill_tokens
+        typer.echo(
+            f"  {agent_col:>13} {skill_col:>13} {format_token_estimate(inherited):>8} "
+            f"{format_token_estimate(cost.total_tokens):>8}  {cost.project}"
+        )
+
+
+@app_cli.command()
+def budget(
+    projects: list[Path] = typer.Argument(..., help="Project directories"),
+    top: int = typer.Option(5, "--top", "-n", help="Largest contributors to list"),
+    json_output: bool = _JSON_OPTION,
+) -> None:
+    """Show the estimated tokens a project loads from linked agents and skills."""
+    import json
+
+    from agent_manager.core.config_manager import ConfigManager
+    from agent_manager.core.context_budget import BudgetAnalyzer, LARGE_SHARE
+    from agent_manager.core.tokens import TokenCache, default_token_cache_path, format_token_estimate
+
+    config = ConfigManager().load()
+    agents, skills = _load_items()
+    cache = TokenCache(default_token_cache_path())
+    analyzer = BudgetAnalyzer(agents, skills, token_cache=cache, claude_dir=config.claude_dir)
+    budgets = [analyzer.analyze(p.expanduser().resolve()) for p in projects]
+    cache.save()
+
+    if json_output:
+        typer.echo(json.dumps([b.to_dict(top) for b in budgets], indent=2))
+        return
+
+    for b in budgets:
+        own = sum(1 for i in b.items if i.scope == "project")
+        typer.echo(
+            f"{b.project}: {format_token_estimate(b.total_tokens)} tokens "
+            f"({format_token_estimate(b.description_tokens)} in descriptions every session, "
+            f"{format_token_estimate(b.body_tokens)} in bodies on use)"
+        )
+        typer.echo(
+            f"  {own} from the project, {len(b.items) - own} global"
+            + (f", {len(b.shadowed)} global shadowed by the project" if b.shadowed else "")
+        )
+        for item in b.largest(top):
+            share = item.total_tokens / b.total_tokens if b.total_tokens else 0
+            flag = typer.style(" ⚠", fg="yellow") if b.is_large(item) else ""
+            outside = "" if item.in_catalog else ", not in catalog"
+            typer.echo(
+                f"  {format_token_estimate(item.total_tokens):>8} {share:>4.0%}  "
+                f"{item.kind:<5} {item.name} ({item.scope}{outside}){flag}"
+            )
+    if any(b.is_large(i) for b in budgets for i in b.items):
+        typer.echo(f"\n⚠ marks items costing {LARGE_SHARE:.0%} or more of their project's total")
+
+
 def main():
     """Main entry point for CLI."""
     try:
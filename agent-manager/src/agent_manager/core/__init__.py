@@ -1,21 +1,52 @@
-"""Core business logic for Agent Manager."""
-
-from agent_manager.core.parser import FrontmatterParser
-from agent_manager.core.scanner import AgentSkillScanner, ScanResult
-from agent_manager.core.symlink_manager import SymlinkManager, LinkResult
-from agent_manager.core.config_manager import ConfigManager
-from agent_manager.core.validator import AgentValidator
-from agent_manager.core.mcp_manager import MCPManager
-from agent_manager.core.session_manager import SessionManager
-
-__all__ = [
-    "FrontmatterParser",
-    "AgentSkillScanner",
-    "ScanResult",
-    "SymlinkManager",
-    "LinkResult",
-    "ConfigManager",
-    "AgentValidator",
-    "MCPManager",
-    "SessionManager",
-]
+"""Core business logic for Agent Manager.
+
+Exports are resolved lazily (PEP 562) so that importing one submodule, e.g.
+``agent_manager.core.scanner``, does not also import jsonschema and every
+other manager.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agent_manager.core.parser import FrontmatterParser
+    from agent_manager.core.scanner import AgentSkillScanner, ScanResult
+    from agent_manager.core.symlink_manager import SymlinkManager, LinkResult
+    from agent_manager.core.config_manager import ConfigManager
+    from agent_manager.core.catalog_store import CatalogStore
+    from agent_manager.core.search_index import SearchIndex
+    from agent_manager.core.similarity import SimilarityIndex
+    from agent_manager.core.validator import AgentValidator
+    from agent_manager.core.mcp_manager import MCPManager
+    from agent_manager.core.session_manager import SessionManager
+
+_EXPORTS = {
+    "FrontmatterParser": "agent_manager.core.parser",
+    "AgentSkillScanner": "agent_manager.core.scanner",
+    "ScanResult": "agent_manager.core.scanner",
+    "SymlinkManager": "agent_manager.core.symlink_manager",
+    "LinkResult": "agent_manager.core.symlink_manager",
+    "ConfigManager": "agent_manager.core.config_manager",
+    "CatalogStore": "agent_manager.core.catalog_store",
+    "SearchIndex": "agent_manager.core.search_index",
+    "SimilarityIndex": "agent_manager.core.similarity",
+    "AgentValidator": "agent_manager.core.validator",
+    "MCPManager": "agent_manager.core.mcp_manager",
+    "SessionManager": "agent_manager.core.session_manager",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule providing ``name`` on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -0,0 +1,83 @@
+"""Per-agent usage aggregated from subagent calls in session logs."""
+
+from dataclasses import dataclass, field
+
+# Upper bounds (ms) of the latency histogram buckets; a last bucket holds the rest
+LATENCY_BUCKETS_MS = (1_000, 2_000, 5_000, 10_000, 30_000, 60_000, 120_000, 300_000, 600_000)
+
+# Rolling windows (days) shown in the agent preview
+USAGE_WINDOWS = (1, 7, 30, 365)
+
+
+@dataclass
+class AgentUsage:
+    """Calls of one agent as a subagent over a window of days."""
+
+    agent: str
+    calls: int = 0
+    # Calls whose result has been logged; tokens and durations come from these
+    finished: int = 0
+    tokens: int = 0
+    duration_ms: float = 0.0
+    # Finished calls per LATENCY_BUCKETS_MS bucket
+    latency: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    # Unix time of the most recent call (in any window)
+    last_used: float | None = None
+
+    @property
+    def mean_ms(self) -> float | None:
+        """Mean duration of the finished calls."""
+        return self.duration_ms / self.finished if self.finished else None
+
+    @property
+    def mean_tokens(self) -> float | None:
+        """Mean tokens of the finished calls."""
+        return self.tokens / self.finished if self.finished else None
+
+    def percentile_ms(self, q: float) -> float | None:
+        """
+        Estimate a latency percentile from the histogram.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Upper bound of the bucket holding the quantile (``inf`` for the
+            last bucket), or None without timed calls
+        """
+        total = sum(self.latency)
+        if not total:
+            return None
+        seen = 0
+        for bound, count in zip((*LATENCY_BUCKETS_MS, float("inf")), self.latency):
+            seen += count
+            if seen >= q * total:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization (percentiles past the last bucket are None)."""
+        def bound(ms: float | None) -> float | None:
+            return None if ms == float("inf") else ms
+
+        return {
+            "agent": self.agent,
+            "calls": self.calls,
+            "finished": self.finished,
+            "tokens": self.tokens,
+            "mean_ms": self.mean_ms,
+            "p50_ms": bound(self.percentile_ms(0.5)),
+            "p95_ms": bound(self.percentile_ms(0.95)),
+            "latency_buckets_ms": list(LATENCY_BUCKETS_MS),
+            "latency": self.latency,
+            "last_used": self.last_used,
+        }
+
+
+def format_latency(ms: float | None) -> str:
+    """Format a histogram percentile, e.g. ``≤5s`` or ``>600s``."""
+    if ms is None:
+        return "-"
+    if ms == float("inf"):
+        return f">{LATENCY_BUCKETS_MS[-1] // 1000}s"
+    return f"≤{ms / 1000:g}s"
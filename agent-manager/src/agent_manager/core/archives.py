@@ -0,0 +1,73 @@
+"""Read agent/skill files out of zip and tar.gz archives without extracting."""
+
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Callable
+
+# Archive types treated as directories by the scanner
+ARCHIVE_SUFFIXES = (".zip", ".tar.gz", ".tgz")
+
+# Errors raised for corrupt or unreadable archives
+ARCHIVE_ERRORS = (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError)
+
+
+def is_archive(path: Path) -> bool:
+    """Check whether a file name has a supported archive suffix."""
+    return path.name.endswith(ARCHIVE_SUFFIXES)
+
+
+def read_archive(
+    path: Path, match: Callable[[str], bool]
+) -> tuple[list[str], dict[str, bytes]]:
+    """
+    List an archive's files and read the ones that match.
+
+    Zip files are read through their central directory; tar.gz files are
+    streamed once from start to end. Non-matching members are never
+    decompressed into memory.
+
+    Args:
+        path: Archive file
+        match: Called with each member's normalized name
+
+    Returns:
+        (every file name, name -> content of matching files). Names are
+        POSIX paths relative to the archive root; unsafe names are dropped.
+
+    Raises:
+        OSError, EOFError, zipfile.BadZipFile, tarfile.TarError: If the
+            archive can't be read
+    """
+    names: list[str] = []
+    contents: dict[str, bytes] = {}
+
+    if path.name.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                name = _normalize(info.filename)
+                if info.is_dir() or name is None:
+                    continue
+                names.append(name)
+                if match(name):
+                    contents[name] = archive.read(info)
+        return names, contents
+
+    # "r|gz" streams the members in order without seeking
+    with tarfile.open(path, "r|gz") as archive:
+        for member in archive:
+            name = _normalize(member.name)
+            if not member.isfile() or name is None:
+                continue
+            names.append(name)
+            if match(name):
+                contents[name] = archive.extractfile(member).read()
+    return names, contents
+
+
+def _normalize(name: str) -> str | None:
+    """Strip leading "./" and reject absolute or parent-relative names."""
+    parts = [p for p in PurePosixPath(name).parts if p != "."]
+    if not parts or parts[0] == "/" or ".." in parts:
+        return None
+    return "/".join(parts)
@@ -0,0 +1,228 @@
+"""Reconcile project links with the project assignments in the config."""
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from agent_manager.core.installer import Action, apply_actions
+from agent_manager.core.symlink_manager import LinkResult
+from agent_manager.models import Agent, ProjectAssignment, Skill
+
+# Projects whose links are read or changed at once
+DEFAULT_CONCURRENCY = 16
+
+
+@dataclass
+class ProjectPlan:
+    """The link changes that bring one project in line with its assignment."""
+
+    project: Path
+    # Links to create, replace or remove, and conflicts left alone ("skip")
+    actions: list[Action] = field(default_factory=list)
+    # Assigned links that are already correct
+    unchanged: int = 0
+    # Assigned names that match no catalog agent or skill
+    missing: list[str] = field(default_factory=list)
+
+    @property
+    def changes(self) -> list[Action]:
+        """Actions that change the filesystem."""
+        return [a for a in self.actions if a.kind != "skip"]
+
+    @property
+    def failed(self) -> list[Action]:
+        """Applied actions that did not succeed."""
+        return [a for a in self.changes if a.result not in (None, LinkResult.SUCCESS)]
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "project": str(self.project),
+            "actions": [a.to_dict() for a in self.actions],
+            "unchanged": self.unchanged,
+            "missing": self.missing,
+        }
+
+
+class AssignmentReconciler:
+    """
+    Make each assigned project's ``.claude`` links match its assignment.
+
+    The desired links of a project are ``.claude/agents/<file>.md`` for each
+    assigned agent and ``.claude/skills/<dir>`` for each assigned skill,
+    pointing at the catalog item of that name. They are diffed against one
+    listing of each of the project's two directories, so a project already
+    in line costs two ``scandir`` calls and no writes. Only links into the
+    catalog are ever removed: regular files, and links to anything else,
+    are left alone, and a regular file in the way of a desired link is
+    reported as a conflict.
+    """
+
+    def __init__(
+        self,
+        agents: Iterable[Agent],
+        skills: Iterable[Skill],
+        prune: bool = True,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """
+        Initialize the reconciler.
+
+        Args:
+            agents: Catalog agents; the first of each name is linked
+            skills: Catalog skills; the first of each name is linked
+            prune: Remove links to catalog items that are no longer assigned
+            concurrency: Projects handled at once
+        """
+        self._agents: dict[str, Path] = {}
+        self._skills: dict[str, Path] = {}
+        for agent in agents:
+            self._agents.setdefault(agent.metadata.name, agent.source_path)
+            self._agents.setdefault(agent.source_path.stem, agent.source_path)
+        for skill in skills:
+            self._skills.setdefault(skill.metadata.name, skill.source_dir)
+            self._skills.setdefault(skill.source_dir.name, skill.source_dir)
+        self._managed = {str(p) for p in (*self._agents.values(), *self._skills.values())}
+        self.prune = prune
+        self.concurrency = concurrency
+
+    def source(self, kind: str, name: str) -> Path | None:
+        """
+        Get the catalog path an assigned name links to.
+
+        Args:
+            kind: "agents" or "skills"
+            name: Item name or file (directory for skills) name
+
+        Returns:
+            The agent file or skill directory, or None if not in the catalog
+        """
+        return (self._agents if kind == "agents" else self._skills).get(name)
+
+    def plan_project(self, assignment: ProjectAssignment) -> ProjectPlan:
+        """
+        Diff one project's desired links against its ``.claude`` directories.
+
+        Args:
+            assignment: Project and the agent and skill names assigned to it
+
+        Returns:
+            ProjectPlan with the actions needed
+        """
+        project = assignment.project_path.expanduser()
+        plan = ProjectPlan(project)
+        for kind, names, sources in (
+            ("agents", assignment.agent_names, self._agents),
+            ("skills", assignment.skill_names, self._skills),
+        ):
+            directory = project / ".claude" / kind
+            actual = _read_links(directory)
+            desired: dict[str, Path] = {}
+            for name in names:
+                source = sources.get(name)
+                if source is None:
+                    plan.missing.append(name)
+                else:
+                    desired[source.name] = source
+
+            for entry, source in desired.items():
+                target = directory / entry
+                if entry not in actual:
+                    plan.actions.append(Action("link", source, target))
+                elif actual[entry] is None and target == source:
+                    plan.unchanged += 1  # The catalog item lives in the project itself
+                elif actual[entry] is None:
+                    plan.actions.append(Action("skip", source, target, "not a symlink"))
+                elif actual[entry] == str(source):
+                    plan.unchanged += 1
+                else:
+                    plan.actions.append(
+                        Action("relink", source, target, f"was linked to {actual[entry]}")
+                    )
+            if self.prune:
+                for entry, link in actual.items():
+                    if entry not in desired and link in self._managed:
+                        plan.actions.append(
+                            Action("unlink", Path(link), directory / entry, "not assigned")
+                        )
+        return plan
+
+    def plan(self, assignments: Iterable[ProjectAssignment]) -> list[ProjectPlan]:
+        """
+        Plan every project, merging assignments that name the same project.
+
+        Args:
+            assignments: Project assignments from the config
+
+        Returns:
+            One plan per project, in order of first appearance
+        """
+        merged: dict[Path, ProjectAssignment] = {}
+        for a in assignments:
+            project = a.project_path.expanduser()
+            into = merged.setdefault(project, ProjectAssignment(project))
+            into.agent_names.extend(n for n in a.agent_names if n not in into.agent_names)
+            into.skill_names.extend(n for n in a.skill_names if n not in into.skill_names)
+        return [self.plan_project(a) for a in merged.values()]
+
+    async def apply(self, plans: list[ProjectPlan]) -> list[ProjectPlan]:
+        """
+        Apply the changes of every plan, several projects at a time.
+
+        Projects with nothing to change are not touched.
+
+        Args:
+            plans: Plans from ``plan``
+
+        Returns:
+            The same plans, with each action's ``result`` set
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(plan: ProjectPlan) -> None:
+            async with semaphore:
+                await asyncio.to_thread(apply_actions, plan.actions)
+
+        await asyncio.gather(*(run(p) for p in plans if p.changes))
+        return plans
+
+    async def sync(
+        self, assignments: Iterable[ProjectAssignment], dry_run: bool = False
+    ) -> list[ProjectPlan]:
+        """
+        Plan, then (unless ``dry_run``) apply, every project assignment.
+
+        Args:
+            assignments: Project assignments from the config
+            dry_run: Only plan
+
+        Returns:
+            One plan per project
+        """
+        plans = self.plan(assignments)
+        if not dry_run:
+            await self.apply(plans)
+        return plans
+
+
+def _read_links(directory: Path) -> dict[str, str | None]:
+    """
+    List a link directory in one ``scandir`` call.
+
+    Returns:
+        Entry name -> normalized absolute link target, or None for entries
+        that are not symlinks
+    """
+    entries: dict[str, str | None] = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_symlink():
+                    entries[entry.name] = os.path.normpath(directory / os.readlink(entry.path))
+                else:
+                    entries[entry.name] = None
+    except OSError:
+        pass
+    return entries
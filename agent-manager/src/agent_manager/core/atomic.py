@@ -0,0 +1,58 @@
+"""Atomic file writes shared by the config, cache, index and bundle files."""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+@contextmanager
+def atomic_path(path: Path, mode: int | None = None) -> Iterator[Path]:
+    """
+    Yield a temporary file that replaces ``path`` when the block succeeds.
+
+    The temporary file is uniquely named and sits next to the target, so
+    processes saving the same file at once (the TUI and a CLI command, say)
+    never share or delete each other's temporary file; the last replace wins.
+    It is removed if the block raises, leaving the target untouched.
+
+    Args:
+        path: File to replace; missing parent directories are created and
+            symlinks are followed
+        mode: Permissions for a new file (an existing file keeps its own);
+            by default only the owner can read it
+
+    Yields:
+        Path of the temporary file to write
+    """
+    path = path.resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield Path(tmp)
+        try:
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            if mode is not None:
+                os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """
+    Replace a file's contents atomically, keeping its mode and following symlinks.
+
+    Args:
+        path: File to write; missing parent directories are created
+        text: New contents
+    """
+    with atomic_path(path) as tmp:
+        tmp.write_text(text, encoding="utf-8")
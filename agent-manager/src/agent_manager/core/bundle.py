@@ -0,0 +1,273 @@
+"""Portable, content-addressed bundles of agents and skills."""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from agent_manager.core.atomic import atomic_path
+from agent_manager.core.symlink_manager import LinkResult, SymlinkManager
+from agent_manager.models import Agent, Skill
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+# Metadata copied into the manifest, so unpacking never parses markdown
+AGENT_METADATA = [
+    "name", "description", "model", "color", "tags", "version", "author", "tools", "content_hash",
+]
+SKILL_METADATA = ["name", "description", "content_hash"]
+
+
+def default_store_dir() -> Path:
+    """Get the shared store that bundles are unpacked into."""
+    return Path.home() / ".local" / "share" / "agent-manager" / "store"
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass
+class BundleItem:
+    """One agent or skill in a bundle."""
+
+    kind: str
+    # File or directory name under ~/.claude/agents or ~/.claude/skills
+    entry: str
+    # Item hash: identifies the store directory
+    hash: str
+    # Path relative to the store directory -> blob hash
+    files: dict[str, str]
+    metadata: dict = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        """The agent or skill name."""
+        return self.metadata.get("name", self.entry)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for the manifest."""
+        return {
+            "kind": self.kind,
+            "entry": self.entry,
+            "hash": self.hash,
+            "files": self.files,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BundleItem":
+        """Create from a manifest entry."""
+        return cls(
+            kind=data["kind"],
+            entry=data["entry"],
+            hash=data["hash"],
+            files=data["files"],
+            metadata=data.get("metadata", {}),
+        )
+
+
+@dataclass
+class Manifest:
+    """Contents of a bundle."""
+
+    items: list[BundleItem] = field(default_factory=list)
+    created: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "format": FORMAT_VERSION,
+            "created": self.created,
+            "items": [item.to_dict() for item in self.items],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Manifest":
+        """
+        Create from dictionary.
+
+        Raises:
+            ValueError: If the bundle format is not supported
+        """
+        if data.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported bundle format: {data.get('format')!r}")
+        return cls(
+            items=[BundleItem.from_dict(item) for item in data.get("items", [])],
+            created=data.get("created", 0.0),
+        )
+
+
+@dataclass
+class UnpackResult:
+    """Outcome for one bundle item."""
+
+    item: BundleItem
+    path: Path
+    # False if the store already held this exact content
+    stored: bool
+    link: LinkResult | None = None
+
+
+def _item_hash(files: dict[str, str]) -> str:
+    """Hash an item's file list, so equal content maps to one store directory."""
+    listing = "\n".join(f"{path}\0{blob}" for path, blob in sorted(files.items()))
+    return _digest(listing.encode("utf-8"))
+
+
+def pack(output: Path, agents: list[Agent], skills: list[Skill]) -> Manifest:
+    """
+    Write agents and skills to a bundle.
+
+    A bundle is a zip file holding ``manifest.json`` and one ``objects/<hash>``
+    member per distinct file content.
+
+    Args:
+        output: Bundle file to write
+        agents: Agents to include
+        skills: Skills to include (with every file in their directory)
+
+    Returns:
+        The manifest written
+
+    Raises:
+        OSError: If a source file can't be read or the bundle can't be written
+    """
+    manifest = Manifest(created=time.time())
+    blobs: dict[str, bytes] = {}
+
+    def add(data: bytes) -> str:
+        blob = _digest(data)
+        blobs.setdefault(blob, data)
+        return blob
+
+    for agent in agents:
+        entry = agent.source_path.name
+        files = {entry: add(agent.source_path.read_bytes())}
+        manifest.items.append(BundleItem(
+            "agent", entry, _item_hash(files), files, agent.to_dict(AGENT_METADATA)
+        ))
+
+    for skill in skills:
+        entry = skill.source_dir.name
+        files = {}
+        for path in sorted(skill.source_dir.rglob("*")):
+            if path.is_file() and not path.is_symlink():
+                relative = path.relative_to(skill.source_dir).as_posix()
+                files[f"{entry}/{relative}"] = add(path.read_bytes())
+        manifest.items.append(BundleItem(
+            "skill", entry, _item_hash(files), files, skill.to_dict(SKILL_METADATA)
+        ))
+
+    # Bundles are meant to be shared, so a new one is world-readable
+    with atomic_path(output, mode=0o644) as tmp:
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+            bundle.writestr(MANIFEST, json.dumps(manifest.to_dict(), indent=2))
+            for blob, data in blobs.items():
+                bundle.writestr(f"objects/{blob}", data)
+    return manifest
+
+
+def read_manifest(bundle: Path) -> Manifest:
+    """
+    Read a bundle's manifest without touching its objects.
+
+    Raises:
+        OSError, zipfile.BadZipFile, KeyError, ValueError: If the bundle is
+            unreadable or not a bundle
+    """
+    with zipfile.ZipFile(bundle) as archive:
+        return Manifest.from_dict(json.loads(archive.read(MANIFEST)))
+
+
+def unpack(
+    bundle: Path,
+    store: Path | None = None,
+    symlink_manager: SymlinkManager | None = None,
+    link: bool = True,
+) -> list[UnpackResult]:
+    """
+    Unpack a bundle into the shared store and link its items globally.
+
+    Each item lands in ``<store>/<item hash>``. Items already in the store
+    are not written again, so unpacking is idempotent and versions that
+    share content share a directory. A global link that points into the
+    store (an older version) is replaced; any other existing file is left
+    alone and reported as a conflict.
+
+    Args:
+        bundle: Bundle file
+        store: Store directory (default: ~/.local/share/agent-manager/store)
+        symlink_manager: Manager for the global links (default: ~/.claude)
+        link: Create global links
+
+    Returns:
+        One result per item
+
+    Raises:
+        OSError, zipfile.BadZipFile, KeyError, ValueError: If the bundle is
+            unreadable, not a bundle, or an object fails its hash check
+    """
+    store = (store or default_store_dir()).resolve()
+    symlink_manager = symlink_manager or SymlinkManager()
+    store.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    with zipfile.ZipFile(bundle) as archive:
+        manifest = Manifest.from_dict(json.loads(archive.read(MANIFEST)))
+        for item in manifest.items:
+            if item.hash != _item_hash(item.files):
+                raise ValueError(f"Manifest hash mismatch for {item.entry}")
+            if "/" in item.entry or item.entry in ("", ".", ".."):
+                raise ValueError(f"Unsafe entry name in bundle: {item.entry}")
+            item_dir = store / item.hash
+            stored = not item_dir.exists()
+            if stored:
+                _materialize(archive, item, item_dir)
+            result = UnpackResult(item, item_dir / item.entry, stored)
+            if link:
+                result.link = _link(symlink_manager, item, result.path, store)
+            results.append(result)
+    return results
+
+
+def _materialize(archive: zipfile.ZipFile, item: BundleItem, item_dir: Path) -> None:
+    """Write an item's files into a temporary directory, then rename it into place."""
+    tmp = item_dir.with_name(f".tmp-{item.hash}-{os.getpid()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    try:
+        for relative, blob in item.files.items():
+            if Path(relative).is_absolute() or ".." in Path(relative).parts:
+                raise ValueError(f"Unsafe path in bundle: {relative}")
+            target = tmp / relative
+            data = archive.read(f"objects/{blob}")
+            if _digest(data) != blob:
+                raise ValueError(f"Corrupt object {blob} for {relative}")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+        try:
+            tmp.rename(item_dir)
+        except OSError:
+            # Another process stored the same content first
+            if not item_dir.exists():
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _link(manager: SymlinkManager, item: BundleItem, source: Path, store: Path) -> LinkResult:
+    """Link an unpacked item globally, replacing links to other stored versions."""
+    directory = manager.global_agents_dir if item.kind == "agent" else manager.global_skills_dir
+    target = directory / item.entry
+    if target.is_symlink():
+        current = Path(os.readlink(target))
+        if current != source and current.is_relative_to(store):
+            target.unlink()
+    if item.kind == "agent":
+        return manager.link_agent_global(source)
+    return manager.link_skill_global(source)
@@ -0,0 +1,719 @@
+"""SQLite-backed persistent catalog of agents and skills."""
+
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from agent_manager.models import Agent, AgentMetadata, Skill, SkillMetadata
+
+# Bump when the schema changes; older databases are rebuilt from scratch
+SCHEMA_VERSION = 4
+
+# Rows written between commits while ingesting a scan
+BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE scan_roots (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    last_scanned REAL,
+    agent_count INTEGER NOT NULL DEFAULT 0,
+    skill_count INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE agents (
+    id INTEGER PRIMARY KEY,
+    root_id INTEGER NOT NULL REFERENCES scan_roots(id) ON DELETE CASCADE,
+    source_path TEXT NOT NULL UNIQUE,
+    source_repo TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    model TEXT NOT NULL,
+    color TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    version TEXT,
+    author TEXT,
+    tools TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    content_hash TEXT,
+    tokens INTEGER,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+CREATE INDEX agents_name ON agents(name COLLATE NOCASE);
+CREATE INDEX agents_model ON agents(model COLLATE NOCASE);
+CREATE INDEX agents_repo ON agents(source_repo);
+CREATE INDEX agents_content_hash ON agents(content_hash);
+
+CREATE TABLE agent_tags (
+    agent_id INTEGER NOT NULL REFERENCES agents(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL
+);
+CREATE INDEX agent_tags_tag ON agent_tags(tag COLLATE NOCASE);
+CREATE INDEX agent_tags_agent ON agent_tags(agent_id);
+
+CREATE TABLE skills (
+    id INTEGER PRIMARY KEY,
+    root_id INTEGER NOT NULL REFERENCES scan_roots(id) ON DELETE CASCADE,
+    source_path TEXT NOT NULL UNIQUE,
+    source_dir TEXT NOT NULL,
+    source_repo TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    content TEXT NOT NULL,
+    scripts TEXT NOT NULL,
+    content_hash TEXT,
+    tokens INTEGER,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+CREATE INDEX skills_name ON skills(name COLLATE NOCASE);
+CREATE INDEX skills_repo ON skills(source_repo);
+
+-- Directories holding a root's items (and the root itself), with their mtime
+-- when last ingested; an added or removed item changes one of them
+CREATE TABLE scan_dirs (
+    root_id INTEGER NOT NULL REFERENCES scan_roots(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER,
+    PRIMARY KEY (root_id, path)
+);
+
+-- Symlinks pointing at a catalog item (scope is 'global' or 'project')
+CREATE TABLE links (
+    source_path TEXT NOT NULL,
+    link_path TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    PRIMARY KEY (source_path, link_path)
+);
+
+CREATE TABLE validation_results (
+    root_id INTEGER NOT NULL REFERENCES scan_roots(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX validation_results_path ON validation_results(path);
+
+CREATE VIRTUAL TABLE agents_fts USING fts5(
+    name, description, prompt, content='agents', content_rowid='id'
+);
+CREATE TRIGGER agents_fts_insert AFTER INSERT ON agents BEGIN
+    INSERT INTO agents_fts(rowid, name, description, prompt)
+    VALUES (new.id, new.name, new.description, new.prompt);
+END;
+CREATE TRIGGER agents_fts_delete AFTER DELETE ON agents BEGIN
+    INSERT INTO agents_fts(agents_fts, rowid, name, description, prompt)
+    VALUES ('delete', old.id, old.name, old.description, old.prompt);
+END;
+CREATE TRIGGER agents_fts_update AFTER UPDATE ON agents BEGIN
+    INSERT INTO agents_fts(agents_fts, rowid, name, description, prompt)
+    VALUES ('delete', old.id, old.name, old.description, old.prompt);
+    INSERT INTO agents_fts(rowid, name, description, prompt)
+    VALUES (new.id, new.name, new.description, new.prompt);
+END;
+
+CREATE VIRTUAL TABLE skills_fts USING fts5(
+    name, description, content, content='skills', content_rowid='id'
+);
+CREATE TRIGGER skills_fts_insert AFTER INSERT ON skills BEGIN
+    INSERT INTO skills_fts(rowid, name, description, content)
+    VALUES (new.id, new.name, new.description, new.content);
+END;
+CREATE TRIGGER skills_fts_delete AFTER DELETE ON skills BEGIN
+    INSERT INTO skills_fts(skills_fts, rowid, name, description, content)
+    VALUES ('delete', old.id, old.name, old.description, old.content);
+END;
+CREATE TRIGGER skills_fts_update AFTER UPDATE ON skills BEGIN
+    INSERT INTO skills_fts(skills_fts, rowid, name, description, content)
+    VALUES ('delete', old.id, old.name, old.description, old.content);
+    INSERT INTO skills_fts(rowid, name, description, content)
+    VALUES (new.id, new.name, new.description, new.content);
+END;
+"""
+
+# Existing rows are only rewritten (and re-indexed) when the file changed
+_UPSERT_AGENT = """
+INSERT INTO agents (
+    root_id, source_path, source_repo, name, description, model, color,
+    tags, version, author, tools, prompt, content_hash, tokens, mtime_ns, size
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(source_path) DO UPDATE SET
+    root_id = excluded.root_id,
+    source_repo = excluded.source_repo,
+    name = excluded.name,
+    description = excluded.description,
+    model = excluded.model,
+    color = excluded.color,
+    tags = excluded.tags,
+    version = excluded.version,
+    author = excluded.author,
+    tools = excluded.tools,
+    prompt = excluded.prompt,
+    content_hash = excluded.content_hash,
+    tokens = excluded.tokens,
+    mtime_ns = excluded.mtime_ns,
+    size = excluded.size
+WHERE mtime_ns IS NOT excluded.mtime_ns OR size IS NOT excluded.size
+    OR root_id != excluded.root_id
+RETURNING id
+"""
+
+_UPSERT_SKILL = """
+INSERT INTO skills (
+    root_id, source_path, source_dir, source_repo, name, description,
+    content, scripts, content_hash, tokens, mtime_ns, size
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(source_path) DO UPDATE SET
+    root_id = excluded.root_id,
+    source_dir = excluded.source_dir,
+    source_repo = excluded.source_repo,
+    name = excluded.name,
+    description = excluded.description,
+    content = excluded.content,
+    scripts = excluded.scripts,
+    content_hash = excluded.content_hash,
+    tokens = excluded.tokens,
+    mtime_ns = excluded.mtime_ns,
+    size = excluded.size
+WHERE mtime_ns IS NOT excluded.mtime_ns OR size IS NOT excluded.size
+    OR root_id != excluded.root_id
+RETURNING id
+"""
+
+_DELETE_ORPHAN_LINKS = """
+DELETE FROM links WHERE source_path NOT IN (
+    SELECT source_path FROM agents UNION ALL SELECT source_path FROM skills
+)
+"""
+
+
+def default_catalog_path() -> Path:
+    """Get the catalog database path (~/.config/agent-manager/catalog.db)."""
+    return Path.home() / ".config" / "agent-manager" / "catalog.db"
+
+
+@dataclass
+class RootInfo:
+    """Summary of one scan root stored in the catalog."""
+
+    path: Path
+    last_scanned: float | None
+    agent_count: int
+    skill_count: int
+    error_count: int
+
+
+@dataclass
+class IngestResult:
+    """Row changes made while ingesting one scan root."""
+
+    written: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+
+@dataclass
+class SearchHit:
+    """A full-text search match."""
+
+    kind: str
+    name: str
+    source_path: Path
+    rank: float
+
+
+class CatalogStore:
+    """
+    Persistent agent/skill catalog in SQLite (WAL mode).
+
+    Holds the last-known scan so the TUI and CLI can start from it instantly
+    while a rescan refreshes it. Scans are ingested per root: rows are
+    upserted as items arrive, unchanged files (same mtime and size) are left
+    alone, and items no longer found under the root are deleted. The mtimes
+    of the directories holding each root's items are kept too, so
+    ``stale_roots`` can tell which roots need a rescan without walking them.
+
+    One instance wraps one connection; open a separate instance per thread.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Open (and create or migrate) the catalog database.
+
+        Args:
+            path: Database file (default: ~/.config/agent-manager/catalog.db)
+        """
+        self.path = path or default_catalog_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._ensure_schema()
+
+    def __enter__(self) -> "CatalogStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _ensure_schema(self) -> None:
+        """Create the schema, rebuilding it if it is from another version."""
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version == SCHEMA_VERSION:
+            return
+
+        # The catalog is a cache of the filesystem, so just start over
+        tables = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND sql NOT LIKE 'CREATE VIRTUAL%'"
+            " AND name NOT LIKE '%fts_%' AND name NOT LIKE 'sqlite_%'"
+        ).fetchall()
+        virtual = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE sql LIKE 'CREATE VIRTUAL%'"
+        ).fetchall()
+        with self._conn:
+            self._conn.execute("PRAGMA foreign_keys=OFF")
+            for (name,) in [*virtual, *tables]:
+                self._conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+
+    # Writing
+
+    def ingest(self, root: Path, events: Iterable[tuple[str, object]]) -> IngestResult:
+        """
+        Upsert a scan of ``root`` from a stream of scanner events.
+
+        Items are written in batches as they arrive, so this works directly
+        on ``AgentSkillScanner.iter_path``. Items under ``root`` that are not
+        in the stream are deleted once it is exhausted, and the root's
+        validation results are replaced.
+
+        Args:
+            root: Scan root the events came from
+            events: ("agent", Agent), ("skill", Skill) or ("error", (path, message))
+
+        Returns:
+            IngestResult with row counts
+        """
+        result = IngestResult()
+        conn = self._conn
+        root_id = self._root_id(root)
+        conn.execute("DELETE FROM validation_results WHERE root_id = ?", (root_id,))
+
+        seen_agents: set[str] = set()
+        seen_skills: set[str] = set()
+        dirs: set[Path] = {root}
+        errors = 0
+        pending = 0
+        for kind, item in events:
+            if kind == "agent":
+                seen_agents.add(str(item.source_path))
+                dirs.add(item.source_path.parent)
+                changed = self._upsert_agent(root_id, item)
+            elif kind == "skill":
+                seen_skills.add(str(item.source_path))
+                dirs.add(item.source_dir.parent)
+                changed = self._upsert_skill(root_id, item)
+            else:
+                path, message = item
+                conn.execute(
+                    "INSERT INTO validation_results (root_id, path, message) VALUES (?, ?, ?)",
+                    (root_id, str(path), message),
+                )
+                errors += 1
+                continue
+
+            if changed:
+                result.written += 1
+            else:
+                result.unchanged += 1
+            self._replace_links(item)
+
+            pending += 1
+            if pending >= BATCH_SIZE:
+                conn.commit()
+                pending = 0
+
+        result.removed += self._delete_missing("agents", root_id, seen_agents)
+        result.removed += self._delete_missing("skills", root_id, seen_skills)
+        if result.removed:
+            conn.execute(_DELETE_ORPHAN_LINKS)
+        self._replace_dirs(root_id, dirs)
+        conn.execute(
+            "UPDATE scan_roots SET last_scanned = ?, agent_count = ?, skill_count = ?,"
+            " error_count = ? WHERE id = ?",
+            (time.time(), len(seen_agents), len(seen_skills), errors, root_id),
+        )
+        conn.commit()
+        return result
+
+    def update_root(
+        self,
+        root: Path,
+        agents: Iterable[Agent] = (),
+        skills: Iterable[Skill] = (),
+        errors: Iterable[tuple[Path, str]] = (),
+    ) -> IngestResult:
+        """
+        Upsert an already collected scan of ``root``.
+
+        Args:
+            root: Scan root
+            agents: Agents found under the root
+            skills: Skills found under the root
+            errors: (path, message) errors found under the root
+
+        Returns:
+            IngestResult with row counts
+        """
+        return self.ingest(root, _as_events(agents, skills, errors))
+
+    def remove_root(self, root: Path) -> None:
+        """Delete a scan root and everything found under it."""
+        with self._conn:
+            self._conn.execute("DELETE FROM scan_roots WHERE path = ?", (str(root),))
+            self._conn.execute(_DELETE_ORPHAN_LINKS)
+
+    def _root_id(self, root: Path) -> int:
+        (root_id,) = self._conn.execute(
+            "INSERT INTO scan_roots (path) VALUES (?)"
+            " ON CONFLICT(path) DO UPDATE SET path = excluded.path RETURNING id",
+            (str(root),),
+        ).fetchone()
+        return root_id
+
+    def _upsert_agent(self, root_id: int, agent: Agent) -> bool:
+        """Insert or update an agent; returns False if the row was unchanged."""
+        meta = agent.metadata
+        mtime_ns, size = _stat(agent.source_path)
+        row = self._conn.execute(_UPSERT_AGENT, (
+            root_id, str(agent.source_path), str(agent.source_repo),
+            meta.name, meta.description, meta.model, meta.color,
+            json.dumps(meta.tags), meta.version, meta.author,
+            json.dumps(meta.tools), agent.prompt, agent.content_hash, agent.tokens,
+            mtime_ns, size,
+        )).fetchone()
+        if row is None:
+            return False
+
+        (agent_id,) = row
+        self._conn.execute("DELETE FROM agent_tags WHERE agent_id = ?", (agent_id,))
+        self._conn.executemany(
+            "INSERT INTO agent_tags (agent_id, tag) VALUES (?, ?)",
+            [(agent_id, str(tag)) for tag in meta.tags],
+        )
+        return True
+
+    def _upsert_skill(self, root_id: int, skill: Skill) -> bool:
+        """Insert or update a skill; returns False if the row was unchanged."""
+        mtime_ns, size = _stat(skill.source_path)
+        row = self._conn.execute(_UPSERT_SKILL, (
+            root_id, str(skill.source_path), str(skill.source_dir), str(skill.source_repo),
+            skill.metadata.name, skill.metadata.description, skill.content,
+            json.dumps([str(s) for s in skill.scripts]), skill.content_hash, skill.tokens,
+            mtime_ns, size,
+        )).fetchone()
+        return row is not None
+
+    def _replace_links(self, item: Agent | Skill) -> None:
+        """Store the global and project links of an agent or skill."""
+        source = str(item.source_path)
+        self._conn.execute("DELETE FROM links WHERE source_path = ?", (source,))
+        rows = [(source, str(p), "project") for p in item.project_links]
+        if item.global_link:
+            rows.append((source, str(item.global_link), "global"))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO links (source_path, link_path, scope) VALUES (?, ?, ?)",
+            rows,
+        )
+
+    def _replace_dirs(self, root_id: int, dirs: set[Path]) -> None:
+        """Store the mtimes of the directories holding a root's items."""
+        rows = {}
+        for path in dirs:
+            # Items read from an archive live under the archive file
+            while not path.exists() and path != path.parent:
+                path = path.parent
+            rows[str(path)] = _stat(path)[0]
+        self._conn.execute("DELETE FROM scan_dirs WHERE root_id = ?", (root_id,))
+        self._conn.executemany(
+            "INSERT INTO scan_dirs (root_id, path, mtime_ns) VALUES (?, ?, ?)",
+            [(root_id, path, mtime_ns) for path, mtime_ns in rows.items()],
+        )
+
+    def _delete_missing(self, table: str, root_id: int, seen: set[str]) -> int:
+        """Delete rows under a root whose source_path was not seen."""
+        stale = [
+            path for (path,) in self._conn.execute(
+                f"SELECT source_path FROM {table} WHERE root_id = ?", (root_id,)
+            )
+            if path not in seen
+        ]
+        self._conn.executemany(
+            f"DELETE FROM {table} WHERE source_path = ?", [(p,) for p in stale]
+        )
+        return len(stale)
+
+    # Reading
+
+    def stale_roots(self, roots: Iterable[Path]) -> list[Path]:
+        """
+        Find the roots a rescan would change.
+
+        A root is stale if it was never ingested, if a stored file's mtime or
+        size differs from disk (edited or deleted), or if a directory holding
+        its items changed (an item was added or removed). New ``.claude``
+        directories elsewhere under a root are only found by a full rescan.
+
+        Args:
+            roots: Scan roots to check
+
+        Returns:
+            The stale roots, in order
+        """
+        stale = []
+        for root in roots:
+            row = self._conn.execute(
+                "SELECT id FROM scan_roots WHERE path = ? AND last_scanned IS NOT NULL",
+                (str(root),),
+            ).fetchone()
+            if row is None or self._root_changed(row[0]):
+                stale.append(root)
+        return stale
+
+    def _root_changed(self, root_id: int) -> bool:
+        """Whether any stored file or directory of a root differs from disk."""
+        files = self._conn.execute(
+            "SELECT source_path, mtime_ns, size FROM agents WHERE root_id = ?1"
+            " UNION ALL SELECT source_path, mtime_ns, size FROM skills WHERE root_id = ?1",
+            (root_id,),
+        )
+        if any(_stat(Path(path)) != (mtime_ns, size) for path, mtime_ns, size in files):
+            return True
+        dirs = self._conn.execute(
+            "SELECT path, mtime_ns FROM scan_dirs WHERE root_id = ?", (root_id,)
+        )
+        return any(_stat(Path(path))[0] != mtime_ns for path, mtime_ns in dirs)
+
+    def load_agents(
+        self,
+        name: str | None = None,
+        model: str | None = None,
+        tag: str | None = None,
+        repo: Path | None = None,
+    ) -> list[Agent]:
+        """
+        Load agents, optionally narrowed by exact-match indexed columns.
+
+        Name, model and tag match case-insensitively.
+
+        Args:
+            name: Agent name
+            model: Model name
+            tag: Tag the agent must have
+            repo: Source repository
+
+        Returns:
+            Agents with links restored, ordered by name
+        """
+        clauses, params = [], []
+        for column, value in (("name", name), ("model", model)):
+            if value is not None:
+                clauses.append(f"a.{column} = ? COLLATE NOCASE")
+                params.append(value)
+        if repo is not None:
+            clauses.append("a.source_repo = ?")
+            params.append(str(repo))
+        if tag is not None:
+            clauses.append(
+                "a.id IN (SELECT agent_id FROM agent_tags WHERE tag = ? COLLATE NOCASE)"
+            )
+            params.append(tag)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        rows = self._conn.execute(
+            "SELECT source_path, source_repo, name, description, model, color, tags,"
+            " version, author, tools, prompt, content_hash, tokens"
+            f" FROM agents a {where} ORDER BY name",
+            params,
+        ).fetchall()
+        links = self._links()
+
+        agents = []
+        for (source_path, source_repo, name_, description, model_, color, tags,
+             version, author, tools, prompt, content_hash, tokens) in rows:
+            agent = Agent(
+                metadata=AgentMetadata(
+                    name=name_,
+                    description=description,
+                    model=model_,
+                    color=color,
+                    tags=json.loads(tags),
+                    version=version,
+                    author=author,
+                    tools=json.loads(tools),
+                ),
+                prompt=prompt,
+                source_path=Path(source_path),
+                source_repo=Path(source_repo),
+                content_hash=content_hash,
+                tokens=tokens,
+            )
+            _restore_links(agent, links.get(source_path, ()))
+            agents.append(agent)
+        return agents
+
+    def load_skills(self, name: str | None = None, repo: Path | None = None) -> list[Skill]:
+        """
+        Load skills, optionally narrowed by name or source repository.
+
+        Args:
+            name: Skill name (case-insensitive)
+            repo: Source repository
+
+        Returns:
+            Skills with links restored, ordered by name
+        """
+        clauses, params = [], []
+        if name is not None:
+            clauses.append("name = ? COLLATE NOCASE")
+            params.append(name)
+        if repo is not None:
+            clauses.append("source_repo = ?")
+            params.append(str(repo))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        rows = self._conn.execute(
+            "SELECT source_path, source_dir, source_repo, name, description, content,"
+            f" scripts, content_hash, tokens FROM skills {where} ORDER BY name",
+            params,
+        ).fetchall()
+        links = self._links()
+
+        skills = []
+        for (source_path, source_dir, source_repo, name_, description, content,
+             scripts, content_hash, tokens) in rows:
+            skill = Skill(
+                metadata=SkillMetadata(name=name_, description=description),
+                content=content,
+                source_path=Path(source_path),
+                source_dir=Path(source_dir),
+                source_repo=Path(source_repo),
+                scripts=[Path(s) for s in json.loads(scripts)],
+                content_hash=content_hash,
+                tokens=tokens,
+            )
+            _restore_links(skill, links.get(source_path, ()))
+            skills.append(skill)
+        return skills
+
+    def validation_results(self, path: Path | None = None) -> list[tuple[Path, str]]:
+        """
+        Get stored scan and validation errors.
+
+        Args:
+            path: Only errors for this file or directory
+
+        Returns:
+            List of (path, message)
+        """
+        if path is None:
+            rows = self._conn.execute("SELECT path, message FROM validation_results")
+        else:
+            rows = self._conn.execute(
+                "SELECT path, message FROM validation_results WHERE path = ?", (str(path),)
+            )
+        return [(Path(p), m) for p, m in rows]
+
+    def roots(self) -> list[RootInfo]:
+        """Get the scan roots stored in the catalog."""
+        rows = self._conn.execute(
+            "SELECT path, last_scanned, agent_count, skill_count, error_count"
+            " FROM scan_roots ORDER BY path"
+        )
+        return [RootInfo(Path(p), *rest) for p, *rest in rows]
+
+    def search(
+        self, query: str, limit: int = 20, kind: str | None = None
+    ) -> list[SearchHit]:
+        """
+        Full-text search over names, descriptions and prompts/content.
+
+        Args:
+            query: FTS5 query, e.g. ``kubernetes`` or ``"incident review"``
+            limit: Maximum number of hits
+            kind: Only search "agent" or "skill" items
+
+        Returns:
+            Hits from agents and skills, best match first
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax
+        """
+        selects = []
+        if kind in (None, "agent"):
+            selects.append(
+                "SELECT 'agent', a.name, a.source_path, bm25(agents_fts) AS rank"
+                " FROM agents_fts JOIN agents a ON a.id = agents_fts.rowid"
+                " WHERE agents_fts MATCH ?1"
+            )
+        if kind in (None, "skill"):
+            selects.append(
+                "SELECT 'skill', s.name, s.source_path, bm25(skills_fts) AS rank"
+                " FROM skills_fts JOIN skills s ON s.id = skills_fts.rowid"
+                " WHERE skills_fts MATCH ?1"
+            )
+        try:
+            rows = self._conn.execute(
+                " UNION ALL ".join(selects) + " ORDER BY rank LIMIT ?2",
+                (query, limit),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query {query!r}: {e}") from None
+        return [SearchHit(kind, name, Path(path), rank) for kind, name, path, rank in rows]
+
+    def _links(self) -> dict[str, list[tuple[str, str]]]:
+        """All stored links, keyed by source path."""
+        links: dict[str, list[tuple[str, str]]] = {}
+        for source, link_path, scope in self._conn.execute(
+            "SELECT source_path, link_path, scope FROM links"
+        ):
+            links.setdefault(source, []).append((link_path, scope))
+        return links
+
+
+def _as_events(agents, skills, errors) -> Iterator[tuple[str, object]]:
+    for agent in agents:
+        yield "agent", agent
+    for skill in skills:
+        yield "skill", skill
+    for error in errors:
+        yield "error", error
+
+
+def _restore_links(item: Agent | Skill, links: Iterable[tuple[str, str]]) -> None:
+    for link_path, scope in links:
+        if scope == "global":
+            item.global_link = Path(link_path)
+        else:
+            item.project_links.append(Path(link_path))
+
+
+def _stat(path: Path) -> tuple[int | None, int | None]:
+    """Get (mtime_ns, size) of a file, or (None, None) if it can't be read."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    return st.st_mtime_ns, st.st_size
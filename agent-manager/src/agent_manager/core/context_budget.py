@@ -0,0 +1,200 @@
+"""Estimated context cost of the agents and skills a project loads."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from agent_manager.core.parser import FrontmatterParser
+from agent_manager.core.tokens import TokenCache, _list
+from agent_manager.models import Agent, Skill
+
+# Items costing at least this share of a project's total are flagged
+LARGE_SHARE = 0.10
+
+
+@dataclass
+class BudgetItem:
+    """An agent or skill a project loads, with its estimated cost."""
+
+    kind: str  # "agent" or "skill"
+    name: str
+    scope: str  # "global" or "project"
+    # Resolved file (agents) or directory (skills) the entry points at
+    path: Path
+    # The description is listed in every session; the body is loaded on use
+    description_tokens: int
+    body_tokens: int
+    # False for files outside the scanned catalog, counted from disk
+    in_catalog: bool = True
+
+    @property
+    def total_tokens(self) -> int:
+        """Description and body tokens."""
+        return self.description_tokens + self.body_tokens
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "scope": self.scope,
+            "path": str(self.path),
+            "description_tokens": self.description_tokens,
+            "body_tokens": self.body_tokens,
+            "total_tokens": self.total_tokens,
+            "in_catalog": self.in_catalog,
+        }
+
+
+@dataclass
+class ContextBudget:
+    """Everything one project loads from its own and the global .claude directory."""
+
+    project: Path
+    items: list[BudgetItem] = field(default_factory=list)
+    # Global items not loaded because a project item has the same name
+    shadowed: list[BudgetItem] = field(default_factory=list)
+
+    @property
+    def description_tokens(self) -> int:
+        """Tokens paid in every session."""
+        return sum(i.description_tokens for i in self.items)
+
+    @property
+    def body_tokens(self) -> int:
+        """Tokens paid when every item is used."""
+        return sum(i.body_tokens for i in self.items)
+
+    @property
+    def total_tokens(self) -> int:
+        """Description and body tokens of every item."""
+        return self.description_tokens + self.body_tokens
+
+    def largest(self, limit: int = 5) -> list[BudgetItem]:
+        """The most expensive items, largest first."""
+        return sorted(self.items, key=lambda i: (-i.total_tokens, i.name))[:limit]
+
+    def is_large(self, item: BudgetItem) -> bool:
+        """Whether an item costs at least LARGE_SHARE of the total."""
+        return bool(self.total_tokens) and item.total_tokens >= LARGE_SHARE * self.total_tokens
+
+    def to_dict(self, limit: int = 5) -> dict:
+        """Convert to dictionary for serialization, with the ``limit`` largest items."""
+        return {
+            "project": str(self.project),
+            "description_tokens": self.description_tokens,
+            "body_tokens": self.body_tokens,
+            "total_tokens": self.total_tokens,
+            "items": [i.to_dict() for i in self.items],
+            "shadowed": [i.to_dict() for i in self.shadowed],
+            "largest": [
+                {**i.to_dict(), "large": self.is_large(i)} for i in self.largest(limit)
+            ],
+        }
+
+
+class BudgetAnalyzer:
+    """
+    Work out what projects load into context from their ``.claude`` directories.
+
+    Entries in ``.claude/agents`` and ``.claude/skills`` (links or plain
+    files) are matched to catalog items by resolved path, so their token
+    counts come from the scan rather than from reading the files. The global
+    directory is listed once and shared by every project analyzed, so each
+    project costs two directory listings plus one batched cache lookup for
+    the descriptions.
+    """
+
+    def __init__(
+        self,
+        agents: Iterable[Agent],
+        skills: Iterable[Skill],
+        token_cache: TokenCache | None = None,
+        claude_dir: Path | None = None,
+    ):
+        """
+        Initialize the analyzer.
+
+        Args:
+            agents: Catalog agents, ideally with ``tokens`` set
+            skills: Catalog skills, ideally with ``tokens`` set
+            token_cache: Cache for descriptions and files outside the catalog
+            claude_dir: Global Claude directory (default: ~/.claude)
+        """
+        self._agents = {a.source_path: a for a in agents}
+        self._skills = {s.source_dir: s for s in skills}
+        self.token_cache = token_cache or TokenCache()
+        self.claude_dir = claude_dir or Path.home() / ".claude"
+        self.parser = FrontmatterParser()
+        self._global: list[BudgetItem] | None = None
+
+    def analyze(self, project: Path) -> ContextBudget:
+        """
+        Total the agents and skills a project loads.
+
+        Args:
+            project: Project directory (the one holding ``.claude``)
+
+        Returns:
+            ContextBudget with project items first, then global ones
+        """
+        if self._global is None:
+            self._global = self._items(self.claude_dir, "global")
+        budget = ContextBudget(project)
+        budget.items = self._items(project / ".claude", "project")
+        own = {(i.kind, i.name) for i in budget.items}
+        for item in self._global:
+            target = budget.shadowed if (item.kind, item.name) in own else budget.items
+            target.append(item)
+        return budget
+
+    def _items(self, claude_dir: Path, scope: str) -> list[BudgetItem]:
+        """Cost every agent and skill entry in one .claude directory."""
+        # (kind, name, path, description, body to count or None, count from the catalog)
+        found: list[tuple[str, str, Path, str, str | None, int | None]] = []
+        for kind, directory in (("agent", claude_dir / "agents"), ("skill", claude_dir / "skills")):
+            for entry in _list(directory):
+                if kind == "agent" and not entry.name.endswith(".md"):
+                    continue
+                try:
+                    path = Path(entry.path).resolve(strict=True)
+                except (OSError, RuntimeError):
+                    continue  # Broken link
+                item = (self._agents if kind == "agent" else self._skills).get(path)
+                if item is not None:
+                    body = item.prompt if kind == "agent" else item.content
+                    found.append((
+                        kind, item.metadata.name, path, item.metadata.description,
+                        body if item.tokens is None else None, item.tokens,
+                    ))
+                    continue
+                file = path if kind == "agent" else path / "SKILL.md"
+                try:
+                    text = file.read_text(encoding="utf-8")
+                except (OSError, ValueError):
+                    continue
+                name = Path(entry.name).stem if kind == "agent" else entry.name
+                try:
+                    frontmatter, body = self.parser.parse_string(text, file.name)
+                    name = str(frontmatter.get("name", name))
+                    description = str(frontmatter.get("description", ""))
+                except ValueError:
+                    description, body = "", text
+                found.append((kind, name, path, description, body, None))
+
+        # One batch for every description and uncounted body
+        texts = [f[3] for f in found] + [f[4] for f in found if f[4] is not None]
+        counts = iter(self.token_cache.count(texts))
+        descriptions = [next(counts) for _ in found]
+        items = []
+        for (kind, name, path, _, body, tokens), description_tokens in zip(found, descriptions):
+            items.append(BudgetItem(
+                kind=kind,
+                name=name,
+                scope=scope,
+                path=path,
+                description_tokens=description_tokens,
+                body_tokens=next(counts) if body is not None else tokens,
+                in_catalog=path in (self._agents if kind == "agent" else self._skills),
+            ))
+        return items
@@ -0,0 +1,356 @@
+"""Long-lived catalog daemon serving queries over a Unix domain socket."""
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from agent_manager.core.daemon_client import DaemonClient, default_socket_path
+from agent_manager.core.query import filter_by_text
+from agent_manager.core.scanner import AgentSkillScanner, ScanResult
+from agent_manager.core.search_index import SearchIndex
+from agent_manager.core.symlink_manager import SymlinkManager
+from agent_manager.models import Agent, Skill
+from agent_manager.models.agent import DEFAULT_FIELDS as AGENT_FIELDS
+from agent_manager.models.skill import DEFAULT_FIELDS as SKILL_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+APPLICATION_ERROR = -32000
+
+
+class CatalogDaemon:
+    """
+    Keeps a ScanResult warm in memory and answers catalog queries.
+
+    The filesystem is watched by polling: every ``poll_interval`` seconds the
+    daemon stats the agent/skill files and directories it already knows about
+    and rescans only the roots whose signature changed. A full rescan runs
+    every ``full_rescan_interval`` seconds to pick up new ``.claude``
+    directories elsewhere in the tree.
+
+    Methods: ping, list_agents, list_skills, search, full_text_search,
+    link_status, link, unlink, rescan, shutdown.
+    """
+
+    def __init__(
+        self,
+        paths: list[Path],
+        socket_path: Path | None = None,
+        symlink_manager: SymlinkManager | None = None,
+        poll_interval: float = 2.0,
+        full_rescan_interval: float = 300.0,
+    ):
+        """
+        Initialize the daemon.
+
+        Args:
+            paths: Root directories to keep scanned
+            socket_path: Override socket path (default: ~/.config/agent-manager/daemon.sock)
+            symlink_manager: Override symlink manager (default: ~/.claude)
+            poll_interval: Seconds between change checks
+            full_rescan_interval: Seconds between full rescans
+        """
+        self.paths = list(paths)
+        self.socket_path = socket_path or default_socket_path()
+        self.symlink_manager = symlink_manager or SymlinkManager()
+        self.poll_interval = poll_interval
+        self.full_rescan_interval = full_rescan_interval
+        self.scanner = AgentSkillScanner(keep_parsed=True)
+
+        self.agents: list[Agent] = []
+        self.skills: list[Skill] = []
+        self.errors: list[tuple[Path, str]] = []
+        # BM25 index over prompts and content, refreshed per rescanned root
+        self.search_index = SearchIndex()
+        self._results: dict[Path, ScanResult] = {}
+        self._signatures: dict[Path, dict[Path, int]] = {}
+        self._last_full_scan = 0.0
+        # Last error raised while watching, reported by ping until a pass succeeds
+        self.watch_error: str | None = None
+        self._stop: asyncio.Event | None = None
+
+        self._methods: dict[str, Callable[[dict], Any]] = {
+            "ping": self._ping,
+            "list_agents": self._list_agents,
+            "list_skills": self._list_skills,
+            "search": self._search,
+            "full_text_search": self._full_text_search,
+            "link_status": self._link_status,
+            "link": self._link,
+            "unlink": self._unlink,
+            "rescan": self._rescan,
+            "shutdown": self._shutdown,
+        }
+
+    async def serve_forever(self) -> None:
+        """Scan, then serve requests until a shutdown request arrives."""
+        self._stop = asyncio.Event()
+
+        client = DaemonClient.connect(self.socket_path)
+        if client is not None:
+            client.close()
+            raise RuntimeError(f"Daemon already listening on {self.socket_path}")
+
+        await self.rescan()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(
+            self._handle_client, path=str(self.socket_path)
+        )
+        self.socket_path.chmod(0o600)
+        watcher = asyncio.create_task(self._watch())
+        try:
+            async with server:
+                await self._stop.wait()
+        finally:
+            watcher.cancel()
+            self.socket_path.unlink(missing_ok=True)
+
+    def stop(self) -> None:
+        """Request the daemon to stop."""
+        if self._stop is not None:
+            self._stop.set()
+
+    async def rescan(self, roots: list[Path] | None = None) -> None:
+        """
+        Rescan roots and swap the results into the in-memory catalog.
+
+        Args:
+            roots: Roots to rescan (default: all configured paths)
+        """
+        roots = self.paths if roots is None else roots
+        results = await asyncio.gather(*(self.scanner.scan_path(r) for r in roots))
+        for root, result in zip(roots, results):
+            self._results[root] = result
+            self._signatures[root] = self._signature(result)
+            # Only items whose text changed are re-tokenized
+            await asyncio.to_thread(
+                self.search_index.update_root, root, result.agents, result.skills
+            )
+        if roots is self.paths:
+            self._last_full_scan = time.monotonic()
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Flatten per-root results and refresh link state."""
+        self.agents = [a for r in self._results.values() for a in r.agents]
+        self.skills = [s for r in self._results.values() for s in r.skills]
+        self.errors = [e for r in self._results.values() for e in r.errors]
+        self._refresh_links()
+
+    def _refresh_links(self) -> None:
+        """Update global link state from one listing of each global directory."""
+        self.symlink_manager.resolve_global_links(self.agents, self.skills)
+
+    @staticmethod
+    def _signature(result: ScanResult) -> dict[Path, int]:
+        """Collect mtimes of every known agent/skill file and its parent directory."""
+        paths: set[Path] = set()
+        for agent in result.agents:
+            paths.add(agent.source_path)
+            paths.add(agent.source_path.parent)
+        for skill in result.skills:
+            paths.add(skill.source_path)
+            paths.add(skill.source_dir.parent)
+        return _stat_all(paths)
+
+    async def _watch(self) -> None:
+        """Poll for filesystem changes and rescan affected roots, until cancelled."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self._watch_once()
+                self.watch_error = None
+            except Exception as e:
+                # Keep watching: the changed roots are retried on the next poll
+                logger.exception("Catalog rescan failed")
+                self.watch_error = f"{type(e).__name__}: {e}"
+
+    async def _watch_once(self) -> None:
+        """Rescan everything when due, otherwise only the roots that changed."""
+        if time.monotonic() - self._last_full_scan >= self.full_rescan_interval:
+            await self.rescan()
+            return
+
+        changed = []
+        for root in self.paths:
+            old = self._signatures.get(root, {})
+            new = await asyncio.to_thread(_stat_all, old)
+            if new != old:
+                changed.append(root)
+
+        if changed:
+            await self.rescan(changed)
+        else:
+            self._refresh_links()
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve newline-delimited JSON-RPC requests on one connection."""
+        try:
+            while line := await reader.readline():
+                response = await self._dispatch(line)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> dict:
+        """Decode a request, invoke the method and build the response."""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return _error(None, PARSE_ERROR, f"Parse error: {e}")
+
+        if not isinstance(request, dict) or "method" not in request:
+            return _error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        handler = self._methods.get(request["method"])
+        if handler is None:
+            return _error(request_id, METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+
+        params = request.get("params") or {}
+        try:
+            result = handler(params)
+            if asyncio.iscoroutine(result):
+                result = await result
+        except (KeyError, TypeError, ValueError) as e:
+            return _error(request_id, INVALID_PARAMS, f"Invalid params: {e}")
+        except Exception as e:
+            return _error(request_id, APPLICATION_ERROR, str(e))
+
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    # Method handlers
+    def _ping(self, params: dict) -> dict:
+        return {
+            "agents": len(self.agents),
+            "skills": len(self.skills),
+            "errors": len(self.errors),
+            "paths": [str(p) for p in self.paths],
+            "watch_error": self.watch_error,
+        }
+
+    def _list_agents(self, params: dict) -> list[dict]:
+        include_body = params.get("include_body", False)
+        return [_agent_payload(a, include_body) for a in self.agents]
+
+    def _list_skills(self, params: dict) -> list[dict]:
+        include_body = params.get("include_body", False)
+        return [_skill_payload(s, include_body) for s in self.skills]
+
+    def _search(self, params: dict) -> dict:
+        query = params["query"]
+        kind = params.get("kind")
+        result: dict[str, list[dict]] = {}
+        if kind in (None, "agent"):
+            result["agents"] = [_agent_payload(a) for a in filter_by_text(self.agents, query)]
+        if kind in (None, "skill"):
+            result["skills"] = [_skill_payload(s) for s in filter_by_text(self.skills, query)]
+        return result
+
+    def _full_text_search(self, params: dict) -> list[dict]:
+        results = self.search_index.search(
+            params["query"], kind=params.get("kind"), limit=params.get("limit", 20)
+        )
+        return [
+            {
+                "kind": r.kind,
+                "name": r.name,
+                "source_path": str(r.source_path),
+                "score": r.score,
+            }
+            for r in results
+        ]
+
+    def _link_status(self, params: dict) -> list[dict]:
+        items = self._find(params["name"], params.get("kind", "agent"))
+        return [
+            {
+                "name": item.metadata.name,
+                "source_path": str(item.source_path),
+                "link_status": item.link_status.value,
+                "global_link": str(item.global_link) if item.global_link else None,
+            }
+            for item in items
+        ]
+
+    def _link(self, params: dict) -> dict:
+        kind = params.get("kind", "agent")
+        item = self._find_one(params["name"], kind)
+        if kind == "skill":
+            result = self.symlink_manager.link_skill_global(item.source_dir)
+        else:
+            result = self.symlink_manager.link_agent_global(item.source_path)
+        self._refresh_links()
+        return {"result": result.value}
+
+    def _unlink(self, params: dict) -> dict:
+        kind = params.get("kind", "agent")
+        item = self._find_one(params["name"], kind)
+        if kind == "skill":
+            removed = self.symlink_manager.unlink_skill_global(item.source_dir.name)
+        else:
+            removed = self.symlink_manager.unlink_agent_global(item.source_path.name)
+        self._refresh_links()
+        return {"removed": removed}
+
+    async def _rescan(self, params: dict) -> dict:
+        await self.rescan()
+        return self._ping(params)
+
+    def _shutdown(self, params: dict) -> dict:
+        self.stop()
+        return {"stopping": True}
+
+    def _find(self, name: str, kind: str) -> list[Agent] | list[Skill]:
+        items = self.skills if kind == "skill" else self.agents
+        return [i for i in items if i.metadata.name == name]
+
+    def _find_one(self, name: str, kind: str) -> Agent | Skill:
+        items = self._find(name, kind)
+        if not items:
+            raise ValueError(f"No {kind} named {name!r}")
+        if len(items) > 1:
+            raise ValueError(f"{len(items)} {kind}s named {name!r}; link from the TUI instead")
+        return items[0]
+
+
+def _stat_all(paths) -> dict[Path, int]:
+    """Map each path to its mtime in nanoseconds (-1 if missing)."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except OSError:
+            mtimes[path] = -1
+    return mtimes
+
+
+def _error(request_id: Any, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _agent_payload(agent: Agent, include_body: bool = False) -> dict:
+    data = agent.to_dict([*AGENT_FIELDS, "prompt"] if include_body else None)
+    data["global_link"] = str(agent.global_link) if agent.global_link else None
+    return data
+
+
+def _skill_payload(skill: Skill, include_body: bool = False) -> dict:
+    data = skill.to_dict([*SKILL_FIELDS, "content"] if include_body else None)
+    data["global_link"] = str(skill.global_link) if skill.global_link else None
+    return data
@@ -0,0 +1,103 @@
+"""Client for the agent-manager catalog daemon.
+
+Kept separate from ``daemon.py`` so that CLI commands can talk to a running
+daemon without importing the scanner.
+"""
+
+import json
+import socket
+from pathlib import Path
+from typing import Any
+
+
+def default_socket_path() -> Path:
+    """Get the default daemon socket path (~/.config/agent-manager/daemon.sock)."""
+    return Path.home() / ".config" / "agent-manager" / "daemon.sock"
+
+
+class DaemonError(Exception):
+    """Error response returned by the daemon."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class DaemonClient:
+    """
+    Synchronous JSON-RPC client for the catalog daemon.
+
+    Requests and responses are single-line JSON-RPC 2.0 messages over a
+    Unix domain socket.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+        self._next_id = 0
+
+    @classmethod
+    def connect(
+        cls, socket_path: Path | None = None, timeout: float = 5.0
+    ) -> "DaemonClient | None":
+        """
+        Connect to a running daemon.
+
+        Args:
+            socket_path: Override socket path (default: ~/.config/agent-manager/daemon.sock)
+            timeout: Socket timeout in seconds
+
+        Returns:
+            Connected client, or None if no daemon is listening
+        """
+        path = socket_path or default_socket_path()
+        if not path.exists():
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            sock.close()
+            return None
+        return cls(sock)
+
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Call a daemon method.
+
+        Args:
+            method: Method name (e.g. "list_agents")
+            **params: Method parameters
+
+        Returns:
+            The method result
+
+        Raises:
+            DaemonError: If the daemon returns an error
+            ConnectionError: If the daemon closes the connection
+        """
+        self._next_id += 1
+        request = {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
+        self._sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Daemon closed the connection")
+
+        response = json.loads(line)
+        if "error" in response:
+            error = response["error"]
+            raise DaemonError(error.get("code", -32000), error.get("message", "Unknown error"))
+        return response.get("result")
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._reader.close()
+        self._sock.close()
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,68 @@
+"""Content hashing and grouping of duplicated agents and skills."""
+
+import hashlib
+import json
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def content_hash(frontmatter: dict[str, Any], body: str) -> str:
+    """
+    Hash normalized frontmatter and body.
+
+    Key order, YAML formatting, trailing whitespace and line endings don't
+    affect the hash, so reformatted copies of the same agent still match.
+
+    Args:
+        frontmatter: Parsed frontmatter
+        body: Markdown body
+
+    Returns:
+        Hex digest
+    """
+    normalized_body = "\n".join(line.rstrip() for line in body.strip().splitlines())
+    payload = json.dumps(frontmatter, sort_keys=True, default=str) + "\0" + normalized_body
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def group_duplicates(items: list[T]) -> list[list[T]]:
+    """
+    Group agents or skills with identical content, keeping first-seen order.
+
+    Items without a content hash are never grouped.
+
+    Args:
+        items: Agents or skills
+
+    Returns:
+        Groups of one or more items
+    """
+    groups: dict[Any, list[T]] = {}
+    for item in items:
+        key = item.content_hash or id(item)
+        groups.setdefault(key, []).append(item)
+    return list(groups.values())
+
+
+def divergent_copies(items: list[T]) -> dict[str, list[list[T]]]:
+    """
+    Find names that exist with more than one distinct content.
+
+    Args:
+        items: Agents or skills
+
+    Returns:
+        Name -> variants (each a group of identical copies), largest first,
+        for names with at least two variants
+    """
+    by_name: dict[str, list[T]] = {}
+    for item in items:
+        by_name.setdefault(item.metadata.name, []).append(item)
+
+    divergent = {}
+    for name, copies in sorted(by_name.items()):
+        variants = group_duplicates(copies)
+        if len(variants) > 1:
+            divergent[name] = sorted(variants, key=len, reverse=True)
+    return divergent
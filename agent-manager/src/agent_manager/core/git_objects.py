@@ -0,0 +1,251 @@
+"""Read trees and blobs straight from a git object database."""
+
+import bisect
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+# Mode of a blob holding a symbolic link's target
+SYMLINK_MODE = "120000"
+
+# Links followed while resolving one path, as in the kernel's limit
+MAX_SYMLINK_HOPS = 40
+
+
+class GitError(Exception):
+    """A git command failed or returned unexpected output."""
+
+
+@dataclass
+class TreeEntry:
+    """A blob in a tree listing."""
+
+    path: str
+    sha: str
+    mode: str
+
+    @property
+    def is_symlink(self) -> bool:
+        """Whether the blob is a symbolic link, holding the target path."""
+        return self.mode == SYMLINK_MODE
+
+
+class GitObjectReader:
+    """
+    Lists trees and reads blobs of one repository without a checkout.
+
+    Blobs are read through a single long-running ``git cat-file --batch``
+    process, so reading many files costs one process, not one per file.
+    """
+
+    def __init__(self, repo: Path):
+        """
+        Initialize the reader.
+
+        Args:
+            repo: Path to a git work tree or bare repository
+        """
+        self.repo = repo
+        self._batch: subprocess.Popen | None = None
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        if self._batch is not None:
+            self._batch.stdin.close()
+            self._batch.wait()
+            self._batch.stdout.close()
+            self._batch = None
+
+    def _git(self, *args: str) -> bytes:
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(self.repo), *args],
+                capture_output=True,
+                check=False,
+            )
+        except OSError as e:
+            raise GitError(f"Cannot run git: {e}") from e
+        if result.returncode != 0:
+            message = result.stderr.decode("utf-8", "replace").strip()
+            raise GitError(message or f"git {args[0]} failed")
+        return result.stdout
+
+    def list_refs(self) -> list[str]:
+        """
+        List local branches and tags.
+
+        Returns:
+            Short ref names
+        """
+        output = self._git(
+            "for-each-ref", "--format=%(refname:short)", "refs/heads", "refs/tags"
+        )
+        return output.decode("utf-8").split()
+
+    def list_tree(self, ref: str) -> list[TreeEntry]:
+        """
+        List every blob reachable from a ref's tree.
+
+        Args:
+            ref: Branch, tag or commit
+
+        Returns:
+            Blob entries with repository-relative paths
+
+        Raises:
+            GitError: If the ref doesn't exist
+        """
+        output = self._git("ls-tree", "-r", "-z", "--full-tree", ref)
+        entries = []
+        for record in output.split(b"\0"):
+            if not record:
+                continue
+            # "<mode> <type> <sha>\t<path>"
+            info, _, path = record.partition(b"\t")
+            mode, kind, sha = info.split(b" ")
+            if kind == b"blob":
+                entries.append(TreeEntry(
+                    path.decode("utf-8", "surrogateescape"), sha.decode(), mode.decode()
+                ))
+        return entries
+
+    def read_blobs(self, shas: list[str]) -> dict[str, bytes]:
+        """
+        Read blobs in one round trip.
+
+        Args:
+            shas: Blob object names
+
+        Returns:
+            SHA -> content, for the blobs that exist
+        """
+        if not shas:
+            return {}
+        batch = self._start_batch()
+
+        # Write the requests from a thread so a full stdout pipe can't block us
+        def write() -> None:
+            batch.stdin.write("".join(f"{sha}\n" for sha in shas).encode())
+            batch.stdin.flush()
+
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        blobs = {}
+        for sha in shas:
+            header = batch.stdout.readline()
+            if not header:
+                raise GitError("git cat-file exited unexpectedly")
+            parts = header.split()
+            if len(parts) != 3:
+                # "<sha> missing"
+                continue
+            size = int(parts[2])
+            data = batch.stdout.read(size)
+            batch.stdout.read(1)
+            if parts[1] == b"blob":
+                blobs[sha] = data
+        writer.join()
+        return blobs
+
+    def _start_batch(self) -> subprocess.Popen:
+        if self._batch is None:
+            try:
+                self._batch = subprocess.Popen(
+                    ["git", "-C", str(self.repo), "cat-file", "--batch"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                raise GitError(f"Cannot run git: {e}") from e
+        return self._batch
+
+
+def resolve_tree_path(path: str, links: dict[str, str]) -> str | None:
+    """
+    Resolve the symbolic links in a tree path, the way ``realpath`` would.
+
+    Args:
+        path: Repository-relative path
+        links: Link path -> target, for every symlink blob in the tree
+
+    Returns:
+        The path with every link component replaced by its target, or None
+        if a link is absolute, leads out of the repository or loops
+    """
+    resolved: list[str] = []
+    pending = list(reversed(path.split("/")))
+    hops = 0
+    while pending:
+        part = pending.pop()
+        if part in ("", "."):
+            continue
+        if part == "..":
+            if not resolved:
+                return None
+            resolved.pop()
+            continue
+        target = links.get("/".join([*resolved, part]))
+        if target is None:
+            resolved.append(part)
+            continue
+        hops += 1
+        if hops > MAX_SYMLINK_HOPS or target.startswith("/"):
+            return None
+        # Relative to the link's directory, which is what ``resolved`` holds
+        pending.extend(reversed(target.split("/")))
+    return "/".join(resolved)
+
+
+def follow_symlinks(
+    entries: list[TreeEntry], links: dict[str, str]
+) -> tuple[dict[str, TreeEntry], list[TreeEntry]]:
+    """
+    Map every path a checkout would show as a file to the blob it reads.
+
+    Regular blobs map to themselves. A link to a file adds the link's path,
+    and a link to a directory adds the directory's files under the link's
+    path, so the tree can be matched the way a filesystem walk that follows
+    links matches a checkout.
+
+    Args:
+        entries: The tree listing
+        links: Link path -> target, for every symlink blob in ``entries``
+
+    Returns:
+        (path -> regular blob entry, links whose target isn't in the tree)
+    """
+    files = {e.path: e for e in entries if not e.is_symlink}
+    paths = sorted(e.path for e in entries)
+    visible = dict(files)
+    broken = []
+    for link in entries:
+        if not link.is_symlink:
+            continue
+        target = resolve_tree_path(link.path, links)
+        if not target:
+            # Out of the repository, looping, or the whole tree again
+            broken.append(link)
+        elif target in files:
+            visible[link.path] = files[target]
+        else:
+            prefix = target + "/"
+            start = bisect.bisect_left(paths, prefix)
+            found = False
+            for path in paths[start:]:
+                if not path.startswith(prefix):
+                    break
+                real = resolve_tree_path(path, links)
+                if real in files:
+                    visible[link.path + path[len(target):]] = files[real]
+                    found = True
+            if not found:
+                broken.append(link)
+    return visible, broken
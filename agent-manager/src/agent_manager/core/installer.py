@@ -0,0 +1,259 @@
+"""Install agents from a source directory into ~/.claude/agents in batches."""
+
+import os
+import time
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+from agent_manager.core.symlink_manager import LinkResult, SymlinkManager
+
+
+class InstallState(Enum):
+    """Where an agent's global entry stands."""
+
+    INSTALLED = "installed"
+    OTHER_SOURCE = "other_source"
+    REGULAR_FILE = "regular_file"
+    NOT_INSTALLED = "not_installed"
+
+
+@dataclass
+class AgentStatus:
+    """Install status of one source agent."""
+
+    source: Path
+    target: Path
+    state: InstallState
+    # Where the existing symlink points, if any
+    link_target: Path | None = None
+
+    @property
+    def name(self) -> str:
+        """Agent file name without .md."""
+        return self.source.stem
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "name": self.name,
+            "source": str(self.source),
+            "target": str(self.target),
+            "state": self.state.value,
+            "link_target": str(self.link_target) if self.link_target else None,
+        }
+
+
+@dataclass
+class Action:
+    """A planned change to one link (a global entry, or one in a project)."""
+
+    # "link", "relink", "backup", "unlink" or "skip"
+    kind: str
+    source: Path | None
+    target: Path
+    reason: str = ""
+    result: LinkResult | None = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "action": self.kind,
+            "source": str(self.source) if self.source else None,
+            "target": str(self.target),
+            "reason": self.reason,
+            "result": self.result.value if self.result else None,
+        }
+
+
+class Installer:
+    """
+    Plans and applies links from a source ``agents/`` directory.
+
+    Status for every agent comes from one listing of the source directory
+    and one of the global agents directory; plans are computed from those
+    listings without touching the filesystem again.
+    """
+
+    def __init__(self, source_dir: Path, symlink_manager: SymlinkManager | None = None):
+        """
+        Initialize the installer.
+
+        Args:
+            source_dir: Directory holding the agent .md files
+            symlink_manager: Manager whose global agents directory is the target
+        """
+        self.source_dir = source_dir.resolve()
+        self.target_dir = (symlink_manager or SymlinkManager()).global_agents_dir
+
+    def sources(self) -> list[Path]:
+        """List the source agent files."""
+        try:
+            return sorted(
+                Path(e.path) for e in os.scandir(self.source_dir)
+                if e.name.endswith(".md") and e.is_file()
+            )
+        except FileNotFoundError:
+            return []
+
+    def status(self, names: list[str] | None = None) -> list[AgentStatus]:
+        """
+        Get the install status of source agents.
+
+        Args:
+            names: Agent names (with or without .md); all if omitted
+
+        Returns:
+            One status per matching source agent
+        """
+        entries: dict[str, tuple[bool, Path | None]] = {}
+        try:
+            with os.scandir(self.target_dir) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        link = self.target_dir / os.readlink(entry.path)
+                        entries[entry.name] = (True, link)
+                    elif entry.is_file():
+                        entries[entry.name] = (False, None)
+        except FileNotFoundError:
+            pass
+
+        statuses = []
+        for source in self._select(names):
+            target = self.target_dir / source.name
+            is_link, link = entries.get(source.name, (False, None))
+            if source.name not in entries:
+                state = InstallState.NOT_INSTALLED
+            elif not is_link:
+                state = InstallState.REGULAR_FILE
+            elif os.path.normpath(link) == str(source):
+                state = InstallState.INSTALLED
+            else:
+                state = InstallState.OTHER_SOURCE
+            statuses.append(AgentStatus(source, target, state, link))
+        return statuses
+
+    def plan_install(self, names: list[str] | None = None, backup: bool = False) -> list[Action]:
+        """
+        Plan links for source agents.
+
+        Links to another source are replaced. Regular files are backed up
+        and replaced only if ``backup`` is set.
+
+        Args:
+            names: Agent names (with or without .md); all if omitted
+            backup: Move regular files aside instead of skipping them
+
+        Returns:
+            One action per agent
+        """
+        actions = []
+        for status in self.status(names):
+            if status.state is InstallState.INSTALLED:
+                actions.append(Action("skip", status.source, status.target, "already installed"))
+            elif status.state is InstallState.OTHER_SOURCE:
+                actions.append(Action(
+                    "relink", status.source, status.target, f"was linked to {status.link_target}"
+                ))
+            elif status.state is InstallState.REGULAR_FILE:
+                if backup:
+                    actions.append(Action("backup", status.source, status.target, "regular file"))
+                else:
+                    actions.append(Action(
+                        "skip", status.source, status.target, "regular file (use --backup)"
+                    ))
+            else:
+                actions.append(Action("link", status.source, status.target))
+        return actions
+
+    def plan_uninstall(self, names: list[str] | None = None) -> list[Action]:
+        """
+        Plan removing the global links of source agents.
+
+        Only symlinks are removed; regular files are never touched.
+
+        Args:
+            names: Agent names (with or without .md); all if omitted
+
+        Returns:
+            One action per agent
+        """
+        actions = []
+        for status in self.status(names):
+            if status.state in (InstallState.INSTALLED, InstallState.OTHER_SOURCE):
+                actions.append(Action("unlink", status.source, status.target))
+            elif status.state is InstallState.REGULAR_FILE:
+                actions.append(Action("skip", status.source, status.target, "not a symlink"))
+            else:
+                actions.append(Action("skip", status.source, status.target, "not installed"))
+        return actions
+
+    def apply(self, actions: list[Action]) -> list[Action]:
+        """
+        Carry out planned actions, recording each result.
+
+        Args:
+            actions: Actions from plan_install or plan_uninstall
+
+        Returns:
+            The same actions with ``result`` set
+        """
+        return apply_actions(actions)
+
+    def unknown(self, names: list[str]) -> list[str]:
+        """Return the names that don't match a source agent."""
+        known = {s.name for s in self.sources()}
+        return [n for n in names if _filename(n) not in known]
+
+    def _select(self, names: list[str] | None) -> list[Path]:
+        sources = self.sources()
+        if not names:
+            return sources
+        by_name = {s.name: s for s in sources}
+        return [by_name[_filename(n)] for n in names if _filename(n) in by_name]
+
+
+def apply_actions(actions: list[Action]) -> list[Action]:
+    """
+    Carry out planned link actions, recording each result.
+
+    Missing target directories are created. A failed action does not stop
+    the ones after it.
+
+    Args:
+        actions: "link", "relink", "backup", "unlink" or "skip" actions
+
+    Returns:
+        The same actions with ``result`` set (skips are left unset)
+    """
+    stamp = int(time.time())
+    made: set[Path] = set()
+    for action in actions:
+        try:
+            if action.kind == "skip":
+                continue
+            if action.kind == "unlink":
+                action.target.unlink()
+                action.result = LinkResult.SUCCESS
+                continue
+            if action.target.parent not in made:
+                action.target.parent.mkdir(parents=True, exist_ok=True)
+                made.add(action.target.parent)
+            if action.kind == "relink":
+                action.target.unlink()
+            elif action.kind == "backup":
+                action.target.rename(action.target.with_name(f"{action.target.name}.backup.{stamp}"))
+            action.target.symlink_to(action.source)
+            action.result = LinkResult.SUCCESS
+        except FileExistsError:
+            action.result = LinkResult.CONFLICT
+        except PermissionError:
+            action.result = LinkResult.PERMISSION_DENIED
+        except OSError:
+            action.result = LinkResult.ERROR
+    return actions
+
+
+def _filename(name: str) -> str:
+    """Add the .md extension to an agent name if missing."""
+    return name if name.endswith(".md") else f"{name}.md"
@@ -0,0 +1,378 @@
+"""Benchmark how fast MCP servers start and how much memory they use."""
+
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from agent_manager.core.atomic import atomic_write
+from agent_manager.core.mcp_health import (
+    ServerExited,
+    drain_stderr,
+    initialize,
+    list_tools,
+    spawn_server,
+    stop_server,
+)
+from agent_manager.models.mcp_server import MCPServer
+
+DEFAULT_RUNS = 5
+DEFAULT_COLD_RUNS = 1
+DEFAULT_TIMEOUT = 60.0
+# p95 time to first tool list allowed, in milliseconds
+DEFAULT_BUDGET_MS = 2000.0
+DEFAULT_COLD_BUDGET_MS = 10000.0
+# A warm p50 this much slower (and by at least MIN_DELTA_MS) than the
+# previous run is a regression; same ratio for peak RSS
+REGRESSION_THRESHOLD = 0.25
+MIN_DELTA_MS = 50.0
+# Runs kept per server
+HISTORY_LIMIT = 20
+_SAMPLE_INTERVAL = 0.01
+# Package manager and bytecode caches pointed at an empty directory for cold runs
+_CACHE_VARS = (
+    "XDG_CACHE_HOME",
+    "npm_config_cache",
+    "UV_CACHE_DIR",
+    "PIP_CACHE_DIR",
+    "PYTHONPYCACHEPREFIX",
+)
+
+
+def default_bench_path() -> Path:
+    """Get the benchmark history path (~/.config/agent-manager/mcp_bench.json)."""
+    return Path.home() / ".config" / "agent-manager" / "mcp_bench.json"
+
+
+def percentiles(values: list[float]) -> dict | None:
+    """
+    Summarize values as p50, p95 and max.
+
+    Args:
+        values: Measurements
+
+    Returns:
+        Dict with p50, p95, max and n, or None if there are no values
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    p95 = statistics.quantiles(values, n=20, method="inclusive")[18] if len(values) > 1 else values[0]
+    return {"p50": statistics.median(values), "p95": p95, "max": values[-1], "n": len(values)}
+
+
+@dataclass
+class Sample:
+    """Measurements from one spawn."""
+
+    init_ms: float | None = None
+    # Spawn to the first tools/list page (None if the server has no tools)
+    tools_ms: float | None = None
+    # Peak resident memory of the server and its children, in KiB
+    peak_rss_kb: int | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "init_ms": self.init_ms,
+            "tools_ms": self.tools_ms,
+            "peak_rss_kb": self.peak_rss_kb,
+            "error": self.error,
+        }
+
+
+@dataclass
+class BenchRun:
+    """One benchmark of one server: cold and warm spawns."""
+
+    server_id: str
+    fingerprint: str
+    ran_at: float
+    budget_ms: float
+    cold_budget_ms: float
+    cold: list[Sample] = field(default_factory=list)
+    warm: list[Sample] = field(default_factory=list)
+
+    def summary(self, mode: str) -> dict:
+        """
+        Summarize the cold or warm samples.
+
+        Args:
+            mode: "cold" or "warm"
+
+        Returns:
+            Percentiles for init_ms, tools_ms and peak_rss_kb, plus the failure count
+        """
+        samples = [s for s in getattr(self, mode) if s.error is None]
+        return {
+            "init_ms": percentiles([s.init_ms for s in samples]),
+            "tools_ms": percentiles([s.tools_ms for s in samples if s.tools_ms is not None]),
+            "peak_rss_kb": percentiles([s.peak_rss_kb for s in samples if s.peak_rss_kb is not None]),
+            "failures": len(getattr(self, mode)) - len(samples),
+        }
+
+    def over_budget(self) -> list[str]:
+        """
+        Get the modes whose p95 startup time exceeds the budget.
+
+        Startup time is time to the first tool list, or to initialize for
+        servers without tools. A mode where every spawn failed is over budget.
+
+        Returns:
+            "cold" and/or "warm"
+        """
+        over = []
+        for mode, budget in (("cold", self.cold_budget_ms), ("warm", self.budget_ms)):
+            samples = getattr(self, mode)
+            if not samples:
+                continue
+            summary = self.summary(mode)
+            startup = summary["tools_ms"] or summary["init_ms"]
+            if startup is None or startup["p95"] > budget:
+                over.append(mode)
+        return over
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "server_id": self.server_id,
+            "fingerprint": self.fingerprint,
+            "ran_at": self.ran_at,
+            "budget_ms": self.budget_ms,
+            "cold_budget_ms": self.cold_budget_ms,
+            "cold": [s.to_dict() for s in self.cold],
+            "warm": [s.to_dict() for s in self.warm],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BenchRun":
+        """Create from dictionary."""
+        return cls(
+            server_id=data["server_id"],
+            fingerprint=data.get("fingerprint", ""),
+            ran_at=data["ran_at"],
+            budget_ms=data.get("budget_ms", DEFAULT_BUDGET_MS),
+            cold_budget_ms=data.get("cold_budget_ms", DEFAULT_COLD_BUDGET_MS),
+            cold=[Sample(**s) for s in data.get("cold", [])],
+            warm=[Sample(**s) for s in data.get("warm", [])],
+        )
+
+
+def regressions(previous: BenchRun, current: BenchRun) -> list[str]:
+    """
+    Compare warm medians of two runs of the same server.
+
+    Args:
+        previous: Earlier run
+        current: Later run
+
+    Returns:
+        One description per metric that got worse beyond REGRESSION_THRESHOLD
+    """
+    found = []
+    before, after = previous.summary("warm"), current.summary("warm")
+    for metric, label, unit, min_delta in (
+        ("init_ms", "initialize", "ms", MIN_DELTA_MS),
+        ("tools_ms", "first tool list", "ms", MIN_DELTA_MS),
+        ("peak_rss_kb", "peak RSS", "KiB", 0),
+    ):
+        if before[metric] is None or after[metric] is None:
+            continue
+        old, new = before[metric]["p50"], after[metric]["p50"]
+        if new > old * (1 + REGRESSION_THRESHOLD) and new - old > min_delta:
+            found.append(f"{label} p50 {old:.0f} → {new:.0f} {unit} (+{new / old - 1:.0%})")
+    return found
+
+
+class MCPBench:
+    """
+    Spawns MCP servers repeatedly and keeps a history of the results.
+
+    Location: ~/.config/agent-manager/mcp_bench.json
+
+    Servers are benchmarked one at a time so runs don't compete for CPU.
+    Cold spawns point package-manager and bytecode caches (npm, uv, pip,
+    ``__pycache__``) at an empty directory, so ``npx``/``uvx`` servers
+    resolve and compile from scratch. Warm spawns use the normal environment
+    after one untimed spawn.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        runs: int = DEFAULT_RUNS,
+        cold_runs: int = DEFAULT_COLD_RUNS,
+        timeout: float = DEFAULT_TIMEOUT,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        cold_budget_ms: float = DEFAULT_COLD_BUDGET_MS,
+    ):
+        """
+        Initialize the benchmark.
+
+        Args:
+            path: Override the history file
+            runs: Warm spawns per server
+            cold_runs: Cold spawns per server
+            timeout: Seconds allowed per spawn
+            budget_ms: Warm p95 startup budget
+            cold_budget_ms: Cold p95 startup budget
+        """
+        self.path = path or default_bench_path()
+        self.runs = runs
+        self.cold_runs = cold_runs
+        self.timeout = timeout
+        self.budget_ms = budget_ms
+        self.cold_budget_ms = cold_budget_ms
+        self._history: dict[str, list[BenchRun]] | None = None
+
+    async def run_all(self, servers: list[MCPServer]) -> list[BenchRun]:
+        """
+        Benchmark stdio servers one after another and record the results.
+
+        Args:
+            servers: Servers to benchmark; remote servers are skipped
+
+        Returns:
+            One run per stdio server
+        """
+        results = []
+        for server in servers:
+            if server.transport == "stdio":
+                results.append(await self.run(server))
+        self.save()
+        return results
+
+    async def run(self, server: MCPServer) -> BenchRun:
+        """
+        Benchmark one server and add the run to the history (not saved).
+
+        Args:
+            server: Stdio server to spawn
+
+        Returns:
+            The run
+        """
+        run = BenchRun(
+            server.id, server.fingerprint, time.time(), self.budget_ms, self.cold_budget_ms
+        )
+        for _ in range(self.cold_runs):
+            with tempfile.TemporaryDirectory(prefix="mcp-bench-") as cache:
+                run.cold.append(await self._spawn(server, {var: cache for var in _CACHE_VARS}))
+        if self.runs:
+            await self._spawn(server)
+            for _ in range(self.runs):
+                run.warm.append(await self._spawn(server))
+
+        history = self._load().setdefault(server.id, [])
+        history.append(run)
+        del history[:-HISTORY_LIMIT]
+        return run
+
+    def history(self, server_id: str) -> list[BenchRun]:
+        """Get a server's runs, oldest first."""
+        return list(self._load().get(server_id, []))
+
+    def regressions(self, server_id: str) -> list[str]:
+        """Compare a server's latest run with the one before it."""
+        runs = self._load().get(server_id, [])
+        return regressions(runs[-2], runs[-1]) if len(runs) > 1 else []
+
+    def save(self) -> None:
+        """Write the history to disk."""
+        data = {k: [r.to_dict() for r in runs] for k, runs in self._load().items()}
+        atomic_write(self.path, json.dumps(data))
+
+    def _load(self) -> dict[str, list[BenchRun]]:
+        if self._history is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._history = {
+                    k: [BenchRun.from_dict(r) for r in runs] for k, runs in data.items()
+                }
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                self._history = {}
+        return self._history
+
+    async def _spawn(self, server: MCPServer, env: dict[str, str] | None = None) -> Sample:
+        """Start the server once, time the handshake and sample its memory."""
+        sample = Sample()
+        start = time.perf_counter()
+        try:
+            process = await spawn_server(server, env)
+        except OSError as e:
+            sample.error = f"could not start {server.command!r}: {e.strerror or e}"
+            return sample
+
+        stderr_tail: deque[str] = deque(maxlen=5)
+        drain = asyncio.create_task(drain_stderr(process.stderr, stderr_tail))
+        peak = [0]
+        sampler = asyncio.create_task(_sample_rss(process.pid, peak))
+
+        async def handshake() -> None:
+            capabilities = await initialize(process)
+            sample.init_ms = (time.perf_counter() - start) * 1000
+            if "tools" in capabilities:
+                await list_tools(process, all_pages=False)
+                sample.tools_ms = (time.perf_counter() - start) * 1000
+
+        try:
+            await asyncio.wait_for(handshake(), self.timeout)
+        except asyncio.TimeoutError:
+            sample.error = f"timed out after {self.timeout:g}s"
+        except ServerExited:
+            code = await stop_server(process)
+            await asyncio.wait([drain], timeout=1.0)
+            detail = f": {stderr_tail[-1]}" if stderr_tail else ""
+            sample.error = f"exited with code {code}{detail}"
+        except (RuntimeError, OSError) as e:
+            sample.error = str(e)
+        finally:
+            # The kernel's high-water mark catches spikes between samples
+            peak[0] = max(peak[0], _status_kb(process.pid, "VmHWM") or 0)
+            sampler.cancel()
+            await stop_server(process)
+            drain.cancel()
+        sample.peak_rss_kb = peak[0] or None
+        return sample
+
+
+async def _sample_rss(pid: int, peak: list[int]) -> None:
+    """Track the peak summed VmRSS of ``pid`` and its descendants."""
+    while True:
+        rss = _tree_rss_kb(pid)
+        if rss is None:
+            return
+        peak[0] = max(peak[0], rss)
+        await asyncio.sleep(_SAMPLE_INTERVAL)
+
+
+def _tree_rss_kb(pid: int) -> int | None:
+    """Sum VmRSS over a process and its descendants (None without /proc)."""
+    pids = [pid]
+    for p in pids:
+        try:
+            children = Path(f"/proc/{p}/task/{p}/children").read_text().split()
+        except OSError:
+            continue
+        pids.extend(int(c) for c in children)
+    sizes = [_status_kb(p, "VmRSS") for p in pids]
+    if sizes[0] is None:
+        return None
+    return sum(s for s in sizes if s)
+
+
+def _status_kb(pid: int, key: str) -> int | None:
+    """Read a ``kB`` field from /proc/<pid>/status."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(key + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        return None
+    return None
@@ -0,0 +1,301 @@
+"""Check that MCP servers start and answer the initialize handshake."""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from agent_manager import __version__
+from agent_manager.core.atomic import atomic_write
+from agent_manager.models.mcp_server import HealthCheck, HealthStatus, MCPServer
+
+if TYPE_CHECKING:
+    from agent_manager.core.mcp_tools import ToolCatalog
+
+PROTOCOL_VERSION = "2025-06-18"
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_CONCURRENCY = 8
+# Seconds a result is reused before the server is started again
+DEFAULT_TTL = 300.0
+# tools/list responses can be large; asyncio's default line limit is 64 KiB
+_LINE_LIMIT = 16 * 1024 * 1024
+
+
+def default_health_path() -> Path:
+    """Get the health cache path (~/.config/agent-manager/mcp_health.json)."""
+    return Path.home() / ".config" / "agent-manager" / "mcp_health.json"
+
+
+class ServerExited(Exception):
+    """The server closed stdout before answering."""
+
+
+class HealthChecker:
+    """
+    Starts stdio MCP servers concurrently and records how they respond.
+
+    Each check spawns the server, sends ``initialize``, then lists its tools
+    (following pagination) and shuts it down. Results are kept for ``ttl``
+    seconds in a JSON cache and reused unless the server's launch
+    command, arguments or environment changed. Given a ToolCatalog, the
+    listed tools are recorded in it too.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path | None = None,
+        ttl: float = DEFAULT_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        catalog: "ToolCatalog | None" = None,
+    ):
+        """
+        Initialize the checker.
+
+        Args:
+            cache_path: Override the cache file (default: ~/.config/agent-manager/mcp_health.json)
+            ttl: Seconds to reuse a cached result
+            timeout: Seconds allowed for the handshake and tool listing
+            concurrency: Maximum servers running at once
+            catalog: Tool catalog to record successful tool listings in
+        """
+        self.cache_path = cache_path or default_health_path()
+        self.ttl = ttl
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.catalog = catalog
+        self._cache: dict[str, HealthCheck] | None = None
+
+    def cached(self, server: MCPServer) -> HealthCheck | None:
+        """
+        Get a server's cached result if it is still fresh.
+
+        Args:
+            server: Server to look up
+
+        Returns:
+            The result, or None if missing, expired or for another launch command
+        """
+        result = self._load_cache().get(server.id)
+        if (
+            result is None
+            or result.fingerprint != server.fingerprint
+            or time.time() - result.checked_at > self.ttl
+        ):
+            return None
+        return result
+
+    async def check_all(self, servers: list[MCPServer], force: bool = False) -> list[HealthCheck]:
+        """
+        Check servers concurrently, reusing fresh cached results.
+
+        Args:
+            servers: Servers to check; each one's ``health`` is set
+            force: Ignore cached results
+
+        Returns:
+            One result per server, in order
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(server: MCPServer) -> HealthCheck:
+            result = None if force else self.cached(server)
+            if result is None:
+                async with semaphore:
+                    result = await self.check(server)
+                self._load_cache()[server.id] = result
+            server.health = result
+            return result
+
+        results = await asyncio.gather(*(run(s) for s in servers))
+        self._save_cache()
+        if self.catalog is not None:
+            self.catalog.save()
+        return list(results)
+
+    async def check(self, server: MCPServer) -> HealthCheck:
+        """
+        Start one server and run the handshake, bypassing the cache.
+
+        Args:
+            server: Server to check
+
+        Returns:
+            The result; failures are recorded in it, never raised
+        """
+        fingerprint = server.fingerprint
+        if server.transport != "stdio":
+            return HealthCheck(HealthStatus.SKIPPED, time.time(), fingerprint=fingerprint,
+                               error="remote servers are not started locally")
+        start = time.perf_counter()
+        try:
+            process = await spawn_server(server)
+        except OSError as e:
+            return HealthCheck(HealthStatus.FAILED, time.time(), fingerprint=fingerprint,
+                               error=f"could not start {server.command!r}: {e.strerror or e}")
+
+        stderr_tail: deque[str] = deque(maxlen=5)
+        drain = asyncio.create_task(drain_stderr(process.stderr, stderr_tail))
+        latency_ms = None
+
+        async def handshake() -> list[dict]:
+            nonlocal latency_ms
+            capabilities = await initialize(process)
+            latency_ms = (time.perf_counter() - start) * 1000
+            return await list_tools(process) if "tools" in capabilities else []
+
+        try:
+            tools = await asyncio.wait_for(handshake(), self.timeout)
+            result = HealthCheck(HealthStatus.OK, time.time(), latency_ms, len(tools))
+            if self.catalog is not None:
+                self.catalog.record(server, tools)
+        except asyncio.TimeoutError:
+            stage = "initialize" if latency_ms is None else "tools/list"
+            result = HealthCheck(HealthStatus.TIMEOUT, time.time(), latency_ms,
+                                 error=f"no {stage} response after {self.timeout:g}s")
+        except ServerExited:
+            code = await stop_server(process)
+            # stderr may be held open by a child of the server
+            await asyncio.wait([drain], timeout=1.0)
+            detail = f": {stderr_tail[-1]}" if stderr_tail else ""
+            result = HealthCheck(HealthStatus.FAILED, time.time(), latency_ms,
+                                 error=f"exited with code {code}{detail}")
+        except (RuntimeError, OSError) as e:
+            result = HealthCheck(HealthStatus.FAILED, time.time(), latency_ms, error=str(e))
+        finally:
+            await stop_server(process)
+            drain.cancel()
+        result.fingerprint = fingerprint
+        return result
+
+    def _load_cache(self) -> dict[str, HealthCheck]:
+        if self._cache is None:
+            try:
+                data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+                self._cache = {k: HealthCheck.from_dict(v) for k, v in data.items()}
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                self._cache = {}
+        return self._cache
+
+    def _save_cache(self) -> None:
+        data = {k: v.to_dict() for k, v in self._load_cache().items()}
+        atomic_write(self.cache_path, json.dumps(data, indent=2))
+
+
+async def spawn_server(
+    server: MCPServer, env: dict[str, str] | None = None
+) -> asyncio.subprocess.Process:
+    """
+    Start a stdio server with pipes for the protocol and stderr.
+
+    Args:
+        server: Server to start
+        env: Extra environment variables, applied over the server's own
+
+    Returns:
+        The running process
+
+    Raises:
+        OSError: If the command can't be started
+    """
+    return await asyncio.create_subprocess_exec(
+        server.command,
+        *server.args,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, **server.env, **(env or {})},
+        limit=_LINE_LIMIT,
+    )
+
+
+async def initialize(process: asyncio.subprocess.Process) -> dict:
+    """
+    Send initialize and the initialized notification.
+
+    Returns:
+        The server's capabilities
+
+    Raises:
+        RuntimeError: If the server answers with an error
+        ServerExited: If the server closes stdout
+    """
+    result = await _request(process, 1, "initialize", {
+        "protocolVersion": PROTOCOL_VERSION,
+        "capabilities": {},
+        "clientInfo": {"name": "agent-manager", "version": __version__},
+    })
+    await _send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+    return result.get("capabilities") or {}
+
+
+async def list_tools(process: asyncio.subprocess.Process, all_pages: bool = True) -> list[dict]:
+    """List the server's tools, following tools/list pagination unless ``all_pages`` is off."""
+    tools = []
+    cursor = None
+    request_id = 2
+    while True:
+        page = await _request(process, request_id, "tools/list", {"cursor": cursor} if cursor else {})
+        tools.extend(page.get("tools") or [])
+        cursor = page.get("nextCursor")
+        if not cursor or not all_pages:
+            return tools
+        request_id += 1
+
+
+async def _request(process: asyncio.subprocess.Process, request_id: int, method: str, params: dict) -> dict:
+    """Send a JSON-RPC request and wait for its response, skipping anything else."""
+    await _send(process, {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+    while True:
+        line = await process.stdout.readline()
+        if not line:
+            raise ServerExited()
+        try:
+            message = json.loads(line)
+        except ValueError:
+            # Log output on stdout; not ours to judge here
+            continue
+        if not isinstance(message, dict) or message.get("id") != request_id:
+            continue
+        if "error" in message:
+            error = message["error"] or {}
+            raise RuntimeError(f"{method} failed: {error.get('message', error)}")
+        return message.get("result") or {}
+
+
+async def _send(process: asyncio.subprocess.Process, message: dict) -> None:
+    """Write one newline-delimited JSON-RPC message."""
+    try:
+        process.stdin.write(json.dumps(message).encode() + b"\n")
+        await process.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError) as e:
+        raise ServerExited() from e
+
+
+async def drain_stderr(stream: asyncio.StreamReader, tail: deque[str]) -> None:
+    """Read stderr so the server never blocks on it, keeping the last lines."""
+    while line := await stream.readline():
+        if text := line.decode(errors="replace").strip():
+            tail.append(text)
+
+
+async def stop_server(process: asyncio.subprocess.Process) -> int | None:
+    """Close stdin, then terminate and finally kill the server; return its exit code."""
+    if process.returncode is not None:
+        return process.returncode
+    if not process.stdin.is_closing():
+        process.stdin.close()
+    for signal in (None, process.terminate, process.kill):
+        if signal is not None:
+            try:
+                signal()
+            except ProcessLookupError:
+                break
+        try:
+            return await asyncio.wait_for(process.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            continue
+    return process.returncode
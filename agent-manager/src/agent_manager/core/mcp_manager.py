@@ -0,0 +1,476 @@
+"""Sync MCP server definitions into the config files of MCP clients."""
+
+import copy
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+import tomli_w
+
+from agent_manager.core.atomic import atomic_write
+from agent_manager.models.mcp_server import MCPServer, TARGETS
+
+# Entry keys owned by the sync engine; any other key in a client's entry
+# (timeouts, trust flags, ...) is kept on update
+MANAGED_KEYS = {"type", "command", "args", "env", "url", "httpUrl"}
+
+
+@dataclass
+class TargetSpec:
+    """Where and how one client stores its MCP servers."""
+
+    key: str
+    path: Path
+    # "json" or "toml"
+    format: str
+    # Top-level key holding the servers
+    section: str
+    # Write a "type" key with the transport (Claude Code)
+    typed: bool = False
+    # Key for streamable HTTP URLs, if the client doesn't use "url"
+    http_url_key: str = "url"
+
+
+def target_specs(home: Path) -> dict[str, TargetSpec]:
+    """
+    Get the config file of every target.
+
+    Args:
+        home: Home directory the client configs live under
+
+    Returns:
+        Target key -> spec, in TARGETS order
+    """
+    if sys.platform == "darwin":
+        desktop = home / "Library" / "Application Support" / "Claude"
+    else:
+        desktop = home / ".config" / "Claude"
+    specs = [
+        TargetSpec("claude_code", home / ".claude.json", "json", "mcpServers", typed=True),
+        TargetSpec("claude_desktop", desktop / "claude_desktop_config.json", "json", "mcpServers"),
+        TargetSpec("cursor", home / ".cursor" / "mcp.json", "json", "mcpServers"),
+        TargetSpec("gemini", home / ".gemini" / "settings.json", "json", "mcpServers", http_url_key="httpUrl"),
+        TargetSpec("codex", home / ".codex" / "config.toml", "toml", "mcp_servers"),
+    ]
+    return {spec.key: spec for spec in specs if spec.key in TARGETS}
+
+
+@dataclass
+class TargetConfig:
+    """A target's config file as read from disk."""
+
+    spec: TargetSpec
+    # Raw file text (None if the file doesn't exist)
+    text: str | None
+    data: dict = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def servers(self) -> dict[str, dict]:
+        """Server entries in the file."""
+        servers = self.data.get(self.spec.section)
+        return servers if isinstance(servers, dict) else {}
+
+
+@dataclass
+class TargetDiff:
+    """Changes needed to bring one target in line with the desired servers."""
+
+    target: str
+    path: Path
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    written: bool = False
+    error: str | None = None
+
+    @property
+    def changed(self) -> bool:
+        """Check whether the target needs to be written."""
+        return bool(self.added or self.updated or self.removed)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "target": self.target,
+            "path": str(self.path),
+            "added": self.added,
+            "updated": self.updated,
+            "removed": self.removed,
+            "written": self.written,
+            "error": self.error,
+        }
+
+
+class MCPManager:
+    """
+    Keeps MCP client configs in sync with a desired set of servers.
+
+    Config Location: ~/.config/agent-manager/mcp_servers.json
+
+    Each target file is read once per sync and written at most once, and
+    only if its servers differ. Servers that aren't in the desired set are
+    never touched.
+    """
+
+    def __init__(self, config_dir: Path | None = None, home: Path | None = None):
+        """
+        Initialize the MCP manager.
+
+        Args:
+            config_dir: Override config directory (default: ~/.config/agent-manager)
+            home: Override the home directory holding client configs
+        """
+        self.config_dir = config_dir or (Path.home() / ".config" / "agent-manager")
+        self.servers_file = self.config_dir / "mcp_servers.json"
+        self.targets = target_specs(home or Path.home())
+
+    def load_servers(self) -> list[MCPServer]:
+        """
+        Load the desired servers.
+
+        Returns:
+            Servers, or an empty list if none are configured or the file is corrupt
+        """
+        try:
+            data = json.loads(self.servers_file.read_text(encoding="utf-8"))
+            return [MCPServer.from_dict(s) for s in data.get("servers", [])]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            return []
+
+    def save_servers(self, servers: list[MCPServer]) -> None:
+        """
+        Persist the desired servers.
+
+        Args:
+            servers: Servers to save
+        """
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        text = json.dumps({"servers": [s.to_dict() for s in servers]}, indent=2) + "\n"
+        atomic_write(self.servers_file, text)
+
+    def read_targets(self) -> dict[str, TargetConfig]:
+        """
+        Read every target's config file once.
+
+        Returns:
+            Target key -> config (with ``error`` set if it can't be parsed)
+        """
+        configs = {}
+        for key, spec in self.targets.items():
+            try:
+                text = spec.path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                configs[key] = TargetConfig(spec, None)
+                continue
+            except OSError as e:
+                configs[key] = TargetConfig(spec, None, error=str(e))
+                continue
+            try:
+                data = _parse(spec, text)
+            except (ValueError, tomllib.TOMLDecodeError) as e:
+                configs[key] = TargetConfig(spec, text, error=f"Invalid {spec.format}: {e}")
+                continue
+            configs[key] = TargetConfig(spec, text, data)
+        return configs
+
+    def refresh_status(
+        self, servers: list[MCPServer], configs: dict[str, TargetConfig] | None = None
+    ) -> None:
+        """
+        Set each server's ``synced_to`` from the target configs.
+
+        Args:
+            servers: Servers to update
+            configs: Configs from read_targets (read now if omitted)
+        """
+        configs = configs if configs is not None else self.read_targets()
+        for server in servers:
+            server.synced_to = {}
+            for key, config in configs.items():
+                entry = config.servers.get(server.id)
+                server.synced_to[key] = (
+                    entry is not None and _entry_key(entry) == _server_key(server)
+                )
+
+    def plan(
+        self, servers: list[MCPServer], configs: dict[str, TargetConfig] | None = None
+    ) -> list[TargetDiff]:
+        """
+        Compute per-target changes without writing anything.
+
+        Args:
+            servers: Desired servers
+            configs: Configs from read_targets (read now if omitted)
+
+        Returns:
+            One diff per target
+        """
+        configs = configs if configs is not None else self.read_targets()
+        diffs = []
+        for key, config in configs.items():
+            diff = TargetDiff(key, config.spec.path, error=config.error)
+            if config.error is None:
+                current = config.servers
+                for server in servers:
+                    wanted = server.enabled and key in server.targets
+                    entry = current.get(server.id)
+                    if wanted and entry is None:
+                        diff.added.append(server.id)
+                    elif wanted and _entry_key(entry) != _server_key(server):
+                        diff.updated.append(server.id)
+                    elif not wanted and entry is not None:
+                        diff.removed.append(server.id)
+            diffs.append(diff)
+        return diffs
+
+    def sync(self, servers: list[MCPServer], dry_run: bool = False) -> list[TargetDiff]:
+        """
+        Bring every target in line with the desired servers.
+
+        Args:
+            servers: Desired servers; their ``synced_to`` is refreshed
+            dry_run: Only compute the diffs
+
+        Returns:
+            One diff per target, with ``written`` set for rewritten files
+        """
+        configs = self.read_targets()
+        diffs = self.plan(servers, configs)
+        if not dry_run:
+            by_id = {s.id: s for s in servers}
+            for diff in diffs:
+                if not diff.changed or diff.error:
+                    continue
+                config = configs[diff.target]
+                try:
+                    text = _render(config, diff, by_id)
+                    atomic_write(config.spec.path, text)
+                except OSError as e:
+                    diff.error = str(e)
+                    continue
+                diff.written = True
+                config.text = text
+                config.data = _parse(config.spec, text)
+        self.refresh_status(servers, configs)
+        return diffs
+
+    def import_servers(
+        self,
+        existing: list[MCPServer],
+        configs: dict[str, TargetConfig] | None = None,
+    ) -> list[MCPServer]:
+        """
+        Build servers for entries found in target configs but not in ``existing``.
+
+        Args:
+            existing: Servers already in the desired set
+            configs: Configs from read_targets (read now if omitted)
+
+        Returns:
+            New servers, targeting every client that already has them
+        """
+        configs = configs if configs is not None else self.read_targets()
+        known = {s.id for s in existing}
+        found: dict[str, MCPServer] = {}
+        for key, config in configs.items():
+            for server_id, entry in config.servers.items():
+                if server_id in known or not isinstance(entry, dict):
+                    continue
+                if server_id in found:
+                    found[server_id].targets.append(key)
+                    continue
+                command, args, env, url = _entry_key(entry)
+                found[server_id] = MCPServer(
+                    id=server_id,
+                    command=command,
+                    args=list(args),
+                    env=dict(env),
+                    transport=entry.get("type", "stdio" if command else "http"),
+                    url=url,
+                    targets=[key],
+                )
+        return list(found.values())
+
+
+def _server_key(server: MCPServer) -> tuple:
+    """Comparable form of a server's managed fields."""
+    if server.transport == "stdio":
+        return (server.command, tuple(server.args), tuple(sorted(server.env.items())), None)
+    return ("", (), tuple(sorted(server.env.items())), server.url)
+
+
+def _entry_key(entry: dict) -> tuple:
+    """Comparable form of a client's server entry, as ``_server_key`` returns it."""
+    if not isinstance(entry, dict):
+        return ()
+    env = entry.get("env") or {}
+    url = entry.get("url") or entry.get("httpUrl")
+    return (
+        entry.get("command", ""),
+        tuple(entry.get("args") or ()),
+        tuple(sorted((str(k), str(v)) for k, v in env.items())),
+        url,
+    )
+
+
+def _entry(server: MCPServer, spec: TargetSpec, current: dict | None) -> dict:
+    """Render a server as a client entry, keeping the client's unmanaged keys."""
+    entry = {k: v for k, v in (current or {}).items() if k not in MANAGED_KEYS}
+    if spec.typed:
+        entry["type"] = server.transport
+    if server.transport == "stdio":
+        entry["command"] = server.command
+        entry["args"] = list(server.args)
+    else:
+        url_key = spec.http_url_key if server.transport == "http" else "url"
+        entry[url_key] = server.url
+    if server.env:
+        entry["env"] = dict(server.env)
+    return entry
+
+
+def _parse(spec: TargetSpec, text: str) -> dict:
+    """
+    Parse a target file.
+
+    Raises:
+        ValueError: If the JSON is invalid or not an object
+        tomllib.TOMLDecodeError: If the TOML is invalid
+    """
+    if not text.strip():
+        return {}
+    data = json.loads(text) if spec.format == "json" else tomllib.loads(text)
+    if not isinstance(data, dict):
+        raise ValueError("top level is not an object")
+    return data
+
+
+def _render(config: TargetConfig, diff: TargetDiff, servers: dict[str, MCPServer]) -> str:
+    """Produce the new file text for a target."""
+    spec = config.spec
+    current = config.servers
+    entries = {
+        server_id: _entry(servers[server_id], spec, current.get(server_id))
+        for server_id in (*diff.added, *diff.updated)
+    }
+    if spec.format == "toml":
+        return _render_toml(config, entries, diff.removed)
+
+    # Keep key order: existing entries in place, new ones at the end
+    data = copy.copy(config.data)
+    section = dict(current)
+    section.update(entries)
+    for server_id in diff.removed:
+        del section[server_id]
+    data[spec.section] = section
+    indent, newline = _json_style(config.text)
+    return json.dumps(data, indent=indent, ensure_ascii=False) + newline
+
+
+def _json_style(text: str | None) -> tuple[int | str | None, str]:
+    """Detect the indentation and trailing newline of a JSON document."""
+    if not text or not text.strip():
+        return 2, "\n"
+    newline = "\n" if text.endswith("\n") else ""
+    if "\n" not in text.strip():
+        return None, newline
+    match = re.search(r"^[{\[]\s*?\n([ \t]+)\S", text.lstrip(), re.MULTILINE)
+    return (match.group(1) if match else 2), newline
+
+
+_TOML_HEADER = re.compile(r"^\s*\[\[?\s*(.+?)\s*\]\]?\s*(#.*)?$")
+
+
+def _toml_key(key: str) -> list[str]:
+    """Split a dotted TOML key, honouring quotes."""
+    parts = re.findall(r'"((?:[^"\\]|\\.)*)"|\'([^\']*)\'|([^.\s]+)', key)
+    return [basic.encode().decode("unicode_escape") if basic else literal or bare for basic, literal, bare in parts]
+
+
+def _render_toml(config: TargetConfig, entries: dict[str, dict], removed: list[str]) -> str:
+    """
+    Splice changed server tables into TOML text, leaving the rest untouched.
+
+    Falls back to rewriting the whole document if the servers are defined in
+    a form the splice can't handle (inline tables, dotted keys).
+    """
+    section = config.spec.section
+    text = config.text or ""
+    lines = text.splitlines(keepends=True)
+    changing = set(entries) | set(removed)
+
+    # Locate [section.<id>] and [section.<id>.*] blocks of changing servers
+    headers = [i for i, line in enumerate(lines) if _TOML_HEADER.match(line)]
+    blocks: dict[str, list[tuple[int, int]]] = {}
+    for n, start in enumerate(headers):
+        key = _toml_key(_TOML_HEADER.match(lines[start]).group(1))
+        if len(key) < 2 or key[0] != section or key[1] not in changing:
+            continue
+        end = headers[n + 1] if n + 1 < len(headers) else len(lines)
+        # Comments and blank lines right before the next header belong to it
+        while end > start + 1 and (not lines[end - 1].strip() or lines[end - 1].lstrip().startswith("#")):
+            end -= 1
+        blocks.setdefault(key[1], []).append((start, end))
+
+    current = config.servers
+    if any(server_id in current and server_id not in blocks for server_id in changing):
+        return _dump_toml(config, entries, removed)
+
+    def table(server_id: str) -> str:
+        return tomli_w.dumps({section: {server_id: entries[server_id]}})
+
+    insert_at: dict[int, str] = {}
+    drop: set[int] = set()
+    for server_id, ranges in blocks.items():
+        for n, (start, end) in enumerate(ranges):
+            drop.update(range(start, end))
+            # Blank lines between two tables of the same server go with them
+            if n + 1 < len(ranges) and not "".join(lines[end:ranges[n + 1][0]]).strip():
+                drop.update(range(end, ranges[n + 1][0]))
+        if server_id in entries:
+            insert_at[ranges[0][0]] = table(server_id)
+
+    out = []
+    for i, line in enumerate(lines):
+        if i in insert_at:
+            out.append(insert_at[i])
+        if i not in drop:
+            out.append(line)
+    new_text = "".join(out)
+
+    appended = [server_id for server_id in entries if server_id not in blocks]
+    if appended:
+        if new_text and not new_text.endswith("\n"):
+            new_text += "\n"
+        if new_text.strip():
+            new_text += "\n"
+        new_text += "\n".join(table(server_id) for server_id in appended)
+
+    # Make sure the splice produced exactly the intended servers
+    try:
+        result = tomllib.loads(new_text).get(section, {})
+    except tomllib.TOMLDecodeError:
+        return _dump_toml(config, entries, removed)
+    expected = {k: v for k, v in current.items() if k not in removed}
+    expected.update(entries)
+    if result != expected:
+        return _dump_toml(config, entries, removed)
+    return new_text
+
+
+def _dump_toml(config: TargetConfig, entries: dict[str, dict], removed: list[str]) -> str:
+    """Rewrite a whole TOML document (comments are lost)."""
+    data = copy.deepcopy(config.data)
+    section = dict(data.get(config.spec.section, {}))
+    section.update(entries)
+    for server_id in removed:
+        section.pop(server_id, None)
+    data[config.spec.section] = section
+    return tomli_w.dumps(data)
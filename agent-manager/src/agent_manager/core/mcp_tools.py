@@ -0,0 +1,204 @@
+"""Persisted catalog of the tools each MCP server provides."""
+
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from agent_manager.core.atomic import atomic_write
+from agent_manager.models import Agent
+from agent_manager.models.mcp_server import MCPServer
+
+# Seconds before a server's tool list is fetched again in the background
+CATALOG_MAX_AGE = 24 * 3600
+
+
+def default_tool_catalog_path() -> Path:
+    """Get the tool catalog path (~/.config/agent-manager/mcp_tools.json)."""
+    return Path.home() / ".config" / "agent-manager" / "mcp_tools.json"
+
+
+@dataclass
+class ToolInfo:
+    """One tool as listed by a server."""
+
+    name: str
+    # Length of the description in characters; it is sent with every request
+    description_size: int = 0
+    input_schema: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "name": self.name,
+            "description_size": self.description_size,
+            "input_schema": self.input_schema,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ToolInfo":
+        """Create from dictionary."""
+        return cls(
+            name=data["name"],
+            description_size=data.get("description_size", 0),
+            input_schema=data.get("input_schema", {}),
+        )
+
+
+@dataclass
+class ServerTools:
+    """The tool list fetched for one launch fingerprint."""
+
+    fetched_at: float
+    tools: list[ToolInfo] = field(default_factory=list)
+
+    @property
+    def names(self) -> set[str]:
+        """Names of the tools."""
+        return {t.name for t in self.tools}
+
+
+def mcp_tool_name(server_id: str, tool: str | None = None) -> str:
+    """
+    Build the name agents use for a server (or one of its tools).
+
+    Claude Code replaces characters outside ``[A-Za-z0-9_-]`` with ``_``.
+
+    Args:
+        server_id: Server id from the config
+        tool: Tool name; omit to name the whole server
+
+    Returns:
+        ``mcp__<server>`` or ``mcp__<server>__<tool>``
+    """
+    name = "mcp__" + re.sub(r"[^A-Za-z0-9_-]", "_", server_id)
+    return f"{name}__{tool}" if tool else name
+
+
+def agent_tool_refs(agent: Agent) -> list[str]:
+    """Get the MCP tool names an agent's ``tools`` field references."""
+    # A bare "tools:" line in frontmatter parses as None
+    tools = agent.metadata.tools or []
+    # Frontmatter often writes tools as "Read, Grep, mcp__x__y"
+    if isinstance(tools, str):
+        tools = tools.split(",")
+    return [t.strip() for t in tools if isinstance(t, str) and t.strip().startswith("mcp__")]
+
+
+class ToolCatalog:
+    """
+    Tool lists for MCP servers, keyed by ``MCPServer.fingerprint``.
+
+    Location: ~/.config/agent-manager/mcp_tools.json
+
+    Keying on the launch command, arguments and environment means an edited
+    server is fetched again while renaming one keeps its tools. Entries are
+    filled in by HealthChecker, which lists tools as part of each check.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Initialize the catalog.
+
+        Args:
+            path: Override the catalog file
+        """
+        self.path = path or default_tool_catalog_path()
+        self._entries: dict[str, ServerTools] | None = None
+
+    def get(self, server: MCPServer) -> ServerTools | None:
+        """Get a server's tools, or None if they haven't been fetched."""
+        return self._load().get(server.fingerprint)
+
+    def record(self, server: MCPServer, tools: list[dict]) -> None:
+        """
+        Store the tools a server listed.
+
+        Args:
+            server: Server that was checked
+            tools: Tool objects from ``tools/list``
+        """
+        self._load()[server.fingerprint] = ServerTools(time.time(), [
+            ToolInfo(
+                name=t.get("name", ""),
+                description_size=len(t.get("description") or ""),
+                input_schema=t.get("inputSchema") or {},
+            )
+            for t in tools if isinstance(t, dict)
+        ])
+
+    def stale(self, servers: list[MCPServer], max_age: float = CATALOG_MAX_AGE) -> list[MCPServer]:
+        """
+        Get the enabled stdio servers whose tools are missing or older than ``max_age``.
+
+        Args:
+            servers: Configured servers
+            max_age: Seconds a tool list stays fresh
+
+        Returns:
+            Servers to fetch again
+        """
+        now = time.time()
+        return [
+            s for s in servers
+            if s.enabled and s.transport == "stdio"
+            and ((entry := self.get(s)) is None or now - entry.fetched_at > max_age)
+        ]
+
+    def missing_tools(self, agent: Agent, servers: list[MCPServer]) -> list[str]:
+        """
+        Get the MCP tools an agent references that no configured server provides.
+
+        A reference to a server that isn't configured (or is disabled) is
+        missing. A reference to a tool of a configured server is missing only
+        once that server's tools are known and don't include it.
+
+        Args:
+            agent: Agent whose ``tools`` to check
+            servers: Configured servers
+
+        Returns:
+            Missing tool names, in the agent's order
+        """
+        by_name = {mcp_tool_name(s.id): s for s in servers if s.enabled}
+        missing = []
+        for ref in agent_tool_refs(agent):
+            server_name, _, tool = ref.partition("__")[2].partition("__")
+            server = by_name.get(f"mcp__{server_name}")
+            if server is None:
+                missing.append(ref)
+            elif tool and tool != "*":
+                entry = self.get(server)
+                if entry is not None and tool not in entry.names:
+                    missing.append(ref)
+        return missing
+
+    def prune(self, servers: list[MCPServer]) -> None:
+        """Drop tool lists that no configured server uses any more."""
+        keep = {s.fingerprint for s in servers}
+        entries = self._load()
+        for fingerprint in [f for f in entries if f not in keep]:
+            del entries[fingerprint]
+
+    def save(self) -> None:
+        """Write the catalog to disk."""
+        data = {
+            fingerprint: {"fetched_at": e.fetched_at, "tools": [t.to_dict() for t in e.tools]}
+            for fingerprint, e in self._load().items()
+        }
+        atomic_write(self.path, json.dumps(data))
+
+    def _load(self) -> dict[str, ServerTools]:
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._entries = {
+                    fingerprint: ServerTools(
+                        e["fetched_at"], [ToolInfo.from_dict(t) for t in e.get("tools", [])]
+                    )
+                    for fingerprint, e in data.items()
+                }
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                self._entries = {}
+        return self._entries
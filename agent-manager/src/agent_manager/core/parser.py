@@ -39,6 +39,23 @@ class FrontmatterParser:
         Returns:
             Tuple of (frontmatter_dict, body_content)
 
+        Raises:
+            ValueError: If format is invalid
+        """
+        frontmatter_str, body = self.split(content, filename)
+        return self.load_frontmatter(frontmatter_str, filename), body
+
+    def split(self, content: str, filename: str = "<string>") -> tuple[str, str]:
+        """
+        Split content into raw frontmatter text and body without parsing YAML.
+
+        Args:
+            content: String content to split
+            filename: Name for error messages
+
+        Returns:
+            Tuple of (frontmatter_text, body_content)
+
         Raises:
             ValueError: If format is invalid
         """
@@ -58,6 +75,24 @@ class FrontmatterParser:
         if not frontmatter_str:
             raise ValueError(f"Empty frontmatter in {filename}")
 
+        return frontmatter_str, body
+
+    def load_frontmatter(
+        self, frontmatter_str: str, filename: str = "<string>"
+    ) -> dict[str, Any]:
+        """
+        Parse raw frontmatter text as YAML.
+
+        Args:
+            frontmatter_str: Frontmatter text as returned by ``split``
+            filename: Name for error messages
+
+        Returns:
+            Frontmatter dictionary
+
+        Raises:
+            ValueError: If the YAML is invalid or not a mapping
+        """
         try:
             frontmatter = yaml.safe_load(frontmatter_str)
         except yaml.YAMLError as e:
@@ -66,7 +101,7 @@ class FrontmatterParser:
         if not isinstance(frontmatter, dict):
             raise ValueError(f"Frontmatter must be a dictionary in {filename}")
 
-        return frontmatter, body
+        return frontmatter
 
     def serialize(self, frontmatter: dict[str, Any], body: str) -> str:
         """
@@ -0,0 +1,158 @@
+"""Filter and field-projection helpers for catalog queries."""
+
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any
+
+# Filter keys accepted on the command line, mapped to metadata attributes
+FILTER_KEYS = {
+    "name": "name",
+    "description": "description",
+    "model": "model",
+    "color": "color",
+    "tag": "tags",
+    "tags": "tags",
+    "tool": "tools",
+    "tools": "tools",
+    "author": "author",
+    "version": "version",
+}
+
+
+def filter_by_text(items: list, text: str) -> list:
+    """
+    Filter agents or skills by a case-insensitive substring of name or description.
+
+    Args:
+        items: Agents or skills
+        text: Search text (empty returns all items)
+
+    Returns:
+        Matching items, in order
+    """
+    if not text:
+        return items
+    needle = text.lower()
+    return [
+        item for item in items
+        if needle in item.metadata.name.lower()
+        or needle in item.metadata.description.lower()
+    ]
+
+
+def sort_by_tokens(items: list) -> list:
+    """
+    Sort agents or skills by estimated tokens, most expensive first.
+
+    Items without an estimate go last; ties keep their order.
+
+    Args:
+        items: Agents or skills
+
+    Returns:
+        Sorted copy of ``items``
+    """
+    return sorted(items, key=lambda item: -1 if item.tokens is None else item.tokens, reverse=True)
+
+
+def parse_fields(spec: str | None) -> list[str] | None:
+    """
+    Parse a comma-separated field list.
+
+    Args:
+        spec: e.g. "name,model,source_path" (None for all default fields)
+
+    Returns:
+        List of field names, or None if no projection was requested
+    """
+    if not spec:
+        return None
+    return [f.strip() for f in spec.split(",") if f.strip()]
+
+
+@dataclass
+class ScanFilter:
+    """
+    Metadata filter applied by the scanner right after frontmatter parsing.
+
+    Conditions on different keys must all match; repeated keys match if any
+    value does. Values are case-insensitive shell-style patterns, and list
+    fields (tags, tools) match if any element does. A condition on a field
+    the item's kind doesn't have (e.g. ``model`` for a skill) is ignored.
+    """
+
+    conditions: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, spec: str | None) -> "ScanFilter | None":
+        """
+        Parse a filter expression.
+
+        Args:
+            spec: e.g. "model=opus,tag=sre" (None for no filter)
+
+        Returns:
+            ScanFilter, or None if spec is empty
+
+        Raises:
+            ValueError: If a term is malformed or uses an unknown key
+        """
+        if not spec:
+            return None
+
+        conditions: dict[str, list[str]] = {}
+        for term in spec.split(","):
+            term = term.strip()
+            if not term:
+                continue
+            key, sep, value = term.partition("=")
+            key = key.strip().lower()
+            if not sep or not value.strip():
+                raise ValueError(f"Invalid filter term {term!r}, expected key=value")
+            if key not in FILTER_KEYS:
+                valid = ", ".join(sorted(FILTER_KEYS))
+                raise ValueError(f"Unknown filter key {key!r} (valid: {valid})")
+            conditions.setdefault(FILTER_KEYS[key], []).append(value.strip().lower())
+
+        return cls(conditions=conditions) if conditions else None
+
+    def exact(self, attr: str) -> str | None:
+        """
+        Get the value a field must equal, if its condition is a single literal.
+
+        Lets stores with an index on the field narrow results before
+        ``matches`` is applied.
+
+        Args:
+            attr: Metadata attribute, e.g. "model" or "tags"
+
+        Returns:
+            The lowercased value, or None if the field is unconstrained or
+            matched by several values or a pattern
+        """
+        patterns = self.conditions.get(attr, [])
+        if len(patterns) != 1 or any(c in patterns[0] for c in "*?["):
+            return None
+        return patterns[0]
+
+    def matches(self, metadata: Any) -> bool:
+        """
+        Check whether agent or skill metadata satisfies every condition.
+
+        Args:
+            metadata: AgentMetadata or SkillMetadata
+
+        Returns:
+            True if all conditions match
+        """
+        for attr, patterns in self.conditions.items():
+            if not hasattr(metadata, attr):
+                continue  # Doesn't apply to this kind
+            value = getattr(metadata, attr)
+            if value is None:
+                return False
+            values = value if isinstance(value, list) else [value]
+            values = [str(v).lower() for v in values]
+            if not any(fnmatchcase(v, p) for v in values for p in patterns):
+                return False
+        return True
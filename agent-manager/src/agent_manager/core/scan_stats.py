@@ -0,0 +1,103 @@
+"""Per-root scan metrics."""
+
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Number of slowest files kept per root
+SLOWEST_FILES = 10
+
+
+@dataclass
+class RootStats:
+    """Metrics collected while scanning one root directory."""
+
+    root: Path
+    dirs_visited: int = 0
+    entries_seen: int = 0
+    candidate_files: int = 0
+    parsed_files: int = 0
+    # Files byte-identical to one already parsed (parse skipped)
+    duplicate_files: int = 0
+    wall_time: float = 0.0
+    parse_time: float = 0.0
+    yaml_time: float = 0.0
+    validation_time: float = 0.0
+    errors_by_type: Counter = field(default_factory=Counter)
+    # Min-heap of (seconds, path); the top SLOWEST_FILES survive
+    _slowest: list[tuple[float, str]] = field(default_factory=list, repr=False)
+
+    @property
+    def error_count(self) -> int:
+        """Total number of errors of any type."""
+        return sum(self.errors_by_type.values())
+
+    @property
+    def slowest_files(self) -> list[tuple[Path, float]]:
+        """Slowest files to read and parse, slowest first."""
+        return [(Path(p), t) for t, p in sorted(self._slowest, reverse=True)]
+
+    def record_file(self, path: Path, seconds: float) -> None:
+        """Record the time spent reading and parsing one candidate file."""
+        self.parse_time += seconds
+        item = (seconds, str(path))
+        if len(self._slowest) < SLOWEST_FILES:
+            heapq.heappush(self._slowest, item)
+        elif item > self._slowest[0]:
+            heapq.heapreplace(self._slowest, item)
+
+    def record_error(self, error_type: str) -> None:
+        """Count an error by type (e.g. "PermissionError", "invalid_frontmatter")."""
+        self.errors_by_type[error_type] += 1
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "root": str(self.root),
+            "dirs_visited": self.dirs_visited,
+            "entries_seen": self.entries_seen,
+            "candidate_files": self.candidate_files,
+            "parsed_files": self.parsed_files,
+            "duplicate_files": self.duplicate_files,
+            "wall_time": self.wall_time,
+            "parse_time": self.parse_time,
+            "yaml_time": self.yaml_time,
+            "validation_time": self.validation_time,
+            "errors_by_type": dict(self.errors_by_type),
+            "slowest_files": [
+                {"path": str(p), "seconds": t} for p, t in self.slowest_files
+            ],
+        }
+
+
+@dataclass
+class ScanStats:
+    """Metrics for a whole scan, keyed by root."""
+
+    roots: dict[Path, RootStats] = field(default_factory=dict)
+
+    @property
+    def dirs_visited(self) -> int:
+        return sum(r.dirs_visited for r in self.roots.values())
+
+    @property
+    def candidate_files(self) -> int:
+        return sum(r.candidate_files for r in self.roots.values())
+
+    @property
+    def parse_time(self) -> float:
+        return sum(r.parse_time for r in self.roots.values())
+
+    @property
+    def error_count(self) -> int:
+        return sum(r.error_count for r in self.roots.values())
+
+    def slowest_files(self, limit: int = SLOWEST_FILES) -> list[tuple[Path, float]]:
+        """Slowest files across all roots, slowest first."""
+        files = [f for r in self.roots.values() for f in r.slowest_files]
+        return sorted(files, key=lambda f: f[1], reverse=True)[:limit]
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {"roots": [r.to_dict() for r in self.roots.values()]}
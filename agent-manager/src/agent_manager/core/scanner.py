@@ -1,12 +1,33 @@
 """Filesystem scanner for finding agents and skills."""
 
 import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from functools import partial
 from dataclasses import dataclass, field
 from pathlib import Path
-
+from typing import TYPE_CHECKING, Any, Callable, Generic, Hashable, Iterator, TypeVar
+
+from agent_manager.core.archives import ARCHIVE_ERRORS, is_archive, read_archive
+from agent_manager.core.duplicates import content_hash
+from agent_manager.core.git_objects import (
+    GitError,
+    GitObjectReader,
+    TreeEntry,
+    follow_symlinks,
+)
 from agent_manager.core.parser import FrontmatterParser
+from agent_manager.core.query import ScanFilter
+from agent_manager.core.scan_stats import RootStats, ScanStats
+from agent_manager.core.tokens import TokenCache
 from agent_manager.models import Agent, AgentMetadata, Skill, SkillMetadata
 
+if TYPE_CHECKING:
+    from agent_manager.core.validator import AgentValidator
+
 
 # Directories to skip during scanning
 SKIP_DIRS = {
@@ -25,6 +46,92 @@ SKIP_DIRS = {
 }
 
 
+# A single scan result: ("agent", Agent), ("skill", Skill) or ("error", (Path, str))
+ScanEvent = tuple[str, Any]
+
+# Parsed files (by content digest, and by git blob SHA) kept between scans by
+# long-lived scanners; well above the largest catalogs, so only records of old
+# file versions go
+PARSE_CACHE_SIZE = 50_000
+
+# Archives whose parsed members are kept between scans by long-lived scanners
+ARCHIVE_CACHE_SIZE = 256
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class LRUCache(Generic[_K, _V]):
+    """
+    Mapping that drops its least recently used entries beyond ``size``.
+
+    A long-lived scanner (the daemon's) sees every version of every file it
+    rescans, so its caches must forget old ones. Safe to share between the
+    threads of concurrent scans.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            size: Maximum number of entries kept
+        """
+        self.size = size
+        self._items: OrderedDict[_K, _V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self._items
+
+    def get(self, key: _K) -> _V | None:
+        """Get an entry, marking it as recently used, or None if absent."""
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: _K, value: _V) -> None:
+        if not self.size:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+
+@dataclass
+class ParsedFile:
+    """
+    A parsed agent/skill file, shared by every byte-identical copy.
+
+    Copies found in other repositories reuse the same frontmatter, body
+    string, metadata object and validation messages instead of parsing again.
+    """
+
+    frontmatter: dict[str, Any]
+    body: str
+    content_hash: str
+    metadata: AgentMetadata | SkillMetadata | None = None
+    validation: list[str] | None = None
+
+
+@dataclass
+class ArchiveContents:
+    """Parsed members of one archive, valid while its mtime and size match."""
+
+    mtime_ns: int
+    size: int
+    names: list[str]
+    # Member name -> parsed file, or the error parsing it raised
+    members: dict[str, ParsedFile | Exception]
+
+
 @dataclass
 class ScanResult:
     """Result of scanning a directory tree."""
@@ -32,6 +139,7 @@ class ScanResult:
     agents: list[Agent] = field(default_factory=list)
     skills: list[Skill] = field(default_factory=list)
     errors: list[tuple[Path, str]] = field(default_factory=list)
+    stats: ScanStats = field(default_factory=ScanStats)
 
 
 class AgentSkillScanner:
@@ -43,10 +151,46 @@ class AgentSkillScanner:
     - agents/*.md (standalone agent repos)
     - .claude/skills/*/SKILL.md (project-embedded skills)
     - skills/*/SKILL.md (standalone skill repos)
+
+    .zip and .tar.gz files are searched for the same layouts as if they
+    were directories.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        scan_filter: ScanFilter | None = None,
+        validator: "AgentValidator | None" = None,
+        token_cache: TokenCache | None = None,
+        keep_parsed: bool = False,
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            scan_filter: Discard items whose metadata doesn't match, right
+                after frontmatter parsing
+            validator: Validate agents against the schema and report
+                failures as errors
+            token_cache: Cache for the token estimates set on every item
+                (default: in memory, kept across scans)
+            keep_parsed: Keep parsed files and archives between scans, so
+                unchanged and identical files aren't parsed again. For
+                long-lived scanners (the daemon's, the TUI's); one-shot
+                scans hold nothing, so streaming stays constant-memory
+        """
         self.parser = FrontmatterParser()
+        self.scan_filter = scan_filter
+        self.validator = validator
+        self.token_cache = token_cache or TokenCache()
+        # File bytes digest -> parsed record, kept across scans
+        parse_cache_size = PARSE_CACHE_SIZE if keep_parsed else 0
+        self._parsed: LRUCache[bytes, ParsedFile] = LRUCache(parse_cache_size)
+        # Git blob SHA -> parsed record, kept across scans
+        self._blobs: LRUCache[str, ParsedFile] = LRUCache(parse_cache_size)
+        # Archive path -> parsed members
+        self._archives: LRUCache[Path, ArchiveContents] = LRUCache(
+            ARCHIVE_CACHE_SIZE if keep_parsed else 0
+        )
 
     async def scan_path(self, root: Path) -> ScanResult:
         """
@@ -58,19 +202,8 @@ class AgentSkillScanner:
         Returns:
             ScanResult with discovered agents and skills
         """
-        result = ScanResult()
-
-        if not root.exists():
-            result.errors.append((root, "Path does not exist"))
-            return result
-
-        if not root.is_dir():
-            result.errors.append((root, "Path is not a directory"))
-            return result
-
         # Run blocking I/O in thread pool
-        await asyncio.to_thread(self._scan_recursive, root, root, result)
-        return result
+        return await asyncio.to_thread(self._collect, root)
 
     async def scan_all(self, paths: list[Path]) -> ScanResult:
         """
@@ -93,13 +226,254 @@ class AgentSkillScanner:
                 combined.agents.extend(r.agents)
                 combined.skills.extend(r.skills)
                 combined.errors.extend(r.errors)
+                combined.stats.roots.update(r.stats.roots)
 
         return combined
 
-    def _scan_recursive(self, root: Path, current: Path, result: ScanResult) -> None:
+    def iter_scan(
+        self, paths: list[Path], stats: ScanStats | None = None
+    ) -> Iterator[ScanEvent]:
+        """
+        Scan paths one after another, yielding results as they are found.
+
+        Unlike ``scan_all`` nothing is accumulated, so memory use does not
+        grow with the size of the catalog.
+
+        Args:
+            paths: List of root directories to scan
+            stats: Optional ScanStats to record per-root metrics into
+
+        Yields:
+            ("agent", Agent), ("skill", Skill) or ("error", (path, message))
+        """
+        for path in paths:
+            root_stats = RootStats(root=path)
+            if stats is not None:
+                stats.roots[path] = root_stats
+            yield from self.iter_path(path, root_stats)
+
+    def iter_path(
+        self, root: Path, stats: RootStats | None = None, estimate_tokens: bool = True
+    ) -> Iterator[ScanEvent]:
+        """
+        Scan a single root path, yielding results as they are found.
+
+        Args:
+            root: Root directory to scan
+            stats: Optional RootStats to record metrics into
+            estimate_tokens: Set token estimates on items; callers that only
+                read the text can skip the cost
+
+        Yields:
+            ("agent", Agent), ("skill", Skill) or ("error", (path, message))
+        """
+        events = self._iter_path(root, stats)
+        yield from self._with_tokens(events) if estimate_tokens else events
+
+    def _iter_path(self, root: Path, stats: RootStats | None) -> Iterator[ScanEvent]:
+        """Scan a single root path without estimating tokens."""
+        stats = stats if stats is not None else RootStats(root=root)
+        yield from _timed(self._walk_root(root, stats), stats)
+
+    def _walk_root(self, root: Path, stats: RootStats) -> Iterator[ScanEvent]:
+        """Check the root, then scan it recursively."""
+        if not root.exists():
+            stats.record_error("missing_root")
+            yield "error", (root, "Path does not exist")
+        elif not root.is_dir():
+            stats.record_error("not_a_directory")
+            yield "error", (root, "Path is not a directory")
+        else:
+            yield from self._scan_recursive(root, root, stats)
+
+    def _collect(self, root: Path) -> ScanResult:
+        """Run iter_path to completion and gather the results."""
+        result = ScanResult()
+        stats = RootStats(root=root)
+        result.stats.roots[root] = stats
+        _gather(self._iter_path(root, stats), result)
+        # One batch per root instead of one lookup per item
+        self.token_cache.annotate(result.agents, result.skills)
+        return result
+
+    def _with_tokens(self, events: Iterator[ScanEvent]) -> Iterator[ScanEvent]:
+        """Set the token estimate on each agent and skill as it is yielded."""
+        for kind, item in events:
+            if kind == "agent":
+                self.token_cache.annotate(agents=[item])
+            elif kind == "skill":
+                self.token_cache.annotate(skills=[item])
+            yield kind, item
+
+    def iter_ref(
+        self,
+        repo: Path,
+        ref: str,
+        stats: RootStats | None = None,
+        reader: GitObjectReader | None = None,
+    ) -> Iterator[ScanEvent]:
+        """
+        Scan a git ref for agents and skills without checking it out.
+
+        Matches the same layouts as a filesystem scan. Blobs already parsed
+        (in any ref) are looked up by SHA and not read again. Source paths
+        are where the files would be in a checkout of ``repo``.
+
+        Args:
+            repo: Git repository
+            ref: Branch, tag or commit
+            stats: Optional RootStats to record metrics into
+            reader: Reader to reuse; one is opened (and closed) otherwise
+
+        Yields:
+            ("agent", Agent), ("skill", Skill) or ("error", (path, message))
+        """
+        yield from self._with_tokens(self._iter_ref(repo, ref, stats, reader))
+
+    def _iter_ref(
+        self,
+        repo: Path,
+        ref: str,
+        stats: RootStats | None,
+        reader: GitObjectReader | None,
+        shared: dict[str, ParsedFile] | None = None,
+    ) -> Iterator[ScanEvent]:
+        """Scan a git ref without estimating tokens."""
+        repo = repo.resolve()
+        stats = stats if stats is not None else RootStats(root=repo)
+        yield from _timed(self._walk_ref(repo, ref, stats, reader, shared), stats)
+
+    def _walk_ref(
+        self,
+        repo: Path,
+        ref: str,
+        stats: RootStats,
+        reader: GitObjectReader | None,
+        shared: dict[str, ParsedFile] | None = None,
+    ) -> Iterator[ScanEvent]:
+        """
+        List a ref's tree, read the new blobs and parse the matches.
+
+        ``shared`` maps blob SHAs to records parsed for other refs of the
+        same call, and is added to.
+        """
+        own_reader = reader is None
+        reader = reader or GitObjectReader(repo)
+        try:
+            try:
+                entries = reader.list_tree(ref)
+            except GitError as e:
+                stats.record_error("GitError")
+                yield "error", (repo, f"{ref}: {e}")
+                return
+
+            # Symlink blobs hold their target; follow them as a checkout would
+            # show them, so linked agents and skill directories are found too
+            try:
+                targets = reader.read_blobs([e.sha for e in entries if e.is_symlink])
+            except GitError as e:
+                stats.record_error("GitError")
+                yield "error", (repo, f"{ref}: {e}")
+                return
+            links = {
+                e.path: targets[e.sha].decode("utf-8", "surrogateescape") for e in entries
+                if e.is_symlink and e.sha in targets
+            }
+            visible, broken = follow_symlinks(entries, links)
+            for link in broken:
+                if _classify_path(link.path) or _classify_path(f"{link.path}/SKILL.md"):
+                    stats.record_error("BrokenSymlink")
+                    yield "error", (
+                        repo / link.path,
+                        f"{ref}: symlink target is not in the tree: {links.get(link.path)}",
+                    )
+
+            # Items keep the path they resolve to, as the filesystem scan does
+            agents: list[TreeEntry] = []
+            skills: list[TreeEntry] = []
+            scripts: dict[str, list[Path]] = {}
+            stats.entries_seen += len(entries)
+            for path, entry in visible.items():
+                kind = _classify_path(path)
+                if kind == "agent":
+                    agents.append(entry)
+                elif kind == "skill":
+                    skills.append(entry)
+                elif "/scripts/" in path and path == entry.path:
+                    skill_dir, _, script = path.rpartition("/scripts/")
+                    if "/" not in script:
+                        scripts.setdefault(skill_dir, []).append(repo / path)
+            stats.candidate_files += len(agents) + len(skills)
+
+            # Read every blob not seen before in one cat-file round trip; the
+            # records already parsed are held here so eviction can't lose them
+            known = {} if shared is None else shared
+            for e in (*agents, *skills):
+                if e.sha not in known and (parsed := self._blobs.get(e.sha)) is not None:
+                    known[e.sha] = parsed
+            wanted = list(dict.fromkeys(
+                e.sha for e in (*agents, *skills) if e.sha not in known
+            ))
+            try:
+                blobs = reader.read_blobs(wanted)
+            except GitError as e:
+                stats.record_error("GitError")
+                yield "error", (repo, f"{ref}: {e}")
+                return
+
+            for entry in agents:
+                yield from self._parse_agent(
+                    repo / entry.path, repo, stats,
+                    load=lambda e=entry: self._load_blob(e, blobs, known, stats),
+                )
+            for entry in skills:
+                skill_dir = entry.path.rpartition("/")[0]
+                skill = self._parse_skill(
+                    repo / entry.path, repo / skill_dir, repo, stats,
+                    load=lambda e=entry: self._load_blob(e, blobs, known, stats),
+                    scripts=scripts.get(skill_dir, []),
+                )
+                if skill:
+                    yield "skill", skill
+        finally:
+            if own_reader:
+                reader.close()
+
+    def scan_refs(self, repo: Path, refs: list[str]) -> dict[str, ScanResult]:
+        """
+        Scan several refs of one repository through a single git process.
+
+        Blobs unchanged between the refs are parsed once, whether or not the
+        scanner keeps parsed files between calls.
+
+        Args:
+            repo: Git repository
+            refs: Branches, tags or commits
+
+        Returns:
+            Ref -> ScanResult, in the order given
+        """
+        repo = repo.resolve()
+        results = {}
+        shared: dict[str, ParsedFile] = {}
+        with GitObjectReader(repo) as reader:
+            for ref in refs:
+                result = ScanResult()
+                stats = RootStats(root=repo)
+                result.stats.roots[repo] = stats
+                _gather(self._iter_ref(repo, ref, stats, reader, shared), result)
+                self.token_cache.annotate(result.agents, result.skills)
+                results[ref] = result
+        return results
+
+    def _scan_recursive(
+        self, root: Path, current: Path, stats: RootStats
+    ) -> Iterator[ScanEvent]:
         """Recursively scan directories for agents and skills."""
+        stats.dirs_visited += 1
         try:
             for entry in current.iterdir():
+                stats.entries_seen += 1
                 if entry.is_dir():
                     # Skip excluded directories
                     if entry.name in SKIP_DIRS:
@@ -107,105 +481,361 @@ class AgentSkillScanner:
 
                     # Check for .claude directory
                     if entry.name == ".claude":
-                        self._scan_claude_dir(root, entry, result)
+                        yield from self._scan_claude_dir(root, entry, stats)
                     # Check for standalone agents directory
                     elif entry.name == "agents":
-                        self._scan_agents_dir(root, entry, result)
+                        yield from self._scan_agents_dir(root, entry, stats)
                     # Check for standalone skills directory
                     elif entry.name == "skills":
-                        self._scan_skills_dir(root, entry, result)
+                        yield from self._scan_skills_dir(root, entry, stats)
                     else:
                         # Recurse into subdirectory
-                        self._scan_recursive(root, entry, result)
+                        yield from self._scan_recursive(root, entry, stats)
+                elif is_archive(entry) and entry.is_file():
+                    yield from self._scan_archive(root, entry, stats)
         except PermissionError:
-            result.errors.append((current, "Permission denied"))
+            stats.record_error("PermissionError")
+            yield "error", (current, "Permission denied")
         except OSError as e:
-            result.errors.append((current, str(e)))
+            stats.record_error(type(e).__name__)
+            yield "error", (current, str(e))
 
-    def _scan_claude_dir(self, root: Path, claude_dir: Path, result: ScanResult) -> None:
+    def _scan_claude_dir(
+        self, root: Path, claude_dir: Path, stats: RootStats
+    ) -> Iterator[ScanEvent]:
         """Scan a .claude directory for agents and skills."""
+        stats.dirs_visited += 1
         agents_dir = claude_dir / "agents"
         if agents_dir.exists() and agents_dir.is_dir():
-            self._scan_agents_dir(root, agents_dir, result)
+            yield from self._scan_agents_dir(root, agents_dir, stats)
 
         skills_dir = claude_dir / "skills"
         if skills_dir.exists() and skills_dir.is_dir():
-            self._scan_skills_dir(root, skills_dir, result)
+            yield from self._scan_skills_dir(root, skills_dir, stats)
 
-    def _scan_agents_dir(self, root: Path, agents_dir: Path, result: ScanResult) -> None:
+    def _scan_agents_dir(
+        self, root: Path, agents_dir: Path, stats: RootStats
+    ) -> Iterator[ScanEvent]:
         """Scan an agents directory for .md files."""
+        stats.dirs_visited += 1
         try:
             for entry in agents_dir.iterdir():
+                stats.entries_seen += 1
                 if entry.is_file() and entry.suffix == ".md":
-                    agent = self._parse_agent(entry, root)
-                    if agent:
-                        result.agents.append(agent)
+                    stats.candidate_files += 1
+                    yield from self._parse_agent(entry, root, stats)
         except OSError as e:
-            result.errors.append((agents_dir, str(e)))
+            stats.record_error(type(e).__name__)
+            yield "error", (agents_dir, str(e))
 
-    def _scan_skills_dir(self, root: Path, skills_dir: Path, result: ScanResult) -> None:
+    def _scan_skills_dir(
+        self, root: Path, skills_dir: Path, stats: RootStats
+    ) -> Iterator[ScanEvent]:
         """Scan a skills directory for SKILL.md files."""
+        stats.dirs_visited += 1
         try:
             for entry in skills_dir.iterdir():
+                stats.entries_seen += 1
                 if entry.is_dir():
                     skill_file = entry / "SKILL.md"
                     if skill_file.exists():
-                        skill = self._parse_skill(skill_file, entry, root)
+                        stats.candidate_files += 1
+                        skill = self._parse_skill(skill_file, entry, root, stats)
                         if skill:
-                            result.skills.append(skill)
+                            yield "skill", skill
         except OSError as e:
-            result.errors.append((skills_dir, str(e)))
-
-    def _parse_agent(self, file_path: Path, repo_root: Path) -> Agent | None:
-        """Parse an agent file and return Agent object."""
+            stats.record_error(type(e).__name__)
+            yield "error", (skills_dir, str(e))
+
+    def _scan_archive(
+        self, root: Path, archive: Path, stats: RootStats
+    ) -> Iterator[ScanEvent]:
+        """Scan a zip/tar.gz archive as if it were a directory."""
+        stats.dirs_visited += 1
         try:
-            frontmatter, body = self.parser.parse(file_path)
-
-            metadata = AgentMetadata(
-                name=frontmatter.get("name", file_path.stem),
-                description=frontmatter.get("description", ""),
-                model=frontmatter.get("model", "sonnet"),
-                color=frontmatter.get("color", "blue"),
-                tags=frontmatter.get("tags", []),
-                version=frontmatter.get("version"),
-                author=frontmatter.get("author"),
-                tools=frontmatter.get("tools", []),
-            )
+            st = archive.stat()
+            contents = self._archives.get(archive)
+            if contents is None or (contents.mtime_ns, contents.size) != (st.st_mtime_ns, st.st_size):
+                names, data = read_archive(archive, lambda name: _classify_path(name) is not None)
+                members: dict[str, ParsedFile | Exception] = {}
+                for name, blob in data.items():
+                    try:
+                        members[name] = self._parse_bytes(blob, name, stats)
+                    except (ValueError, KeyError) as e:
+                        members[name] = e
+                contents = ArchiveContents(st.st_mtime_ns, st.st_size, names, members)
+                self._archives[archive] = contents
+        except ARCHIVE_ERRORS as e:
+            stats.record_error(type(e).__name__)
+            yield "error", (archive, f"Cannot read archive: {e}")
+            return
+
+        scripts: dict[str, list[Path]] = {}
+        for name in contents.names:
+            stats.entries_seen += 1
+            skill_dir, _, script = name.rpartition("/scripts/")
+            if skill_dir and "/" not in script:
+                scripts.setdefault(skill_dir, []).append(archive / name)
+
+        for name, member in contents.members.items():
+            stats.candidate_files += 1
+            load = partial(_raise_or_return, member)
+            if _classify_path(name) == "agent":
+                yield from self._parse_agent(archive / name, root, stats, load=load)
+            else:
+                skill_dir = name.rpartition("/")[0]
+                skill = self._parse_skill(
+                    archive / name, archive / skill_dir, root, stats,
+                    load=load, scripts=scripts.get(skill_dir, []),
+                )
+                if skill:
+                    yield "skill", skill
+
+    def _read_frontmatter(self, file_path: Path, stats: RootStats) -> ParsedFile:
+        """Read and parse a file."""
+        return self._parse_bytes(file_path.read_bytes(), file_path.name, stats)
+
+    def _parse_bytes(self, data: bytes, filename: str, stats: RootStats) -> ParsedFile:
+        """
+        Parse file contents, timing the YAML step separately.
 
-            return Agent(
+        Contents are looked up by a hash of their bytes first, so identical
+        copies are parsed once.
+        """
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        parsed = self._parsed.get(digest)
+        if parsed is not None:
+            stats.duplicate_files += 1
+            return parsed
+
+        content = _decode(data)
+        frontmatter_str, body = self.parser.split(content, filename)
+
+        start = time.perf_counter()
+        try:
+            frontmatter = self.parser.load_frontmatter(frontmatter_str, filename)
+        finally:
+            stats.yaml_time += time.perf_counter() - start
+
+        parsed = ParsedFile(frontmatter, body, content_hash(frontmatter, body))
+        self._parsed[digest] = parsed
+        return parsed
+
+    def _load_blob(
+        self,
+        entry: TreeEntry,
+        blobs: dict[str, bytes],
+        known: dict[str, ParsedFile],
+        stats: RootStats,
+    ) -> ParsedFile:
+        """Parse a git blob, or return the record for an already-parsed SHA."""
+        parsed = known.get(entry.sha)
+        if parsed is not None:
+            stats.duplicate_files += 1
+            return parsed
+
+        data = blobs.get(entry.sha)
+        if data is None:
+            raise KeyError(f"Missing blob {entry.sha}")
+        start = time.perf_counter()
+        try:
+            frontmatter, body = self.parser.parse_string(_decode(data), entry.path)
+        finally:
+            stats.yaml_time += time.perf_counter() - start
+
+        parsed = ParsedFile(frontmatter, body, content_hash(frontmatter, body))
+        known[entry.sha] = parsed
+        self._blobs[entry.sha] = parsed
+        return parsed
+
+    def _parse_agent(
+        self,
+        file_path: Path,
+        repo_root: Path,
+        stats: RootStats,
+        load: Callable[[], ParsedFile] | None = None,
+    ) -> Iterator[ScanEvent]:
+        """Parse an agent file, yielding the Agent and any validation errors."""
+        start = time.perf_counter()
+        try:
+            parsed = load() if load else self._read_frontmatter(file_path, stats)
+            frontmatter = parsed.frontmatter
+
+            metadata = parsed.metadata
+            if not isinstance(metadata, AgentMetadata):
+                metadata = AgentMetadata(
+                    name=frontmatter.get("name", file_path.stem),
+                    description=frontmatter.get("description", ""),
+                    model=frontmatter.get("model", "sonnet"),
+                    color=frontmatter.get("color", "blue"),
+                    tags=frontmatter.get("tags", []),
+                    version=frontmatter.get("version"),
+                    author=frontmatter.get("author"),
+                    tools=frontmatter.get("tools", []),
+                )
+                # Only share metadata that doesn't depend on the filename
+                if "name" in frontmatter:
+                    parsed.metadata = metadata
+            if self.scan_filter and not self.scan_filter.matches(metadata):
+                return
+
+            agent = Agent(
                 metadata=metadata,
-                prompt=body,
+                prompt=parsed.body,
                 source_path=file_path.resolve(),
                 source_repo=repo_root.resolve(),
+                content_hash=parsed.content_hash,
             )
         except (ValueError, KeyError) as e:
-            return None
+            stats.record_error(_error_type(e))
+            return
+        except OSError as e:
+            stats.record_error(type(e).__name__)
+            return
+        finally:
+            stats.record_file(file_path, time.perf_counter() - start)
+
+        stats.parsed_files += 1
+        yield "agent", agent
+
+        if self.validator is not None:
+            if parsed.validation is None:
+                start = time.perf_counter()
+                parsed.validation = self.validator.validate_agent(frontmatter, parsed.body)
+                stats.validation_time += time.perf_counter() - start
+            for message in parsed.validation:
+                stats.record_error("validation")
+                yield "error", (file_path, f"Validation failed: {message}")
 
     def _parse_skill(
-        self, skill_file: Path, skill_dir: Path, repo_root: Path
+        self,
+        skill_file: Path,
+        skill_dir: Path,
+        repo_root: Path,
+        stats: RootStats,
+        load: Callable[[], ParsedFile] | None = None,
+        scripts: list[Path] | None = None,
     ) -> Skill | None:
         """Parse a skill file and return Skill object."""
+        start = time.perf_counter()
         try:
-            frontmatter, body = self.parser.parse(skill_file)
-
-            metadata = SkillMetadata(
-                name=frontmatter.get("name", skill_dir.name),
-                description=frontmatter.get("description", ""),
-            )
+            parsed = load() if load else self._read_frontmatter(skill_file, stats)
+            frontmatter = parsed.frontmatter
+
+            metadata = parsed.metadata
+            if not isinstance(metadata, SkillMetadata):
+                metadata = SkillMetadata(
+                    name=frontmatter.get("name", skill_dir.name),
+                    description=frontmatter.get("description", ""),
+                )
+                if "name" in frontmatter:
+                    parsed.metadata = metadata
+            if self.scan_filter and not self.scan_filter.matches(metadata):
+                return None
+            stats.parsed_files += 1
 
             # Find script files in skill directory
-            scripts = []
-            scripts_dir = skill_dir / "scripts"
-            if scripts_dir.exists():
-                scripts = list(scripts_dir.glob("*"))
+            if scripts is None:
+                scripts = []
+                scripts_dir = skill_dir / "scripts"
+                if scripts_dir.exists():
+                    scripts = list(scripts_dir.glob("*"))
 
             return Skill(
                 metadata=metadata,
-                content=body,
+                content=parsed.body,
                 source_path=skill_file.resolve(),
                 source_dir=skill_dir.resolve(),
                 source_repo=repo_root.resolve(),
                 scripts=scripts,
+                content_hash=parsed.content_hash,
             )
         except (ValueError, KeyError) as e:
+            stats.record_error(_error_type(e))
+            return None
+        except OSError as e:
+            stats.record_error(type(e).__name__)
+            return None
+        finally:
+            stats.record_file(skill_file, time.perf_counter() - start)
+
+
+def _timed(events: Iterator[ScanEvent], stats: RootStats) -> Iterator[ScanEvent]:
+    """
+    Pass events through, adding the time spent producing them to ``stats.wall_time``.
+
+    Time the consumer spends between events (writing NDJSON to a slow pipe,
+    say) is not counted.
+    """
+    start: float | None = time.perf_counter()
+    try:
+        with closing(events):
+            for event in events:
+                stats.wall_time += time.perf_counter() - start
+                start = None
+                yield event
+                start = time.perf_counter()
+    finally:
+        if start is not None:
+            stats.wall_time += time.perf_counter() - start
+
+
+def _gather(events: Iterator[ScanEvent], result: ScanResult) -> None:
+    """Sort scan events into a ScanResult."""
+    for kind, item in events:
+        if kind == "agent":
+            result.agents.append(item)
+        elif kind == "skill":
+            result.skills.append(item)
+        else:
+            result.errors.append(item)
+
+
+def _raise_or_return(member: ParsedFile | Exception) -> ParsedFile:
+    """Return a cached archive member, re-raising its cached parse error."""
+    if isinstance(member, Exception):
+        raise member
+    return member
+
+
+def _decode(data: bytes) -> str:
+    """Decode file bytes as UTF-8 with normalized line endings."""
+    content = data.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _classify_path(path: str) -> str | None:
+    """
+    Classify a relative path (in a git tree or archive) the way the filesystem scan would.
+
+    Returns:
+        "agent" for ``agents/*.md``, "skill" for ``skills/*/SKILL.md`` (both
+        also under ``.claude/``), otherwise None
+    """
+    *dirs, name = path.split("/")
+    for i, part in enumerate(dirs):
+        if part in SKIP_DIRS:
+            return None
+        rest = dirs[i + 1:]
+        if part == ".claude":
+            if rest == ["agents"] and name.endswith(".md"):
+                return "agent"
+            if len(rest) == 2 and rest[0] == "skills" and name == "SKILL.md":
+                return "skill"
             return None
+        if part == "agents":
+            return "agent" if not rest and name.endswith(".md") else None
+        if part == "skills":
+            return "skill" if len(rest) == 1 and name == "SKILL.md" else None
+    return None
+
+
+def _error_type(error: Exception) -> str:
+    """Classify a parse error for ScanStats.errors_by_type."""
+    if isinstance(error, UnicodeDecodeError):
+        return "UnicodeDecodeError"
+    if isinstance(error, ValueError):
+        return "invalid_frontmatter"
+    return type(error).__name__
@@ -0,0 +1,562 @@
+"""Inverted index with BM25 ranking over agent prompts and skill content."""
+
+import hashlib
+import heapq
+import math
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from agent_manager.core.atomic import atomic_path
+from agent_manager.models import Agent, Skill
+
+# Bump when the tokenizer or schema changes; older indexes are rebuilt
+INDEX_VERSION = 3
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Characters of context around the best match in a snippet
+SNIPPET_WIDTH = 160
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was were will with you your".split()
+)
+
+_SCHEMA = """
+CREATE TABLE docs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    source_path TEXT NOT NULL UNIQUE,
+    digest TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    -- Set by update_root; NULL for documents indexed from items alone
+    root TEXT,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+CREATE INDEX docs_root ON docs(root);
+
+-- Each document's terms, space-separated, under the document's id; FTS5
+-- keeps the inverted lists compact and cheap to update
+CREATE VIRTUAL TABLE postings USING fts5(terms, detail=full);
+
+CREATE TABLE roots (path TEXT PRIMARY KEY);
+
+-- Directories holding each root's items, to notice added and removed files
+CREATE TABLE dirs (
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER,
+    PRIMARY KEY (root, path)
+);
+"""
+
+
+def default_index_path() -> Path:
+    """Get the search index path (~/.config/agent-manager/search_index.db)."""
+    return Path.home() / ".config" / "agent-manager" / "search_index.db"
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric terms, dropping stopwords."""
+    return [
+        t for t in _TOKEN_RE.findall(text.lower())
+        if len(t) > 1 and t not in STOPWORDS
+    ]
+
+
+@dataclass
+class SearchResult:
+    """A ranked search hit."""
+
+    kind: str
+    name: str
+    source_path: Path
+    score: float
+
+
+@dataclass
+class Snippet:
+    """A window of text around the best match, with match spans."""
+
+    text: str
+    # (start, end) offsets of matched terms within ``text``
+    spans: list[tuple[int, int]]
+
+
+class SearchIndex:
+    """
+    Inverted index over agent prompts and skill content, ranked with BM25.
+
+    Postings live in an SQLite FTS5 table (scored here, with the constants
+    above), so opening a saved index reads nothing up front and a query
+    reads only the posting lists of its terms.
+    Documents are keyed by source path and fingerprinted by a hash of their
+    text, so ``update`` only re-tokenizes items whose content changed and
+    ``prune`` drops items that were not seen in the latest scan.
+
+    Documents indexed per scan root with ``update_root`` also keep their
+    file's mtime and size and the mtimes of the directories holding them,
+    so ``stale_roots`` tells which roots need a rescan without reading any
+    item. That keeps ``agent-manager search`` fast when neither the daemon
+    nor the catalog database is available; the FTS5 tables of the catalog
+    are opt-in, and the TUI's prompt search must work without them.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Open (and create or rebuild) an index.
+
+        Args:
+            path: Index file; None keeps the index in memory
+        """
+        self.path = path
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        try:
+            self._ensure_schema()
+        except sqlite3.DatabaseError:
+            # Outdated, corrupt or not an index: it is a cache, so start over
+            self._conn.close()
+            for stale in (path, Path(f"{path}-wal"), Path(f"{path}-shm")):
+                stale.unlink(missing_ok=True)
+            self._conn = self._connect()
+            self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            ":memory:" if self.path is None else self.path,
+            check_same_thread=False,
+            timeout=30,
+        )
+
+    def _ensure_schema(self) -> None:
+        """Create the schema, or fail on an index from another version."""
+        if self.path is not None:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != INDEX_VERSION:
+            if self._conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0]:
+                raise sqlite3.DatabaseError(f"Search index version {version} is not supported")
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+                self._conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        # Per-term document counts and per-document occurrences, for BM25
+        self._conn.executescript(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS temp.term_docs"
+            " USING fts5vocab(main, postings, row);"
+            "CREATE VIRTUAL TABLE IF NOT EXISTS temp.term_hits"
+            " USING fts5vocab(main, postings, instance);"
+        )
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> "SearchIndex":
+        """
+        Open a saved index, or an empty one if it is missing or outdated.
+
+        Args:
+            path: Index file (default: ~/.config/agent-manager/search_index.db)
+
+        Returns:
+            SearchIndex instance
+        """
+        return cls(path or default_index_path())
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    @property
+    def average_length(self) -> float:
+        """Average document length in terms."""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs"
+            ).fetchone()
+        return total / count if count else 0.0
+
+    # Building
+
+    def update(self, agents: Iterable[Agent] = (), skills: Iterable[Skill] = ()) -> int:
+        """
+        Add or refresh agents and skills.
+
+        Args:
+            agents: Agents to index (name, description and prompt)
+            skills: Skills to index (name, description and content)
+
+        Returns:
+            Number of documents (re)indexed
+        """
+        return self._update(_documents(agents, skills), root=None)
+
+    def update_root(
+        self, root: Path, agents: Iterable[Agent] = (), skills: Iterable[Skill] = ()
+    ) -> int:
+        """
+        Replace the documents of one scan root with a fresh scan of it.
+
+        Documents under ``root`` that are not in the scan are removed, and
+        the mtimes ``stale_roots`` checks are recorded.
+
+        Args:
+            root: Scan root the items were found under
+            agents: Every agent found under the root
+            skills: Every skill found under the root
+
+        Returns:
+            Number of documents (re)indexed or removed
+        """
+        agents, skills = list(agents), list(skills)
+        seen = {str(a.source_path) for a in agents} | {str(s.source_path) for s in skills}
+        changed = self._update(_documents(agents, skills), root=root)
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT source_path FROM docs WHERE root = ? OR root IS NULL", (str(root),)
+            ).fetchall()
+            gone = [
+                path for (path,) in rows
+                if path not in seen and Path(path).is_relative_to(root)
+            ]
+            for path in gone:
+                self._remove(path)
+            dirs: dict[str, int | None] = {}
+            for path in [root, *(a.source_path.parent for a in agents),
+                         *(s.source_dir.parent for s in skills)]:
+                # Items read from an archive live under the archive file
+                while not path.exists() and path != path.parent:
+                    path = path.parent
+                dirs[str(path)] = _mtime(path)
+            self._conn.execute("DELETE FROM dirs WHERE root = ?", (str(root),))
+            self._conn.executemany(
+                "INSERT INTO dirs (root, path, mtime_ns) VALUES (?, ?, ?)",
+                [(str(root), path, mtime_ns) for path, mtime_ns in dirs.items()],
+            )
+            self._conn.execute("INSERT OR IGNORE INTO roots (path) VALUES (?)", (str(root),))
+        return changed + len(gone)
+
+    def remove_root(self, root: Path) -> int:
+        """
+        Forget a scan root and the documents indexed under it.
+
+        Returns:
+            Number of documents removed
+        """
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT source_path FROM docs WHERE root = ?", (str(root),)
+            ).fetchall()
+            for (path,) in rows:
+                self._remove(path)
+            self._conn.execute("DELETE FROM dirs WHERE root = ?", (str(root),))
+            self._conn.execute("DELETE FROM roots WHERE path = ?", (str(root),))
+        return len(rows)
+
+    def roots(self) -> list[Path]:
+        """Get the scan roots indexed with ``update_root``."""
+        with self._lock:
+            rows = self._conn.execute("SELECT path FROM roots ORDER BY path").fetchall()
+        return [Path(p) for (p,) in rows]
+
+    def stale_roots(self, roots: Iterable[Path]) -> list[Path]:
+        """
+        Find the roots a rescan would change.
+
+        A root is stale if it was never indexed with ``update_root``, if a
+        document's file differs in mtime or size (edited, deleted, or
+        re-indexed from items since), or if a directory holding its items
+        changed (an item was added or removed). New ``.claude`` directories
+        elsewhere under a root are only found by a full rescan.
+
+        Args:
+            roots: Scan roots to check
+
+        Returns:
+            The stale roots, in order
+        """
+        stale = []
+        with self._lock:
+            known = {p for (p,) in self._conn.execute("SELECT path FROM roots")}
+            for root in roots:
+                if str(root) not in known:
+                    stale.append(root)
+                    continue
+                files = self._conn.execute(
+                    "SELECT source_path, mtime_ns, size FROM docs WHERE root = ?", (str(root),)
+                )
+                dirs = self._conn.execute(
+                    "SELECT path, mtime_ns FROM dirs WHERE root = ?", (str(root),)
+                )
+                if any(_stat(Path(p)) != (m, size) for p, m, size in files) or any(
+                    _mtime(Path(p)) != m for p, m in dirs
+                ):
+                    stale.append(root)
+        return stale
+
+    def prune(self, keep: Iterable[str | Path]) -> int:
+        """
+        Remove documents whose source path is not in ``keep``.
+
+        Args:
+            keep: Source paths still present
+
+        Returns:
+            Number of documents removed
+        """
+        keep = {str(p) for p in keep}
+        with self._lock, self._conn:
+            paths = [p for (p,) in self._conn.execute("SELECT source_path FROM docs")]
+            stale = [path for path in paths if path not in keep]
+            for path in stale:
+                self._remove(path)
+        return len(stale)
+
+    def _update(self, documents: Iterable[tuple[str, str, Path, str]], root: Path | None) -> int:
+        """Index (kind, name, source path, text) documents whose text changed."""
+        with self._lock:
+            existing = {
+                path: (digest, kind, name, doc_root)
+                for path, digest, kind, name, doc_root in self._conn.execute(
+                    "SELECT source_path, digest, kind, name, root FROM docs"
+                )
+            }
+        root_name = str(root) if root is not None else None
+        refreshed = []
+        indexed = []
+        # Tokenize before taking the lock, so searches aren't held up
+        for kind, name, source_path, text in documents:
+            path = str(source_path)
+            digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+            # Only update_root knows the files are what was just read; a document
+            # changed through update() has no stat, so its root is rescanned
+            mtime_ns, size = _stat(source_path) if root is not None else (None, None)
+            old = existing.get(path)
+            doc_root = root_name or (old[3] if old is not None else None)
+            if old is not None and old[0] == digest:
+                if root is not None or old[1:3] != (kind, name):
+                    refreshed.append((kind, name, doc_root, mtime_ns, size, path))
+                continue
+            tokens = tokenize(text)
+            doc = (kind, name, path, digest, len(tokens), doc_root, mtime_ns, size)
+            indexed.append((doc, " ".join(tokens)))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE docs SET kind = ?, name = ?, root = ?, mtime_ns = ?, size = ?"
+                " WHERE source_path = ?",
+                refreshed,
+            )
+            for doc, terms in indexed:
+                self._remove(doc[2])
+                cursor = self._conn.execute(
+                    "INSERT INTO docs (kind, name, source_path, digest, length, root,"
+                    " mtime_ns, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    doc,
+                )
+                self._conn.execute(
+                    "INSERT INTO postings (rowid, terms) VALUES (?, ?)",
+                    (cursor.lastrowid, terms),
+                )
+        return len(indexed)
+
+    def _remove(self, source_path: str) -> None:
+        """Delete a document and its postings; the caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT id FROM docs WHERE source_path = ?", (source_path,)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM postings WHERE rowid = ?", row)
+            self._conn.execute("DELETE FROM docs WHERE id = ?", row)
+
+    # Querying
+
+    def search(self, query: str, kind: str | None = None, limit: int = 20) -> list[SearchResult]:
+        """
+        Rank documents against a query with BM25.
+
+        Args:
+            query: Free-text query; every term contributes to the score
+            kind: Only return "agent" or "skill" documents
+            limit: Maximum number of results
+
+        Returns:
+            Results, best match first
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+        marks = ", ".join("?" * len(terms))
+        with self._lock:
+            n, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs"
+            ).fetchone()
+            if not n:
+                return []
+            frequency = dict(self._conn.execute(
+                f"SELECT term, doc FROM temp.term_docs WHERE term IN ({marks})", terms
+            ))
+            rows = self._conn.execute(
+                "SELECT h.term, h.doc, COUNT(*), d.length FROM temp.term_hits h"
+                f" JOIN docs d ON d.id = h.doc WHERE h.term IN ({marks})"
+                + (" AND d.kind = ?" if kind is not None else "")
+                + " GROUP BY h.term, h.doc",
+                [*terms, kind] if kind is not None else terms,
+            ).fetchall()
+
+            avgdl = total / n or 1.0
+            scores: dict[int, float] = {}
+            for term, doc_id, tf, length in rows:
+                df = frequency[term]
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                norm = tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avgdl))
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * norm
+
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            docs = {
+                doc_id: (doc_kind, name, path)
+                for doc_id, doc_kind, name, path in self._conn.execute(
+                    f"SELECT id, kind, name, source_path FROM docs"
+                    f" WHERE id IN ({', '.join('?' * len(best))})",
+                    [doc_id for doc_id, _ in best],
+                )
+            }
+        return [
+            SearchResult(docs[doc_id][0], docs[doc_id][1], Path(docs[doc_id][2]), score)
+            for doc_id, score in best
+        ]
+
+    # Persistence
+
+    def save(self, path: Path | None = None) -> None:
+        """
+        Commit the index, or copy it to ``path`` if it lives elsewhere.
+
+        Args:
+            path: Index file (default: where the index was opened, or
+                ~/.config/agent-manager/search_index.db for an in-memory one)
+        """
+        path = path or self.path or default_index_path()
+        with self._lock:
+            self._conn.commit()
+            if self.path is not None and path.resolve() == self.path.resolve():
+                return
+            with atomic_path(path) as tmp:
+                target = sqlite3.connect(tmp)
+                try:
+                    self._conn.backup(target)
+                finally:
+                    target.close()
+
+
+def _documents(
+    agents: Iterable[Agent], skills: Iterable[Skill]
+) -> Iterable[tuple[str, str, Path, str]]:
+    """(kind, name, source path, indexed text) for agents and skills."""
+    for agent in agents:
+        meta = agent.metadata
+        text = f"{meta.name}\n{meta.description}\n{agent.prompt}"
+        yield "agent", meta.name, agent.source_path, text
+    for skill in skills:
+        meta = skill.metadata
+        text = f"{meta.name}\n{meta.description}\n{skill.content}"
+        yield "skill", meta.name, skill.source_path, text
+
+
+def _stat(path: Path) -> tuple[int | None, int | None]:
+    """Get (mtime_ns, size) of a file, or (None, None) if it can't be read."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    return st.st_mtime_ns, st.st_size
+
+
+def _mtime(path: Path) -> int | None:
+    """Get the mtime of a path, or None if it can't be read."""
+    return _stat(path)[0]
+
+
+def snippet(text: str, query: str, width: int = SNIPPET_WIDTH) -> Snippet | None:
+    """
+    Extract the window of ``text`` containing the most distinct query terms.
+
+    Args:
+        text: Document text (prompt or content)
+        query: The search query
+        width: Approximate snippet length in characters
+
+    Returns:
+        Snippet with match spans, or None if no query term occurs in text
+    """
+    terms = set(tokenize(query))
+    if not terms:
+        return None
+
+    matches = [
+        (m.start(), m.end(), m.group().lower())
+        for m in re.finditer(r"[A-Za-z0-9]+", text)
+        if m.group().lower() in terms
+    ]
+    if not matches:
+        return None
+
+    # Slide over matches, keeping the window with the most distinct terms
+    best_start, best_count = matches[0][0], 0
+    right = 0
+    for left, (start, _, _) in enumerate(matches):
+        right = max(right, left)
+        while right + 1 < len(matches) and matches[right + 1][1] - start <= width:
+            right += 1
+        count = len({term for _, _, term in matches[left:right + 1]})
+        if count > best_count:
+            best_start, best_count = start, count
+
+    begin = max(0, best_start - width // 4)
+    # Start on a word boundary
+    while begin > 0 and text[begin - 1].isalnum():
+        begin -= 1
+    end = min(len(text), begin + width)
+    while end < len(text) and text[end - 1].isalnum() and text[end].isalnum():
+        end += 1
+
+    window = text[begin:end]
+    prefix = "…" if begin > 0 else ""
+    suffix = "…" if end < len(text) else ""
+
+    # Collapse whitespace while tracking where each character moved
+    out, offsets = [], []
+    for i, ch in enumerate(window):
+        if ch.isspace():
+            if out and out[-1] == " ":
+                offsets.append(len(prefix) + len(out) - 1)
+                continue
+            ch = " "
+        offsets.append(len(prefix) + len(out))
+        out.append(ch)
+    offsets.append(len(prefix) + len(out))
+
+    spans = [
+        (offsets[s - begin], offsets[e - begin])
+        for s, e, _ in matches
+        if begin <= s and e <= end
+    ]
+    return Snippet(prefix + "".join(out) + suffix, spans)
@@ -0,0 +1,796 @@
+"""Incremental SQLite index of Claude Code session logs."""
+
+import json
+import mmap
+import os
+import re
+import sqlite3
+import time
+from array import array
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from agent_manager.core.agent_usage import LATENCY_BUCKETS_MS, AgentUsage
+from agent_manager.models.session import AgentSession, SessionStatus
+
+# Bump when the schema changes; older databases are rebuilt from scratch
+SCHEMA_VERSION = 3
+
+# Line offsets are stored in chunks of up to this many lines, so appending
+# to a long session only rewrites its last chunk
+CHUNK_LINES = 4096
+
+# Longer lines (mostly tool results carrying whole files) are not decoded;
+# the few fields the index needs are picked out with regexes instead
+LARGE_LINE = 256 * 1024
+
+# Tools Claude Code uses to hand work to a subagent
+SUBAGENT_TOOLS = ("Task", "Agent")
+
+TITLE_LENGTH = 100
+
+_SCHEMA = """
+CREATE TABLE sessions (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    session_id TEXT NOT NULL,
+    project TEXT NOT NULL,
+    inode INTEGER,
+    mtime_ns INTEGER,
+    size INTEGER,
+    -- Everything before this byte offset (always at a line boundary) is indexed
+    indexed_bytes INTEGER NOT NULL,
+    line_count INTEGER NOT NULL,
+    message_count INTEGER NOT NULL,
+    started_at REAL,
+    last_activity REAL,
+    title TEXT NOT NULL,
+    model TEXT,
+    git_branch TEXT,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cache_read_tokens INTEGER NOT NULL,
+    cache_creation_tokens INTEGER NOT NULL,
+    agents TEXT NOT NULL,
+    -- Assistant messages are split over several lines repeating the same
+    -- usage; the last one seen is kept so each is counted once
+    last_message TEXT,
+    last_usage TEXT
+);
+CREATE INDEX sessions_session_id ON sessions(session_id);
+CREATE INDEX sessions_last_activity ON sessions(last_activity);
+
+-- Start offset of every line, as packed native uint64s
+CREATE TABLE line_offsets (
+    session INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    first_line INTEGER NOT NULL,
+    offsets BLOB NOT NULL,
+    PRIMARY KEY (session, first_line)
+);
+
+-- Subagent calls; ended_at stays NULL until the tool result is logged
+CREATE TABLE invocations (
+    session INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    tool_use_id TEXT NOT NULL,
+    agent TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    started_at REAL,
+    ended_at REAL,
+    duration_ms REAL,
+    tokens INTEGER,
+    PRIMARY KEY (session, tool_use_id)
+);
+CREATE INDEX invocations_agent ON invocations(agent, started_at);
+
+-- Subagent use per agent and UTC day, kept in step with invocations by the
+-- triggers below so that each indexing pass updates it incrementally
+CREATE TABLE agent_usage (
+    agent TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    finished INTEGER NOT NULL DEFAULT 0,
+    tokens INTEGER NOT NULL DEFAULT 0,
+    duration_ms REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (agent, day)
+);
+
+-- Finished calls per agent, UTC day and latency bucket
+CREATE TABLE agent_latency (
+    agent TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (agent, day, bucket)
+);
+
+CREATE TRIGGER invocations_usage_insert AFTER INSERT ON invocations BEGIN
+    INSERT OR IGNORE INTO agent_usage (agent, day) VALUES (new.agent, {new_day});
+    UPDATE agent_usage SET calls = calls + 1 WHERE agent = new.agent AND day = {new_day};
+END;
+CREATE TRIGGER invocations_usage_finish_insert AFTER INSERT ON invocations
+WHEN new.ended_at IS NOT NULL BEGIN
+{finish}
+END;
+CREATE TRIGGER invocations_usage_finish_update AFTER UPDATE OF ended_at ON invocations
+WHEN old.ended_at IS NULL AND new.ended_at IS NOT NULL BEGIN
+{finish}
+END;
+CREATE TRIGGER invocations_usage_delete AFTER DELETE ON invocations BEGIN
+    UPDATE agent_usage SET
+        calls = calls - 1,
+        finished = finished - (old.ended_at IS NOT NULL),
+        tokens = tokens - IFNULL(old.tokens, 0),
+        duration_ms = duration_ms - IFNULL(old.duration_ms, 0)
+    WHERE agent = old.agent AND day = {old_day};
+    UPDATE agent_latency SET count = count - 1
+    WHERE old.ended_at IS NOT NULL AND agent = old.agent AND day = {old_day}
+        AND bucket = {old_bucket};
+END;
+"""
+
+# Triggers on the same event fire in no guaranteed order, so each one
+# creates the rows it updates
+_FINISH_CALL = """\
+    INSERT OR IGNORE INTO agent_usage (agent, day) VALUES (new.agent, {new_day});
+    UPDATE agent_usage SET
+        finished = finished + 1,
+        tokens = tokens + IFNULL(new.tokens, 0),
+        duration_ms = duration_ms + IFNULL(new.duration_ms, 0)
+    WHERE agent = new.agent AND day = {new_day};
+    INSERT OR IGNORE INTO agent_latency (agent, day, bucket)
+    SELECT new.agent, {new_day}, {new_bucket} WHERE new.duration_ms IS NOT NULL;
+    UPDATE agent_latency SET count = count + 1
+    WHERE new.duration_ms IS NOT NULL AND agent = new.agent AND day = {new_day}
+        AND bucket = {new_bucket};"""
+
+
+def _day_sql(row: str) -> str:
+    """SQL for the UTC day number of an invocation's start."""
+    return f"CAST(IFNULL({row}.started_at, 0) / 86400 AS INTEGER)"
+
+
+def _bucket_sql(row: str) -> str:
+    """SQL for the LATENCY_BUCKETS_MS bucket of an invocation's duration."""
+    cases = " ".join(
+        f"WHEN {row}.duration_ms < {bound} THEN {i}" for i, bound in enumerate(LATENCY_BUCKETS_MS)
+    )
+    return f"(CASE {cases} ELSE {len(LATENCY_BUCKETS_MS)} END)"
+
+
+_SQL_PARTS = {
+    "new_day": _day_sql("new"),
+    "old_day": _day_sql("old"),
+    "new_bucket": _bucket_sql("new"),
+    "old_bucket": _bucket_sql("old"),
+}
+_SCHEMA = _SCHEMA.format(finish=_FINISH_CALL.format(**_SQL_PARTS), **_SQL_PARTS)
+
+# message.usage keys, in the order of the token columns
+_USAGE_KEYS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_input_tokens",
+    "cache_creation_input_tokens",
+)
+_TOKEN_COLUMNS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_creation_tokens")
+
+_TYPE_RE = re.compile(rb'"type":\s*"([A-Za-z_-]+)"')
+_TIMESTAMP_RE = re.compile(rb'"timestamp":\s*"([^"]+)"')
+_MESSAGE_ID_RE = re.compile(rb'"id":\s*"(msg_[^"]+)"')
+_MODEL_RE = re.compile(rb'"model":\s*"([^"]+)"')
+_USAGE_START_RE = re.compile(rb'"usage":\s*\{')
+_USAGE_RE = re.compile(
+    rb'"(input_tokens|output_tokens|cache_read_input_tokens|cache_creation_input_tokens)":\s*(\d+)'
+)
+
+
+def default_session_index_path() -> Path:
+    """Get the session index path (~/.config/agent-manager/sessions.db)."""
+    return Path.home() / ".config" / "agent-manager" / "sessions.db"
+
+
+@dataclass
+class IndexStats:
+    """Work done while bringing the index up to date."""
+
+    files: int = 0
+    updated: int = 0
+    bytes: int = 0
+    lines: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class Invocation:
+    """One subagent call made from a session."""
+
+    session_id: str
+    tool_use_id: str
+    agent: str
+    started_at: float | None
+    ended_at: float | None
+    duration_ms: float | None
+    tokens: int | None
+
+
+@dataclass
+class _Progress:
+    """Indexing state of one log file, stored as its ``sessions`` row."""
+
+    path: str
+    session_id: str
+    # Working directory from the log; empty until a line carrying it is seen
+    project: str = ""
+    inode: int | None = None
+    mtime_ns: int | None = None
+    size: int | None = None
+    indexed_bytes: int = 0
+    line_count: int = 0
+    message_count: int = 0
+    started_at: float | None = None
+    last_activity: float | None = None
+    title: str = ""
+    model: str | None = None
+    git_branch: str | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    agents: list[str] = field(default_factory=list)
+    last_message: str | None = None
+    last_usage: list[int] | None = None
+
+
+_COLUMNS = [f.name for f in fields(_Progress)]
+_JSON_COLUMNS = ("agents", "last_usage")
+
+
+class SessionIndex:
+    """
+    Index of Claude Code session logs in SQLite (WAL mode).
+
+    Logs are append-only JSONL, so each file is indexed from the byte offset
+    where the previous pass stopped: the new tail is memory-mapped, split at
+    newlines (a trailing partial line waits for the next pass) and folded
+    into per-session totals. The start offset of every line is kept so any
+    page of a session can be read without scanning it. A file that shrank
+    or was replaced is indexed again from the start.
+
+    One instance wraps one connection; open a separate instance per thread.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Open (and create or migrate) the index database.
+
+        Args:
+            path: Database file (default: ~/.config/agent-manager/sessions.db)
+        """
+        self.path = path or default_session_index_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Indexing a large log holds the write lock for a while; wait it out
+        self._conn = sqlite3.connect(self.path, timeout=60)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._ensure_schema()
+
+    def __enter__(self) -> "SessionIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _ensure_schema(self) -> None:
+        """Create the schema, rebuilding it if it is from another version."""
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version == SCHEMA_VERSION:
+            return
+
+        # The index is a cache of the logs, so just start over
+        tables = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        ).fetchall()
+        with self._conn:
+            self._conn.execute("PRAGMA foreign_keys=OFF")
+            for (name,) in tables:
+                self._conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+
+    # Writing
+
+    def index_file(self, path: Path) -> tuple[int, int]:
+        """
+        Index the complete lines appended to ``path`` since the last pass.
+
+        Args:
+            path: Session log (``<session id>.jsonl``)
+
+        Returns:
+            (bytes, lines) newly indexed; (0, 0) if the file is unchanged
+        """
+        st = path.stat()
+        _, progress = self._load_progress(str(path))
+        if progress is not None and _unchanged(progress, st):
+            return 0, 0
+
+        # Read the state again under the write lock, so that passes over the
+        # same log from other threads or processes apply one after the other
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = self._index_file(path, st)
+        except BaseException:
+            self._conn.rollback()
+            raise
+        self._conn.commit()
+        return result
+
+    def _index_file(self, path: Path, st: os.stat_result) -> tuple[int, int]:
+        row_id, progress = self._load_progress(str(path))
+        if progress is not None and _unchanged(progress, st):
+            return 0, 0
+        if progress is not None and (
+            progress.inode != st.st_ino or st.st_size < progress.indexed_bytes
+        ):
+            # Rotated or truncated: the stored offsets no longer apply
+            self._conn.execute("DELETE FROM sessions WHERE id = ?", (row_id,))
+            row_id, progress = None, None
+        if progress is None:
+            progress = _Progress(path=str(path), session_id=path.stem)
+
+        progress.inode = st.st_ino
+        progress.mtime_ns = st.st_mtime_ns
+        progress.size = st.st_size
+        start = progress.indexed_bytes
+        first_line = progress.line_count
+        offsets = array("Q")
+        calls = _Calls(self._open_calls(row_id))
+        if st.st_size > start:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Stop at the last newline; a partial line is picked up next time
+                end = mm.rfind(b"\n", start) + 1
+                pos = start
+                while pos < end:
+                    newline = mm.find(b"\n", pos, end)
+                    entry = _decode(mm[pos:newline], calls)
+                    if entry is not None:
+                        _fold(progress, entry, progress.line_count, calls)
+                    offsets.append(pos)
+                    progress.line_count += 1
+                    pos = newline + 1
+                progress.indexed_bytes = pos
+
+        row_id = self._save_progress(progress)
+        self._append_offsets(row_id, first_line, offsets)
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO invocations (session, tool_use_id, agent, line, started_at,"
+            " ended_at, duration_ms, tokens) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(row_id, tool_use_id, *call) for tool_use_id, call in calls.new.items()],
+        )
+        self._conn.executemany(
+            "UPDATE invocations SET ended_at = ?, duration_ms = ?, tokens = ?"
+            " WHERE session = ? AND tool_use_id = ?",
+            [(*result, row_id, tool_use_id) for tool_use_id, result in calls.finished],
+        )
+        return progress.indexed_bytes - start, len(offsets)
+
+    def remove_missing(self, paths: set[str]) -> int:
+        """
+        Delete the sessions whose log is not in ``paths``.
+
+        Args:
+            paths: Paths of every log that still exists
+
+        Returns:
+            Number of sessions removed
+        """
+        gone = [
+            (row_id,) for row_id, path in self._conn.execute("SELECT id, path FROM sessions")
+            if path not in paths
+        ]
+        with self._conn:
+            self._conn.executemany("DELETE FROM sessions WHERE id = ?", gone)
+        return len(gone)
+
+    def _load_progress(self, path: str) -> tuple[int | None, _Progress | None]:
+        row = self._conn.execute(
+            f"SELECT id, {', '.join(_COLUMNS)} FROM sessions WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None:
+            return None, None
+        values = dict(zip(_COLUMNS, row[1:]))
+        for column in _JSON_COLUMNS:
+            values[column] = json.loads(values[column]) if values[column] else None
+        values["agents"] = values["agents"] or []
+        return row[0], _Progress(**values)
+
+    def _save_progress(self, progress: _Progress) -> int:
+        values = [getattr(progress, c) for c in _COLUMNS]
+        for column in _JSON_COLUMNS:
+            i = _COLUMNS.index(column)
+            values[i] = None if values[i] is None else json.dumps(values[i])
+        updates = ", ".join(f"{c} = excluded.{c}" for c in _COLUMNS if c != "path")
+        (row_id,) = self._conn.execute(
+            f"INSERT INTO sessions ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+            f" ON CONFLICT(path) DO UPDATE SET {updates} RETURNING id",
+            values,
+        ).fetchone()
+        return row_id
+
+    def _open_calls(self, row_id: int | None) -> set[str]:
+        """Subagent calls of a session that have not returned yet."""
+        if row_id is None:
+            return set()
+        return {
+            tool_use_id for (tool_use_id,) in self._conn.execute(
+                "SELECT tool_use_id FROM invocations WHERE session = ? AND ended_at IS NULL",
+                (row_id,),
+            )
+        }
+
+    def _append_offsets(self, row_id: int, first_line: int, offsets: array) -> None:
+        """Store new line offsets, topping up the session's last chunk first."""
+        if not offsets:
+            return
+        last = self._conn.execute(
+            "SELECT first_line, offsets FROM line_offsets WHERE session = ?"
+            " ORDER BY first_line DESC LIMIT 1",
+            (row_id,),
+        ).fetchone()
+        if last is not None and len(last[1]) < CHUNK_LINES * offsets.itemsize:
+            merged = array("Q")
+            merged.frombytes(last[1])
+            merged.extend(offsets)
+            first_line, offsets = last[0], merged
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO line_offsets (session, first_line, offsets) VALUES (?, ?, ?)",
+            [
+                (row_id, first_line + i, offsets[i:i + CHUNK_LINES].tobytes())
+                for i in range(0, len(offsets), CHUNK_LINES)
+            ],
+        )
+
+    # Reading
+
+    def count(self, query: str = "") -> int:
+        """Count the sessions matching ``query`` (see ``sessions``)."""
+        where, params = _where(query)
+        (count,) = self._conn.execute(f"SELECT COUNT(*) FROM sessions{where}", params).fetchone()
+        return count
+
+    def sessions(self, offset: int = 0, limit: int = 100, query: str = "") -> list[AgentSession]:
+        """
+        Get one page of sessions, most recently active first.
+
+        Args:
+            offset: Sessions to skip
+            limit: Page size
+            query: Case-insensitive substring of the project, title or session id
+
+        Returns:
+            Sessions on the page
+        """
+        where, params = _where(query)
+        rows = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM sessions{where}"
+            " ORDER BY last_activity IS NULL, last_activity DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        ).fetchall()
+        now = time.time()
+        return [_to_session(dict(zip(_COLUMNS, row)), now) for row in rows]
+
+    def get(self, session_id: str) -> AgentSession | None:
+        """Get a session by id (or a unique prefix of it)."""
+        rows = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM sessions WHERE session_id LIKE ? LIMIT 2",
+            (session_id.replace("%", "") + "%",),
+        ).fetchall()
+        if len(rows) != 1:
+            return None
+        return _to_session(dict(zip(_COLUMNS, rows[0])), time.time())
+
+    def session_at(self, path: Path) -> AgentSession | None:
+        """Get the session indexed from the log at ``path``."""
+        row = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM sessions WHERE path = ?", (str(path),)
+        ).fetchone()
+        return _to_session(dict(zip(_COLUMNS, row)), time.time()) if row else None
+
+    def line_spans(self, path: Path, start: int, count: int) -> list[tuple[int, int]]:
+        """
+        Get the byte ranges of lines ``start`` to ``start + count`` of a log.
+
+        Args:
+            path: Session log
+            start: First line number (0-based)
+            count: Number of lines
+
+        Returns:
+            (start, end) offsets, newline excluded; shorter near the end of the log
+        """
+        row = self._conn.execute(
+            "SELECT id, line_count, indexed_bytes FROM sessions WHERE path = ?", (str(path),)
+        ).fetchone()
+        if row is None or count <= 0:
+            return []
+        row_id, line_count, indexed_bytes = row
+        stop = min(start + count, line_count)
+        chunks = self._conn.execute(
+            "SELECT first_line, offsets FROM line_offsets WHERE session = ? AND first_line <= ?"
+            " AND first_line >= (SELECT MAX(first_line) FROM line_offsets"
+            " WHERE session = ? AND first_line <= ?) ORDER BY first_line",
+            (row_id, stop, row_id, start),
+        ).fetchall()
+        offsets: dict[int, int] = {}
+        for first_line, blob in chunks:
+            chunk = array("Q")
+            chunk.frombytes(blob)
+            for i in range(max(start, first_line), min(stop + 1, first_line + len(chunk))):
+                offsets[i] = chunk[i - first_line]
+        offsets.setdefault(line_count, indexed_bytes)
+        return [
+            (offsets[i], offsets[i + 1] - 1)
+            for i in range(max(start, 0), stop)
+            if i in offsets and i + 1 in offsets
+        ]
+
+    def agent_usage(self, days: int, now: float | None = None) -> dict[str, AgentUsage]:
+        """
+        Sum subagent use per agent over the last ``days`` UTC days.
+
+        Reads the daily rollups, so the cost depends on the number of agents
+        and days, not on the number of calls.
+
+        Args:
+            days: Window length in days, today included
+            now: Unix time the window ends at (default: now)
+
+        Returns:
+            Agent name -> usage, for agents called in the window
+        """
+        first_day = int((time.time() if now is None else now) // 86400) - days + 1
+        usage = {
+            agent: AgentUsage(agent, calls, finished, tokens, duration_ms)
+            for agent, calls, finished, tokens, duration_ms in self._conn.execute(
+                "SELECT agent, SUM(calls), SUM(finished), SUM(tokens), SUM(duration_ms)"
+                " FROM agent_usage WHERE day >= ? GROUP BY agent HAVING SUM(calls) > 0",
+                (first_day,),
+            )
+        }
+        for agent, bucket, count in self._conn.execute(
+            "SELECT agent, bucket, SUM(count) FROM agent_latency WHERE day >= ?"
+            " GROUP BY agent, bucket",
+            (first_day,),
+        ):
+            if agent in usage:
+                usage[agent].latency[bucket] = count
+        for agent, last_used in self._conn.execute(
+            "SELECT agent, MAX(started_at) FROM invocations GROUP BY agent"
+        ):
+            if agent in usage:
+                usage[agent].last_used = last_used
+        return usage
+
+    def invocations(self, since: float | None = None) -> Iterator[Invocation]:
+        """
+        Iterate over subagent calls, oldest first.
+
+        Args:
+            since: Only calls started at or after this Unix time
+
+        Yields:
+            Invocation for each call
+        """
+        yield from (
+            Invocation(*row) for row in self._conn.execute(
+                "SELECT s.session_id, i.tool_use_id, i.agent, i.started_at, i.ended_at,"
+                " i.duration_ms, i.tokens FROM invocations i JOIN sessions s ON s.id = i.session"
+                " WHERE i.started_at >= ? ORDER BY i.started_at",
+                (since if since is not None else float("-inf"),),
+            )
+        )
+
+
+class _Calls:
+    """Subagent calls started and finished during one indexing pass."""
+
+    def __init__(self, open_ids: set[str]):
+        # Calls from earlier passes still waiting for their result
+        self.open = open_ids
+        # tool_use_id -> (agent, line, started_at, ended_at, duration_ms, tokens)
+        self.new: dict[str, list] = {}
+        # (tool_use_id, (ended_at, duration_ms, tokens)) for calls from earlier passes
+        self.finished: list[tuple[str, tuple]] = []
+
+    def waiting(self) -> list[str]:
+        return [*self.open, *(k for k, v in self.new.items() if v[3] is None)]
+
+
+def _unchanged(progress: _Progress, st: os.stat_result) -> bool:
+    """Whether a log is exactly as it was when it was last indexed."""
+    return (progress.inode, progress.size, progress.mtime_ns) == (
+        st.st_ino, st.st_size, st.st_mtime_ns
+    )
+
+
+def _decode(line: bytes, calls: _Calls) -> dict | None:
+    """Decode a log line, skimming large ones that cannot start or end a subagent call."""
+    if len(line) > LARGE_LINE and b'"subagent_type"' not in line and not (
+        b'"tool_use_id"' in line and any(k.encode() in line for k in calls.waiting())
+    ):
+        return _skim(line)
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _skim(line: bytes) -> dict:
+    """Pick the indexed fields out of a line without decoding it."""
+    entry: dict = {}
+    match = _TYPE_RE.search(line)
+    if match:
+        entry["type"] = match.group(1).decode()
+    match = _TIMESTAMP_RE.search(line)
+    if match:
+        entry["timestamp"] = match.group(1).decode()
+    usage = _USAGE_START_RE.search(line)
+    if usage:
+        message: dict = {"usage": {}}
+        match = _MESSAGE_ID_RE.search(line)
+        if match:
+            message["id"] = match.group(1).decode()
+        match = _MODEL_RE.search(line)
+        if match:
+            message["model"] = match.group(1).decode()
+        for key, value in _USAGE_RE.findall(line, usage.end(), usage.end() + 1024):
+            message["usage"].setdefault(key.decode(), int(value))
+        entry["message"] = message
+    return entry
+
+
+def _fold(progress: _Progress, entry: dict, line: int, calls: _Calls) -> None:
+    """Add one decoded log line to a session's totals."""
+    ts = _parse_timestamp(entry.get("timestamp"))
+    if ts is not None:
+        if progress.started_at is None:
+            progress.started_at = ts
+        progress.last_activity = max(ts, progress.last_activity or ts)
+    if not progress.project and isinstance(entry.get("cwd"), str):
+        progress.project = entry["cwd"]
+    if entry.get("gitBranch"):
+        progress.git_branch = entry["gitBranch"]
+
+    kind = entry.get("type")
+    if kind == "summary" and isinstance(entry.get("summary"), str):
+        progress.title = entry["summary"][:TITLE_LENGTH]
+        return
+    message = entry.get("message")
+    if kind not in ("user", "assistant") or not isinstance(message, dict):
+        return
+    content = message.get("content")
+    blocks = [b for b in content if isinstance(b, dict)] if isinstance(content, list) else []
+
+    if kind == "user":
+        progress.message_count += 1
+        if not progress.title and not entry.get("isMeta") and not entry.get("isSidechain"):
+            progress.title = _prompt_title(content)
+        for block in blocks:
+            if block.get("type") == "tool_result":
+                _finish_call(calls, block.get("tool_use_id"), entry, ts)
+        return
+
+    message_id = message.get("id")
+    same_message = message_id is not None and message_id == progress.last_message
+    if not same_message:
+        progress.message_count += 1
+    if message.get("model") and not message["model"].startswith("<"):
+        progress.model = message["model"]
+    usage = message.get("usage")
+    if isinstance(usage, dict):
+        values = [int(usage.get(k) or 0) for k in _USAGE_KEYS]
+        previous = progress.last_usage if same_message and progress.last_usage else [0] * 4
+        for column, new, old in zip(_TOKEN_COLUMNS, values, previous):
+            setattr(progress, column, getattr(progress, column) + new - old)
+        progress.last_usage = values
+    progress.last_message = message_id
+
+    for block in blocks:
+        if block.get("type") != "tool_use" or block.get("name") not in SUBAGENT_TOOLS:
+            continue
+        tool_input = block.get("input") if isinstance(block.get("input"), dict) else {}
+        agent = str(tool_input.get("subagent_type") or "general-purpose")
+        if agent not in progress.agents:
+            progress.agents.append(agent)
+        if block.get("id"):
+            calls.new[block["id"]] = [agent, line, ts, None, None, None]
+
+
+def _finish_call(calls: _Calls, tool_use_id: str | None, entry: dict, ts: float | None) -> None:
+    """Record the result of a subagent call, if ``tool_use_id`` is one."""
+    result = entry.get("toolUseResult") if isinstance(entry.get("toolUseResult"), dict) else {}
+    duration = result.get("totalDurationMs")
+    tokens = result.get("totalTokens")
+    if tool_use_id in calls.new:
+        call = calls.new[tool_use_id]
+        if duration is None and ts is not None and call[2] is not None:
+            duration = (ts - call[2]) * 1000
+        call[3:] = [ts, duration, tokens]
+    elif tool_use_id in calls.open:
+        calls.open.discard(tool_use_id)
+        calls.finished.append((tool_use_id, (ts, duration, tokens)))
+
+
+def _prompt_title(content) -> str:
+    """Title a session by its first typed prompt (not a command or tool result)."""
+    if isinstance(content, list):
+        content = next(
+            (b.get("text") for b in content if isinstance(b, dict) and b.get("type") == "text"),
+            None,
+        )
+    if not isinstance(content, str):
+        return ""
+    text = content.strip()
+    if not text or text.startswith("<"):
+        return ""
+    return text.splitlines()[0][:TITLE_LENGTH]
+
+
+def _parse_timestamp(value) -> float | None:
+    """Parse an ISO 8601 log timestamp to Unix time."""
+    if not isinstance(value, str):
+        return None
+    try:
+        # fromisoformat only accepts "Z" from Python 3.11
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _where(query: str) -> tuple[str, tuple]:
+    if not query:
+        return "", ()
+    pattern = f"%{query}%"
+    return (
+        " WHERE project LIKE ? OR title LIKE ? OR session_id LIKE ?",
+        (pattern, pattern, pattern),
+    )
+
+
+def _to_session(values: dict, now: float) -> AgentSession:
+    path = Path(values["path"])
+    # Claude Code names project directories after the cwd, with / replaced by -
+    project = values["project"] or path.parent.name.replace("-", "/")
+    mtime = (values["mtime_ns"] or 0) / 1e9
+    return AgentSession(
+        session_id=values["session_id"],
+        path=path,
+        project=project,
+        started_at=_datetime(values["started_at"]),
+        last_activity=_datetime(values["last_activity"]),
+        title=values["title"],
+        model=values["model"],
+        git_branch=values["git_branch"],
+        line_count=values["line_count"],
+        message_count=values["message_count"],
+        input_tokens=values["input_tokens"],
+        output_tokens=values["output_tokens"],
+        cache_read_tokens=values["cache_read_tokens"],
+        cache_creation_tokens=values["cache_creation_tokens"],
+        agents=json.loads(values["agents"]),
+        status=SessionStatus.from_age(now - mtime),
+    )
+
+
+def _datetime(value: float | None) -> datetime | None:
+    return datetime.fromtimestamp(value) if value is not None else None
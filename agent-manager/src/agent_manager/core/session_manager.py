@@ -0,0 +1,280 @@
+"""Find Claude Code session logs and browse them through the session index."""
+
+import asyncio
+import json
+import mmap
+import os
+import time
+from pathlib import Path
+
+from agent_manager.core.agent_usage import AgentUsage
+from agent_manager.core.session_index import IndexStats, SessionIndex, default_session_index_path
+from agent_manager.models.session import AgentSession, SessionStatus
+
+# Sessions per page in the TUI and `agent-manager sessions list`
+PAGE_SIZE = 200
+
+# Seconds between polls of followed logs, and between looks for new ones
+TAIL_INTERVAL = 1.0
+DISCOVER_INTERVAL = 10.0
+
+# Updates buffered for the consumer; the oldest is dropped when full
+TAIL_QUEUE_SIZE = 256
+
+
+class SessionManager:
+    """
+    Keep the session index in step with ``~/.claude/projects`` and query it.
+
+    Every call opens its own ``SessionIndex``, so a manager can be shared
+    between the UI thread and worker threads.
+    """
+
+    def __init__(self, claude_dir: Path | None = None, index_path: Path | None = None):
+        """
+        Initialize the session manager.
+
+        Args:
+            claude_dir: Claude directory holding ``projects/`` (default: ~/.claude)
+            index_path: Index database (default: ~/.config/agent-manager/sessions.db)
+        """
+        self.claude_dir = claude_dir or Path.home() / ".claude"
+        self.index_path = index_path or default_session_index_path()
+
+    @property
+    def projects_dir(self) -> Path:
+        """Directory with one subdirectory of session logs per project."""
+        return self.claude_dir / "projects"
+
+    def log_files(self) -> list[Path]:
+        """List the session logs (``projects/<project>/<session id>.jsonl``)."""
+        logs: list[Path] = []
+        try:
+            projects = list(os.scandir(self.projects_dir))
+        except OSError:
+            return logs
+        for project in projects:
+            if not project.is_dir():
+                continue
+            try:
+                with os.scandir(project.path) as entries:
+                    logs.extend(
+                        Path(e.path) for e in entries
+                        if e.name.endswith(".jsonl") and e.is_file()
+                    )
+            except OSError:
+                continue
+        return logs
+
+    def update_index(self) -> IndexStats:
+        """
+        Index what was appended to each log since the last update.
+
+        Returns:
+            IndexStats with the work done
+        """
+        started = time.perf_counter()
+        stats = IndexStats()
+        logs = self.log_files()
+        with SessionIndex(self.index_path) as index:
+            for path in logs:
+                try:
+                    new_bytes, new_lines = index.index_file(path)
+                except OSError:
+                    continue
+                stats.files += 1
+                if new_bytes:
+                    stats.updated += 1
+                    stats.bytes += new_bytes
+                    stats.lines += new_lines
+            stats.removed = index.remove_missing({str(p) for p in logs})
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+    def count(self, query: str = "") -> int:
+        """Count the indexed sessions matching ``query``."""
+        with SessionIndex(self.index_path) as index:
+            return index.count(query)
+
+    def list_sessions(
+        self, offset: int = 0, limit: int = PAGE_SIZE, query: str = ""
+    ) -> list[AgentSession]:
+        """
+        Get one page of indexed sessions, most recently active first.
+
+        Args:
+            offset: Sessions to skip
+            limit: Page size
+            query: Case-insensitive substring of the project, title or session id
+
+        Returns:
+            Sessions on the page
+        """
+        with SessionIndex(self.index_path) as index:
+            return index.sessions(offset, limit, query)
+
+    def get(self, session_id: str) -> AgentSession | None:
+        """Get an indexed session by id or unique id prefix."""
+        with SessionIndex(self.index_path) as index:
+            return index.get(session_id)
+
+    def agent_usage(self, days: int) -> dict[str, AgentUsage]:
+        """
+        Get subagent use per agent over the last ``days`` days from the index.
+
+        Args:
+            days: Window length in UTC days, today included
+
+        Returns:
+            Agent name -> usage, for agents called in the window
+        """
+        with SessionIndex(self.index_path) as index:
+            return index.agent_usage(days)
+
+    def read_lines(self, session: AgentSession, start: int, count: int) -> list[dict]:
+        """
+        Read and decode lines of a session log by line number.
+
+        Only the requested lines are read, using the offsets in the index.
+
+        Args:
+            session: Indexed session
+            start: First line number (0-based; negative counts from the end)
+            count: Number of lines
+
+        Returns:
+            Decoded entries (lines that are not valid JSON are skipped)
+        """
+        if start < 0:
+            start = max(session.line_count + start, 0)
+        with SessionIndex(self.index_path) as index:
+            spans = index.line_spans(session.path, start, count)
+        if not spans:
+            return []
+        entries = []
+        with open(session.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for begin, end in spans:
+                try:
+                    entries.append(json.loads(mm[begin:end]))
+                except ValueError:
+                    continue
+        return entries
+
+
+class SessionTailer:
+    """
+    Follow the logs of running sessions and publish their updated totals.
+
+    Every ``interval`` seconds the followed logs are stat'ed. Those that grew,
+    shrank or were replaced are brought up to date through the index, which
+    reads only the appended bytes and leaves a partial last line for the next
+    poll. A session is also published when its status changes without new
+    writes (active, then idle, then ended), and is dropped once it has ended.
+    Logs written to recently are picked up every ``discover_interval`` seconds.
+
+    Memory stays flat however long a session runs: only sessions that have
+    not ended are followed, a poll holds just the lines appended since the
+    last one, and updates go through a fixed-size queue. When the consumer
+    falls behind, the oldest update is dropped; every update is a complete
+    snapshot of its session, so a later one supersedes it.
+    """
+
+    def __init__(
+        self,
+        manager: SessionManager,
+        interval: float = TAIL_INTERVAL,
+        discover_interval: float = DISCOVER_INTERVAL,
+        queue_size: int = TAIL_QUEUE_SIZE,
+    ):
+        """
+        Initialize the tailer.
+
+        Args:
+            manager: Session manager whose logs and index to use
+            interval: Seconds between polls
+            discover_interval: Seconds between looks for newly active logs
+            queue_size: Updates buffered in ``updates``
+        """
+        self.manager = manager
+        self.interval = interval
+        self.discover_interval = discover_interval
+        self.updates: asyncio.Queue[AgentSession] = asyncio.Queue(maxsize=queue_size)
+        # Updates dropped because the queue was full
+        self.dropped = 0
+        # Followed log -> ((inode, size, mtime_ns), status) when last published
+        self._followed: dict[Path, tuple[tuple | None, SessionStatus | None]] = {}
+        self._last_discover = float("-inf")
+
+    @property
+    def followed(self) -> list[Path]:
+        """Logs currently followed."""
+        return list(self._followed)
+
+    async def run(self) -> None:
+        """Poll until cancelled, publishing changed sessions to ``updates``."""
+        while True:
+            for session in await asyncio.to_thread(self.poll):
+                self.publish(session)
+            await asyncio.sleep(self.interval)
+
+    def publish(self, session: AgentSession) -> None:
+        """Queue an update without blocking, dropping the oldest if the queue is full."""
+        if self.updates.full():
+            self.updates.get_nowait()
+            self.dropped += 1
+        self.updates.put_nowait(session)
+
+    def poll(self) -> list[AgentSession]:
+        """
+        Index what the followed logs gained since the last poll.
+
+        Returns:
+            Sessions whose log or status changed
+        """
+        now = time.time()
+        if now - self._last_discover >= self.discover_interval:
+            self._discover(now)
+            self._last_discover = now
+
+        changed: list[Path] = []
+        for path, (stamp, status) in list(self._followed.items()):
+            try:
+                st = path.stat()
+            except OSError:
+                del self._followed[path]
+                continue
+            new_stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+            new_status = SessionStatus.from_age(now - st.st_mtime_ns / 1e9)
+            if new_stamp != stamp or new_status is not status:
+                changed.append(path)
+            if new_status is SessionStatus.ENDED:
+                del self._followed[path]
+            else:
+                self._followed[path] = (new_stamp, new_status)
+        if not changed:
+            return []
+
+        sessions = []
+        with SessionIndex(self.manager.index_path) as index:
+            for path in changed:
+                try:
+                    index.index_file(path)
+                except OSError:
+                    continue
+                session = index.session_at(path)
+                if session is not None:
+                    sessions.append(session)
+        return sessions
+
+    def _discover(self, now: float) -> None:
+        """Start following logs written to since they would count as ended."""
+        for path in self.manager.log_files():
+            if path in self._followed:
+                continue
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if SessionStatus.from_age(now - mtime) is not SessionStatus.ENDED:
+                # No stamp yet, so the first poll indexes and publishes it
+                self._followed[path] = (None, None)
@@ -0,0 +1,275 @@
+"""Near-duplicate detection for agents with MinHash and LSH."""
+
+import difflib
+import re
+import zlib
+from dataclasses import dataclass, field
+
+from agent_manager.models import Agent
+
+# Words per shingle
+SHINGLE_SIZE = 5
+
+# Signature length and LSH banding (NUM_BINS = BANDS * rows per band). With
+# 32 bands of 4 rows, pairs above ~0.42 Jaccard similarity are likely to
+# share a bucket.
+NUM_BINS = 128
+BANDS = 32
+
+# Default similarity for clustering
+THRESHOLD = 0.5
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_EMPTY = _MASK64
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_WORD_RE = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    """
+    Hash overlapping word n-grams of text.
+
+    Args:
+        text: Prompt body
+        size: Words per shingle
+
+    Returns:
+        Set of 64-bit shingle hashes (empty for empty text)
+    """
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return set()
+    if len(words) < size:
+        grams = [" ".join(words)]
+    else:
+        grams = [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+    # crc32 is fast and stable across runs; the odd multiplier spreads it
+    # over 64 bits so the top bits can pick the bin
+    return {(zlib.crc32(g.encode("utf-8")) * _GOLDEN) & _MASK64 for g in grams}
+
+
+def signature(hashes: set[int]) -> tuple[int, ...]:
+    """
+    One-permutation MinHash: split the hash space into bins, keep each bin's minimum.
+
+    Args:
+        hashes: Shingle hashes
+
+    Returns:
+        NUM_BINS values; empty bins hold a sentinel
+    """
+    mins = [_EMPTY] * NUM_BINS
+    shift = 64 - _BIN_BITS
+    low = (1 << shift) - 1
+    for h in hashes:
+        b = h >> shift
+        v = h & low
+        if v < mins[b]:
+            mins[b] = v
+    return tuple(mins)
+
+
+def estimate(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity from two signatures."""
+    used = equal = 0
+    for x, y in zip(a, b):
+        if x == _EMPTY and y == _EMPTY:
+            continue
+        used += 1
+        if x == y:
+            equal += 1
+    return equal / used if used else 0.0
+
+
+def diff(base: Agent, other: Agent, context: int = 2) -> str:
+    """
+    Unified diff between two agents' prompts.
+
+    Args:
+        base: Agent shown as the original
+        other: Agent shown as the changed copy
+        context: Lines of context around each change
+
+    Returns:
+        Diff text (empty if the prompts are equal)
+    """
+    return "".join(difflib.unified_diff(
+        base.prompt.splitlines(keepends=True),
+        other.prompt.splitlines(keepends=True),
+        fromfile=str(base.source_path),
+        tofile=str(other.source_path),
+        n=context,
+    ))
+
+
+@dataclass
+class Variant:
+    """Identical copies of an agent within a cluster."""
+
+    copies: list[Agent]
+    # Estimated similarity to the cluster's base variant
+    similarity: float = 1.0
+
+    @property
+    def agent(self) -> Agent:
+        """The representative copy."""
+        return self.copies[0]
+
+
+@dataclass
+class Cluster:
+    """A group of agents with similar prompts."""
+
+    # Base variant (most copies) first, then by similarity to it
+    variants: list[Variant] = field(default_factory=list)
+
+    @property
+    def base(self) -> Agent:
+        """The agent the other variants are compared against."""
+        return self.variants[0].agent
+
+    @property
+    def names(self) -> list[str]:
+        """Distinct agent names in the cluster."""
+        return list(dict.fromkeys(v.agent.metadata.name for v in self.variants))
+
+
+@dataclass
+class _Doc:
+    signature: tuple[int, ...]
+    copies: list[Agent]
+
+
+class SimilarityIndex:
+    """
+    MinHash/LSH index over agent prompts.
+
+    Identical copies (same content hash) are indexed once. Each signature is
+    split into bands; agents sharing any band bucket are candidate pairs,
+    which are then checked against the estimated similarity, so clustering
+    avoids comparing every pair.
+    """
+
+    def __init__(self):
+        self._docs: dict[str, _Doc] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, agent: Agent, previous: "SimilarityIndex | None" = None) -> None:
+        """
+        Index an agent's prompt.
+
+        Args:
+            agent: Agent to add; copies with the same content hash are grouped
+            previous: Earlier index to reuse the signature from, if it has one
+        """
+        key = agent.content_hash or str(agent.source_path)
+        doc = self._docs.get(key)
+        if doc is not None:
+            doc.copies.append(agent)
+            return
+
+        # Only reuse by content hash; a path key says nothing about the content
+        old = previous._docs.get(key) if previous and agent.content_hash else None
+        if old is not None:
+            sig = old.signature
+        else:
+            hashes = shingles(agent.prompt)
+            if not hashes:
+                return
+            sig = signature(hashes)
+        doc = _Doc(sig, [agent])
+        self._docs[key] = doc
+
+        rows = NUM_BINS // BANDS
+        for band in range(BANDS):
+            values = doc.signature[band * rows:(band + 1) * rows]
+            if all(v == _EMPTY for v in values):
+                continue
+            self._buckets.setdefault((band, values), []).append(key)
+
+    def relatives(
+        self, agent: Agent, limit: int = 5, threshold: float = 0.3
+    ) -> list[tuple[Agent, float]]:
+        """
+        Find the agents most similar to ``agent`` (excluding identical copies).
+
+        Args:
+            agent: An indexed agent
+            limit: Maximum number of relatives
+            threshold: Minimum estimated similarity
+
+        Returns:
+            (representative agent, similarity), most similar first
+        """
+        key = agent.content_hash or str(agent.source_path)
+        doc = self._docs.get(key)
+        if doc is None:
+            return []
+
+        scored = []
+        for other in self._candidates(key, doc):
+            similarity = estimate(doc.signature, self._docs[other].signature)
+            if similarity >= threshold:
+                scored.append((self._docs[other].copies[0], similarity))
+        scored.sort(key=lambda pair: pair[1], reverse=True)
+        return scored[:limit]
+
+    def clusters(self, threshold: float = THRESHOLD) -> list[Cluster]:
+        """
+        Group similar agents into clusters.
+
+        Args:
+            threshold: Minimum estimated similarity for two variants to link
+
+        Returns:
+            Clusters of two or more variants, largest first
+        """
+        parent = {key: key for key in self._docs}
+
+        def find(key: str) -> str:
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        # Within a bucket, compare each member with the first and with its
+        # predecessor only; this keeps huge buckets linear
+        for members in self._buckets.values():
+            for i in range(1, len(members)):
+                for j in {0, i - 1}:
+                    a, b = members[j], members[i]
+                    if find(a) == find(b):
+                        continue
+                    if estimate(self._docs[a].signature, self._docs[b].signature) >= threshold:
+                        parent[find(b)] = find(a)
+
+        groups: dict[str, list[str]] = {}
+        for key in self._docs:
+            groups.setdefault(find(key), []).append(key)
+
+        clusters = []
+        for keys in groups.values():
+            if len(keys) < 2:
+                continue
+            docs = sorted((self._docs[k] for k in keys), key=lambda d: len(d.copies), reverse=True)
+            base = docs[0]
+            variants = [Variant(base.copies)] + [
+                Variant(d.copies, estimate(base.signature, d.signature)) for d in docs[1:]
+            ]
+            variants[1:] = sorted(variants[1:], key=lambda v: v.similarity, reverse=True)
+            clusters.append(Cluster(variants))
+        clusters.sort(key=lambda c: len(c.variants), reverse=True)
+        return clusters
+
+    def _candidates(self, key: str, doc: _Doc) -> set[str]:
+        rows = NUM_BINS // BANDS
+        candidates: set[str] = set()
+        for band in range(BANDS):
+            values = doc.signature[band * rows:(band + 1) * rows]
+            candidates.update(self._buckets.get((band, values), ()))
+        candidates.discard(key)
+        return candidates
@@ -1,5 +1,7 @@
 """Symlink management for agents and skills."""
 
+import os
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
@@ -15,6 +17,31 @@ class LinkResult(Enum):
     ERROR = "error"
 
 
+@dataclass
+class GlobalLinkIndex:
+    """Symlinks found in the global agents/skills directories, by entry name."""
+
+    agents_dir: Path
+    skills_dir: Path
+    agent_links: dict[str, Path] = field(default_factory=dict)
+    skill_links: dict[str, Path] = field(default_factory=dict)
+
+    def agent_link(self, source: Path) -> Path | None:
+        """Return the global link for an agent file if it points at ``source``."""
+        return self._match(self.agent_links, self.agents_dir, source)
+
+    def skill_link(self, source_dir: Path) -> Path | None:
+        """Return the global link for a skill directory if it points at ``source_dir``."""
+        return self._match(self.skill_links, self.skills_dir, source_dir)
+
+    @staticmethod
+    def _match(links: dict[str, Path], directory: Path, source: Path) -> Path | None:
+        target = links.get(source.name)
+        if target is not None and target == source.resolve():
+            return directory / source.name
+        return None
+
+
 class SymlinkManager:
     """
     Manages symlinks for agents and skills.
@@ -194,6 +221,54 @@ class SymlinkManager:
             "project_links": [],
         }
 
+    def read_links(self, directory: Path) -> dict[str, Path]:
+        """
+        Resolve every symlink in a directory with a single listing.
+
+        Args:
+            directory: Directory to list (e.g. ~/.claude/agents)
+
+        Returns:
+            Dict mapping entry name to resolved link target
+        """
+        links: dict[str, Path] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        links[entry.name] = Path(entry.path).resolve()
+        except OSError:
+            pass
+        return links
+
+    def global_link_index(self) -> "GlobalLinkIndex":
+        """
+        Snapshot the global agent and skill links with one listing per directory.
+
+        Returns:
+            GlobalLinkIndex for resolving link state without further stat calls
+        """
+        return GlobalLinkIndex(
+            agents_dir=self.global_agents_dir,
+            skills_dir=self.global_skills_dir,
+            agent_links=self.read_links(self.global_agents_dir),
+            skill_links=self.read_links(self.global_skills_dir),
+        )
+
+    def resolve_global_links(self, agents: list = (), skills: list = ()) -> None:
+        """
+        Set ``global_link`` on agents and skills from one listing per directory.
+
+        Args:
+            agents: Agents to update
+            skills: Skills to update
+        """
+        index = self.global_link_index()
+        for agent in agents:
+            agent.global_link = index.agent_link(agent.source_path)
+        for skill in skills:
+            skill.global_link = index.skill_link(skill.source_dir)
+
     # Private helpers
     def _create_symlink(self, source: Path, target: Path) -> LinkResult:
         """
@@ -0,0 +1,285 @@
+"""Offline token estimates for agent prompts and skill content."""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Iterable
+
+from agent_manager.core.atomic import atomic_write
+from agent_manager.models import Agent, LinkScope, Skill
+from agent_manager.models.session import format_tokens
+
+# Stored with cached counts; bump when the estimate changes so old counts are dropped
+ESTIMATOR_VERSION = 1
+
+# Counts kept in memory and in the cache file; the least recently used are
+# dropped beyond this
+CACHE_SIZE = 20_000
+
+# Pre-tokenizer split the way BPE tokenizers split before merging: contractions,
+# words with their leading space or punctuation, up to three digits, punctuation
+# runs with trailing newlines, newline runs, and other whitespace
+_PIECE_RE = re.compile(
+    r"'(?:[sdmt]|ll|ve|re)"
+    r"|[^\r\n\w]?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+",
+    re.IGNORECASE,
+)
+
+# A word up to this many letters is usually a single token
+_WORD_CHARS = 8
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens ``text`` costs in a model's context.
+
+    The text is split the way BPE tokenizers split it before merging, then
+    each piece is costed: common words, numbers and whitespace runs are one
+    token, longer words one per six letters, punctuation runs one per three
+    characters and non-ASCII text one per two UTF-8 bytes. The result is an
+    estimate, meant for comparing items and budgeting context, not billing.
+
+    Args:
+        text: Prompt or skill content
+
+    Returns:
+        Estimated token count
+    """
+    tokens = 0
+    for piece in _PIECE_RE.findall(text):
+        if not piece.isascii():
+            tokens += math.ceil(len(piece.encode("utf-8")) / 2)
+        elif piece[-1].isalpha():
+            word = len(piece) - (not piece[0].isalpha())
+            tokens += 1 if word <= _WORD_CHARS else math.ceil(word / 6)
+        elif piece.isspace() or piece.isdigit():
+            tokens += 1
+        else:
+            tokens += math.ceil(len(piece.strip()) / 3) or 1
+    return tokens
+
+
+def text_hash(text: str) -> str:
+    """Hash of the text a count was computed from, used as its cache key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def default_token_cache_path() -> Path:
+    """Get the token cache path (~/.config/agent-manager/tokens.json)."""
+    return Path.home() / ".config" / "agent-manager" / "tokens.json"
+
+
+class TokenCache:
+    """
+    Token counts keyed by a hash of the counted text.
+
+    Location: ~/.config/agent-manager/tokens.json when a path is given;
+    without one, counts are only kept for the life of the object.
+
+    Counts are looked up and computed a batch at a time, so a scan hashes
+    each prompt once, estimates only text it has not seen before and writes
+    the file at most once. Scans of several roots run in worker threads
+    and may share one cache.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Cache file, or None to keep counts in memory only
+        """
+        self.path = path
+        self._counts: dict[str, int] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def count(self, texts: Iterable[str]) -> list[int]:
+        """
+        Get token counts for a batch of texts, estimating those not cached.
+
+        Args:
+            texts: Texts to count
+
+        Returns:
+            Counts in the order of ``texts``
+        """
+        batch = [(text_hash(text), text) for text in texts]
+        with self._lock:
+            counts = self._load()
+            found = {key: counts.pop(key) for key, _ in batch if key in counts}
+        # Estimated outside the lock; identical texts in a batch are estimated once
+        missing = {key: text for key, text in batch if key not in found}
+        found.update((key, estimate_tokens(text)) for key, text in missing.items())
+        with self._lock:
+            # Re-inserting keeps the dict ordered from least to most recently used
+            counts.update(found)
+            for key in list(islice(counts, max(0, len(counts) - CACHE_SIZE))):
+                del counts[key]
+            self._dirty = self._dirty or bool(missing)
+        return [found[key] for key, _ in batch]
+
+    def annotate(self, agents: Iterable[Agent] = (), skills: Iterable[Skill] = ()) -> None:
+        """
+        Set ``tokens`` on agents and skills that don't have a count yet.
+
+        Args:
+            agents: Agents whose prompts to count
+            skills: Skills whose content to count
+        """
+        agents = [a for a in agents if a.tokens is None]
+        skills = [s for s in skills if s.tokens is None]
+        counts = self.count([a.prompt for a in agents] + [s.content for s in skills])
+        for item, tokens in zip([*agents, *skills], counts):
+            item.tokens = tokens
+
+    def save(self) -> None:
+        """Write new counts to the cache file, if there is one."""
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            keep = dict(self._load())
+        atomic_write(self.path, json.dumps({"version": ESTIMATOR_VERSION, "counts": keep}))
+        self._dirty = False
+
+    def _load(self) -> dict[str, int]:
+        if self._counts is None:
+            self._counts = {}
+            if self.path is not None:
+                try:
+                    data = json.loads(self.path.read_text(encoding="utf-8"))
+                    if data.get("version") == ESTIMATOR_VERSION:
+                        self._counts = {k: int(v) for k, v in data["counts"].items()}
+                except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                    pass
+        return self._counts
+
+
+def format_token_estimate(count: int | None) -> str:
+    """Format an estimated count, e.g. ``~1.2k``."""
+    return "-" if count is None else f"~{format_tokens(count)}"
+
+
+@dataclass
+class ContextCost:
+    """Estimated tokens of the agents and skills available in one project."""
+
+    # Project directory, or None for the globally linked items every project sees
+    project: Path | None
+    # Name -> tokens, for items in or linked into the project's .claude directory
+    agents: dict[str, int] = field(default_factory=dict)
+    skills: dict[str, int] = field(default_factory=dict)
+    # Globally linked items not shadowed by a project item of the same name
+    global_agents: dict[str, int] = field(default_factory=dict)
+    global_skills: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def agent_tokens(self) -> int:
+        """Tokens of the project's own agents."""
+        return sum(self.agents.values())
+
+    @property
+    def skill_tokens(self) -> int:
+        """Tokens of the project's own skills."""
+        return sum(self.skills.values())
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens of every agent and skill the project sees, global ones included."""
+        return (
+            self.agent_tokens + self.skill_tokens
+            + sum(self.global_agents.values()) + sum(self.global_skills.values())
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "project": str(self.project) if self.project else None,
+            "agents": self.agents,
+            "skills": self.skills,
+            "agent_tokens": self.agent_tokens,
+            "skill_tokens": self.skill_tokens,
+            "global_agent_tokens": sum(self.global_agents.values()),
+            "global_skill_tokens": sum(self.global_skills.values()),
+            "total_tokens": self.total_tokens,
+        }
+
+
+def context_costs(
+    agents: Iterable[Agent],
+    skills: Iterable[Skill],
+    projects: Iterable[Path] = (),
+) -> list[ContextCost]:
+    """
+    Add up the estimated tokens of the agents and skills each project sees.
+
+    A project is a directory whose ``.claude/agents`` or ``.claude/skills``
+    holds or links to catalog items. Each project's entries are listed and
+    matched to catalog items by resolved path, as ``BudgetAnalyzer`` does,
+    because the scanner records a linked item under its target rather than
+    under the project. Globally linked items count towards every project,
+    unless the project has its own item of the same name, which Claude Code
+    uses instead.
+
+    Args:
+        agents: Agents with ``tokens`` set
+        skills: Skills with ``tokens`` set
+        projects: Project directories to check besides those the catalog's
+            own ``.claude`` items are in, e.g. ones with assignments
+
+    Returns:
+        The global cost first, then one cost per project, most expensive first
+    """
+    everywhere = ContextCost(None)
+    by_path: dict[str, dict[Path, Agent | Skill]] = {"agents": {}, "skills": {}}
+    candidates = {Path(p).expanduser().resolve() for p in projects}
+
+    for kind, items in (("agents", agents), ("skills", skills)):
+        for item in items:
+            path = item.source_path if kind == "agents" else item.source_dir
+            by_path[kind][path] = item
+            if item.link_status is LinkScope.GLOBAL:
+                getattr(everywhere, kind)[item.metadata.name] = item.tokens or 0
+            # .claude/agents/<name>.md or .claude/skills/<name>
+            if len(path.parents) > 2 and path.parents[1].name == ".claude":
+                candidates.add(path.parents[2])
+
+    costs = []
+    for project in candidates:
+        cost = ContextCost(project)
+        for kind in ("agents", "skills"):
+            for entry in _list(project / ".claude" / kind):
+                if kind == "agents" and not entry.name.endswith(".md"):
+                    continue
+                try:
+                    item = by_path[kind].get(Path(entry.path).resolve(strict=True))
+                except (OSError, RuntimeError):
+                    continue  # Broken link
+                if item is not None:
+                    getattr(cost, kind)[item.metadata.name] = item.tokens or 0
+        if not cost.agents and not cost.skills:
+            continue
+        cost.global_agents = {n: t for n, t in everywhere.agents.items() if n not in cost.agents}
+        cost.global_skills = {n: t for n, t in everywhere.skills.items() if n not in cost.skills}
+        costs.append(cost)
+    return [everywhere, *sorted(costs, key=lambda c: (-c.total_tokens, str(c.project)))]
+
+
+def _list(directory: Path) -> list[os.DirEntry]:
+    """List a directory, treating a missing or unreadable one as empty."""
+    try:
+        with os.scandir(directory) as entries:
+            return list(entries)
+    except OSError:
+        return []
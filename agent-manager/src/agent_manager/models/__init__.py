@@ -3,7 +3,13 @@
 from agent_manager.models.agent import Agent, AgentMetadata, LinkScope
 from agent_manager.models.skill import Skill, SkillMetadata
 from agent_manager.models.config import AppConfig, ScanPath, ProjectAssignment
-from agent_manager.models.mcp_server import MCPServer, SyncStatus, TARGETS
+from agent_manager.models.mcp_server import (
+    HealthCheck,
+    HealthStatus,
+    MCPServer,
+    SyncStatus,
+    TARGETS,
+)
 from agent_manager.models.session import AgentSession, SessionStatus
 
 __all__ = [
@@ -16,6 +22,8 @@ __all__ = [
     "ScanPath",
     "ProjectAssignment",
     "MCPServer",
+    "HealthCheck",
+    "HealthStatus",
     "SyncStatus",
     "TARGETS",
     "AgentSession",
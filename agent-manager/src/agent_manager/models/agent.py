@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 
 class LinkScope(Enum):
@@ -38,6 +38,10 @@ class Agent:
     source_repo: Path
     global_link: Optional[Path] = None
     project_links: list[Path] = field(default_factory=list)
+    # Hash of normalized frontmatter and body; equal for identical copies
+    content_hash: Optional[str] = None
+    # Estimated tokens of the prompt, filled in after scanning (see core.tokens)
+    tokens: Optional[int] = None
 
     @property
     def filename(self) -> str:
@@ -58,18 +62,67 @@ class Agent:
         """Get display name for UI."""
         return self.metadata.name.replace("-", " ").title()
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
-        return {
-            "name": self.metadata.name,
-            "description": self.metadata.description,
-            "model": self.metadata.model,
-            "color": self.metadata.color,
-            "tags": self.metadata.tags,
-            "version": self.metadata.version,
-            "author": self.metadata.author,
-            "tools": self.metadata.tools,
-            "source_path": str(self.source_path),
-            "source_repo": str(self.source_repo),
-            "link_status": self.link_status.value,
-        }
+    def to_dict(self, fields: list[str] | None = None) -> dict:
+        """
+        Convert to dictionary for serialization.
+
+        Args:
+            fields: Fields to include (default: DEFAULT_FIELDS). Only the
+                requested fields are computed, so link_status (a stat call)
+                and prompt are skipped unless asked for.
+
+        Raises:
+            ValueError: If a field name is unknown
+        """
+        fields = DEFAULT_FIELDS if fields is None else fields
+        try:
+            return {name: _FIELD_GETTERS[name](self) for name in fields}
+        except KeyError as e:
+            raise ValueError(
+                f"Unknown agent field {e.args[0]!r} (valid: {', '.join(_FIELD_GETTERS)})"
+            ) from None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Agent":
+        """Create from dictionary (as produced by ``to_dict``)."""
+        global_link = data.get("global_link")
+        return cls(
+            metadata=AgentMetadata(
+                name=data["name"],
+                description=data.get("description", ""),
+                model=data.get("model", "sonnet"),
+                color=data.get("color", "blue"),
+                tags=data.get("tags", []),
+                version=data.get("version"),
+                author=data.get("author"),
+                tools=data.get("tools", []),
+            ),
+            prompt=data.get("prompt", ""),
+            source_path=Path(data["source_path"]),
+            source_repo=Path(data["source_repo"]),
+            global_link=Path(global_link) if global_link else None,
+            content_hash=data.get("content_hash"),
+            tokens=data.get("tokens"),
+        )
+
+
+_FIELD_GETTERS: dict[str, Callable[[Agent], Any]] = {
+    "name": lambda a: a.metadata.name,
+    "description": lambda a: a.metadata.description,
+    "model": lambda a: a.metadata.model,
+    "color": lambda a: a.metadata.color,
+    "tags": lambda a: a.metadata.tags,
+    "version": lambda a: a.metadata.version,
+    "author": lambda a: a.metadata.author,
+    "tools": lambda a: a.metadata.tools,
+    "source_path": lambda a: str(a.source_path),
+    "source_repo": lambda a: str(a.source_repo),
+    "link_status": lambda a: a.link_status.value,
+    "content_hash": lambda a: a.content_hash,
+    "tokens": lambda a: a.tokens,
+    "prompt": lambda a: a.prompt,
+}
+
+# All serializable fields, and those serialized by default (all but the body)
+FIELDS = list(_FIELD_GETTERS)
+DEFAULT_FIELDS = [name for name in _FIELD_GETTERS if name != "prompt"]
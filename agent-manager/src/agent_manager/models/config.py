@@ -80,6 +80,8 @@ class AppConfig:
     vim_mode: bool = True
     show_preview: bool = True
     preview_width: int = 50
+    # Keep a SQLite catalog (catalog.db) to start from the last-known scan
+    catalog_db: bool = False
 
     @property
     def config_dir(self) -> Path:
@@ -102,6 +104,7 @@ class AppConfig:
             "vim_mode": self.vim_mode,
             "show_preview": self.show_preview,
             "preview_width": self.preview_width,
+            "catalog_db": self.catalog_db,
         }
 
     @classmethod
@@ -119,4 +122,5 @@ class AppConfig:
             vim_mode=data.get("vim_mode", True),
             show_preview=data.get("show_preview", True),
             preview_width=data.get("preview_width", 50),
+            catalog_db=data.get("catalog_db", False),
         )
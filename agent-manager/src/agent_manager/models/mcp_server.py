@@ -0,0 +1,157 @@
+"""MCP server data models."""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional
+
+# Client configs that servers can be synced to: target -> display name
+TARGETS = {
+    "claude_code": "Claude Code",
+    "claude_desktop": "Claude Desktop",
+    "cursor": "Cursor",
+    "gemini": "Gemini CLI",
+    "codex": "Codex",
+}
+
+
+class SyncStatus(Enum):
+    """How far a server's desired state has reached its targets."""
+
+    SYNCED = "synced"
+    PARTIAL = "partial"
+    DISABLED = "disabled"
+    NONE = "none"
+
+
+class HealthStatus(Enum):
+    """Outcome of starting a server and completing the MCP handshake."""
+
+    OK = "ok"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    # Remote servers aren't started locally
+    SKIPPED = "skipped"
+
+
+@dataclass
+class HealthCheck:
+    """Result of one health check."""
+
+    status: HealthStatus
+    # Unix time the check finished
+    checked_at: float
+    # Spawn to initialize response, in milliseconds
+    latency_ms: Optional[float] = None
+    tool_count: Optional[int] = None
+    error: Optional[str] = None
+    # MCPServer.fingerprint when checked; a different value means stale
+    fingerprint: str = ""
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "status": self.status.value,
+            "checked_at": self.checked_at,
+            "latency_ms": self.latency_ms,
+            "tool_count": self.tool_count,
+            "error": self.error,
+            "fingerprint": self.fingerprint,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HealthCheck":
+        """Create from dictionary."""
+        return cls(
+            status=HealthStatus(data["status"]),
+            checked_at=data["checked_at"],
+            latency_ms=data.get("latency_ms"),
+            tool_count=data.get("tool_count"),
+            error=data.get("error"),
+            fingerprint=data.get("fingerprint", ""),
+        )
+
+
+@dataclass
+class MCPServer:
+    """An MCP server definition to keep in sync across client configs."""
+
+    id: str
+    command: str = ""
+    args: list[str] = field(default_factory=list)
+    env: dict[str, str] = field(default_factory=dict)
+    # "stdio" (command) or "http"/"sse" (url)
+    transport: str = "stdio"
+    url: Optional[str] = None
+    name: Optional[str] = None
+    enabled: bool = True
+    tags: list[str] = field(default_factory=list)
+    # Targets this server should be written to
+    targets: list[str] = field(default_factory=lambda: list(TARGETS))
+    # Target -> whether its config currently matches; filled in by MCPManager
+    synced_to: dict[str, bool] = field(default_factory=dict)
+    # Last health check; filled in by HealthChecker
+    health: Optional[HealthCheck] = None
+
+    @property
+    def display_name(self) -> str:
+        """Get display name for UI."""
+        return self.name or self.id.replace("-", " ").replace("_", " ").title()
+
+    @property
+    def type(self) -> str:
+        """Get "local" for servers started from a command, "remote" otherwise."""
+        return "local" if self.transport == "stdio" else "remote"
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of what determines how the server is launched."""
+        key = json.dumps(
+            [self.transport, self.command, self.args, sorted(self.env.items()), self.url]
+        )
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+    @property
+    def sync_status(self) -> SyncStatus:
+        """Get the sync status across this server's targets."""
+        if not self.enabled:
+            return SyncStatus.DISABLED
+        synced = [self.synced_to.get(t, False) for t in self.targets]
+        if synced and all(synced):
+            return SyncStatus.SYNCED
+        if any(synced):
+            return SyncStatus.PARTIAL
+        return SyncStatus.NONE
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization (without sync or health state)."""
+        data = {
+            "id": self.id,
+            "command": self.command,
+            "args": self.args,
+            "env": self.env,
+            "transport": self.transport,
+            "url": self.url,
+            "name": self.name,
+            "enabled": self.enabled,
+            "tags": self.tags,
+            "targets": self.targets,
+        }
+        return {k: v for k, v in data.items() if v is not None}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MCPServer":
+        """Create from dictionary."""
+        return cls(
+            id=data["id"],
+            command=data.get("command", ""),
+            args=list(data.get("args", [])),
+            env=dict(data.get("env", {})),
+            transport=data.get("transport", "stdio"),
+            url=data.get("url"),
+            name=data.get("name"),
+            enabled=data.get("enabled", True),
+            tags=list(data.get("tags", [])),
+            targets=list(data.get("targets", TARGETS)),
+        )
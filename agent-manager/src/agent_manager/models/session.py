@@ -0,0 +1,103 @@
+"""Claude Code session data models."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+# Seconds since the last write for a session to count as active / idle
+ACTIVE_SECONDS = 120
+IDLE_SECONDS = 30 * 60
+
+
+def format_tokens(count: int) -> str:
+    """Format a token count compactly, e.g. ``950``, ``12.3k``, ``4.1M``."""
+    if count >= 1_000_000:
+        return f"{count / 1_000_000:.1f}M"
+    if count >= 1_000:
+        return f"{count / 1_000:.1f}k"
+    return str(count)
+
+
+class SessionStatus(Enum):
+    """How recently a session's log was written to."""
+
+    ACTIVE = "active"
+    IDLE = "idle"
+    ENDED = "ended"
+
+    @classmethod
+    def from_age(cls, seconds: float) -> "SessionStatus":
+        """Get the status of a session last written ``seconds`` ago."""
+        if seconds < ACTIVE_SECONDS:
+            return cls.ACTIVE
+        if seconds < IDLE_SECONDS:
+            return cls.IDLE
+        return cls.ENDED
+
+
+@dataclass
+class AgentSession:
+    """One Claude Code session log (``~/.claude/projects/<project>/<id>.jsonl``)."""
+
+    session_id: str
+    path: Path
+    # Working directory of the session
+    project: str
+    started_at: Optional[datetime] = None
+    last_activity: Optional[datetime] = None
+    # First user prompt or the session summary
+    title: str = ""
+    model: Optional[str] = None
+    git_branch: Optional[str] = None
+    line_count: int = 0
+    message_count: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    # Subagents invoked in the session, in first-use order
+    agents: list[str] = field(default_factory=list)
+    status: SessionStatus = SessionStatus.ENDED
+
+    @property
+    def display_name(self) -> str:
+        """Get display name for UI."""
+        return self.title or self.session_id[:8]
+
+    @property
+    def total_tokens(self) -> int:
+        """Input, output and cache tokens together."""
+        return (
+            self.input_tokens + self.output_tokens
+            + self.cache_read_tokens + self.cache_creation_tokens
+        )
+
+    @property
+    def duration_seconds(self) -> float:
+        """Time between the first and last entry."""
+        if self.started_at is None or self.last_activity is None:
+            return 0.0
+        return (self.last_activity - self.started_at).total_seconds()
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "session_id": self.session_id,
+            "path": str(self.path),
+            "project": self.project,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "last_activity": self.last_activity.isoformat() if self.last_activity else None,
+            "title": self.title,
+            "model": self.model,
+            "git_branch": self.git_branch,
+            "line_count": self.line_count,
+            "message_count": self.message_count,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "agents": self.agents,
+            "status": self.status.value,
+        }
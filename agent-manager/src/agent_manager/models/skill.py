@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from agent_manager.models.agent import LinkScope
 
@@ -27,6 +27,10 @@ class Skill:
     scripts: list[Path] = field(default_factory=list)
     global_link: Optional[Path] = None
     project_links: list[Path] = field(default_factory=list)
+    # Hash of normalized frontmatter and body; equal for identical copies
+    content_hash: Optional[str] = None
+    # Estimated tokens of the content, filled in after scanning (see core.tokens)
+    tokens: Optional[int] = None
 
     @property
     def dirname(self) -> str:
@@ -47,14 +51,59 @@ class Skill:
         """Get display name for UI."""
         return self.metadata.name.replace("-", " ").title()
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
-        return {
-            "name": self.metadata.name,
-            "description": self.metadata.description,
-            "source_path": str(self.source_path),
-            "source_dir": str(self.source_dir),
-            "source_repo": str(self.source_repo),
-            "scripts": [str(s) for s in self.scripts],
-            "link_status": self.link_status.value,
-        }
+    def to_dict(self, fields: list[str] | None = None) -> dict:
+        """
+        Convert to dictionary for serialization.
+
+        Args:
+            fields: Fields to include (default: DEFAULT_FIELDS). Only the
+                requested fields are computed, so link_status (a stat call)
+                and content are skipped unless asked for.
+
+        Raises:
+            ValueError: If a field name is unknown
+        """
+        fields = DEFAULT_FIELDS if fields is None else fields
+        try:
+            return {name: _FIELD_GETTERS[name](self) for name in fields}
+        except KeyError as e:
+            raise ValueError(
+                f"Unknown skill field {e.args[0]!r} (valid: {', '.join(_FIELD_GETTERS)})"
+            ) from None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Skill":
+        """Create from dictionary (as produced by ``to_dict``)."""
+        global_link = data.get("global_link")
+        return cls(
+            metadata=SkillMetadata(
+                name=data["name"],
+                description=data.get("description", ""),
+            ),
+            content=data.get("content", ""),
+            source_path=Path(data["source_path"]),
+            source_dir=Path(data["source_dir"]),
+            source_repo=Path(data["source_repo"]),
+            scripts=[Path(s) for s in data.get("scripts", [])],
+            global_link=Path(global_link) if global_link else None,
+            content_hash=data.get("content_hash"),
+            tokens=data.get("tokens"),
+        )
+
+
+_FIELD_GETTERS: dict[str, Callable[[Skill], Any]] = {
+    "name": lambda s: s.metadata.name,
+    "description": lambda s: s.metadata.description,
+    "source_path": lambda s: str(s.source_path),
+    "source_dir": lambda s: str(s.source_dir),
+    "source_repo": lambda s: str(s.source_repo),
+    "scripts": lambda s: [str(p) for p in s.scripts],
+    "link_status": lambda s: s.link_status.value,
+    "content_hash": lambda s: s.content_hash,
+    "tokens": lambda s: s.tokens,
+    "content": lambda s: s.content,
+}
+
+# All serializable fields, and those serialized by default (all but the body)
+FIELDS = list(_FIELD_GETTERS)
+DEFAULT_FIELDS = [name for name in _FIELD_GETTERS if name != "content"]
@@ -6,6 +6,8 @@ from textual.widgets import Header, Footer, Input, ListView, Static
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
 
+from agent_manager.core.duplicates import group_duplicates
+from agent_manager.core.query import filter_by_text, sort_by_tokens
 from agent_manager.models import Agent
 from agent_manager.ui.widgets.item_list import AgentListItem
 from agent_manager.ui.widgets.preview_pane import PreviewPane
@@ -20,6 +22,8 @@ class AgentsScreen(Screen):
         ("g", "link_global", "Link Global"),
         ("u", "unlink", "Unlink"),
         ("slash", "focus_search", "Search"),
+        ("f", "toggle_prompt_search", "Prompt Search"),
+        ("t", "toggle_token_sort", "Sort by Tokens"),
     ]
 
     class AgentSelected(Message):
@@ -32,6 +36,8 @@ class AgentsScreen(Screen):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._filter_text = ""
+        self._prompt_search = False
+        self._sort_by_tokens = False
         self._selected_agent: Agent | None = None
 
     def compose(self) -> ComposeResult:
@@ -59,14 +65,9 @@ class AgentsScreen(Screen):
         list_view = self.query_one("#agent-list", ListView)
         list_view.clear()
 
-        agents = self.app.agents
-        if self._filter_text:
-            filter_lower = self._filter_text.lower()
-            agents = [
-                a for a in agents
-                if filter_lower in a.metadata.name.lower()
-                or filter_lower in a.metadata.description.lower()
-            ]
+        agents = self._filtered_agents()
+        if self._sort_by_tokens:
+            agents = sort_by_tokens(agents)
 
         if not agents:
             # Show empty state
@@ -79,36 +80,65 @@ class AgentsScreen(Screen):
                 preview.show_message("No agents found\n\nAdd .claude/agents/ folders to your scan paths")
             return
 
-        for agent in agents:
-            list_view.append(AgentListItem(agent))
+        # Identical copies from different repos share one row
+        for copies in group_duplicates(agents):
+            list_view.append(AgentListItem(copies[0], copies))
 
         # Update preview if we have agents
         if agents and list_view.index is not None:
             self._update_preview_for_index(list_view.index)
 
+    def _filtered_agents(self) -> list[Agent]:
+        """Apply the search box; prompt search mode ranks by prompt text."""
+        if not (self._prompt_search and self._filter_text):
+            return filter_by_text(self.app.agents, self._filter_text)
+        results = self.app.search_content(self._filter_text, "agent")
+        if results is None:
+            return filter_by_text(self.app.agents, self._filter_text)
+        by_path = {a.source_path: a for a in self.app.agents}
+        return [by_path[r.source_path] for r in results if r.source_path in by_path]
+
+    @property
+    def _snippet_query(self) -> str | None:
+        """Query to highlight in the preview, in prompt search mode."""
+        return self._filter_text if self._prompt_search and self._filter_text else None
+
     def _update_preview_for_index(self, index: int) -> None:
         """Update preview pane for the given list index."""
         list_view = self.query_one("#agent-list", ListView)
         if 0 <= index < len(list_view.children):
             item = list_view.children[index]
             if isinstance(item, AgentListItem):
-                self._selected_agent = item.agent
-                preview = self.query_one("#preview-pane", PreviewPane)
-                preview.show_agent(item.agent)
+                self._show_preview(item)
+
+    def _show_preview(self, item: AgentListItem) -> None:
+        """Show an agent row in the preview pane."""
+        self._selected_agent = item.agent
+        preview = self.query_one("#preview-pane", PreviewPane)
+        preview.show_agent(
+            item.agent,
+            query=self._snippet_query,
+            copies=item.copies,
+            relatives=self.app.similar_agents(item.agent),
+            missing_tools=self.app.missing_tools(item.agent),
+            usage=self.app.usage_of(item.agent),
+        )
+
+    def update_usage(self) -> None:
+        """Redraw the preview with the latest usage figures."""
+        list_view = self.query_one("#agent-list", ListView)
+        if list_view.index is not None:
+            self._update_preview_for_index(list_view.index)
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle list item selection."""
         if isinstance(event.item, AgentListItem):
-            self._selected_agent = event.item.agent
-            preview = self.query_one("#preview-pane", PreviewPane)
-            preview.show_agent(event.item.agent)
+            self._show_preview(event.item)
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         """Handle list item highlight (cursor movement)."""
         if isinstance(event.item, AgentListItem):
-            self._selected_agent = event.item.agent
-            preview = self.query_one("#preview-pane", PreviewPane)
-            preview.show_agent(event.item.agent)
+            self._show_preview(event.item)
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
@@ -126,6 +156,27 @@ class AgentsScreen(Screen):
         list_view = self.query_one("#agent-list", ListView)
         list_view.action_cursor_up()
 
+    def action_toggle_prompt_search(self) -> None:
+        """Switch the search box between name/description and prompt search."""
+        self._prompt_search = not self._prompt_search
+        search = self.query_one("#search-input", Input)
+        if self._prompt_search:
+            search.placeholder = "Search agent prompts... (press /)"
+            if self.app.search_index is None:
+                self.notify(
+                    "Search index is still building; matching names and descriptions for now",
+                    severity="warning",
+                )
+        else:
+            search.placeholder = "Search agents... (press /)"
+        self._rebuild_list()
+
+    def action_toggle_token_sort(self) -> None:
+        """Switch between the default order and most tokens first."""
+        self._sort_by_tokens = not self._sort_by_tokens
+        self.notify("Sorted by tokens" if self._sort_by_tokens else "Default order")
+        self._rebuild_list()
+
     def action_focus_search(self) -> None:
         """Focus the search input."""
         search = self.query_one("#search-input", Input)
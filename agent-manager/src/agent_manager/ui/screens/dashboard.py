@@ -1,12 +1,19 @@
 """Dashboard screen showing overview statistics."""
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static
 from textual.containers import Horizontal, Vertical, Container
 
+from agent_manager.core.agent_usage import format_latency
+from agent_manager.models.session import format_tokens
 from agent_manager.ui.widgets.stat_card import StatCard
 
+# Usage window (one of USAGE_WINDOWS) and number of agents shown
+USAGE_DAYS = 30
+USAGE_TOP = 10
+
 
 class DashboardScreen(Screen):
     """Main dashboard showing overview statistics."""
@@ -39,6 +46,16 @@ class DashboardScreen(Screen):
                 yield Static("Scan Paths", classes="preview-title")
                 yield Static("No scan paths configured", id="paths-list")
 
+            # Where the last scan spent its time
+            with Vertical(classes="content-panel"):
+                yield Static("Scan Statistics", classes="preview-title")
+                yield Static("No scan yet", id="scan-stats", classes="preview-meta")
+
+            # Which agents sessions actually call
+            with Vertical(classes="content-panel"):
+                yield Static(f"Agent Usage ({USAGE_DAYS} days)", classes="preview-title")
+                yield Static("Session logs not read yet", id="agent-usage", classes="preview-meta")
+
         yield Footer()
 
     def on_mount(self) -> None:
@@ -78,3 +95,58 @@ class DashboardScreen(Screen):
             paths_list.update(paths_text)
         else:
             paths_list.update("No scan paths configured. Press [bold],[/] to add paths.")
+
+        self._update_scan_stats()
+        self._update_agent_usage()
+
+    def _update_scan_stats(self) -> None:
+        """Show per-root metrics from the last scan."""
+        stats_widget = self.query_one("#scan-stats", Static)
+        stats = self.app.scan_stats
+        if stats is None or not stats.roots:
+            stats_widget.update("No scan statistics (scan not run yet, or served by the daemon)")
+            return
+
+        lines = [
+            f"  {'Dirs':>7} {'Files':>6} {'Wall ms':>9} {'Parse ms':>9} {'YAML ms':>8} {'Errors':>6}  Root"
+        ]
+        for root in sorted(stats.roots.values(), key=lambda r: r.wall_time, reverse=True):
+            lines.append(
+                f"  {root.dirs_visited:>7} {root.candidate_files:>6} "
+                f"{root.wall_time * 1000:>9.1f} {root.parse_time * 1000:>9.1f} "
+                f"{root.yaml_time * 1000:>8.1f} {root.error_count:>6}  {root.root}"
+            )
+
+        slowest = stats.slowest_files(3)
+        if slowest:
+            lines.append("")
+            lines.append("  Slowest files:")
+            lines.extend(f"    {t * 1000:7.2f} ms  {p}" for p, t in slowest)
+
+        stats_widget.update(Text("\n".join(lines)))
+
+    def _update_agent_usage(self) -> None:
+        """Show the most-called agents and how much of the catalog goes unused."""
+        usage_widget = self.query_one("#agent-usage", Static)
+        usage = self.app.agent_usage.get(USAGE_DAYS)
+        if usage is None:
+            usage_widget.update("Session logs not read yet")
+            return
+
+        catalog = {a.metadata.name for a in self.app.agents}
+        if usage:
+            lines = [f"  {'Calls':>6} {'Tokens':>8} {'p50':>7} {'p95':>7}  Agent"]
+            for u in sorted(usage.values(), key=lambda u: u.calls, reverse=True)[:USAGE_TOP]:
+                note = "  (not in catalog)" if catalog and u.agent not in catalog else ""
+                lines.append(
+                    f"  {u.calls:>6} {format_tokens(u.tokens):>8} "
+                    f"{format_latency(u.percentile_ms(0.5)):>7} "
+                    f"{format_latency(u.percentile_ms(0.95)):>7}  {u.agent}{note}"
+                )
+        else:
+            lines = [f"  No subagent calls in the last {USAGE_DAYS} days"]
+        if catalog:
+            unused = len(catalog - set(usage))
+            lines.append("")
+            lines.append(f"  {unused} of {len(catalog)} catalog agents not called in {USAGE_DAYS} days")
+        usage_widget.update(Text("\n".join(lines)))
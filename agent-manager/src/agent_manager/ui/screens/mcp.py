@@ -0,0 +1,203 @@
+"""MCP screen for listing and syncing MCP servers."""
+
+import asyncio
+
+from textual.app import ComposeResult
+from textual.screen import Screen
+from textual.widgets import Header, Footer, Input, ListView
+from textual.containers import Horizontal, Vertical
+
+from agent_manager.core.mcp_bench import MCPBench
+from agent_manager.core.mcp_health import HealthChecker
+from agent_manager.models import MCPServer
+from agent_manager.ui.widgets.item_list import MCPServerListItem
+from agent_manager.ui.widgets.preview_pane import PreviewPane
+
+
+class MCPScreen(Screen):
+    """List MCP servers and sync them to client configs."""
+
+    BINDINGS = [
+        ("j", "cursor_down", "Down"),
+        ("k", "cursor_up", "Up"),
+        ("y", "sync", "Sync All"),
+        ("e", "toggle_enabled", "Enable/Disable"),
+        ("c", "check", "Health Check"),
+        ("slash", "focus_search", "Search"),
+    ]
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._filter_text = ""
+        self._selected_server: MCPServer | None = None
+        self._checker: HealthChecker | None = None
+        # Read-only here; `agent-manager mcp bench` records the runs
+        self._bench = MCPBench()
+
+    def compose(self) -> ComposeResult:
+        """Compose the MCP screen."""
+        yield Header()
+        yield Input(placeholder="Search MCP servers... (press /)", id="search-input")
+
+        with Horizontal(id="main-content"):
+            with Vertical(id="list-container"):
+                yield ListView(id="mcp-list")
+
+            yield PreviewPane(id="preview-pane")
+
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Called when screen is mounted."""
+        self.app.sub_title = "MCP Servers"
+        # Health checks also keep the app's tool catalog up to date
+        self._checker = HealthChecker(catalog=self.app.tool_catalog)
+        self._rebuild_list()
+        self.query_one("#mcp-list", ListView).focus()
+        self.run_worker(self._load_servers(), exclusive=True)
+
+    async def _load_servers(self) -> None:
+        """Load servers and their sync status off the UI thread."""
+        manager = self.app.mcp_manager
+
+        def load() -> list[MCPServer]:
+            servers = manager.load_servers()
+            manager.refresh_status(servers)
+            return servers
+
+        self.app.mcp_servers = await asyncio.to_thread(load)
+        self._rebuild_list()
+        await self._check_health(force=False)
+
+    async def _check_health(self, force: bool) -> None:
+        """Probe enabled servers (reusing fresh results) and refresh the badges."""
+        servers = [s for s in self.app.mcp_servers if s.enabled]
+        results = await self._checker.check_all(servers, force=force)
+        self._rebuild_list()
+        down = [s.id for s, r in zip(servers, results) if r.status.value in ("failed", "timeout")]
+        if down:
+            self.notify(f"Not responding: {', '.join(down)}", severity="warning")
+
+    def _rebuild_list(self) -> None:
+        """Rebuild the server list with current filter."""
+        list_view = self.query_one("#mcp-list", ListView)
+        previous = list_view.index
+        list_view.clear()
+
+        servers = [
+            s for s in self.app.mcp_servers
+            if not self._filter_text
+            or self._filter_text.lower() in s.id.lower()
+            or self._filter_text.lower() in s.display_name.lower()
+        ]
+
+        if not servers:
+            preview = self.query_one("#preview-pane", PreviewPane)
+            if self._filter_text:
+                preview.show_message("No MCP servers match your search")
+            else:
+                preview.show_message(
+                    "No MCP servers configured\n\n"
+                    "Run `agent-manager mcp import` or `agent-manager mcp add`"
+                )
+            return
+
+        for server in servers:
+            list_view.append(MCPServerListItem(server))
+
+        # Keep the cursor in place; servers arrive after mount, so start at the top
+        list_view.index = min(previous or 0, len(servers) - 1)
+        self._update_preview_for_index(list_view.index)
+
+    def _update_preview_for_index(self, index: int) -> None:
+        """Update preview pane for the given list index."""
+        list_view = self.query_one("#mcp-list", ListView)
+        if 0 <= index < len(list_view.children):
+            item = list_view.children[index]
+            if isinstance(item, MCPServerListItem):
+                self._show(item.server)
+
+    def _show(self, server: MCPServer) -> None:
+        self._selected_server = server
+        history = self._bench.history(server.id)
+        self.query_one("#preview-pane", PreviewPane).show_mcp_server(
+            server,
+            tools=self.app.tool_catalog.get(server),
+            bench=history[-1] if history else None,
+            regressions=self._bench.regressions(server.id),
+        )
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        """Handle list item selection."""
+        if isinstance(event.item, MCPServerListItem):
+            self._show(event.item.server)
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Handle list item highlight (cursor movement)."""
+        if isinstance(event.item, MCPServerListItem):
+            self._show(event.item.server)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Handle search input changes."""
+        if event.input.id == "search-input":
+            self._filter_text = event.value
+            self._rebuild_list()
+
+    def action_cursor_down(self) -> None:
+        """Move cursor down in the list."""
+        self.query_one("#mcp-list", ListView).action_cursor_down()
+
+    def action_cursor_up(self) -> None:
+        """Move cursor up in the list."""
+        self.query_one("#mcp-list", ListView).action_cursor_up()
+
+    def action_focus_search(self) -> None:
+        """Focus the search input."""
+        self.query_one("#search-input", Input).focus()
+
+    def on_key(self, event) -> None:
+        """Handle key events for search clearing."""
+        search = self.query_one("#search-input", Input)
+        if event.key == "escape" and search.has_focus and self._filter_text:
+            search.value = ""
+            self._filter_text = ""
+            self._rebuild_list()
+            self.query_one("#mcp-list", ListView).focus()
+            event.stop()
+
+    def action_sync(self) -> None:
+        """Write the servers to every target config."""
+        self.run_worker(self._sync(), exclusive=True)
+
+    async def _sync(self) -> None:
+        servers = self.app.mcp_servers
+        diffs = await asyncio.to_thread(self.app.mcp_manager.sync, servers)
+        written = [d for d in diffs if d.written]
+        errors = [d for d in diffs if d.error]
+        if errors:
+            self.notify(
+                "Sync failed for " + ", ".join(f"{d.target} ({d.error})" for d in errors),
+                severity="error",
+            )
+        if written:
+            self.notify(f"Updated {len(written)} config file{'s' if len(written) != 1 else ''}")
+        elif not errors:
+            self.notify("All targets already in sync", severity="information")
+        self._rebuild_list()
+
+    def action_toggle_enabled(self) -> None:
+        """Enable or disable the selected server (applied on the next sync)."""
+        if not self._selected_server:
+            self.notify("No server selected", severity="warning")
+            return
+        server = self._selected_server
+        server.enabled = not server.enabled
+        self.app.mcp_manager.save_servers(self.app.mcp_servers)
+        state = "enabled" if server.enabled else "disabled"
+        self.notify(f"{server.id} {state}; press [y] to sync")
+        self._rebuild_list()
+
+    def action_check(self) -> None:
+        """Re-run the health check on every enabled server."""
+        self.notify("Checking MCP servers...")
+        self.run_worker(self._check_health(force=True), group="health", exclusive=True)
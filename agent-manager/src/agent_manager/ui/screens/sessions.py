@@ -0,0 +1,181 @@
+"""Sessions screen for browsing Claude Code session logs."""
+
+import asyncio
+
+from textual.app import ComposeResult
+from textual.screen import Screen
+from textual.widgets import Header, Footer, Input, ListView
+from textual.containers import Horizontal, Vertical
+
+from agent_manager.core.session_manager import PAGE_SIZE, SessionTailer
+from agent_manager.models import AgentSession
+from agent_manager.ui.widgets.item_list import SessionListItem
+from agent_manager.ui.widgets.preview_pane import PreviewPane
+
+# Log entries shown in the preview
+PREVIEW_ENTRIES = 12
+
+
+class SessionsScreen(Screen):
+    """Page through indexed sessions, most recently active first."""
+
+    BINDINGS = [
+        ("j", "cursor_down", "Down"),
+        ("k", "cursor_up", "Up"),
+        ("right_square_bracket", "next_page", "Next Page"),
+        ("left_square_bracket", "prev_page", "Prev Page"),
+        ("slash", "focus_search", "Search"),
+    ]
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._filter_text = ""
+        self._offset = 0
+        self._total = 0
+        self._sessions: list[AgentSession] = []
+        self._tailer: SessionTailer | None = None
+
+    def compose(self) -> ComposeResult:
+        """Compose the sessions screen."""
+        yield Header()
+        yield Input(placeholder="Search sessions by project or prompt... (press /)", id="search-input")
+
+        with Horizontal(id="main-content"):
+            with Vertical(id="list-container"):
+                yield ListView(id="session-list")
+
+            yield PreviewPane(id="preview-pane")
+
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Called when screen is mounted."""
+        self.app.sub_title = "Sessions"
+        self.query_one("#session-list", ListView).focus()
+        self.run_worker(self._load(), exclusive=True)
+
+    async def _load(self) -> None:
+        """Show the indexed page right away, index new log lines, then follow running sessions."""
+        await self._load_page()
+        stats = await asyncio.to_thread(self.app.session_manager.update_index)
+        if stats.updated or stats.removed or not self._sessions:
+            await self._load_page()
+
+        self._tailer = SessionTailer(self.app.session_manager)
+        self.run_worker(self._tailer.run(), group="tail", exclusive=True)
+        self.run_worker(self._apply_updates(), group="tail-updates", exclusive=True)
+
+    async def _apply_updates(self) -> None:
+        """Apply live updates from the tailer to the rows on screen."""
+        while True:
+            self._apply_update(await self._tailer.updates.get())
+
+    def _apply_update(self, session: AgentSession) -> None:
+        """Refresh a session's row (and preview) in place, or reload to show a new session."""
+        list_view = self.query_one("#session-list", ListView)
+        for i, item in enumerate(list_view.children):
+            if isinstance(item, SessionListItem) and item.session.path == session.path:
+                # Updated in place rather than re-sorted, so the cursor stays put
+                self._sessions[i] = session
+                item.update_session(session)
+                if list_view.index == i:
+                    self._show(session)
+                return
+        # Sessions off this page are picked up when it is loaded; new ones go on top
+        if self._offset == 0 and not self._filter_text:
+            self.run_worker(self._load_page(), group="page", exclusive=True)
+
+    async def _load_page(self) -> None:
+        """Query the current page off the UI thread."""
+        manager = self.app.session_manager
+        query, offset = self._filter_text, self._offset
+
+        def load() -> tuple[int, list[AgentSession]]:
+            return manager.count(query), manager.list_sessions(offset, PAGE_SIZE, query)
+
+        self._total, self._sessions = await asyncio.to_thread(load)
+        self._rebuild_list()
+
+    def _rebuild_list(self) -> None:
+        """Rebuild the list from the loaded page."""
+        list_view = self.query_one("#session-list", ListView)
+        previous = list_view.index
+        list_view.clear()
+
+        if self._total:
+            last = min(self._offset + PAGE_SIZE, self._total)
+            self.app.sub_title = f"Sessions {self._offset + 1}-{last} of {self._total}"
+        else:
+            self.app.sub_title = "Sessions"
+
+        if not self._sessions:
+            preview = self.query_one("#preview-pane", PreviewPane)
+            if self._filter_text:
+                preview.show_message("No sessions match your search")
+            else:
+                preview.show_message(
+                    f"No sessions found\n\nLooking in `{self.app.session_manager.projects_dir}`"
+                )
+            return
+
+        for session in self._sessions:
+            list_view.append(SessionListItem(session))
+
+        # Sessions arrive after mount, so start at the top
+        list_view.index = min(previous or 0, len(self._sessions) - 1)
+        self._show(self._sessions[list_view.index])
+
+    def _show(self, session: AgentSession) -> None:
+        self.query_one("#preview-pane", PreviewPane).show_session(session)
+        self.run_worker(self._show_entries(session), group="preview", exclusive=True)
+
+    async def _show_entries(self, session: AgentSession) -> None:
+        """Read the last lines of the session through the index."""
+        entries = await asyncio.to_thread(
+            self.app.session_manager.read_lines, session, -PREVIEW_ENTRIES, PREVIEW_ENTRIES
+        )
+        self.query_one("#preview-pane", PreviewPane).show_session(session, entries)
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Handle list item highlight (cursor movement)."""
+        if isinstance(event.item, SessionListItem):
+            self._show(event.item.session)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Handle search input changes."""
+        if event.input.id == "search-input":
+            self._filter_text = event.value
+            self._offset = 0
+            self.run_worker(self._load_page(), group="page", exclusive=True)
+
+    def action_cursor_down(self) -> None:
+        """Move cursor down in the list."""
+        self.query_one("#session-list", ListView).action_cursor_down()
+
+    def action_cursor_up(self) -> None:
+        """Move cursor up in the list."""
+        self.query_one("#session-list", ListView).action_cursor_up()
+
+    def action_next_page(self) -> None:
+        """Show the next page of sessions."""
+        if self._offset + PAGE_SIZE < self._total:
+            self._offset += PAGE_SIZE
+            self.run_worker(self._load_page(), group="page", exclusive=True)
+
+    def action_prev_page(self) -> None:
+        """Show the previous page of sessions."""
+        if self._offset:
+            self._offset = max(self._offset - PAGE_SIZE, 0)
+            self.run_worker(self._load_page(), group="page", exclusive=True)
+
+    def action_focus_search(self) -> None:
+        """Focus the search input."""
+        self.query_one("#search-input", Input).focus()
+
+    def on_key(self, event) -> None:
+        """Handle key events for search clearing."""
+        search = self.query_one("#search-input", Input)
+        if event.key == "escape" and search.has_focus and self._filter_text:
+            search.value = ""
+            self.query_one("#session-list", ListView).focus()
+            event.stop()
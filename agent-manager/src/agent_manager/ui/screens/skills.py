@@ -5,6 +5,7 @@ from textual.screen import Screen
 from textual.widgets import Header, Footer, Input, ListView
 from textual.containers import Horizontal, Vertical
 
+from agent_manager.core.query import filter_by_text, sort_by_tokens
 from agent_manager.models import Skill
 from agent_manager.ui.widgets.item_list import SkillListItem
 from agent_manager.ui.widgets.preview_pane import PreviewPane
@@ -19,11 +20,15 @@ class SkillsScreen(Screen):
         ("g", "link_global", "Link Global"),
         ("u", "unlink", "Unlink"),
         ("slash", "focus_search", "Search"),
+        ("f", "toggle_prompt_search", "Prompt Search"),
+        ("t", "toggle_token_sort", "Sort by Tokens"),
     ]
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._filter_text = ""
+        self._prompt_search = False
+        self._sort_by_tokens = False
         self._selected_skill: Skill | None = None
 
     def compose(self) -> ComposeResult:
@@ -51,14 +56,9 @@ class SkillsScreen(Screen):
         list_view = self.query_one("#skill-list", ListView)
         list_view.clear()
 
-        skills = self.app.skills
-        if self._filter_text:
-            filter_lower = self._filter_text.lower()
-            skills = [
-                s for s in skills
-                if filter_lower in s.metadata.name.lower()
-                or filter_lower in s.metadata.description.lower()
-            ]
+        skills = self._filtered_skills()
+        if self._sort_by_tokens:
+            skills = sort_by_tokens(skills)
 
         if not skills:
             # Show empty state
@@ -78,6 +78,21 @@ class SkillsScreen(Screen):
         if skills and list_view.index is not None:
             self._update_preview_for_index(list_view.index)
 
+    def _filtered_skills(self) -> list[Skill]:
+        """Apply the search box; prompt search mode ranks by content."""
+        if not (self._prompt_search and self._filter_text):
+            return filter_by_text(self.app.skills, self._filter_text)
+        results = self.app.search_content(self._filter_text, "skill")
+        if results is None:
+            return filter_by_text(self.app.skills, self._filter_text)
+        by_path = {s.source_path: s for s in self.app.skills}
+        return [by_path[r.source_path] for r in results if r.source_path in by_path]
+
+    @property
+    def _snippet_query(self) -> str | None:
+        """Query to highlight in the preview, in prompt search mode."""
+        return self._filter_text if self._prompt_search and self._filter_text else None
+
     def _update_preview_for_index(self, index: int) -> None:
         """Update preview pane for the given list index."""
         list_view = self.query_one("#skill-list", ListView)
@@ -86,21 +101,21 @@ class SkillsScreen(Screen):
             if isinstance(item, SkillListItem):
                 self._selected_skill = item.skill
                 preview = self.query_one("#preview-pane", PreviewPane)
-                preview.show_skill(item.skill)
+                preview.show_skill(item.skill, query=self._snippet_query)
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle list item selection."""
         if isinstance(event.item, SkillListItem):
             self._selected_skill = event.item.skill
             preview = self.query_one("#preview-pane", PreviewPane)
-            preview.show_skill(event.item.skill)
+            preview.show_skill(event.item.skill, query=self._snippet_query)
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         """Handle list item highlight (cursor movement)."""
         if isinstance(event.item, SkillListItem):
             self._selected_skill = event.item.skill
             preview = self.query_one("#preview-pane", PreviewPane)
-            preview.show_skill(event.item.skill)
+            preview.show_skill(event.item.skill, query=self._snippet_query)
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
@@ -118,6 +133,27 @@ class SkillsScreen(Screen):
         list_view = self.query_one("#skill-list", ListView)
         list_view.action_cursor_up()
 
+    def action_toggle_prompt_search(self) -> None:
+        """Switch the search box between name/description and prompt search."""
+        self._prompt_search = not self._prompt_search
+        search = self.query_one("#search-input", Input)
+        if self._prompt_search:
+            search.placeholder = "Search skill content... (press /)"
+            if self.app.search_index is None:
+                self.notify(
+                    "Search index is still building; matching names and descriptions for now",
+                    severity="warning",
+                )
+        else:
+            search.placeholder = "Search skills... (press /)"
+        self._rebuild_list()
+
+    def action_toggle_token_sort(self) -> None:
+        """Switch between the default order and most tokens first."""
+        self._sort_by_tokens = not self._sort_by_tokens
+        self.notify("Sorted by tokens" if self._sort_by_tokens else "Default order")
+        self._rebuild_list()
+
     def action_focus_search(self) -> None:
         """Focus the search input."""
         search = self.query_one("#search-input", Input)
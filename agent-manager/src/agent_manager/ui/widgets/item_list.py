@@ -1,19 +1,23 @@
-"""List item widgets for agents, skills, and MCP servers."""
+"""List item widgets for agents, skills, MCP servers and sessions."""
 
 from textual.app import ComposeResult
 from textual.widgets import ListItem, Static
 from textual.containers import Horizontal
 
+from agent_manager.core.tokens import format_token_estimate
 from agent_manager.models import Agent, Skill, LinkScope
-from agent_manager.models.mcp_server import MCPServer, SyncStatus
+from agent_manager.models.mcp_server import HealthStatus, MCPServer, SyncStatus
+from agent_manager.models.session import AgentSession, SessionStatus, format_tokens
 
 
 class AgentListItem(ListItem):
     """A single agent entry in the list."""
 
-    def __init__(self, agent: Agent, **kwargs) -> None:
+    def __init__(self, agent: Agent, copies: list[Agent] | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self.agent = agent
+        # Identical copies of this agent (including itself) shown as one row
+        self.copies = copies or [agent]
 
     def compose(self) -> ComposeResult:
         """Compose the agent list item."""
@@ -24,7 +28,10 @@ class AgentListItem(ListItem):
         with Horizontal(classes="item-row"):
             yield Static(f"●", classes=f"item-color-dot {color_class}")
             yield Static(self.agent.metadata.name, classes="item-name")
+            yield Static(format_token_estimate(self.agent.tokens), classes="item-tokens")
             yield Static(self.agent.metadata.model, classes="item-model")
+            if len(self.copies) > 1:
+                yield Static(f"×{len(self.copies)}", classes="badge badge-copies")
             if badge_text:
                 yield Static(badge_text, classes=f"badge {badge_class}")
 
@@ -53,6 +60,7 @@ class SkillListItem(ListItem):
         with Horizontal(classes="item-row"):
             yield Static("◆", classes="item-color-dot color-purple")
             yield Static(self.skill.metadata.name, classes="item-name")
+            yield Static(format_token_estimate(self.skill.tokens), classes="item-tokens")
             yield Static(f"{len(self.skill.scripts)} scripts", classes="item-model")
             if badge_text:
                 yield Static(badge_text, classes=f"badge {badge_class}")
@@ -87,6 +95,9 @@ class MCPServerListItem(ListItem):
             yield Static(dot, classes=f"item-color-dot {dot_class}")
             yield Static(self.server.id, classes="item-name")
             yield Static(self.server.transport, classes="item-model")
+            health_text, health_class = self._get_health_badge()
+            if health_text:
+                yield Static(health_text, classes=f"badge {health_class}")
             if badge_text:
                 yield Static(badge_text, classes=f"badge {badge_class}")
 
@@ -102,3 +113,46 @@ class MCPServerListItem(ListItem):
             return "DISABLED", "badge-disabled"
         else:
             return "", ""
+
+    def _get_health_badge(self) -> tuple[str, str]:
+        """Get badge text and class from the last health check."""
+        health = self.server.health
+        if health is None or health.status is HealthStatus.SKIPPED:
+            return "", ""
+        if health.status is HealthStatus.OK:
+            return f"UP {health.latency_ms:.0f}ms", "badge-healthy"
+        if health.status is HealthStatus.TIMEOUT:
+            return "TIMEOUT", "badge-unhealthy"
+        return "DOWN", "badge-unhealthy"
+
+
+class SessionListItem(ListItem):
+    """A single Claude Code session entry in the list."""
+
+    STATUS_CLASSES = {
+        SessionStatus.ACTIVE: "color-green",
+        SessionStatus.IDLE: "color-yellow",
+        SessionStatus.ENDED: "color-gray",
+    }
+
+    def __init__(self, session: AgentSession, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.session = session
+
+    def update_session(self, session: AgentSession) -> None:
+        """Show a newer snapshot of the session."""
+        self.session = session
+        self.refresh(recompose=True)
+
+    def compose(self) -> ComposeResult:
+        """Compose the session list item."""
+        session = self.session
+        when = session.last_activity.strftime("%Y-%m-%d %H:%M") if session.last_activity else "-"
+
+        with Horizontal(classes="item-row"):
+            yield Static("●", classes=f"item-color-dot {self.STATUS_CLASSES[session.status]}")
+            yield Static(session.display_name, classes="item-name")
+            yield Static(session.project.rstrip("/").rsplit("/", 1)[-1], classes="item-model")
+            yield Static(when, classes="item-model")
+            if session.total_tokens:
+                yield Static(format_tokens(session.total_tokens), classes="badge badge-tokens")
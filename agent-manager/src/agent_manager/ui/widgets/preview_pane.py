@@ -1,13 +1,20 @@
 """Preview pane widget for viewing agent/skill content."""
 
+from datetime import datetime
 from pathlib import Path
 
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.widgets import Static, Markdown
 
+from agent_manager.core.agent_usage import AgentUsage, USAGE_WINDOWS, format_latency
+from agent_manager.core.mcp_bench import BenchRun
+from agent_manager.core.mcp_tools import ServerTools
+from agent_manager.core.search_index import snippet
+from agent_manager.core.tokens import format_token_estimate
 from agent_manager.models import Agent, Skill
-from agent_manager.models.mcp_server import MCPServer, SyncStatus, TARGETS
+from agent_manager.models.mcp_server import HealthStatus, MCPServer, SyncStatus, TARGETS
+from agent_manager.models.session import AgentSession, format_tokens
 
 
 def _shorten_path(path: Path) -> str:
@@ -18,6 +25,108 @@ def _shorten_path(path: Path) -> str:
         return str(path)
 
 
+def _format_match(text: str, query: str | None) -> str:
+    """Format the best-matching snippet of text as a markdown section."""
+    if not query:
+        return ""
+    match = snippet(text, query)
+    if match is None:
+        return ""
+
+    parts, last = [], 0
+    for start, end in match.spans:
+        parts.append(match.text[last:start])
+        parts.append(f"**{match.text[start:end]}**")
+        last = end
+    parts.append(match.text[last:])
+    return f"\n## Match\n\n> {''.join(parts)}\n"
+
+
+def _format_copies(copies: list[Agent] | None) -> str:
+    """List the locations of identical copies as a markdown section."""
+    if not copies or len(copies) < 2:
+        return ""
+    paths = "\n".join(f"- `{_shorten_path(a.source_path)}`" for a in copies)
+    return f"\n## Identical Copies ({len(copies)})\n\n{paths}\n"
+
+
+def _format_relatives(relatives: list[tuple[Agent, float]] | None) -> str:
+    """List near-duplicate agents with their similarity as a markdown section."""
+    if not relatives:
+        return ""
+    rows = "\n".join(
+        f"- {score:.0%} **{a.metadata.name}** `{_shorten_path(a.source_path)}`"
+        for a, score in relatives
+    )
+    return f"\n## Similar Agents\n\n{rows}\n"
+
+
+def _format_missing_tools(missing: list[str] | None) -> str:
+    """List MCP tools no configured server provides as a markdown section."""
+    if not missing:
+        return ""
+    rows = "\n".join(f"- ⚠ `{name}`" for name in missing)
+    return f"\n## Missing MCP Tools\n\n{rows}\n"
+
+
+def _entry_text(entry: dict) -> str:
+    """Get the readable text of a session log entry, with tool calls summarized."""
+    message = entry.get("message")
+    if not isinstance(message, dict):
+        return entry.get("summary", "") if entry.get("type") == "summary" else ""
+    content = message.get("content")
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content if isinstance(content, list) else []:
+        if not isinstance(block, dict):
+            continue
+        if block.get("type") == "text":
+            parts.append(block.get("text", ""))
+        elif block.get("type") == "tool_use":
+            parts.append(f"[{block.get('name')}]")
+        elif block.get("type") == "tool_result":
+            parts.append("[tool result]")
+    return " ".join(parts)
+
+
+def _format_transcript(entries: list[dict]) -> str:
+    """Format the last entries of a session log as a markdown list."""
+    rows = []
+    for entry in entries:
+        text = " ".join(_entry_text(entry).split())
+        if not text:
+            continue
+        role = entry.get("type", "?")
+        rows.append(f"- **{role}:** {text[:200]}{'...' if len(text) > 200 else ''}")
+    return "\n".join(rows) or "(no messages)"
+
+
+def _format_usage(usage: dict[int, AgentUsage] | None) -> str:
+    """Summarize subagent calls per rolling window as a markdown section."""
+    if usage is None:
+        return ""
+    if not usage:
+        return f"\n## Usage\n\nNot called as a subagent in the last {USAGE_WINDOWS[-1]} days\n"
+
+    rows = ["| Window | Calls | Tokens | Mean | p50 | p95 |", "|---|---:|---:|---:|---:|---:|"]
+    for days in USAGE_WINDOWS:
+        u = usage.get(days)
+        label = "Today" if days == 1 else f"{days} days"
+        if u is None:
+            rows.append(f"| {label} | 0 | - | - | - | - |")
+            continue
+        mean = f"{u.mean_ms / 1000:.1f}s" if u.mean_ms is not None else "-"
+        rows.append(
+            f"| {label} | {u.calls} | {format_tokens(u.tokens)} | {mean} "
+            f"| {format_latency(u.percentile_ms(0.5))} | {format_latency(u.percentile_ms(0.95))} |"
+        )
+    last_used = next((u.last_used for u in usage.values() if u.last_used), None)
+    if last_used:
+        rows.append(f"\n_Last used {datetime.fromtimestamp(last_used).strftime('%Y-%m-%d %H:%M')}_")
+    return "\n## Usage\n\n" + "\n".join(rows) + "\n"
+
+
 class PreviewPane(VerticalScroll):
     """Preview agent/skill content with markdown rendering."""
 
@@ -30,8 +139,16 @@ class PreviewPane(VerticalScroll):
         )
         yield Markdown("", id="preview-content")
 
-    def show_agent(self, agent: Agent) -> None:
-        """Update preview with agent details."""
+    def show_agent(
+        self,
+        agent: Agent,
+        query: str | None = None,
+        copies: list[Agent] | None = None,
+        relatives: list[tuple[Agent, float]] | None = None,
+        missing_tools: list[str] | None = None,
+        usage: dict[int, AgentUsage] | None = None,
+    ) -> None:
+        """Update preview with agent details, a search match, copies, relatives, missing MCP tools and usage."""
         placeholder = self.query_one("#preview-placeholder", Static)
         content = self.query_one("#preview-content", Markdown)
 
@@ -47,6 +164,7 @@ class PreviewPane(VerticalScroll):
 
 **Model:** `{agent.metadata.model}`
 **Color:** {agent.metadata.color}
+**Tokens:** {format_token_estimate(agent.tokens)} (estimated)
 **Source:** `{source_display}`
 
 {link_info}
@@ -54,7 +172,7 @@ class PreviewPane(VerticalScroll):
 ## Description
 
 {agent.metadata.description[:300]}{"..." if len(agent.metadata.description) > 300 else ""}
-
+{_format_match(agent.prompt, query)}{_format_copies(copies)}{_format_relatives(relatives)}{_format_missing_tools(missing_tools)}{_format_usage(usage)}
 ## System Prompt
 
 ```
@@ -63,8 +181,8 @@ class PreviewPane(VerticalScroll):
 """
         content.update(md)
 
-    def show_skill(self, skill: Skill) -> None:
-        """Update preview with skill details."""
+    def show_skill(self, skill: Skill, query: str | None = None) -> None:
+        """Update preview with skill details, and the best match for ``query``."""
         placeholder = self.query_one("#preview-placeholder", Static)
         content = self.query_one("#preview-content", Markdown)
 
@@ -78,6 +196,7 @@ class PreviewPane(VerticalScroll):
 
         md = f"""# {skill.metadata.name}
 
+**Tokens:** {format_token_estimate(skill.tokens)} (estimated)
 **Source:** `{source_display}`
 
 {link_info}
@@ -85,7 +204,7 @@ class PreviewPane(VerticalScroll):
 ## Description
 
 {skill.metadata.description}
-
+{_format_match(skill.content, query)}
 ## Scripts
 
 {scripts_list}
@@ -134,8 +253,54 @@ class PreviewPane(VerticalScroll):
             return f"**Status:** 🟡 {status} ({projects} project{'s' if projects > 1 else ''})"
         return "**Status:** ⚪ UNLINKED"
 
-    def show_mcp_server(self, server: MCPServer) -> None:
-        """Update preview with MCP server details."""
+    def show_session(self, session: AgentSession, entries: list[dict] | None = None) -> None:
+        """Update preview with session details and its last log entries."""
+        placeholder = self.query_one("#preview-placeholder", Static)
+        content = self.query_one("#preview-content", Markdown)
+
+        placeholder.display = False
+        content.display = True
+
+        def when(value: datetime | None) -> str:
+            return value.strftime("%Y-%m-%d %H:%M:%S") if value else "-"
+
+        minutes = session.duration_seconds / 60
+        agents = ", ".join(f"`{a}`" for a in session.agents) or "(none)"
+        md = f"""# {session.display_name}
+
+**Session:** `{session.session_id}`
+**Project:** `{session.project}`
+**Branch:** {session.git_branch or "-"}
+**Model:** `{session.model or "-"}`
+**Status:** {session.status.value.title()}
+**Started:** {when(session.started_at)}
+**Last activity:** {when(session.last_activity)} ({minutes:.0f} min)
+
+## Tokens
+
+- **Input:** {format_tokens(session.input_tokens)}
+- **Output:** {format_tokens(session.output_tokens)}
+- **Cache read:** {format_tokens(session.cache_read_tokens)}
+- **Cache write:** {format_tokens(session.cache_creation_tokens)}
+
+## Subagents
+
+{agents}
+
+## Recent Messages ({session.message_count} total)
+
+{_format_transcript(entries or [])}
+"""
+        content.update(md)
+
+    def show_mcp_server(
+        self,
+        server: MCPServer,
+        tools: ServerTools | None = None,
+        bench: BenchRun | None = None,
+        regressions: list[str] | None = None,
+    ) -> None:
+        """Update preview with MCP server details, its cataloged tools and last benchmark."""
         placeholder = self.query_one("#preview-placeholder", Static)
         content = self.query_one("#preview-content", Markdown)
 
@@ -171,6 +336,18 @@ class PreviewPane(VerticalScroll):
 
 {sync_status}
 
+## Health
+
+{self._format_mcp_health(server)}
+
+## Startup
+
+{self._format_mcp_bench(bench, regressions)}
+
+## Tools
+
+{self._format_mcp_tools(tools)}
+
 ## Arguments
 
 ```
@@ -189,6 +366,60 @@ class PreviewPane(VerticalScroll):
 """
         content.update(md)
 
+    def _format_mcp_bench(self, bench: BenchRun | None, regressions: list[str] | None) -> str:
+        """Format the last benchmark run with budget and regression warnings."""
+        if bench is None:
+            return "Not benchmarked (run `agent-manager mcp bench`)"
+        lines = []
+        over = bench.over_budget()
+        for mode in ("cold", "warm"):
+            if not getattr(bench, mode):
+                continue
+            summary = bench.summary(mode)
+            startup = summary["tools_ms"] or summary["init_ms"]
+            rss = summary["peak_rss_kb"]
+            text = f"- **{mode.title()}:** "
+            text += f"p50 {startup['p50']:.0f} ms, p95 {startup['p95']:.0f} ms" if startup else "no successful runs"
+            if rss:
+                text += f", peak {rss['max'] / 1024:.1f} MiB"
+            if summary["failures"]:
+                text += f", {summary['failures']} failed"
+            if mode in over:
+                budget = bench.cold_budget_ms if mode == "cold" else bench.budget_ms
+                text += f" ⚠ over {budget:.0f} ms budget"
+            lines.append(text)
+        for regression in regressions or []:
+            lines.append(f"- ⚠ Regression: {regression}")
+        checked = datetime.fromtimestamp(bench.ran_at).strftime("%Y-%m-%d %H:%M")
+        lines.append(f"\n_Benchmarked {checked}_")
+        return "\n".join(lines)
+
+    def _format_mcp_tools(self, tools: ServerTools | None) -> str:
+        """Format a server's cataloged tools with their description sizes."""
+        if tools is None:
+            return "Not listed yet (press [c] to check)"
+        if not tools.tools:
+            return "No tools"
+        lines = [f"- `{t.name}` ({t.description_size} chars)" for t in tools.tools[:30]]
+        if len(tools.tools) > 30:
+            lines.append(f"- ... and {len(tools.tools) - 30} more")
+        return "\n".join(lines)
+
+    def _format_mcp_health(self, server: MCPServer) -> str:
+        """Format the last health check."""
+        health = server.health
+        if health is None:
+            return "Not checked yet"
+        checked = datetime.fromtimestamp(health.checked_at).strftime("%H:%M:%S")
+        if health.status is HealthStatus.OK:
+            return (
+                f"🟢 **Up** in {health.latency_ms:.0f} ms, "
+                f"{health.tool_count} tool{'s' if health.tool_count != 1 else ''} (checked {checked})"
+            )
+        if health.status is HealthStatus.SKIPPED:
+            return f"⚪ {health.error}"
+        return f"🔴 **{health.status.value.title()}**: {health.error} (checked {checked})"
+
     def _format_mcp_sync_status(self, server: MCPServer) -> str:
         """Format MCP sync status as a grid."""
         if not server.synced_to:
@@ -0,0 +1,62 @@
+"""Minimal stdio MCP server for tests.
+
+Usage: python fake_mcp_server.py [--tools N] [--page-size N] [--delay SECONDS]
+                                 [--hang] [--fail] [--noise]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+
+def main() -> None:
+    """Answer initialize and tools/list until stdin closes."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tools", type=int, default=3)
+    parser.add_argument("--page-size", type=int, default=0)
+    parser.add_argument("--delay", type=float, default=0.0, help="Sleep before answering initialize")
+    parser.add_argument("--hang", action="store_true", help="Never answer")
+    parser.add_argument("--fail", action="store_true", help="Exit with an error on startup")
+    parser.add_argument("--noise", action="store_true", help="Print log lines on stdout")
+    args = parser.parse_args()
+
+    if args.fail:
+        print("fatal: missing API key", file=sys.stderr)
+        sys.exit(3)
+    if args.noise:
+        print("starting fake server...", flush=True)
+
+    tools = [
+        {"name": f"tool_{i}", "description": f"Tool {i}", "inputSchema": {"type": "object"}}
+        for i in range(args.tools)
+    ]
+    page_size = args.page_size or len(tools) or 1
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        method = message.get("method")
+        if "id" not in message or args.hang:
+            continue
+        if method == "initialize":
+            time.sleep(args.delay)
+            result = {
+                "protocolVersion": message["params"]["protocolVersion"],
+                "capabilities": {"tools": {}} if args.tools else {},
+                "serverInfo": {"name": "fake", "version": "1.0"},
+            }
+        elif method == "tools/list":
+            start = int(message["params"].get("cursor") or 0)
+            result = {"tools": tools[start:start + page_size]}
+            if start + page_size < len(tools):
+                result["nextCursor"] = str(start + page_size)
+        else:
+            response = {"jsonrpc": "2.0", "id": message["id"],
+                        "error": {"code": -32601, "message": f"Unknown method {method}"}}
+            print(json.dumps(response), flush=True)
+            continue
+        print(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Tests for reconciling project assignments."""
+
+from pathlib import Path
+
+from agent_manager.core.assignments import AssignmentReconciler
+from agent_manager.core.symlink_manager import LinkResult
+from agent_manager.models import Agent, AgentMetadata, ProjectAssignment, Skill, SkillMetadata
+
+
+def make_catalog(root: Path) -> tuple[list[Agent], list[Skill]]:
+    """Create two agent files and a skill directory under ``root``."""
+    agents = []
+    for name in ("reviewer", "planner"):
+        path = root / "agents" / f"{name}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"---\nname: {name}\n---\n")
+        agents.append(Agent(
+            metadata=AgentMetadata(name=name, description="", model="opus"),
+            prompt="",
+            source_path=path,
+            source_repo=root,
+        ))
+    skill_dir = root / "skills" / "deploy"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("---\nname: deploy\n---\n")
+    skill = Skill(
+        metadata=SkillMetadata(name="deploy", description=""),
+        content="",
+        source_path=skill_dir / "SKILL.md",
+        source_dir=skill_dir,
+        source_repo=root,
+    )
+    return agents, [skill]
+
+
+async def test_sync_links_relinks_prunes_and_is_idempotent(tmp_path):
+    """Test the first sync, a changed assignment, conflicts and a no-op rerun."""
+    agents, skills = make_catalog(tmp_path / "lib")
+    projects = [tmp_path / f"p{i}" for i in range(3)]
+    for project in projects:
+        project.mkdir()
+    assignments = [ProjectAssignment(p, ["reviewer", "ghost"], ["deploy"]) for p in projects]
+    reconciler = AssignmentReconciler(agents, skills)
+
+    plans = await reconciler.sync(assignments)
+    assert [len(p.changes) for p in plans] == [2, 2, 2]
+    assert all(a.result is LinkResult.SUCCESS for p in plans for a in p.actions)
+    assert plans[0].missing == ["ghost"]
+    link = projects[0] / ".claude" / "agents" / "reviewer.md"
+    assert link.resolve() == agents[0].source_path
+
+    # A hand-made link elsewhere and a regular file are left alone
+    agents_dir = projects[1] / ".claude" / "agents"
+    (agents_dir / "mine.md").symlink_to(tmp_path / "elsewhere.md")
+    (agents_dir / "planner.md").write_text("local")
+    # A stale link to another catalog item is replaced
+    (projects[2] / ".claude" / "agents" / "reviewer.md").unlink()
+    (projects[2] / ".claude" / "agents" / "reviewer.md").symlink_to(agents[1].source_path)
+
+    assignments[0].agent_names = ["planner"]
+    assignments[1].agent_names = ["reviewer", "planner"]
+    plans = await reconciler.sync(assignments)
+    assert [(a.kind, a.target.name) for a in plans[0].actions] == [
+        ("link", "planner.md"), ("unlink", "reviewer.md"),
+    ]
+    assert [(a.kind, a.target.name) for a in plans[1].actions] == [("skip", "planner.md")]
+    assert [a.kind for a in plans[2].actions] == ["relink"]
+    assert (agents_dir / "mine.md").is_symlink() and (agents_dir / "planner.md").read_text() == "local"
+
+    plans = await reconciler.sync(assignments)
+    assert [len(p.changes) for p in plans] == [0, 0, 0]
+    assert [p.unchanged for p in plans] == [2, 2, 2]
+
+
+def test_plan_merges_projects_and_respects_no_prune(tmp_path):
+    """Test that duplicate entries merge and no-prune keeps unassigned catalog links."""
+    agents, skills = make_catalog(tmp_path / "lib")
+    project = tmp_path / "app"
+    (project / ".claude" / "agents").mkdir(parents=True)
+    (project / ".claude" / "agents" / "planner.md").symlink_to(agents[1].source_path)
+    assignments = [ProjectAssignment(project, ["reviewer"]), ProjectAssignment(project, [], ["deploy"])]
+
+    (plan,) = AssignmentReconciler(agents, skills, prune=False).plan(assignments)
+    assert [a.kind for a in plan.actions] == ["link", "link"]
+    (plan,) = AssignmentReconciler(agents, skills).plan(assignments)
+    assert [a.kind for a in plan.actions] == ["link", "unlink", "link"]
@@ -0,0 +1,51 @@
+"""Tests for the benchmark tree generator and result comparison."""
+
+import asyncio
+
+from agent_manager.core.scanner import AgentSkillScanner
+from benchmarks.compare import compare
+from benchmarks.tree import TreeSpec, generate_tree
+
+
+def test_generated_tree_matches_scan(tmp_path):
+    """Test scanner finds exactly the generated agents and skills."""
+    spec = TreeSpec(depth=2, fanout=2, project_density=1.0, prompt_words=10)
+    tree = generate_tree(tmp_path, spec)
+
+    result = asyncio.run(AgentSkillScanner().scan_all([tree.root]))
+
+    assert tree.agents == 4 * spec.agents_per_project
+    assert len(result.agents) == tree.agents
+    assert len(result.skills) == tree.skills
+    assert not result.errors
+
+
+def test_generate_tree_is_deterministic(tmp_path):
+    """Test the same seed produces the same tree."""
+    spec = TreeSpec(depth=2, fanout=3, prompt_words=10)
+    first = generate_tree(tmp_path / "a", spec)
+    second = generate_tree(tmp_path / "b", spec)
+
+    assert (first.agents, first.skills, first.links) == (second.agents, second.skills, second.links)
+
+
+def test_compare_flags_regressions():
+    """Test only slowdowns above threshold and noise floor are regressions."""
+    baseline = {"benchmarks": {"a": {"median": 10.0}, "b": {"median": 10.0}, "c": {"median": 0.01}}}
+    current = {"benchmarks": {"a": {"median": 10.5}, "b": {"median": 13.0}, "c": {"median": 0.05}}}
+
+    result = {c.name: c.regressed for c in compare(baseline, current, threshold=0.10)}
+
+    assert result == {"a": False, "b": True, "c": False}
+
+
+def test_tui_harness_records_actions():
+    """Test the Pilot harness times every scripted action."""
+    from benchmarks.tui import run
+
+    results = run(agents=5, skills=2, search="re", hold_j=2, switches=1)
+
+    assert results["benchmarks"]["cursor_down"]["runs"] == 2
+    assert results["benchmarks"]["search_keystroke"]["runs"] == 2
+    assert {"open_agents", "switch_skills", "switch_dashboard"} <= set(results["benchmarks"])
+    assert results["widgets"]["agents"] > results["widgets"]["dashboard"]
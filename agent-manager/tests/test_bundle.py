@@ -0,0 +1,106 @@
+"""Tests for portable agent/skill bundles."""
+
+import zipfile
+
+import pytest
+
+from agent_manager.core.bundle import pack, read_manifest, unpack
+from agent_manager.core.scanner import AgentSkillScanner
+from agent_manager.core.symlink_manager import LinkResult, SymlinkManager
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repo with an agent and a skill with a script."""
+    repo = tmp_path / "repo"
+    (repo / "agents").mkdir(parents=True)
+    (repo / "agents" / "reviewer.md").write_text("---\nname: reviewer\nmodel: opus\n---\n\nReview.")
+    skill_dir = repo / "skills" / "notes"
+    (skill_dir / "scripts").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("---\nname: notes\n---\n\nTake notes.")
+    (skill_dir / "scripts" / "run.sh").write_text("echo hi")
+    return repo
+
+
+def _pack(repo, output):
+    result = AgentSkillScanner()._collect(repo)
+    return pack(output, result.agents, result.skills)
+
+
+def test_pack_writes_manifest_with_metadata(repo, tmp_path):
+    """Test the manifest lists item hashes, files and precomputed metadata."""
+    bundle = tmp_path / "bundle.zip"
+    _pack(repo, bundle)
+
+    manifest = read_manifest(bundle)
+    agent, skill = sorted(manifest.items, key=lambda i: i.kind)
+
+    assert agent.metadata["model"] == "opus"
+    assert list(agent.files) == ["reviewer.md"]
+    assert sorted(skill.files) == ["notes/SKILL.md", "notes/scripts/run.sh"]
+    with zipfile.ZipFile(bundle) as archive:
+        assert len([n for n in archive.namelist() if n.startswith("objects/")]) == 3
+
+
+def test_failed_pack_leaves_no_temp_file(repo, tmp_path, monkeypatch):
+    """Test that a pack failing mid-write keeps the old bundle and cleans up."""
+    out = tmp_path / "out"
+    out.mkdir()
+    bundle = out / "bundle.zip"
+    _pack(repo, bundle)
+    assert bundle.stat().st_mode & 0o777 == 0o644
+    before = bundle.read_bytes()
+
+    def fail(self, name, data, *args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(zipfile.ZipFile, "writestr", fail)
+    with pytest.raises(OSError):
+        _pack(repo, bundle)
+
+    assert bundle.read_bytes() == before
+    assert [p.name for p in out.iterdir()] == ["bundle.zip"]
+
+
+def test_unpack_is_idempotent_and_upgrades_links(repo, tmp_path):
+    """Test unpacking stores each version once and relinks to the newest."""
+    store = tmp_path / "store"
+    manager = SymlinkManager(claude_dir=tmp_path / "claude")
+    v1 = tmp_path / "v1.zip"
+    _pack(repo, v1)
+
+    first = unpack(v1, store, manager)
+    again = unpack(v1, store, manager)
+
+    assert [r.stored for r in first] == [True, True]
+    assert [r.stored for r in again] == [False, False]
+    assert [r.link for r in again] == [LinkResult.ALREADY_EXISTS] * 2
+    link = tmp_path / "claude" / "agents" / "reviewer.md"
+    assert link.read_text().endswith("Review.")
+    assert (tmp_path / "claude" / "skills" / "notes" / "scripts" / "run.sh").exists()
+
+    (repo / "agents" / "reviewer.md").write_text("---\nname: reviewer\n---\n\nReview twice.")
+    v2 = tmp_path / "v2.zip"
+    _pack(repo, v2)
+    results = unpack(v2, store, manager)
+
+    # Only the changed agent is new; the skill directory is shared
+    assert [r.stored for r in results] == [True, False]
+    assert results[0].link == LinkResult.SUCCESS
+    assert link.read_text().endswith("Review twice.")
+    assert len(list(store.iterdir())) == 3
+
+
+def test_unpack_rejects_corrupt_objects(repo, tmp_path):
+    """Test objects are verified against their hash."""
+    bundle = tmp_path / "bundle.zip"
+    manifest = _pack(repo, bundle)
+    blob = manifest.items[0].files["reviewer.md"]
+    corrupt = tmp_path / "corrupt.zip"
+    with zipfile.ZipFile(bundle) as src, zipfile.ZipFile(corrupt, "w") as dst:
+        for name in src.namelist():
+            dst.writestr(name, b"tampered" if name == f"objects/{blob}" else src.read(name))
+
+    with pytest.raises(ValueError, match="Corrupt object"):
+        unpack(corrupt, tmp_path / "store", link=False)
+    assert list((tmp_path / "store").iterdir()) == []
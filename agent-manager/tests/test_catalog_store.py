@@ -0,0 +1,159 @@
+"""Tests for the SQLite catalog store."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from agent_manager.core.catalog_store import CatalogStore
+from agent_manager.core.scanner import AgentSkillScanner
+
+
+def _write_agent(path: Path, name: str, model: str = "sonnet", body: str = "Prompt.") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"""---
+name: {name}
+description: Agent {name}
+model: {model}
+tags: [sre, {name}]
+---
+
+{body}""")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repo with two agents and one skill."""
+    repo = tmp_path / "repo"
+    _write_agent(repo / "agents" / "alpha.md", "alpha", model="opus", body="Handles kubernetes incidents.")
+    _write_agent(repo / "agents" / "beta.md", "beta")
+    skill_dir = repo / "skills" / "notes"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("""---
+name: notes
+description: Take notes
+---
+
+Write markdown notes to the vault.""")
+    return repo.resolve()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Open a catalog database in a temp directory."""
+    with CatalogStore(tmp_path / "catalog.db") as store:
+        yield store
+
+
+def _ingest(store: CatalogStore, root: Path):
+    return store.ingest(root, AgentSkillScanner().iter_path(root))
+
+
+def test_ingest_and_load(store, repo):
+    """Test scanned items round-trip through the database."""
+    result = _ingest(store, repo)
+
+    assert result.written == 3
+    agents = store.load_agents()
+    assert [a.metadata.name for a in agents] == ["alpha", "beta"]
+    assert agents[0].metadata.tags == ["sre", "alpha"]
+    assert agents[0].prompt == "Handles kubernetes incidents."
+    assert agents[0].tokens == 6
+    assert [(s.metadata.name, s.tokens) for s in store.load_skills()] == [("notes", 7)]
+    (root,) = store.roots()
+    assert (root.path, root.agent_count, root.skill_count) == (repo, 2, 1)
+
+
+def test_wal_mode(store):
+    """Test the database uses write-ahead logging."""
+    (mode,) = store._conn.execute("PRAGMA journal_mode").fetchone()
+    assert mode == "wal"
+
+
+def test_indexed_lookups(store, repo):
+    """Test lookups by model, tag, name and repo."""
+    _ingest(store, repo)
+
+    assert [a.metadata.name for a in store.load_agents(model="opus")] == ["alpha"]
+    assert [a.metadata.name for a in store.load_agents(tag="beta")] == ["beta"]
+    assert len(store.load_agents(tag="sre", repo=repo)) == 2
+    assert store.load_skills(name="missing") == []
+
+
+def test_rescan_is_incremental(store, repo):
+    """Test unchanged files are skipped and deleted files are removed."""
+    _ingest(store, repo)
+
+    agent_file = repo / "agents" / "beta.md"
+    _write_agent(agent_file, "beta", body="Now about kubernetes too.")
+    os.utime(agent_file, ns=(1, 1))
+    (repo / "agents" / "alpha.md").unlink()
+
+    result = _ingest(store, repo)
+
+    assert (result.written, result.unchanged, result.removed) == (1, 1, 1)
+    assert [a.metadata.name for a in store.load_agents()] == ["beta"]
+    assert [h.name for h in store.search("kubernetes")] == ["beta"]
+
+
+def test_search_ranks_agents_and_skills(store, repo):
+    """Test full-text search over prompts and skill content."""
+    _ingest(store, repo)
+
+    assert [(h.kind, h.name) for h in store.search("kubernetes")] == [("agent", "alpha")]
+    assert [(h.kind, h.name) for h in store.search("vault")] == [("skill", "notes")]
+    assert store.search("vault", kind="agent") == []
+    assert [h.name for h in store.search("kubernetes OR vault", kind="skill")] == ["notes"]
+    with pytest.raises(ValueError):
+        store.search('"unterminated')
+
+
+def test_links_and_validation_results(store, repo, tmp_path):
+    """Test global links and scan errors are stored per root."""
+    scanner = AgentSkillScanner()
+    link = tmp_path / "claude" / "agents" / "alpha.md"
+
+    def events():
+        for kind, item in scanner.iter_path(repo):
+            if kind == "agent" and item.metadata.name == "alpha":
+                item.global_link = link
+            yield kind, item
+        yield "error", (repo / "agents" / "broken.md", "Invalid frontmatter")
+
+    store.ingest(repo, events())
+
+    alpha = store.load_agents(name="alpha")[0]
+    assert alpha.global_link == link
+    assert store.validation_results() == [(repo / "agents" / "broken.md", "Invalid frontmatter")]
+
+    store.remove_root(repo)
+    assert store.load_agents() == []
+    assert store.validation_results() == []
+
+
+def test_stale_roots(store, repo, tmp_path):
+    """Test that edits, additions and deletions mark a root stale until it is rescanned."""
+    other = tmp_path / "other"
+    other.mkdir()
+    _ingest(store, repo)
+    assert store.stale_roots([repo, other]) == [other]
+
+    def changed(mutate) -> bool:
+        mutate()
+        stale = store.stale_roots([repo]) == [repo]
+        _ingest(store, repo)
+        assert store.stale_roots([repo]) == []
+        return stale
+
+    alpha = repo / "agents" / "alpha.md"
+    assert changed(lambda: alpha.write_text(alpha.read_text() + "\nMore."))
+    assert changed(lambda: _write_agent(repo / "agents" / "gamma.md", "gamma"))
+    assert changed(lambda: (repo / "agents" / "beta.md").unlink())
+    assert changed(lambda: (repo / "skills" / "todo").mkdir())
+
+
+def test_lookups_ignore_case(store, repo):
+    """Test that indexed name, model and tag lookups are case-insensitive."""
+    _ingest(store, repo)
+    assert [a.metadata.name for a in store.load_agents(model="OPUS", tag="SRE")] == ["alpha"]
+    assert [s.metadata.name for s in store.load_skills(name="Notes")] == ["notes"]
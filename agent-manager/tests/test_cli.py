@@ -0,0 +1,494 @@
+"""Tests for CLI commands."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from agent_manager.cli import app_cli
+
+
+@pytest.fixture
+def runner():
+    """Create a CLI runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Create a repo with one agent and one skill, and an isolated home."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+
+    repo = tmp_path / "repo"
+    (repo / "agents").mkdir(parents=True)
+    (repo / "agents" / "test-agent.md").write_text("""---
+name: test-agent
+description: A test agent
+model: opus
+tags: [sre]
+---
+
+Agent prompt.""")
+    skill_dir = repo / "skills" / "test-skill"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("""---
+name: test-skill
+description: A test skill
+---
+
+Skill content.""")
+    return repo
+
+
+def _configure(repo: Path) -> None:
+    """Write a config with ``repo`` as the only scan path."""
+    config_dir = Path.home() / ".config" / "agent-manager"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.json").write_text(
+        json.dumps({"scan_paths": [{"path": str(repo)}]})
+    )
+
+
+def test_scan_json(runner, repo):
+    """Test scan --json output."""
+    result = runner.invoke(app_cli, ["scan", str(repo), "--json"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert [a["name"] for a in data["agents"]] == ["test-agent"]
+    assert [s["name"] for s in data["skills"]] == ["test-skill"]
+
+
+def test_scan_ndjson(runner, repo, tmp_path):
+    """Test scan --ndjson emits one compact object per line."""
+    result = runner.invoke(
+        app_cli, ["scan", str(repo), str(tmp_path / "missing"), "--ndjson"]
+    )
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    records = [json.loads(line) for line in lines]
+    assert sorted(r["type"] for r in records) == ["agent", "error", "skill"]
+    assert all(": " not in line for line in lines)
+
+
+def test_list_agents_ndjson(runner, repo):
+    """Test list-agents --ndjson streams agents only."""
+    _configure(repo)
+    result = runner.invoke(app_cli, ["list-agents", "--ndjson", "--no-daemon"])
+    assert result.exit_code == 0
+    [record] = [json.loads(line) for line in result.output.splitlines()]
+    assert record["name"] == "test-agent"
+
+
+def test_scan_fields_and_filter(runner, repo):
+    """Test --fields projection and --filter pushdown."""
+    result = runner.invoke(
+        app_cli,
+        ["scan", str(repo), "--json", "--fields", "name,model", "--filter", "tag=sre,name=test-*"],
+    )
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["agents"] == [{"name": "test-agent", "model": "opus"}]
+    # Skills have no tags, so only the name condition applies to them
+    assert [s["name"] for s in data["skills"]] == ["test-skill"]
+
+    result = runner.invoke(app_cli, ["scan", str(repo), "--json", "--filter", "name=other"])
+    data = json.loads(result.output)
+    assert (data["agents"], data["skills"]) == ([], [])
+
+
+def test_scan_unknown_field(runner, repo):
+    """Test that unknown fields are rejected."""
+    result = runner.invoke(app_cli, ["scan", str(repo), "--json", "--fields", "nope"])
+    assert result.exit_code != 0
+
+
+def test_catalog_update_and_list(runner, repo, monkeypatch):
+    """Test list-agents reads the catalog, refreshed for changed roots, with filters in SQL."""
+    from agent_manager.core.catalog_store import CatalogStore
+
+    _configure(repo)
+    assert runner.invoke(app_cli, ["catalog", "enable"]).exit_code == 0
+
+    result = runner.invoke(app_cli, ["catalog", "update"])
+    assert result.exit_code == 0
+    assert "2 written" in result.output
+
+    loads = []
+    load_agents = CatalogStore.load_agents
+    monkeypatch.setattr(
+        CatalogStore, "load_agents",
+        lambda self, **kw: loads.append(kw) or load_agents(self, **kw),
+    )
+    result = runner.invoke(
+        app_cli, ["list-agents", "--json", "--no-daemon", "--filter", "model=OPUS,tag=s*"]
+    )
+    assert [a["name"] for a in json.loads(result.output)] == ["test-agent"]
+    assert loads == [{"model": "opus"}]
+
+    # Link state comes from ~/.claude, not from when the item was stored
+    global_agents = Path.home() / ".claude" / "agents"
+    global_agents.mkdir(parents=True)
+    (global_agents / "test-agent.md").symlink_to(repo / "agents" / "test-agent.md")
+    result = runner.invoke(app_cli, ["list-agents", "--json", "--fields", "name,link_status"])
+    assert json.loads(result.output) == [{"name": "test-agent", "link_status": "global"}]
+    result = runner.invoke(app_cli, ["list-skills", "--json", "--fields", "name,link_status"])
+    assert json.loads(result.output) == [{"name": "test-skill", "link_status": "unlinked"}]
+
+    # Added and deleted files are picked up before the catalog is served
+    (repo / "agents" / "other.md").write_text(
+        "---\nname: other\ndescription: Other\nmodel: haiku\n---\n\nPrompt."
+    )
+    (repo / "agents" / "test-agent.md").unlink()
+    result = runner.invoke(app_cli, ["list-agents", "--json", "--no-daemon"])
+    assert [a["name"] for a in json.loads(result.output)] == ["other"]
+    assert len(loads) == 3
+
+
+def test_search_builds_index_and_shows_snippets(runner, repo, monkeypatch):
+    """Test search ranks prompt matches and prints snippets."""
+    from agent_manager.core.scanner import AgentSkillScanner
+
+    _configure(repo)
+    scans = []
+    iter_path = AgentSkillScanner.iter_path
+    monkeypatch.setattr(
+        AgentSkillScanner, "iter_path",
+        lambda self, root, **kw: scans.append(root) or iter_path(self, root, **kw),
+    )
+
+    result = runner.invoke(app_cli, ["search", "prompt", "--json"])
+
+    assert result.exit_code == 0
+    (hit,) = json.loads(result.output)
+    assert (hit["kind"], hit["name"]) == ("agent", "test-agent")
+    assert hit["snippet"] == "Agent prompt."
+    assert scans == [repo.resolve()]
+
+    # Unchanged roots are not read again
+    assert len(json.loads(runner.invoke(app_cli, ["search", "prompt", "--json"]).output)) == 1
+    assert len(scans) == 1
+
+    # Roots whose files changed are rescanned before searching
+    (repo / "agents" / "test-agent.md").unlink()
+    (repo / "agents" / "infra.md").write_text(
+        "---\nname: infra\ndescription: Infra\nmodel: opus\n---\n\nRun the terraform plan."
+    )
+    assert json.loads(runner.invoke(app_cli, ["search", "prompt", "--json"]).output) == []
+    (hit,) = json.loads(runner.invoke(app_cli, ["search", "terraform", "--json"]).output)
+    assert hit["name"] == "infra"
+    assert len(scans) == 2
+
+
+def test_search_uses_catalog(runner, repo, monkeypatch):
+    """Test search queries the catalog's full-text tables when it is enabled."""
+    from agent_manager.core.search_index import SearchIndex
+
+    _configure(repo)
+    runner.invoke(app_cli, ["catalog", "enable"])
+    runner.invoke(app_cli, ["catalog", "update"])
+    monkeypatch.setattr(SearchIndex, "load", None)
+
+    result = runner.invoke(app_cli, ["search", "agent prompt", "--json"])
+
+    assert result.exit_code == 0
+    (hit,) = json.loads(result.output)
+    assert (hit["kind"], hit["name"], hit["snippet"]) == ("agent", "test-agent", "Agent prompt.")
+    result = runner.invoke(app_cli, ["search", "test", "--json"])
+    assert len(json.loads(result.output)) == 2
+    result = runner.invoke(app_cli, ["search", "test", "--kind", "skill", "--json"])
+    assert [h["name"] for h in json.loads(result.output)] == ["test-skill"]
+
+
+def test_duplicates_lists_divergent_copies(runner, repo, tmp_path):
+    """Test duplicates reports copies of the same name with different content."""
+    fork = tmp_path / "fork" / ".claude" / "agents" / "test-agent.md"
+    fork.parent.mkdir(parents=True)
+    fork.write_text((repo / "agents" / "test-agent.md").read_text() + "\nExtra rule.")
+    config_dir = Path.home() / ".config" / "agent-manager"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.json").write_text(json.dumps({
+        "scan_paths": [{"path": str(repo)}, {"path": str(tmp_path / "fork")}],
+    }))
+
+    result = runner.invoke(app_cli, ["duplicates", "--json", "--identical"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert len(data["divergent"]["test-agent"]) == 2
+    assert data["identical"] == []
+
+
+def test_similar_clusters_forked_prompts(runner, repo, tmp_path):
+    """Test similar groups agents whose prompts differ by a small edit."""
+    prompt = " ".join(f"Rule {i}: check the {w} first." for i, w in enumerate(["tests", "docs", "types", "logs"]))
+    for repo, name, body in [("a", "reviewer", prompt), ("b", "my-reviewer", prompt + " Be terse.")]:
+        path = tmp_path / repo / ".claude" / "agents" / f"{name}.md"
+        path.parent.mkdir(parents=True)
+        path.write_text(f"---\nname: {name}\ndescription: Reviews\n---\n\n{body}\n")
+    config_dir = Path.home() / ".config" / "agent-manager"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.json").write_text(json.dumps({
+        "scan_paths": [{"path": str(tmp_path / "a")}, {"path": str(tmp_path / "b")}],
+    }))
+
+    result = runner.invoke(app_cli, ["similar", "--json"])
+
+    assert result.exit_code == 0
+    (cluster,) = json.loads(result.output)
+    assert {v["name"] for v in cluster["variants"]} == {"reviewer", "my-reviewer"}
+
+
+def test_pack_and_unpack(runner, repo, tmp_path):
+    """Test a packed bundle installs into the store and links globally."""
+    config_dir = Path.home() / ".config" / "agent-manager"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.json").write_text(json.dumps({"scan_paths": [{"path": str(repo)}]}))
+    bundle = tmp_path / "bundle.zip"
+
+    assert runner.invoke(app_cli, ["pack", str(bundle)]).exit_code != 0
+    result = runner.invoke(app_cli, ["pack", str(bundle), "--all"])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(app_cli, ["unpack", str(bundle), "--json"])
+
+    assert result.exit_code == 0, result.output
+    installed = {r["name"]: r for r in json.loads(result.output)}
+    assert installed["test-agent"]["link"] == "success"
+    assert (Path.home() / ".claude" / "agents" / "test-agent.md").is_symlink()
+    assert Path(installed["test-skill"]["path"]).is_relative_to(
+        Path.home() / ".local" / "share" / "agent-manager" / "store"
+    )
+
+
+def test_install_dry_run_and_status(runner, repo):
+    """Test install --dry-run changes nothing and status reflects a real install."""
+    source = str(repo / "agents")
+
+    result = runner.invoke(app_cli, ["install", "--source", source, "--dry-run"])
+    assert result.exit_code == 0
+    assert "Would change 1 of 1" in result.output
+    assert not (Path.home() / ".claude" / "agents").exists()
+
+    assert runner.invoke(app_cli, ["install", "all", "--source", source]).exit_code == 0
+    result = runner.invoke(app_cli, ["status", "--source", source, "--json"])
+
+    assert [s["state"] for s in json.loads(result.output)] == ["installed"]
+    assert runner.invoke(app_cli, ["install", "nope", "--source", source]).exit_code == 1
+
+    result = runner.invoke(app_cli, ["uninstall", "all", "--source", source, "--yes"])
+    assert "Changed 1 of 1" in result.output
+    assert not (Path.home() / ".claude" / "agents" / "test-agent.md").exists()
+
+
+def test_mcp_add_sync_and_remove(runner, repo):
+    """Test adding an MCP server, syncing it out and removing it again."""
+    result = runner.invoke(
+        app_cli, ["mcp", "add", "fs", "-t", "cursor", "-e", "ROOT=/tmp", "--", "npx", "-y", "fs"]
+    )
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(app_cli, ["mcp", "sync", "--dry-run"])
+    assert result.exit_code == 0 and "would write" in result.output
+    cursor = Path.home() / ".cursor" / "mcp.json"
+    assert not cursor.exists()
+
+    assert runner.invoke(app_cli, ["mcp", "sync"]).exit_code == 0
+    assert json.loads(cursor.read_text())["mcpServers"]["fs"]["args"] == ["-y", "fs"]
+    listed = json.loads(runner.invoke(app_cli, ["mcp", "list", "--json"]).output)
+    assert listed[0]["synced_to"]["cursor"] is True
+
+    assert runner.invoke(app_cli, ["mcp", "remove", "fs"]).exit_code == 0
+    assert json.loads(cursor.read_text())["mcpServers"] == {}
+
+
+def test_mcp_check(runner, repo):
+    """Test mcp check reports healthy and failing servers and exits non-zero."""
+    fake = str(Path(__file__).parent / "fake_mcp_server.py")
+    runner.invoke(app_cli, ["mcp", "add", "ok", "--", sys.executable, fake, "--tools", "2"])
+    runner.invoke(app_cli, ["mcp", "add", "bad", "--", sys.executable, fake, "--fail"])
+
+    result = runner.invoke(app_cli, ["mcp", "check", "--json"])
+
+    assert result.exit_code == 1
+    checks = {c["id"]: c for c in json.loads(result.output)}
+    assert checks["ok"]["status"] == "ok" and checks["ok"]["tool_count"] == 2
+    assert checks["bad"]["status"] == "failed"
+    assert runner.invoke(app_cli, ["mcp", "check", "ok"]).exit_code == 0
+
+
+def test_mcp_tools_and_missing(runner, repo):
+    """Test listing a server's tools and flagging agents that need absent ones."""
+    (repo / "agents" / "needs-tools.md").write_text(
+        "---\nname: needs-tools\ndescription: x\nmodel: opus\n"
+        "tools: Read, mcp__fake__tool_0, mcp__fake__tool_9\n---\n\nPrompt."
+    )
+    _configure(repo)
+    fake = str(Path(__file__).parent / "fake_mcp_server.py")
+    runner.invoke(app_cli, ["mcp", "add", "fake", "--", sys.executable, fake, "--tools", "2"])
+
+    result = runner.invoke(app_cli, ["mcp", "tools", "--json"])
+    assert result.exit_code == 0, result.output
+    assert [t["name"] for t in json.loads(result.output)["fake"]] == ["tool_0", "tool_1"]
+    result = runner.invoke(app_cli, ["mcp", "tools", "fake", "nope"])
+    assert result.exit_code == 1
+    assert "MCP server not found: nope" in result.output
+
+    result = runner.invoke(app_cli, ["mcp", "missing", "--json"])
+    assert json.loads(result.output) == {"needs-tools": ["mcp__fake__tool_9"]}
+
+
+def test_sessions_list_and_show(runner, repo):
+    """Test indexing, listing and showing Claude Code sessions."""
+    project = Path.home() / ".claude" / "projects" / "-work-app"
+    project.mkdir(parents=True)
+    (project / "abc123.jsonl").write_text(json.dumps({
+        "type": "user", "timestamp": "2025-03-01T10:00:00Z", "cwd": "/work/app",
+        "message": {"role": "user", "content": "Add a login page"},
+    }) + "\n")
+
+    result = runner.invoke(app_cli, ["sessions", "list", "--json"])
+    assert result.exit_code == 0, result.output
+    (session,) = json.loads(result.output)
+    assert (session["title"], session["project"]) == ("Add a login page", "/work/app")
+
+    result = runner.invoke(app_cli, ["sessions", "show", "abc"])
+    assert result.exit_code == 0 and "Add a login page" in result.output
+    assert runner.invoke(app_cli, ["sessions", "show", "zzz"]).exit_code == 1
+
+
+def test_usage_export(runner, repo):
+    """Test exporting per-agent usage as JSON and CSV, with unused catalog agents."""
+    _configure(repo)
+    project = Path.home() / ".claude" / "projects" / "-work-app"
+    project.mkdir(parents=True)
+    (project / "s.jsonl").write_text(json.dumps({
+        "type": "assistant", "timestamp": "2025-01-01T00:00:00Z",
+        "message": {"id": "msg_1", "content": [{
+            "type": "tool_use", "id": "toolu_1", "name": "Task",
+            "input": {"subagent_type": "reviewer"},
+        }]},
+    }) + "\n")
+
+    result = runner.invoke(app_cli, ["usage", "--days", "36500", "--unused", "--json"])
+    assert result.exit_code == 0, result.output
+    rows = {r["agent"]: r["calls"] for r in json.loads(result.output)["agents"]}
+    assert rows == {"reviewer": 1, "test-agent": 0}
+
+    result = runner.invoke(app_cli, ["usage", "--days", "36500", "--csv"])
+    assert result.output.splitlines()[1].startswith("reviewer,1,0,0,")
+
+
+def test_stats_context_cost(runner, repo):
+    """Test per-project context cost with a global link and a project agent."""
+    _configure(repo)
+    project_agents = repo / "app" / ".claude" / "agents"
+    project_agents.mkdir(parents=True)
+    (project_agents / "local.md").write_text("---\nname: local\n---\n\nReview the code")
+    global_agents = Path.home() / ".claude" / "agents"
+    global_agents.mkdir(parents=True)
+    (global_agents / "test-agent.md").symlink_to(repo / "agents" / "test-agent.md")
+    linked = repo.parent / "linked"
+    linked.mkdir()
+    assert runner.invoke(app_cli, ["link", "test-agent", "--scope", str(linked)]).exit_code == 0
+
+    result = runner.invoke(app_cli, ["stats", "--json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert (data["agents"], data["skills"], data["catalog_tokens"]) == (2, 1, 9)
+    assert data["global"]["agents"] == {"test-agent": 3}
+    project, assigned = data["projects"]
+    assert project["project"] == str((repo / "app").resolve())
+    assert (project["agent_tokens"], project["total_tokens"]) == (3, 6)
+    # The linked agent is found by listing the assigned project
+    assert assigned["project"] == str(linked.resolve())
+    assert (assigned["agents"], assigned["total_tokens"]) == ({"test-agent": 3}, 3)
+    assert (Path.home() / ".config" / "agent-manager" / "tokens.json").exists()
+
+
+def test_configured_claude_dir(runner, repo, monkeypatch):
+    """Test that stats and listings read global links from the configured Claude directory."""
+    from agent_manager.models import AppConfig
+
+    _configure(repo)
+    claude_dir = repo.parent / "claude"
+    (claude_dir / "agents").mkdir(parents=True)
+    (claude_dir / "agents" / "test-agent.md").symlink_to(repo / "agents" / "test-agent.md")
+    monkeypatch.setattr(AppConfig, "claude_dir", property(lambda self: claude_dir))
+
+    result = runner.invoke(app_cli, ["stats", "--json"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["global"]["agents"] == {"test-agent": 3}
+
+    result = runner.invoke(app_cli, ["list-agents", "--json", "--fields", "name,link_status"])
+    assert json.loads(result.output) == [{"name": "test-agent", "link_status": "global"}]
+
+
+def test_budget(runner, repo):
+    """Test the budget of a project linking a catalog agent, with the global skill link."""
+    _configure(repo)
+    project = repo.parent / "app"
+    (project / ".claude" / "agents").mkdir(parents=True)
+    (project / ".claude" / "agents" / "test-agent.md").symlink_to(repo / "agents" / "test-agent.md")
+    global_skills = Path.home() / ".claude" / "skills"
+    global_skills.mkdir(parents=True)
+    (global_skills / "test-skill").symlink_to(repo / "skills" / "test-skill")
+
+    result = runner.invoke(app_cli, ["budget", str(project), "--json"])
+    assert result.exit_code == 0, result.output
+    (budget,) = json.loads(result.output)
+    assert [(i["scope"], i["name"]) for i in budget["items"]] == [
+        ("project", "test-agent"), ("global", "test-skill"),
+    ]
+    assert budget["total_tokens"] == 3 + 3 + 3 + 3
+
+    result = runner.invoke(app_cli, ["budget", str(project)])
+    assert "1 from the project, 1 global" in result.output
+
+
+def test_sync_and_link_to_project(runner, repo):
+    """Test that link --scope assigns and links, and sync plans then applies the rest."""
+    _configure(repo)
+    project = repo.parent / "app"
+    project.mkdir()
+
+    result = runner.invoke(app_cli, ["link", "test-agent", "--scope", str(project)])
+    assert result.exit_code == 0, result.output
+    assert (project / ".claude" / "agents" / "test-agent.md").resolve() == repo / "agents" / "test-agent.md"
+    result = runner.invoke(app_cli, ["link", "nope", "--scope", str(project)])
+    assert result.exit_code == 1
+
+    config_path = Path.home() / ".config" / "agent-manager" / "config.json"
+    config = json.loads(config_path.read_text())
+    (assignment,) = config["project_assignments"]
+    assert assignment["agent_names"] == ["test-agent"]
+    assignment["skill_names"] = ["test-skill"]
+    config_path.write_text(json.dumps(config))
+
+    result = runner.invoke(app_cli, ["sync", "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "link      skills/test-skill" in result.output
+    assert "Would change 1 link(s) in 1 of 1 project(s)" in result.output
+    assert not (project / ".claude" / "skills").exists()
+
+    result = runner.invoke(app_cli, ["sync"])
+    assert "Changed 1 link(s)" in result.output
+    assert (project / ".claude" / "skills" / "test-skill").is_symlink()
+    result = runner.invoke(app_cli, ["sync", "--json"])
+    assert [p["unchanged"] for p in json.loads(result.output)] == [2]
+
+
+def test_link_to_project_fails_on_conflict(runner, repo):
+    """Test that link --scope exits non-zero when a file is in the way."""
+    _configure(repo)
+    project = repo.parent / "app"
+    (project / ".claude" / "agents").mkdir(parents=True)
+    (project / ".claude" / "agents" / "test-agent.md").write_text("Hand-written")
+
+    result = runner.invoke(app_cli, ["link", "test-agent", "--scope", str(project)])
+    assert result.exit_code == 1
+    assert "skip      agents/test-agent.md (not a symlink)" in result.output
+    assert (project / ".claude" / "agents" / "test-agent.md").read_text() == "Hand-written"
@@ -0,0 +1,59 @@
+"""Tests for CLI startup cost (``python -X importtime``)."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import budget for `import agent_manager.cli`, in milliseconds.
+# Generous enough for slow CI machines; override with AGENT_MANAGER_IMPORT_BUDGET_MS.
+IMPORT_BUDGET_MS = int(os.environ.get("AGENT_MANAGER_IMPORT_BUDGET_MS", "400"))
+
+# Modules that only the TUI (or validation) needs
+HEAVY_MODULES = ["textual", "pydantic", "jsonschema", "agent_manager.ui", "agent_manager.app"]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Return {module: cumulative_us} for importing ``module`` in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|", 2)
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+@pytest.fixture(scope="module")
+def cli_import_times():
+    """Import times for the CLI module."""
+    return _import_times("agent_manager.cli")
+
+
+@pytest.mark.parametrize("module", HEAVY_MODULES)
+def test_cli_does_not_import_heavy_modules(cli_import_times, module):
+    """Test that importing the CLI does not pull in TUI/validation dependencies."""
+    assert module not in cli_import_times
+
+
+def test_scanner_does_not_import_heavy_modules():
+    """Test that the scanner used by non-TUI commands stays lightweight."""
+    times = _import_times("agent_manager.core.scanner")
+    for module in HEAVY_MODULES:
+        assert module not in times
+
+
+def test_cli_import_within_budget(cli_import_times):
+    """Test that the CLI imports within the startup budget."""
+    cumulative_ms = cli_import_times["agent_manager.cli"] / 1000
+    assert cumulative_ms < IMPORT_BUDGET_MS, (
+        f"agent_manager.cli took {cumulative_ms:.1f}ms to import "
+        f"(budget {IMPORT_BUDGET_MS}ms)"
+    )
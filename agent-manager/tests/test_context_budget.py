@@ -0,0 +1,71 @@
+"""Tests for per-project context budgets."""
+
+import os
+from pathlib import Path
+
+from agent_manager.core.context_budget import BudgetAnalyzer
+from agent_manager.models import Agent, AgentMetadata, Skill, SkillMetadata
+
+
+def _agent(path: Path, tokens: int | None = None) -> Agent:
+    """Write an agent file and return its catalog entry."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nname: {path.stem}\n---\n\nbody")
+    return Agent(
+        metadata=AgentMetadata(name=path.stem, description="Reviews code", model="sonnet"),
+        prompt="Review the code",
+        source_path=path.resolve(),
+        source_repo=path.parent,
+        tokens=tokens,
+    )
+
+
+def test_budget_resolves_links_and_shadowing(tmp_path):
+    """Test project and global entries, shadowed names, catalog counts and files outside it."""
+    lib = tmp_path / "lib"
+    reviewer = _agent(lib / "agents" / "reviewer.md", tokens=1000)
+    planner = _agent(lib / "agents" / "planner.md")
+    skill_dir = lib / "skills" / "notes"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("---\nname: notes\n---\n\nTake notes")
+    notes = Skill(
+        metadata=SkillMetadata(name="notes", description=""),
+        content="Take notes",
+        source_path=skill_dir / "SKILL.md",
+        source_dir=skill_dir.resolve(),
+        source_repo=lib,
+        tokens=300,
+    )
+
+    claude = tmp_path / "claude"
+    (claude / "agents").mkdir(parents=True)
+    (claude / "skills").mkdir()
+    os.symlink(reviewer.source_path, claude / "agents" / "reviewer.md")
+    os.symlink(skill_dir, claude / "skills" / "notes")
+    os.symlink(tmp_path / "gone.md", claude / "agents" / "gone.md")
+
+    project = tmp_path / "app"
+    (project / ".claude" / "agents").mkdir(parents=True)
+    os.symlink(planner.source_path, project / ".claude" / "agents" / "planner.md")
+    # A project copy of the reviewer, outside the catalog, replaces the global one
+    (project / ".claude" / "agents" / "reviewer.md").write_text(
+        "---\nname: reviewer\ndescription: Local reviewer\n---\n\nCheck it"
+    )
+
+    analyzer = BudgetAnalyzer([reviewer, planner], [notes], claude_dir=claude)
+    budget = analyzer.analyze(project)
+
+    items = {(i.scope, i.name): i for i in budget.items}
+    assert set(items) == {("project", "planner"), ("project", "reviewer"), ("global", "notes")}
+    assert items["project", "planner"].body_tokens == 3  # counted from the catalog prompt
+    assert not items["project", "reviewer"].in_catalog
+    assert items["project", "reviewer"].total_tokens == 2 + 2
+    assert [i.name for i in budget.shadowed] == ["reviewer"]
+    assert budget.total_tokens == 3 + 2 + 4 + 300
+    assert [i.name for i in budget.largest(1)] == ["notes"]
+    assert budget.is_large(items["global", "notes"]) and not budget.is_large(items["project", "planner"])
+
+    # Without a .claude directory a project only sees the global items
+    bare = analyzer.analyze(tmp_path / "empty")
+    assert sorted(i.name for i in bare.items) == ["notes", "reviewer"]
+    assert bare.total_tokens == 1000 + 2 + 300
@@ -0,0 +1,154 @@
+"""Tests for the catalog daemon and its socket client."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from agent_manager.core.daemon import CatalogDaemon
+from agent_manager.core.daemon_client import DaemonClient, DaemonError
+from agent_manager.core.symlink_manager import SymlinkManager
+
+AGENT = """---
+name: {name}
+description: {description}
+model: sonnet
+---
+
+Prompt for {name}."""
+
+
+@pytest.fixture
+def daemon_env():
+    """Start a daemon over a temporary tree and yield (client, repo, daemon)."""
+    with TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        repo = base / "repo"
+        agents_dir = repo / "agents"
+        agents_dir.mkdir(parents=True)
+        (agents_dir / "alpha.md").write_text(
+            AGENT.format(name="alpha", description="Reviews SRE changes")
+        )
+        (agents_dir / "beta.md").write_text(
+            AGENT.format(name="beta", description="Organizes notes")
+        )
+
+        socket_path = base / "daemon.sock"
+        daemon = CatalogDaemon(
+            [repo],
+            socket_path=socket_path,
+            symlink_manager=SymlinkManager(claude_dir=base / ".claude"),
+            poll_interval=0.05,
+        )
+        thread = threading.Thread(target=asyncio.run, args=(daemon.serve_forever(),))
+        thread.start()
+
+        client = None
+        deadline = time.monotonic() + 10
+        while client is None and time.monotonic() < deadline:
+            client = DaemonClient.connect(socket_path)
+            time.sleep(0.01)
+        assert client is not None
+
+        try:
+            yield client, repo, daemon
+        finally:
+            client.call("shutdown")
+            client.close()
+            thread.join(timeout=10)
+
+
+def test_list_agents(daemon_env):
+    """Test that the daemon serves the scanned agents."""
+    client, _, _ = daemon_env
+    names = {a["name"] for a in client.call("list_agents")}
+    assert names == {"alpha", "beta"}
+
+
+def test_search(daemon_env):
+    """Test searching by description."""
+    client, _, _ = daemon_env
+    result = client.call("search", query="sre")
+    assert [a["name"] for a in result["agents"]] == ["alpha"]
+
+
+def test_full_text_search(daemon_env):
+    """Test BM25 search follows rescans."""
+    client, repo, _ = daemon_env
+    [hit] = client.call("full_text_search", query="notes organizes")
+    assert (hit["kind"], hit["name"]) == ("agent", "beta")
+    assert hit["source_path"] == str(repo / "agents" / "beta.md")
+
+    (repo / "agents" / "beta.md").unlink()
+    client.call("rescan")
+    assert client.call("full_text_search", query="notes") == []
+    assert client.call("full_text_search", query="alpha", kind="skill") == []
+
+
+def test_link_and_unlink(daemon_env):
+    """Test linking updates the served link status."""
+    client, _, _ = daemon_env
+    assert client.call("link", name="alpha") == {"result": "success"}
+    [status] = client.call("link_status", name="alpha")
+    assert status["link_status"] == "global"
+
+    assert client.call("unlink", name="alpha") == {"removed": True}
+    [status] = client.call("link_status", name="alpha")
+    assert status["link_status"] == "unlinked"
+
+
+def test_watch_picks_up_new_agent(daemon_env):
+    """Test that a new file in a known agents dir is picked up by polling."""
+    client, repo, _ = daemon_env
+    (repo / "agents" / "gamma.md").write_text(
+        AGENT.format(name="gamma", description="New agent")
+    )
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if len(client.call("list_agents")) == 3:
+            break
+        time.sleep(0.05)
+    assert {a["name"] for a in client.call("list_agents")} == {"alpha", "beta", "gamma"}
+
+
+def test_errors(daemon_env):
+    """Test error responses."""
+    client, _, _ = daemon_env
+    with pytest.raises(DaemonError, match="Unknown method"):
+        client.call("nope")
+    with pytest.raises(DaemonError, match="No agent named"):
+        client.call("link", name="missing")
+
+
+def test_connect_without_daemon(tmp_path):
+    """Test that connect returns None when nothing is listening."""
+    assert DaemonClient.connect(tmp_path / "missing.sock") is None
+
+
+def test_watch_survives_rescan_errors(daemon_env):
+    """Test that a failing rescan is reported and retried instead of ending the watch."""
+    client, repo, daemon = daemon_env
+    scan_path = daemon.scanner.scan_path
+    failures = []
+
+    async def flaky(root):
+        if not failures:
+            failures.append(root)
+            raise OSError("disk went away")
+        return await scan_path(root)
+
+    daemon.scanner.scan_path = flaky
+    (repo / "agents" / "gamma.md").write_text(
+        AGENT.format(name="gamma", description="New agent")
+    )
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and len(client.call("list_agents")) != 3:
+        time.sleep(0.05)
+    assert failures
+    assert {a["name"] for a in client.call("list_agents")} == {"alpha", "beta", "gamma"}
+    assert client.call("ping")["watch_error"] is None
@@ -0,0 +1,45 @@
+"""Tests for duplicate grouping."""
+
+from pathlib import Path
+
+from agent_manager.core.duplicates import divergent_copies, group_duplicates
+from agent_manager.models import Agent, AgentMetadata
+
+
+def _agent(name: str, repo: str, content_hash: str | None) -> Agent:
+    return Agent(
+        metadata=AgentMetadata(name=name, description="", model="sonnet"),
+        prompt="",
+        source_path=Path(f"/{repo}/agents/{name}.md"),
+        source_repo=Path(f"/{repo}"),
+        content_hash=content_hash,
+    )
+
+
+def test_group_duplicates_keeps_order():
+    """Test identical hashes group together in first-seen order."""
+    a1, b, a2, x, y = (
+        _agent("a", "r1", "h1"),
+        _agent("b", "r1", "h2"),
+        _agent("a", "r2", "h1"),
+        _agent("x", "r1", None),
+        _agent("y", "r1", None),
+    )
+
+    assert group_duplicates([a1, b, a2, x, y]) == [[a1, a2], [b], [x], [y]]
+
+
+def test_divergent_copies_reports_names_with_several_variants():
+    """Test only names with differing content are reported, largest variant first."""
+    agents = [
+        _agent("sre", "r1", "h1"),
+        _agent("sre", "r2", "h2"),
+        _agent("sre", "r3", "h2"),
+        _agent("docs", "r1", "h3"),
+        _agent("docs", "r2", "h3"),
+    ]
+
+    divergent = divergent_copies(agents)
+
+    assert list(divergent) == ["sre"]
+    assert [[a.source_repo.name for a in g] for g in divergent["sre"]] == [["r2", "r3"], ["r1"]]
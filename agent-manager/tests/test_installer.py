@@ -0,0 +1,59 @@
+"""Tests for batched agent installation."""
+
+import pytest
+
+from agent_manager.core.installer import InstallState, Installer
+from agent_manager.core.symlink_manager import LinkResult, SymlinkManager
+
+
+@pytest.fixture
+def installer(tmp_path):
+    """Create an installer with three source agents and an isolated ~/.claude."""
+    source = tmp_path / "agents"
+    source.mkdir()
+    for name in ("alpha", "beta", "gamma"):
+        (source / f"{name}.md").write_text(f"---\nname: {name}\n---\n")
+    return Installer(source, SymlinkManager(claude_dir=tmp_path / "claude"))
+
+
+def test_status_classifies_every_entry(installer, tmp_path):
+    """Test installed, foreign links, regular files and missing agents."""
+    target = installer.target_dir
+    target.mkdir(parents=True)
+    (target / "alpha.md").symlink_to(installer.source_dir / "alpha.md")
+    (target / "beta.md").symlink_to(tmp_path / "elsewhere.md")
+    (target / "gamma.md").write_text("local copy")
+
+    states = {s.name: s.state for s in installer.status()}
+
+    assert states == {
+        "alpha": InstallState.INSTALLED,
+        "beta": InstallState.OTHER_SOURCE,
+        "gamma": InstallState.REGULAR_FILE,
+    }
+    assert [s.name for s in installer.status(["beta.md", "missing"])] == ["beta"]
+    assert installer.unknown(["alpha", "missing"]) == ["missing"]
+
+
+def test_install_and_uninstall(installer):
+    """Test planning, applying, idempotence and backups."""
+    target = installer.target_dir
+    target.mkdir(parents=True)
+    (target / "gamma.md").write_text("local copy")
+
+    actions = installer.apply(installer.plan_install())
+
+    assert [(a.kind, a.result) for a in actions] == [
+        ("link", LinkResult.SUCCESS),
+        ("link", LinkResult.SUCCESS),
+        ("skip", None),
+    ]
+    assert [a.kind for a in installer.plan_install()] == ["skip", "skip", "skip"]
+
+    installer.apply(installer.plan_install(["gamma"], backup=True))
+    assert (target / "gamma.md").is_symlink()
+    assert len(list(target.glob("gamma.md.backup.*"))) == 1
+
+    actions = installer.apply(installer.plan_uninstall(["alpha"]))
+    assert [(a.kind, a.result) for a in actions] == [("unlink", LinkResult.SUCCESS)]
+    assert {s.name for s in installer.status() if s.state is InstallState.INSTALLED} == {"beta", "gamma"}
@@ -0,0 +1,61 @@
+"""Tests for the MCP server startup benchmark."""
+
+import sys
+from pathlib import Path
+
+from agent_manager.core.mcp_bench import BenchRun, MCPBench, Sample, percentiles, regressions
+from agent_manager.models.mcp_server import MCPServer
+
+FAKE_SERVER = str(Path(__file__).parent / "fake_mcp_server.py")
+
+
+def fake(server_id: str, *args: str) -> MCPServer:
+    """Create a server that runs the fake MCP server with the given flags."""
+    return MCPServer(server_id, command=sys.executable, args=[FAKE_SERVER, *args])
+
+
+def run_with(init_ms: list[float], rss_kb: int = 10_000) -> BenchRun:
+    """Create a run with the given warm initialize times."""
+    return BenchRun("s", "f", 0.0, 2000.0, 10000.0, warm=[
+        Sample(init_ms=t, tools_ms=t + 1, peak_rss_kb=rss_kb) for t in init_ms
+    ])
+
+
+async def test_bench_measures_and_flags_budget(tmp_path):
+    """Test cold and warm samples, budgets, failures and the saved history."""
+    bench = MCPBench(path=tmp_path / "bench.json", runs=3, budget_ms=250, timeout=5)
+    servers = [
+        fake("fast"),
+        fake("slow", "--delay", "0.3"),
+        fake("broken", "--fail"),
+        MCPServer("remote", transport="http", url="https://example.com/mcp"),
+    ]
+
+    results = {r.server_id: r for r in await bench.run_all(servers)}
+
+    assert set(results) == {"fast", "slow", "broken"}
+    fast = results["fast"]
+    assert (len(fast.cold), len(fast.warm)) == (1, 3)
+    warm = fast.summary("warm")
+    assert warm["tools_ms"]["p50"] >= warm["init_ms"]["p50"] > 0
+    if Path("/proc/self/status").exists():
+        assert warm["peak_rss_kb"]["max"] > 1000
+    assert fast.over_budget() == []
+    assert results["slow"].over_budget() == ["warm"]
+    assert results["broken"].summary("warm")["failures"] == 3
+    assert "missing API key" in results["broken"].warm[0].error
+    assert results["broken"].over_budget() == ["cold", "warm"]
+
+    history = MCPBench(path=tmp_path / "bench.json").history("fast")
+    assert [r.to_dict() for r in history] == [fast.to_dict()]
+
+
+def test_regressions_compare_warm_medians():
+    """Test that only slowdowns past the threshold and noise floor are reported."""
+    base = run_with([100, 110, 120])
+
+    assert regressions(base, run_with([120, 125, 130])) == []
+    found = regressions(base, run_with([300, 310, 320], rss_kb=20_000))
+    assert [f.split(" p50")[0] for f in found] == ["initialize", "first tool list", "peak RSS"]
+    assert percentiles([]) is None
+    assert percentiles([5.0])["p95"] == 5.0
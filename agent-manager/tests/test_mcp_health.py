@@ -0,0 +1,90 @@
+"""Tests for MCP server health checks against a fake stdio server."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from agent_manager.core.mcp_health import HealthChecker
+from agent_manager.models.mcp_server import HealthStatus, MCPServer
+
+FAKE_SERVER = str(Path(__file__).parent / "fake_mcp_server.py")
+
+
+def fake(server_id: str, *args: str) -> MCPServer:
+    """Create a server that runs the fake MCP server with the given flags."""
+    return MCPServer(server_id, command=sys.executable, args=[FAKE_SERVER, *args])
+
+
+@pytest.fixture
+def checker(tmp_path):
+    """Create a checker with a short timeout and an isolated cache."""
+    return HealthChecker(cache_path=tmp_path / "health.json", timeout=2.0)
+
+
+async def test_check_records_latency_tools_and_failures(checker):
+    """Test healthy, paginated, noisy, crashing, hanging and missing servers."""
+    servers = [
+        fake("ok", "--tools", "5"),
+        fake("paged", "--tools", "7", "--page-size", "3", "--noise"),
+        fake("no-tools", "--tools", "0"),
+        fake("crash", "--fail"),
+        fake("hang", "--hang"),
+        MCPServer("missing", command="/nonexistent/mcp-server"),
+        MCPServer("remote", transport="http", url="https://example.com/mcp"),
+    ]
+
+    await checker.check_all(servers)
+    results = {s.id: s.health for s in servers}
+
+    assert results["ok"].status is HealthStatus.OK
+    assert results["ok"].tool_count == 5 and results["ok"].latency_ms > 0
+    assert results["paged"].tool_count == 7
+    assert results["no-tools"].tool_count == 0
+    assert results["crash"].status is HealthStatus.FAILED
+    assert "code 3" in results["crash"].error and "missing API key" in results["crash"].error
+    assert results["hang"].status is HealthStatus.TIMEOUT
+    assert results["missing"].status is HealthStatus.FAILED
+    assert results["remote"].status is HealthStatus.SKIPPED
+
+
+async def test_checks_run_concurrently(checker):
+    """Test that the semaphore lets servers start in parallel."""
+    servers = [fake(f"slow-{i}", "--delay", "0.5") for i in range(4)]
+
+    start = time.perf_counter()
+    results = await checker.check_all(servers)
+
+    assert all(r.status is HealthStatus.OK for r in results)
+    assert time.perf_counter() - start < 1.5
+
+
+async def test_results_are_cached_until_ttl_or_launch_change(checker, tmp_path):
+    """Test that fresh results are reused across checkers and invalidated by edits."""
+    server = fake("ok")
+    first = (await checker.check_all([server]))[0]
+
+    again = HealthChecker(cache_path=tmp_path / "health.json")
+    assert (await again.check_all([server]))[0].checked_at == first.checked_at
+
+    server.args.append("--tools=1")
+    assert again.cached(server) is None
+    assert (await again.check_all([server]))[0].tool_count == 1
+
+    expired = HealthChecker(cache_path=tmp_path / "health.json", ttl=0)
+    assert expired.cached(server) is None
+
+
+def test_concurrent_saves_do_not_collide(tmp_path):
+    """Test that checkers saving one cache at once (TUI and CLI) never fail or leave temp files."""
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    checkers = [HealthChecker(cache_path=tmp_path / "health.json") for _ in range(8)]
+    with ThreadPoolExecutor(8) as pool:
+        for future in [pool.submit(c._save_cache) for c in checkers * 25]:
+            future.result()
+
+    assert json.loads((tmp_path / "health.json").read_text()) == {}
+    assert [p.name for p in tmp_path.iterdir()] == ["health.json"]
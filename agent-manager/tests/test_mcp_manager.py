@@ -0,0 +1,120 @@
+"""Tests for syncing MCP servers into client configs."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agent_manager.core import mcp_manager
+from agent_manager.core.mcp_manager import MCPManager
+from agent_manager.models.mcp_server import MCPServer, SyncStatus
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a manager with an isolated home and config directory."""
+    return MCPManager(config_dir=tmp_path / "config", home=tmp_path)
+
+
+def test_json_sync_preserves_formatting_and_foreign_entries(manager, tmp_path):
+    """Test that only managed entries change and the file keeps its style."""
+    path = tmp_path / ".cursor" / "mcp.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps(
+        {"theme": "dark", "mcpServers": {"mine": {"command": "node", "timeout": 5}, "other": {"command": "x"}}},
+        indent=4,
+    ))
+    servers = [MCPServer("mine", command="npx", args=["-y", "pkg"], targets=["cursor"])]
+
+    diffs = {d.target: d for d in manager.sync(servers)}
+
+    assert diffs["cursor"].updated == ["mine"] and diffs["cursor"].written
+    text = path.read_text()
+    assert text.startswith('{\n    "theme"') and not text.endswith("\n")
+    data = json.loads(text)
+    assert data["mcpServers"]["other"] == {"command": "x"}
+    assert data["mcpServers"]["mine"] == {"timeout": 5, "command": "npx", "args": ["-y", "pkg"]}
+    assert servers[0].sync_status is SyncStatus.SYNCED
+    # Targets the server doesn't want are left alone, and not created
+    assert not diffs["claude_code"].changed and not (tmp_path / ".claude.json").exists()
+
+
+def test_toml_splice_keeps_comments(manager, tmp_path):
+    """Test that Codex's TOML is edited in place around the changed tables."""
+    path = tmp_path / ".codex" / "config.toml"
+    path.parent.mkdir()
+    path.write_text(
+        '# my settings\nmodel = "o3"\n\n'
+        '[mcp_servers.fs]\ncommand = "old"\n\n[mcp_servers.fs.env]\nA = "1"\n\n'
+        '# keep me\n[mcp_servers.other]\ncommand = "x"\n'
+    )
+    servers = [
+        MCPServer("fs", command="npx", env={"B": "2"}, targets=["codex"]),
+        MCPServer("my.srv", command="uvx", targets=["codex"]),
+    ]
+
+    manager.sync(servers)
+
+    text = path.read_text()
+    assert text.startswith('# my settings\nmodel = "o3"\n')
+    assert "# keep me\n[mcp_servers.other]" in text
+    assert '[mcp_servers."my.srv"]' in text
+    configs = manager.read_targets()
+    assert configs["codex"].servers == {
+        "fs": {"command": "npx", "args": [], "env": {"B": "2"}},
+        "other": {"command": "x"},
+        "my.srv": {"command": "uvx", "args": []},
+    }
+
+    servers[1].enabled = False
+    manager.sync(servers)
+    assert "my.srv" not in manager.read_targets()["codex"].servers
+    assert "# keep me" in path.read_text()
+
+
+def test_many_servers_one_write_per_file(manager, monkeypatch):
+    """Test that a sync writes each target once, and not at all when unchanged."""
+    servers = [MCPServer(f"srv-{i}", command="run", args=[str(i)]) for i in range(100)]
+    writes = []
+    real_write = mcp_manager.atomic_write
+    monkeypatch.setattr(
+        mcp_manager, "atomic_write", lambda path, text: (writes.append(path), real_write(path, text))
+    )
+
+    manager.sync(servers)
+    assert len(writes) == len(manager.targets) == len(set(writes))
+    assert all(len(c.servers) == 100 for c in manager.read_targets().values())
+
+    writes.clear()
+    diffs = manager.sync(servers)
+    assert writes == [] and not any(d.changed for d in diffs)
+
+
+def test_invalid_target_is_skipped(manager, tmp_path):
+    """Test that a config that can't be parsed is reported, not overwritten."""
+    path = tmp_path / ".cursor" / "mcp.json"
+    path.parent.mkdir()
+    path.write_text("{ not json")
+
+    diffs = {d.target: d for d in manager.sync([MCPServer("a", command="x")])}
+
+    assert diffs["cursor"].error and not diffs["cursor"].written
+    assert path.read_text() == "{ not json"
+    assert diffs["gemini"].written
+
+
+def test_import_servers(manager, tmp_path):
+    """Test adopting entries already present in client configs."""
+    (tmp_path / ".claude.json").write_text(json.dumps(
+        {"mcpServers": {"web": {"type": "http", "url": "https://example.com/mcp"}}}
+    ))
+    gemini = tmp_path / ".gemini" / "settings.json"
+    gemini.parent.mkdir()
+    gemini.write_text(json.dumps({"mcpServers": {"web": {"httpUrl": "https://example.com/mcp"}}}))
+
+    (server,) = manager.import_servers([])
+
+    assert (server.id, server.transport, server.url) == ("web", "http", "https://example.com/mcp")
+    assert server.targets == ["claude_code", "gemini"]
+    manager.refresh_status([server])
+    assert server.sync_status is SyncStatus.SYNCED
@@ -0,0 +1,72 @@
+"""Tests for the MCP tool catalog."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from agent_manager.core.mcp_health import HealthChecker
+from agent_manager.core.mcp_tools import ToolCatalog, mcp_tool_name
+from agent_manager.models import Agent, AgentMetadata
+from agent_manager.models.mcp_server import MCPServer
+
+FAKE_SERVER = str(Path(__file__).parent / "fake_mcp_server.py")
+
+
+def make_agent(tools) -> Agent:
+    """Create an agent whose frontmatter lists ``tools``."""
+    return Agent(
+        metadata=AgentMetadata(name="a", description="", model="sonnet", tools=tools),
+        prompt="",
+        source_path=Path("/repo/agents/a.md"),
+        source_repo=Path("/repo"),
+    )
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """Create a catalog in a temporary file."""
+    return ToolCatalog(tmp_path / "tools.json")
+
+
+async def test_health_check_fills_catalog(catalog, tmp_path):
+    """Test that checks record tools by launch fingerprint and persist them."""
+    server = MCPServer("fake", command=sys.executable, args=[FAKE_SERVER, "--tools", "4"])
+    checker = HealthChecker(cache_path=tmp_path / "health.json", catalog=catalog)
+
+    assert catalog.stale([server]) == [server]
+    await checker.check_all([server])
+
+    reloaded = ToolCatalog(catalog.path)
+    entry = reloaded.get(server)
+    assert entry.names == {"tool_0", "tool_1", "tool_2", "tool_3"}
+    assert entry.tools[0].description_size == len("Tool 0")
+    assert entry.tools[0].input_schema == {"type": "object"}
+    assert reloaded.stale([server]) == []
+
+    # Renaming keeps the tools; changing the launch command doesn't
+    assert reloaded.get(MCPServer("renamed", command=server.command, args=server.args)) is entry
+    server.args.append("--noise")
+    assert reloaded.get(server) is None
+    reloaded.prune([server])
+    assert reloaded._load() == {}
+
+
+def test_missing_tools(catalog):
+    """Test cross-referencing agent tools with configured servers."""
+    github = MCPServer("github", command="gh-mcp")
+    docs = MCPServer("my.docs", command="docs-mcp")
+    off = MCPServer("off", command="off-mcp", enabled=False)
+    catalog.record(github, [{"name": "create_issue"}, {"name": "list_prs"}])
+    agent = make_agent(
+        "Read, mcp__github__create_issue, mcp__github__merge, mcp__my_docs__search,"
+        " mcp__off__x, mcp__slack, mcp__github__*"
+    )
+
+    missing = catalog.missing_tools(agent, [github, docs, off])
+
+    # my.docs hasn't been listed yet, so its tools can't be judged
+    assert missing == ["mcp__github__merge", "mcp__off__x", "mcp__slack"]
+    assert mcp_tool_name("my.docs", "search") == "mcp__my_docs__search"
+    assert catalog.missing_tools(make_agent(["Read", "Grep"]), []) == []
+    assert catalog.missing_tools(make_agent(None), [github]) == []
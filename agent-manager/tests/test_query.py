@@ -0,0 +1,82 @@
+"""Tests for query filters and field projection."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_manager.core.query import ScanFilter, parse_fields
+from agent_manager.models import Agent, AgentMetadata, SkillMetadata
+
+
+@pytest.fixture
+def agent():
+    """Create an agent with tags."""
+    return Agent(
+        metadata=AgentMetadata(
+            name="sre-code-reviewer",
+            description="Reviews code",
+            model="opus",
+            tags=["sre", "review"],
+        ),
+        prompt="You are a reviewer.",
+        source_path=Path("/repo/agents/sre-code-reviewer.md"),
+        source_repo=Path("/repo"),
+    )
+
+
+def test_parse_fields():
+    """Test parsing a field list."""
+    assert parse_fields("name, model,,source_path") == ["name", "model", "source_path"]
+    assert parse_fields(None) is None
+
+
+def test_filter_matches(agent):
+    """Test that all keys must match and list fields match any element."""
+    assert ScanFilter.parse("model=opus,tag=sre").matches(agent.metadata)
+    assert ScanFilter.parse("model=OPUS,tag=review").matches(agent.metadata)
+    assert not ScanFilter.parse("model=sonnet,tag=sre").matches(agent.metadata)
+
+
+def test_filter_repeated_key_is_or(agent):
+    """Test that repeated keys match if any value does."""
+    assert ScanFilter.parse("model=sonnet,model=opus").matches(agent.metadata)
+
+
+def test_filter_glob(agent):
+    """Test shell-style patterns."""
+    assert ScanFilter.parse("name=sre-*").matches(agent.metadata)
+    assert not ScanFilter.parse("name=obsidian-*").matches(agent.metadata)
+
+
+def test_filter_ignores_fields_of_other_kinds(agent):
+    """Test that agent-only fields don't exclude skills, but other fields still apply."""
+    skill = SkillMetadata(name="sre-runbook", description="Runbook")
+    assert ScanFilter.parse("model=opus,tag=sre").matches(skill)
+    assert not ScanFilter.parse("model=opus,name=obsidian-*").matches(skill)
+    assert not ScanFilter.parse("version=1.*").matches(agent.metadata)
+
+
+def test_filter_invalid():
+    """Test errors for malformed terms and unknown keys."""
+    assert ScanFilter.parse("") is None
+    with pytest.raises(ValueError, match="expected key=value"):
+        ScanFilter.parse("model")
+    with pytest.raises(ValueError, match="Unknown filter key"):
+        ScanFilter.parse("colour=blue")
+
+
+def test_to_dict_projection(agent, monkeypatch):
+    """Test that only requested fields are computed."""
+    monkeypatch.setattr(
+        Agent, "link_status", property(lambda self: pytest.fail("link_status computed"))
+    )
+    assert agent.to_dict(["name", "prompt"]) == {
+        "name": "sre-code-reviewer",
+        "prompt": "You are a reviewer.",
+    }
+
+
+def test_to_dict_unknown_field(agent):
+    """Test error for unknown fields."""
+    with pytest.raises(ValueError, match="Unknown agent field"):
+        agent.to_dict(["nope"])
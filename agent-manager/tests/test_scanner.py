@@ -2,9 +2,15 @@
 
 import pytest
 import asyncio
+import subprocess
+import tarfile
+import time
+import zipfile
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from agent_manager.core.query import ScanFilter
+from agent_manager.core.scan_stats import RootStats
 from agent_manager.core.scanner import AgentSkillScanner
 
 
@@ -105,3 +111,222 @@ async def test_scan_all(scanner, temp_project):
     assert len(result.agents) == 2
     assert len(result.skills) == 1
     assert len(result.errors) == 1  # The nonexistent path
+
+
+@pytest.mark.asyncio
+async def test_scan_filter_pushdown(temp_project):
+    """Test that the scanner discards items that don't match the filter."""
+    scanner = AgentSkillScanner(scan_filter=ScanFilter.parse("model=opus"))
+    result = await scanner.scan_path(temp_project)
+
+    assert [a.metadata.name for a in result.agents] == ["another-agent"]
+    # Skills have no model, so the condition doesn't apply to them
+    assert len(result.skills) == 1
+
+
+def test_wall_time_excludes_consumer(scanner, temp_project):
+    """Test that time spent by a slow consumer between items isn't counted."""
+    stats = RootStats(root=temp_project)
+    events = 0
+    for _ in scanner.iter_path(temp_project, stats):
+        events += 1
+        time.sleep(0.05)
+    assert events >= 3
+    assert stats.wall_time < 0.05
+
+
+@pytest.mark.asyncio
+async def test_scan_stats(scanner, temp_project):
+    """Test that per-root metrics are recorded."""
+    (temp_project / "agents" / "broken.md").write_text("no frontmatter here")
+
+    result = await scanner.scan_path(temp_project)
+    stats = result.stats.roots[temp_project]
+
+    assert stats.candidate_files == 4
+    assert stats.parsed_files == 3
+    assert stats.dirs_visited >= 4
+    assert stats.errors_by_type == {"invalid_frontmatter": 1}
+    assert stats.yaml_time > 0
+    assert stats.parse_time >= stats.yaml_time
+    assert len(stats.slowest_files) == 4
+
+
+@pytest.mark.asyncio
+async def test_identical_copies_share_parsed_record(temp_project):
+    """Test byte-identical agents are parsed once and share metadata."""
+    scanner = AgentSkillScanner(keep_parsed=True)
+    original = temp_project / "agents" / "test-agent.md"
+    for repo in ("repo-a", "repo-b"):
+        copy = temp_project / repo / ".claude" / "agents" / "test-agent.md"
+        copy.parent.mkdir(parents=True)
+        copy.write_bytes(original.read_bytes())
+
+    result = await scanner.scan_path(temp_project)
+    copies = [a for a in result.agents if a.metadata.name == "test-agent"]
+
+    assert len(copies) == 3
+    assert len({a.source_path for a in copies}) == 3
+    assert all(a.metadata is copies[0].metadata for a in copies)
+    assert len({a.content_hash for a in copies}) == 1
+    assert result.stats.roots[temp_project].duplicate_files == 2
+
+
+@pytest.mark.asyncio
+async def test_parse_cache_is_bounded(monkeypatch, temp_project):
+    """Test that rescanning edited files doesn't grow the parse cache past its cap."""
+    monkeypatch.setattr("agent_manager.core.scanner.PARSE_CACHE_SIZE", 4)
+    scanner = AgentSkillScanner(keep_parsed=True)
+    agent = temp_project / "agents" / "test-agent.md"
+    original = agent.read_text()
+
+    for i in range(10):
+        agent.write_text(f"{original}\nEdit {i}.")
+        result = await scanner.scan_path(temp_project)
+        assert len(result.agents) == 2
+    assert len(scanner._parsed) == 4
+    # The current version of every file is still cached
+    result = await scanner.scan_path(temp_project)
+    assert result.stats.roots[temp_project].duplicate_files == 3
+
+
+def test_one_shot_scanner_keeps_nothing(scanner, temp_project):
+    """Test that streaming with a default scanner doesn't hold parsed files."""
+    for i in range(3):
+        (temp_project / "agents" / f"copy-{i}.md").write_text("---\nname: copy\n---\n\nSame.")
+
+    events = list(scanner.iter_path(temp_project))
+
+    assert len(events) == 6
+    assert (len(scanner._parsed), len(scanner._blobs), len(scanner._archives)) == (0, 0, 0)
+    assert all(item.tokens for kind, item in events if kind == "agent")
+    events = list(scanner.iter_path(temp_project, estimate_tokens=False))
+    assert not any(item.tokens for kind, item in events if kind == "agent")
+
+
+@pytest.mark.asyncio
+async def test_content_hash_ignores_formatting(scanner, tmp_path):
+    """Test reformatted copies hash equally and edited ones don't."""
+    agents_dir = tmp_path / "agents"
+    agents_dir.mkdir()
+    (agents_dir / "a.md").write_text("---\nname: x\nmodel: opus\n---\n\nPrompt.\n")
+    (agents_dir / "b.md").write_text("---\nmodel: opus\nname:   x\n---\r\nPrompt.   \r\n")
+    (agents_dir / "c.md").write_text("---\nname: x\nmodel: opus\n---\n\nOther prompt.\n")
+
+    result = await scanner.scan_path(tmp_path)
+    hashes = {a.source_path.name: a.content_hash for a in result.agents}
+
+    assert hashes["a.md"] == hashes["b.md"]
+    assert hashes["a.md"] != hashes["c.md"]
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_scan_refs_reads_git_objects(scanner, temp_project):
+    """Test refs are scanned without checkout and blobs are parsed once by SHA."""
+    _git(temp_project, "init", "-q", "-b", "main")
+    _git(temp_project, "add", ".")
+    _git(temp_project, "commit", "-q", "-m", "one")
+    _git(temp_project, "checkout", "-q", "-b", "feature")
+    (temp_project / "agents" / "new-agent.md").write_text("---\nname: new-agent\n---\n\nNew.")
+    (temp_project / "node_modules" / "agents").mkdir(parents=True)
+    (temp_project / "node_modules" / "agents" / "ignored.md").write_text("---\nname: ignored\n---\n")
+    _git(temp_project, "add", ".")
+    _git(temp_project, "commit", "-q", "-m", "two")
+    _git(temp_project, "checkout", "-q", "main")
+
+    results = scanner.scan_refs(temp_project, ["main", "feature", "missing"])
+    main, feature, missing = results.values()
+
+    assert {a.metadata.name for a in main.agents} == {"test-agent", "another-agent"}
+    assert {a.metadata.name for a in feature.agents} == {"test-agent", "another-agent", "new-agent"}
+    assert [s.metadata.name for s in feature.skills] == ["test-skill"]
+    assert feature.agents[0].source_path.parent.name == "agents"
+    # Unchanged blobs were parsed on main and reused for feature, without
+    # a one-shot scanner keeping them afterwards
+    assert feature.stats.roots[temp_project.resolve()].duplicate_files == 3
+    assert len(scanner._blobs) == 0
+    scanner = AgentSkillScanner(keep_parsed=True)
+    scanner.scan_refs(temp_project, ["main", "feature"])
+    assert len(scanner._blobs) == 4
+    assert missing.agents == [] and len(missing.errors) == 1
+
+
+def test_scan_refs_follows_symlinks(scanner, tmp_path):
+    """Test linked agents and skill directories in a ref are found like a checkout's."""
+    lib = tmp_path / "lib"
+    (lib / "notes" / "scripts").mkdir(parents=True)
+    (lib / "x.md").write_text("---\nname: x\n---\n\nLinked agent.")
+    (lib / "notes" / "SKILL.md").write_text("---\nname: notes\n---\n\nLinked skill.")
+    (lib / "notes" / "scripts" / "run.sh").write_text("echo hi")
+    claude = tmp_path / ".claude"
+    (claude / "agents").mkdir(parents=True)
+    (claude / "skills").mkdir()
+    (claude / "agents" / "x.md").symlink_to("../../lib/x.md")
+    (claude / "agents" / "gone.md").symlink_to("../../lib/gone.md")
+    (claude / "agents" / "outside.md").symlink_to("/etc/hostname")
+    (claude / "skills" / "notes").symlink_to("../../lib/notes")
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "one")
+
+    result = scanner.scan_refs(tmp_path, ["main"])["main"]
+    checkout = asyncio.run(scanner.scan_path(tmp_path))
+
+    assert [a.metadata.name for a in result.agents] == ["x"]
+    assert result.agents[0].source_path == (lib / "x.md").resolve()
+    assert result.agents[0].prompt.strip() == "Linked agent."
+    (skill,) = result.skills
+    assert (skill.metadata.name, skill.source_dir) == ("notes", (lib / "notes").resolve())
+    assert [p.name for p in skill.scripts] == ["run.sh"]
+    assert [a.source_path for a in result.agents] == [a.source_path for a in checkout.agents]
+    assert [s.source_dir for s in result.skills] == [s.source_dir for s in checkout.skills]
+    assert sorted(p.name for p, _ in result.errors) == ["gone.md", "outside.md"]
+    assert result.stats.roots[tmp_path.resolve()].errors_by_type == {"BrokenSymlink": 2}
+
+
+@pytest.mark.asyncio
+async def test_scan_reads_archives_as_directories(temp_project, monkeypatch):
+    """Test agents and skills inside zip/tar.gz archives are found and cached."""
+    scanner = AgentSkillScanner(keep_parsed=True)
+    packs = temp_project / "packs"
+    packs.mkdir()
+    with zipfile.ZipFile(packs / "pack.zip", "w") as archive:
+        archive.writestr("pack-1.0/agents/zipped.md", "---\nname: zipped\n---\n\nFrom a zip.")
+        archive.writestr("pack-1.0/README.md", "Not an agent.")
+    skill = temp_project / "build" / "skills" / "tarred" / "SKILL.md"
+    skill.parent.mkdir(parents=True)
+    skill.write_text("---\nname: tarred\n---\n\nFrom a tarball.")
+    (skill.parent / "scripts").mkdir()
+    (skill.parent / "scripts" / "run.sh").write_text("echo hi")
+    with tarfile.open(packs / "skills.tar.gz", "w:gz") as archive:
+        archive.add(temp_project / "build" / "skills", arcname="./skills")
+    (packs / "broken.zip").write_bytes(b"not a zip")
+
+    result = await scanner.scan_path(temp_project)
+
+    zipped = next(a for a in result.agents if a.metadata.name == "zipped")
+    assert zipped.source_path == (packs / "pack.zip" / "pack-1.0" / "agents" / "zipped.md").resolve()
+    assert zipped.prompt.strip() == "From a zip."
+    tarred = next(s for s in result.skills if s.source_path.is_relative_to(packs))
+    assert tarred.metadata.name == "tarred"
+    assert [p.name for p in tarred.scripts] == ["run.sh"]
+    assert [p.name for p, _ in result.errors] == ["broken.zip"]
+
+    # Unchanged archives are not opened again
+    calls = []
+
+    def read_archive(path, match):
+        calls.append(path)
+        raise zipfile.BadZipFile("still broken")
+
+    monkeypatch.setattr("agent_manager.core.scanner.read_archive", read_archive)
+    rescan = await scanner.scan_path(temp_project)
+    assert "zipped" in {a.metadata.name for a in rescan.agents}
+    assert [p.name for p in calls] == ["broken.zip"]
@@ -0,0 +1,157 @@
+"""Tests for the BM25 search index."""
+
+import sqlite3
+from pathlib import Path
+
+from agent_manager.core.search_index import INDEX_VERSION, SearchIndex, snippet, tokenize
+from agent_manager.models import Agent, AgentMetadata, Skill, SkillMetadata
+
+
+def _agent(name: str, prompt: str) -> Agent:
+    return Agent(
+        metadata=AgentMetadata(name=name, description="", model="sonnet"),
+        prompt=prompt,
+        source_path=Path(f"/repo/agents/{name}.md"),
+        source_repo=Path("/repo"),
+    )
+
+
+def _skill(name: str, content: str) -> Skill:
+    skill_dir = Path(f"/repo/skills/{name}")
+    return Skill(
+        metadata=SkillMetadata(name=name, description=""),
+        content=content,
+        source_path=skill_dir / "SKILL.md",
+        source_dir=skill_dir,
+        source_repo=Path("/repo"),
+    )
+
+
+def _index() -> SearchIndex:
+    index = SearchIndex()
+    index.update(
+        agents=[
+            _agent("k8s", "Debug kubernetes pods. Kubernetes events and kubernetes logs."),
+            _agent("sre", "Handle incidents and on-call. Sometimes kubernetes."),
+            _agent("writer", "Write documentation and release notes."),
+        ],
+        skills=[_skill("notes", "Take notes in the obsidian vault.")],
+    )
+    return index
+
+
+def test_tokenize_drops_stopwords_and_punctuation():
+    """Test tokens are lowercase terms without stopwords."""
+    assert tokenize("The Kubernetes-operator, and a pod!") == ["kubernetes", "operator", "pod"]
+
+
+def test_bm25_ranks_by_term_frequency():
+    """Test documents with more occurrences rank higher."""
+    results = _index().search("kubernetes")
+
+    assert [r.name for r in results] == ["k8s", "sre"]
+    assert results[0].score > results[1].score
+
+
+def test_search_filters_by_kind():
+    """Test kind restricts results to agents or skills."""
+    index = _index()
+
+    assert {r.name for r in index.search("notes")} == {"writer", "notes"}
+    assert [r.name for r in index.search("notes", kind="skill")] == ["notes"]
+    assert index.search("unknownterm") == []
+
+
+def test_update_is_incremental_and_prune_removes():
+    """Test unchanged documents are skipped and pruned ones disappear."""
+    index = _index()
+
+    changed = index.update(agents=[
+        _agent("k8s", "Debug kubernetes pods. Kubernetes events and kubernetes logs."),
+        _agent("sre", "Handle incidents with terraform."),
+    ])
+    assert changed == 1
+    assert [r.name for r in index.search("kubernetes")] == ["k8s"]
+
+    removed = index.prune([Path("/repo/agents/k8s.md")])
+    assert removed == 3
+    assert len(index) == 1
+    assert index.search("terraform") == []
+
+
+def test_save_and_load(tmp_path):
+    """Test the index round-trips through disk."""
+    path = tmp_path / "index.db"
+    _index().save(path)
+
+    loaded = SearchIndex.load(path)
+
+    assert len(loaded) == 4
+    assert [r.name for r in loaded.search("vault")] == ["notes"]
+    assert loaded.search("kubernetes")[0].score == _index().search("kubernetes")[0].score
+    assert len(SearchIndex.load(tmp_path / "missing.db")) == 0
+
+    # Changes to an opened index persist on save
+    loaded.prune([])
+    loaded.save()
+    loaded.close()
+    assert len(SearchIndex.load(path)) == 0
+
+    # SQLite on disk; an older or unreadable index loads as an empty one
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == INDEX_VERSION
+    _index().save(tmp_path / "old.db")
+    with sqlite3.connect(tmp_path / "old.db") as conn:
+        conn.execute("PRAGMA user_version = 2")
+    assert len(SearchIndex.load(tmp_path / "old.db")) == 0
+    path.write_bytes(b"\x80\x04not an index" * 100)
+    assert len(SearchIndex.load(path)) == 0
+
+
+def _write_agent(path: Path, name: str, prompt: str) -> Agent:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(prompt)
+    agent = _agent(name, prompt)
+    agent.source_path = path
+    return agent
+
+
+def test_stale_roots_follow_file_and_directory_mtimes(tmp_path):
+    """Test only roots whose items changed on disk need a rescan."""
+    root_a, root_b = tmp_path / "a", tmp_path / "b"
+    k8s = _write_agent(root_a / "agents" / "k8s.md", "k8s", "Debug kubernetes pods.")
+    sre = _write_agent(root_b / "agents" / "sre.md", "sre", "Handle incidents.")
+    index = SearchIndex()
+    index.update_root(root_a, agents=[k8s])
+    index.update_root(root_b, agents=[sre])
+
+    assert index.stale_roots([root_a, root_b, tmp_path / "c"]) == [tmp_path / "c"]
+    assert index.roots() == [root_a, root_b]
+
+    # An edited file, an added file and an item changed through update()
+    k8s.source_path.write_text("Debug kubernetes pods and nodes.")
+    assert index.stale_roots([root_a, root_b]) == [root_a]
+    index.update_root(root_a, agents=[_write_agent(k8s.source_path, "k8s", "Nodes.")])
+    assert index.stale_roots([root_a, root_b]) == []
+    _write_agent(root_b / "agents" / "new.md", "new", "New agent.")
+    assert index.stale_roots([root_a, root_b]) == [root_b]
+    index.update_root(root_b, agents=[sre])
+    index.update(agents=[_write_agent(sre.source_path, "sre", "Handle outages.")])
+    assert index.stale_roots([root_a, root_b]) == [root_b]
+
+    # A rescan drops documents that are gone; removing a root forgets it
+    assert index.update_root(root_b) == 1
+    assert [r.name for r in index.search("outages")] == []
+    assert index.remove_root(root_a) == 1
+    assert len(index) == 0 and index.roots() == [root_b]
+
+
+def test_snippet_picks_densest_window():
+    """Test the snippet centres on the window with the most distinct terms."""
+    text = "kubernetes " + "filler " * 100 + "kubernetes pods crash here " + "filler " * 100
+
+    match = snippet(text, "kubernetes pods", width=60)
+
+    assert match.text.startswith("…") and match.text.endswith("…")
+    assert [match.text[s:e] for s, e in match.spans] == ["kubernetes", "pods"]
+    assert snippet(text, "absent") is None
@@ -0,0 +1,253 @@
+"""Tests for the session log index."""
+
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from agent_manager.core.session_index import LARGE_LINE, SessionIndex
+from agent_manager.core.session_manager import SessionManager, SessionTailer
+from agent_manager.models.session import AgentSession, SessionStatus
+
+
+def entry(kind: str, ts: str, **fields) -> str:
+    """Format one session log line."""
+    return json.dumps({"type": kind, "timestamp": f"2025-03-01T{ts}Z", **fields}) + "\n"
+
+
+def assistant(ts: str, message_id: str, output: int, content: list | None = None) -> str:
+    """Format an assistant line with usage."""
+    return entry("assistant", ts, message={
+        "id": message_id,
+        "model": "claude-sonnet-4",
+        "content": content or [{"type": "text", "text": "ok"}],
+        "usage": {
+            "input_tokens": 10,
+            "output_tokens": output,
+            "cache_read_input_tokens": 100,
+            "cache_creation_input_tokens": 0,
+        },
+    })
+
+
+def task(tool_use_id: str, agent: str) -> list:
+    """Content block of a subagent call."""
+    return [{
+        "type": "tool_use", "id": tool_use_id, "name": "Task",
+        "input": {"subagent_type": agent, "prompt": "go"},
+    }]
+
+
+def task_result(ts: str, tool_use_id: str, padding: int = 0) -> str:
+    """Format the user line returning a subagent's result."""
+    return entry(
+        "user", ts,
+        message={"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": tool_use_id, "content": "x" * padding},
+        ]},
+        toolUseResult={"totalDurationMs": 42000, "totalTokens": 5000},
+    )
+
+
+def make_manager(tmp_path: Path) -> tuple[SessionManager, Path]:
+    """Create a manager over an empty projects directory, and the project dir."""
+    project = tmp_path / "claude" / "projects" / "-work-app"
+    project.mkdir(parents=True)
+    return SessionManager(claude_dir=tmp_path / "claude", index_path=tmp_path / "sessions.db"), project
+
+
+def test_index_is_incremental(tmp_path):
+    """Test appends, partial lines, split messages and subagent calls across passes."""
+    manager, project = make_manager(tmp_path)
+    log = project / "s1.jsonl"
+    log.write_text(
+        entry("user", "10:00:00", cwd="/work/app", gitBranch="main",
+              message={"role": "user", "content": "Fix the flaky test\nin ci"})
+        + assistant("10:00:05", "msg_1", 5)
+        # The same message continues on a second line with updated usage
+        + assistant("10:00:06", "msg_1", 30, task("toolu_1", "reviewer"))
+        + '{"type": "user", "timest'
+    )
+
+    stats = manager.update_index()
+    assert (stats.updated, stats.lines) == (1, 3)
+    session = manager.get("s1")
+    assert session.title == "Fix the flaky test"
+    assert (session.project, session.git_branch) == ("/work/app", "main")
+    assert (session.message_count, session.output_tokens, session.input_tokens) == (2, 30, 10)
+    assert session.agents == ["reviewer"]
+    assert session.status is SessionStatus.ACTIVE
+
+    # Finish the partial line, then return the subagent result on a large line
+    with open(log, "a") as f:
+        f.write('amp": "2025-03-01T10:00:07Z"}\n')
+        f.write(task_result("10:01:00", "toolu_1", padding=LARGE_LINE))
+        f.write(assistant("10:01:02", "msg_2", 7))
+    stats = manager.update_index()
+    assert stats.lines == 3
+    assert manager.update_index().updated == 0
+
+    session = manager.get("s1")
+    assert (session.line_count, session.message_count, session.output_tokens) == (6, 4, 37)
+    assert [e["type"] for e in manager.read_lines(session, 2, 2)] == ["assistant", "user"]
+    assert manager.read_lines(session, -1, 1)[0]["message"]["id"] == "msg_2"
+    with SessionIndex(tmp_path / "sessions.db") as index:
+        (call,) = index.invocations()
+    assert (call.agent, call.duration_ms, call.tokens) == ("reviewer", 42000, 5000)
+
+
+def test_index_restarts_on_truncation_and_forgets_deleted_logs(tmp_path):
+    """Test that a rewritten log is indexed from scratch and deleted logs drop out."""
+    manager, project = make_manager(tmp_path)
+    log = project / "s1.jsonl"
+    log.write_text(assistant("10:00:00", "msg_1", 5) + assistant("10:00:01", "msg_2", 5))
+    (project / "s2.jsonl").write_text(assistant("11:00:00", "msg_3", 1))
+    manager.update_index()
+
+    log.write_text(assistant("12:00:00", "msg_9", 3))
+    (project / "s2.jsonl").unlink()
+    stats = manager.update_index()
+
+    assert stats.removed == 1
+    (session,) = manager.list_sessions()
+    assert (session.line_count, session.output_tokens) == (1, 3)
+    assert [e["message"]["id"] for e in manager.read_lines(session, 0, 5)] == ["msg_9"]
+
+
+def test_sessions_page_and_skim_large_lines(tmp_path):
+    """Test paging and search over many sessions, and usage taken from skimmed lines."""
+    manager, project = make_manager(tmp_path)
+    for i in range(25):
+        (project / f"s{i:02}.jsonl").write_text(
+            entry("user", f"10:{i:02}:00", message={"role": "user", "content": f"task {i}"})
+        )
+    huge = assistant("12:00:00", "msg_big", 9, [{"type": "text", "text": "y" * (LARGE_LINE + 1)}])
+    (project / "big.jsonl").write_text(huge)
+
+    manager.update_index()
+
+    assert manager.count() == 26
+    first = manager.list_sessions(0, 10)
+    assert first[0].session_id == "big" and first[0].output_tokens == 9
+    assert [s.title for s in first[1:3]] == ["task 24", "task 23"]
+    assert len(manager.list_sessions(20, 10)) == 6
+    assert [s.session_id for s in manager.list_sessions(query="task 1")] == [
+        f"s{i:02}" for i in range(19, 9, -1)
+    ] + ["s01"]
+
+
+def test_tailer_follows_appends_rotation_and_status(tmp_path):
+    """Test that polls publish new lines, rotated logs and status changes, then stop following."""
+    manager, project = make_manager(tmp_path)
+    old = project / "old.jsonl"
+    old.write_text(assistant("09:00:00", "msg_0", 1))
+    os.utime(old, (time.time() - 7200, time.time() - 7200))
+    log = project / "live.jsonl"
+    log.write_text(assistant("10:00:00", "msg_1", 5))
+    tailer = SessionTailer(manager)
+
+    (session,) = tailer.poll()
+    assert tailer.followed == [log]
+    assert (session.session_id, session.output_tokens) == ("live", 5)
+    assert tailer.poll() == []
+
+    with open(log, "a") as f:
+        f.write(assistant("10:00:01", "msg_2", 7)[:40])
+    assert [s.line_count for s in tailer.poll()] == [1]
+    with open(log, "a") as f:
+        f.write(assistant("10:00:01", "msg_2", 7)[40:])
+    assert [s.output_tokens for s in tailer.poll()] == [12]
+
+    # Replaced by a new, shorter file
+    log.unlink()
+    log.write_text(assistant("11:00:00", "msg_9", 2))
+    assert [(s.line_count, s.output_tokens) for s in tailer.poll()] == [(1, 2)]
+
+    os.utime(log, (time.time() - 600, time.time() - 600))
+    (session,) = tailer.poll()
+    assert session.status is SessionStatus.IDLE
+    os.utime(log, (time.time() - 7200, time.time() - 7200))
+    (session,) = tailer.poll()
+    assert session.status is SessionStatus.ENDED
+    assert tailer.followed == []
+
+
+async def test_tailer_queue_is_bounded(tmp_path):
+    """Test that run() publishes appends and a full queue drops the oldest update."""
+    manager, project = make_manager(tmp_path)
+    log = project / "live.jsonl"
+    log.write_text(assistant("10:00:00", "msg_1", 5))
+    tailer = SessionTailer(manager, interval=0.01, queue_size=2)
+
+    running = asyncio.create_task(tailer.run())
+    try:
+        first = await asyncio.wait_for(tailer.updates.get(), 5)
+        with open(log, "a") as f:
+            f.write(assistant("10:00:01", "msg_2", 7))
+        second = await asyncio.wait_for(tailer.updates.get(), 5)
+    finally:
+        running.cancel()
+    assert (first.output_tokens, second.output_tokens) == (5, 12)
+
+    for tokens in (1, 2, 3):
+        tailer.publish(AgentSession("x", log, "/p", output_tokens=tokens))
+    assert tailer.dropped == 1
+    assert [tailer.updates.get_nowait().output_tokens for _ in range(2)] == [2, 3]
+
+
+def days_ago(days: float) -> str:
+    """ISO timestamp ``days`` before now."""
+    return datetime.fromtimestamp(time.time() - days * 86400, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def call_lines(n: int, agent: str, when: str, duration_ms: float | None = 3000) -> str:
+    """Format a subagent call and, unless ``duration_ms`` is None, its result."""
+    line = json.dumps({"type": "assistant", "timestamp": when, "message": {
+        "id": f"msg_{agent}_{n}", "content": task(f"toolu_{agent}_{n}", agent),
+    }}) + "\n"
+    if duration_ms is not None:
+        line += json.dumps({
+            "type": "user", "timestamp": when,
+            "message": {"content": [{"type": "tool_result", "tool_use_id": f"toolu_{agent}_{n}"}]},
+            "toolUseResult": {"totalDurationMs": duration_ms, "totalTokens": 1000},
+        }) + "\n"
+    return line
+
+
+def test_agent_usage_rolls_up_incrementally(tmp_path):
+    """Test rolling windows, latency percentiles, late results and deleted logs."""
+    manager, project = make_manager(tmp_path)
+    log = project / "s1.jsonl"
+    log.write_text(
+        call_lines(1, "reviewer", days_ago(0), 3000)
+        + call_lines(2, "reviewer", days_ago(0), 40_000)
+        + call_lines(3, "reviewer", days_ago(3), 8000)
+        + call_lines(4, "planner", days_ago(20), 500)
+        + call_lines(5, "planner", days_ago(0), None)
+    )
+    (project / "s2.jsonl").write_text(call_lines(6, "planner", days_ago(200), 1500))
+    manager.update_index()
+
+    assert {a: u.calls for a, u in manager.agent_usage(1).items()} == {"reviewer": 2, "planner": 1}
+    week = manager.agent_usage(7)["reviewer"]
+    assert (week.calls, week.finished, week.tokens) == (3, 3, 3000)
+    assert week.percentile_ms(0.5) == 10_000 and week.percentile_ms(0.95) == 60_000
+    planner = manager.agent_usage(30)["planner"]
+    assert (planner.calls, planner.finished, planner.percentile_ms(0.5)) == (2, 1, 1000)
+    assert manager.agent_usage(365)["planner"].calls == 3
+
+    # The pending call returns on a later pass; a deleted log drops out
+    with open(log, "a") as f:
+        f.write(json.dumps({
+            "type": "user", "timestamp": days_ago(0),
+            "message": {"content": [{"type": "tool_result", "tool_use_id": "toolu_planner_5"}]},
+            "toolUseResult": {"totalDurationMs": 700_000, "totalTokens": 9},
+        }) + "\n")
+    (project / "s2.jsonl").unlink()
+    manager.update_index()
+
+    today = manager.agent_usage(1)["planner"]
+    assert (today.finished, today.tokens, today.percentile_ms(0.5)) == (1, 9, float("inf"))
+    assert manager.agent_usage(365)["planner"].calls == 2
@@ -0,0 +1,74 @@
+"""Tests for MinHash/LSH near-duplicate detection."""
+
+from pathlib import Path
+
+from agent_manager.core.similarity import SimilarityIndex, diff, estimate, shingles, signature
+from agent_manager.models import Agent, AgentMetadata
+
+BASE = " ".join(
+    f"Rule {i}: review the {w} carefully before approving any change."
+    for i, w in enumerate(["tests", "docs", "types", "errors", "logging", "naming", "imports", "config"])
+)
+OTHER = " ".join(f"Step {i}: deploy the {w} service to staging." for i in range(40) for w in ["api"])
+
+
+def _agent(name: str, prompt: str, repo: str = "repo", content_hash: str | None = None) -> Agent:
+    return Agent(
+        metadata=AgentMetadata(name=name, description="", model="sonnet"),
+        prompt=prompt,
+        source_path=Path(f"/{repo}/agents/{name}.md"),
+        source_repo=Path(f"/{repo}"),
+        content_hash=content_hash,
+    )
+
+
+def test_estimate_tracks_jaccard():
+    """Test signature similarity is high for small edits and low for unrelated text."""
+    base = signature(shingles(BASE))
+
+    assert estimate(base, signature(shingles(BASE))) == 1.0
+    assert estimate(base, signature(shingles(BASE + " Also check the changelog."))) > 0.8
+    assert estimate(base, signature(shingles(OTHER))) < 0.1
+    assert shingles("") == set()
+
+
+def test_clusters_group_forks_and_copies():
+    """Test drifted forks cluster together and identical copies count as one variant."""
+    index = SimilarityIndex()
+    index.add(_agent("reviewer", BASE, "a", content_hash="h1"))
+    index.add(_agent("reviewer", BASE, "b", content_hash="h1"))
+    index.add(_agent("reviewer-v2", BASE + " Never approve on Fridays.", "c", content_hash="h2"))
+    index.add(_agent("deployer", OTHER, "a", content_hash="h3"))
+
+    (cluster,) = index.clusters()
+
+    assert cluster.names == ["reviewer", "reviewer-v2"]
+    assert len(cluster.variants[0].copies) == 2
+    assert 0.5 < cluster.variants[1].similarity < 1.0
+    assert "+" in diff(cluster.base, cluster.variants[1].agent)
+
+
+def test_relatives_exclude_self():
+    """Test relatives returns other similar agents, most similar first."""
+    index = SimilarityIndex()
+    agent = _agent("reviewer", BASE, "a")
+    index.add(agent)
+    index.add(_agent("near", BASE + " One more rule.", "b"))
+    index.add(_agent("far", BASE[: len(BASE) // 2] + " " + OTHER, "c"))
+    index.add(_agent("deployer", OTHER, "d"))
+
+    names = [a.metadata.name for a, _ in index.relatives(agent, threshold=0.2)]
+
+    assert names[0] == "near"
+    assert "reviewer" not in names and "deployer" not in names
+
+
+def test_add_reuses_previous_signatures():
+    """Test a rebuilt index reuses signatures for unchanged content hashes."""
+    old = SimilarityIndex()
+    old.add(_agent("reviewer", BASE, content_hash="h1"))
+
+    new = SimilarityIndex()
+    new.add(_agent("reviewer", "", content_hash="h1"), previous=old)
+
+    assert len(new) == 1
@@ -0,0 +1,122 @@
+"""Tests for token estimates and per-project context cost."""
+
+import asyncio
+import json
+from pathlib import Path
+
+from agent_manager.core.scanner import AgentSkillScanner
+from agent_manager.core.tokens import TokenCache, context_costs, estimate_tokens, text_hash
+from agent_manager.models import Agent, AgentMetadata, Skill, SkillMetadata
+
+
+def test_estimate_tokens():
+    """Test that common words cost one token and long or unusual text costs more."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Review the code") == 3
+    assert estimate_tokens("12345") == 2
+    assert estimate_tokens("internationalization") == 4
+    assert estimate_tokens("## Steps\n\n1. Run") == 6
+    assert estimate_tokens("日本語") == 5
+    # Plain English comes out at four to six characters per token
+    prose = "The reviewer reads each changed file and reports bugs it finds. " * 20
+    assert 4 < len(prose) / estimate_tokens(prose) < 6
+
+
+def test_cache_counts_batches_and_persists(tmp_path, monkeypatch):
+    """Test that a batch estimates each new text once and a reloaded cache reuses counts."""
+    calls = []
+    monkeypatch.setattr(
+        "agent_manager.core.tokens.estimate_tokens", lambda text: calls.append(text) or len(text)
+    )
+    cache = TokenCache(tmp_path / "tokens.json")
+
+    assert cache.count(["abc", "de", "abc"]) == [3, 2, 3]
+    assert calls == ["abc", "de"]
+    cache.save()
+
+    reloaded = TokenCache(cache.path)
+    assert reloaded.count(["de", "fghi"]) == [2, 4]
+    assert calls == ["abc", "de", "fghi"]
+
+    # Counts from another estimator version are dropped
+    data = json.loads(cache.path.read_text())
+    assert data["counts"][text_hash("abc")] == 3
+    cache.path.write_text(json.dumps({"version": 0, "counts": data["counts"]}))
+    assert TokenCache(cache.path).count(["abc"]) == [3]
+    assert calls[-1] == "abc"
+
+
+def test_cache_keeps_recently_used_counts(monkeypatch):
+    """Test that the in-memory cache drops the least recently used counts beyond its size."""
+    monkeypatch.setattr("agent_manager.core.tokens.CACHE_SIZE", 3)
+    cache = TokenCache()
+    cache.count(["a", "b", "c"])
+    cache.count(["a", "d"])
+
+    assert set(cache._load()) == {text_hash(t) for t in ("c", "a", "d")}
+
+
+def test_scan_sets_tokens(tmp_path):
+    """Test that scanned and streamed agents and skills carry token estimates."""
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "a.md").write_text("---\nname: a\n---\n\nReview the code")
+    skill = tmp_path / "skills" / "s"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: s\n---\n\nTake notes")
+    scanner = AgentSkillScanner()
+
+    result = asyncio.run(scanner.scan_all([tmp_path]))
+    assert [(a.tokens, s.tokens) for a, s in zip(result.agents, result.skills)] == [(3, 2)]
+    streamed = {item.metadata.name: item.tokens for _, item in scanner.iter_scan([tmp_path])}
+    assert streamed == {"a": 3, "s": 2}
+
+
+def _agent(path: Path, tokens: int, global_link: Path | None = None) -> Agent:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    return Agent(
+        metadata=AgentMetadata(name=path.stem, description="", model="sonnet"),
+        prompt="",
+        source_path=path,
+        source_repo=Path("/"),
+        global_link=global_link,
+        tokens=tokens,
+    )
+
+
+def test_context_costs(tmp_path):
+    """Test that projects add global items, except those they shadow by name."""
+    root = tmp_path.resolve()
+    link = root / "link.md"
+    link.touch()
+    agents = [
+        _agent(root / "lib/agents/reviewer.md", 100, global_link=link),
+        _agent(root / "lib/agents/planner.md", 40, global_link=link),
+        _agent(root / "lib/agents/unused.md", 999),
+        _agent(root / "work/app/.claude/agents/reviewer.md", 10),
+    ]
+    notes = root / "work/web/.claude/skills/notes"
+    notes.mkdir(parents=True)
+    skills = [Skill(
+        metadata=SkillMetadata(name="notes", description=""),
+        content="",
+        source_path=notes / "SKILL.md",
+        source_dir=notes,
+        source_repo=root / "work/web",
+        tokens=5,
+    )]
+    # The scanner records a linked item under its target, so only the
+    # listing of the assigned project finds it
+    linked = root / "work/api/.claude/agents"
+    linked.mkdir(parents=True)
+    (linked / "unused.md").symlink_to(root / "lib/agents/unused.md")
+    (linked / "broken.md").symlink_to(root / "missing.md")
+
+    everywhere, api, web, app = context_costs(agents, skills, [root / "work/api"])
+    assert (everywhere.project, everywhere.agent_tokens) == (None, 140)
+    assert (api.project, api.agents, api.total_tokens) == (root / "work/api", {"unused": 999}, 1139)
+    assert (app.project, app.agents, app.global_agents) == (root / "work/app", {"reviewer": 10}, {"planner": 40})
+    assert app.total_tokens == 50
+    assert (web.project, web.skill_tokens, web.total_tokens) == (root / "work/web", 5, 145)
+    # Without the project directory the link isn't seen
+    assert [c.project for c in context_costs(agents, skills)][1:] == [root / "work/web", root / "work/app"]